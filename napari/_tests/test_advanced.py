@@ -246,7 +246,7 @@ def test_labels_undo_redo(make_test_viewer):
     assert np.array_equal(l2, labels.data)
 
     # history limit
-    labels._history_limit = 1
+    labels._history_max_bytes = 1
     labels.fill((0, 0), 3)
 
     l3 = labels.data.copy()
@@ -27,8 +27,8 @@ def _chunk_outline(chunk: ChunkData) -> np.ndarray:
     """
     x, y = chunk.pos
     h, w = chunk.data.shape[:2]
-    w *= chunk.scale[1]
-    h *= chunk.scale[0]
+    w *= chunk.scale[0]
+    h *= chunk.scale[1]
 
     # We draw lines on all four sides of the chunk. This means are
     # double-drawing all interior lines in the grid. We can draw less if
@@ -0,0 +1,52 @@
+import numpy as np
+from vispy.gloo import VertexBuffer
+from vispy.scene.visuals import create_visual_node
+from vispy.visuals.mesh import MeshVisual, _build_color_transform
+
+
+class ValuesMeshVisual(MeshVisual):
+    """Mesh visual whose vertex values can be updated on their own.
+
+    Setting only the vertex values uploads just the values buffer on the
+    next draw, instead of the vertices, normals and faces of the whole mesh.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._values_changed = False
+        super().__init__(*args, **kwargs)
+
+    def set_vertex_values(self, vertex_values):
+        """Set the vertex values, keeping the geometry of the mesh.
+
+        Parameters
+        ----------
+        vertex_values : (N,) array
+            Values of the N vertices of the mesh.
+        """
+        self.mesh_data.set_vertex_values(vertex_values)
+        self._values_changed = True
+        self.update()
+
+    def _update_values(self):
+        """Upload the vertex values as the base color of the mesh."""
+        md = self.mesh_data
+        if self.shading == 'smooth' and not md.has_face_indexed_data():
+            colors = md.get_vertex_values()[:, np.newaxis]
+        else:
+            colors = md.get_vertex_values(indexed='faces')
+            colors = colors.ravel()[:, np.newaxis]
+        colors = colors.astype(np.float32)
+        self.shared_program.vert['color_transform'] = _build_color_transform(
+            colors, self._cmap, self._clim_values
+        )
+        self.shared_program.vert['base_color'] = VertexBuffer(colors)
+
+    def _prepare_draw(self, view):
+        # a full update of the mesh data also uploads the values
+        if self._values_changed and not self._data_changed:
+            self._update_values()
+        self._values_changed = False
+        return super()._prepare_draw(view)
+
+
+Mesh = create_visual_node(ValuesMeshVisual)
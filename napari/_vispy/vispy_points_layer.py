@@ -48,6 +48,14 @@ class VispyPointsLayer(VispyBaseLayer):
             data = self.layer._view_data
             size = self.layer._view_size
 
+            # When zoomed out on many points only draw a subsample of them
+            lod_index = self.layer._view_lod_index
+            if lod_index is not None:
+                data = data[lod_index]
+                size = size[lod_index]
+                edge_color = edge_color[lod_index]
+                face_color = face_color[lod_index]
+
         set_data = self.node._subvisuals[0].set_data
 
         set_data(
@@ -1,7 +1,7 @@
 import numpy as np
 from vispy.color import Colormap as VispyColormap
-from vispy.scene.visuals import Mesh
 
+from .mesh import Mesh
 from .vispy_base_layer import VispyBaseLayer
 
 
@@ -11,10 +11,14 @@ class VispySurfaceLayer(VispyBaseLayer):
     View is based on the vispy mesh node and uses default values for
     lighting direction and lighting color. More information can be found
     here https://github.com/vispy/vispy/blob/master/vispy/visuals/mesh.py
+
+    The vertices and faces are only sent to the node when the layer's
+    geometry in view changes, otherwise only the vertex values are updated.
     """
 
     def __init__(self, layer):
         node = Mesh()
+        self._geometry_stored = None
 
         super().__init__(layer, node)
 
@@ -32,7 +36,23 @@ class VispySurfaceLayer(VispyBaseLayer):
             vertices = None
             faces = None
             vertex_values = np.array([0])
+            geometry = None
         else:
+            geometry = (
+                self.layer._data_view,
+                self.layer._view_faces,
+                self.layer._dims.ndisplay,
+            )
+            stored = self._geometry_stored
+            if (
+                stored is not None
+                and stored[0] is geometry[0]
+                and stored[1] is geometry[1]
+                and stored[2] == geometry[2]
+            ):
+                self.node.set_vertex_values(self.layer._view_vertex_values)
+                return
+
             # Offsetting so pixels now centered
             vertices = self.layer._data_view[:, ::-1]
             faces = self.layer._view_faces
@@ -47,6 +67,7 @@ class VispySurfaceLayer(VispyBaseLayer):
         self.node.set_data(
             vertices=vertices, faces=faces, vertex_values=vertex_values
         )
+        self._geometry_stored = geometry
         self.node.update()
         # Call to update order of translation values with new dims:
         self._on_matrix_change()
@@ -94,6 +94,14 @@ class VispyTracksLayer(VispyBaseLayer):
         self.track_shader.tail_length = self.layer.tail_length
         self.track_shader.vertex_time = self.layer.track_times
 
+        # when culling the tracks, there may be no vertices in the time
+        # window, so clear the data as for an empty graph below
+        if len(self.layer._view_data) == 0:
+            self.node._subvisuals[0]._pos = None
+            self.node._subvisuals[0]._connect = None
+            self.node.update()
+            return
+
         # change the data to the vispy line visual
         self.node._subvisuals[0].set_data(
             pos=self.layer._view_data,
@@ -115,14 +123,15 @@ class VispyTracksLayer(VispyBaseLayer):
         # if the user clears a graph after it has been created, vispy offers
         # no method to clear the data, therefore, we need to set private
         # attributes to None to prevent errors
-        if self.layer._view_graph is None:
+        view_graph = self.layer._view_graph
+        if view_graph is None or len(view_graph) == 0:
             self.node._subvisuals[2]._pos = None
             self.node._subvisuals[2]._connect = None
             self.node.update()
             return
 
         self.node._subvisuals[2].set_data(
-            pos=self.layer._view_graph,
+            pos=view_graph,
             connect=self.layer.graph_connex,
             width=self.layer.tail_width,
             color='white',
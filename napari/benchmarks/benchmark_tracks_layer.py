@@ -0,0 +1,49 @@
+# See "Writing benchmarks" in the asv docs for more information.
+# https://asv.readthedocs.io/en/latest/writing_benchmarks.html
+# or the napari documentation on benchmarking
+# https://github.com/napari/napari/blob/master/docs/BENCHMARKS.md
+import numpy as np
+
+from napari.layers import Tracks
+
+
+class TracksSuite:
+    """Benchmarks for the Tracks layer with 2D+t data."""
+
+    params = [2 ** i for i in range(4, 22, 2)]
+
+    def setup(self, n):
+        np.random.seed(0)
+        # tracks of 16 vertices each, one vertex per frame
+        n_tracks = max(n // 16, 1)
+        ids = np.repeat(np.arange(n_tracks), 16)[:n]
+        times = np.tile(np.arange(16), n_tracks)[:n]
+        self.data = np.column_stack(
+            [ids, times, 100 * np.random.random((len(ids), 2))]
+        )
+        self.graph = {i: [i - 1] for i in range(1, n_tracks, 2)}
+        self.layer = Tracks(self.data, graph=self.graph)
+
+    def time_create_layer(self, n):
+        """Time to create a layer."""
+        Tracks(self.data)
+
+    def time_create_layer_with_graph(self, n):
+        """Time to create a layer with a graph."""
+        Tracks(self.data, graph=self.graph)
+
+    def time_set_data(self, n):
+        """Time to set the data."""
+        self.layer.data = self.data
+
+    def time_refresh(self, n):
+        """Time to refresh view."""
+        self.layer.refresh()
+
+    def mem_layer(self, n):
+        """Memory used by layer."""
+        return self.layer
+
+    def mem_data(self, n):
+        """Memory used by raw data."""
+        return self.data
@@ -99,3 +99,30 @@ class Vectors3DSuite:
     def mem_data(self, n):
         """Memory used by raw data."""
         return self.data
+
+
+class VectorsNDSuite:
+    """Benchmarks for slicing the Vectors layer with 4D data."""
+
+    params = [2 ** i for i in range(4, 18, 2)]
+
+    def setup(self, n):
+        np.random.seed(0)
+        self.data = np.random.random((n, 2, 4))
+        self.data[:, 0, :2] = np.random.randint(0, 16, (n, 2))
+        self.layer = Vectors(self.data)
+
+    def time_create_layer(self, n):
+        """Time to create a layer."""
+        Vectors(self.data)
+
+    def time_slice_planes(self, n):
+        """Time to step through the first planes."""
+        for i in range(16):
+            self.layer._slice_dims([0, i, 0, 0], ndisplay=2)
+
+    def time_slice_planes_max_vectors(self, n):
+        """Time to step through the first planes drawing few vectors."""
+        self.layer.max_vectors_in_view = 256
+        for i in range(16):
+            self.layer._slice_dims([1, i, 0, 0], ndisplay=2)
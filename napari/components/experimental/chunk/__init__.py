@@ -2,4 +2,4 @@
 """
 from ._config import async_config
 from ._loader import chunk_loader, synchronous_loading, wait_for_async
-from ._request import ChunkKey, ChunkRequest
+from ._request import ChunkKey, ChunkRequest, ChunkTile, LoadPriority
@@ -1,19 +1,21 @@
 """ChunkCache stores loaded chunks.
 """
 import logging
+import math
+import time
+from collections import OrderedDict, namedtuple
 from typing import Dict, Optional
 
+import numpy as np
+
 from ...._vendor.experimental.cachetools import LRUCache
 from ....types import ArrayLike
+from ....utils.memory_budget import BudgetedCache, memory_budget
+from ._disk_cache import DiskCache
 from ._request import ChunkRequest
 
 LOGGER = logging.getLogger("napari.async")
 
-# ChunkCache size as a fraction of total RAM. Keep it small for now until
-# we figure out how ChunkCache will work with the Dask cache, and do
-# a lot more testing.
-CACHE_MEM_FRACTION = 0.1
-
 # A ChunkRequest is just a dict of the arrays we need to load. We allow
 # loading multiple arrays in one request so the caller does not have to
 # deal with partial loads, where it has received some arrays but it cannot
@@ -24,23 +26,8 @@ CACHE_MEM_FRACTION = 0.1
 # "tile.1.1", "tile1.2", "tile2.1", "tile2.2".
 ChunkArrays = Dict[str, ArrayLike]
 
-
-def _get_cache_size_bytes(mem_fraction: float) -> int:
-    """Return the max number of bytes the cache should use.
-
-    Parameters
-    ----------
-    mem_fraction : float
-        The cache should use this fraction of RAM, for example 0.5.
-
-    Returns
-    -------
-    int
-        The max number of bytes the cache should use.
-    """
-    import psutil
-
-    return psutil.virtual_memory().total * mem_fraction
+# What we remember about each entry for the MemoryBudget.
+CacheEntry = namedtuple("CacheEntry", ["access_time", "layer_id", "num_bytes"])
 
 
 def _getsizeof_chunks(chunks: ChunkArrays) -> int:
@@ -59,34 +46,44 @@ def _getsizeof_chunks(chunks: ChunkArrays) -> int:
     return sum(array.nbytes for array in chunks.values())
 
 
-class ChunkCache:
+class ChunkCache(BudgetedCache):
     """Cache of previously loaded chunks.
 
-    We use a cachetools LRUCache to implement a least recently used cache
-    that will grow in memory usage up to some limit. Then it will free the
-    least recently used entries so total usage does not exceed that limit.
+    We use a cachetools LRUCache to implement a least recently used cache.
+    The cache itself is unbounded, instead it shares the global
+    MemoryBudget with the dask cache. Whenever either cache grows the
+    MemoryBudget evicts whichever cache's candidate entry was accessed
+    longest ago, so together they never use more than the budget.
 
     TODO_ASYNC:
 
     1) For dynamically computed data the cache should be disabled. So
        should the default be off? Or can we detect dynamic computations?
 
-    2) Can we use the Dask cache instead of our own? The problem with having
-       two caches is how to manage their sizes? They can't both be 0.5 * RAM
-       for example!
+    Parameters
+    ----------
+    disk_cache : Optional[DiskCache]
+        Optional second tier behind the memory cache which persists
+        between sessions. Only requests with a stable_key use it.
 
     Attributes
     ----------
     chunks : LRUCache
         The cache of chunks.
+    entries : OrderedDict
+        The access time, layer_id and size of each entry, oldest first.
     enabled : bool
         True if the cache is enabled.
     """
 
-    def __init__(self):
-        nbytes = _get_cache_size_bytes(CACHE_MEM_FRACTION)
-        self.chunks = LRUCache(maxsize=nbytes, getsizeof=_getsizeof_chunks)
+    name = "chunk"
+
+    def __init__(self, disk_cache: Optional[DiskCache] = None):
+        self.chunks = LRUCache(maxsize=math.inf, getsizeof=_getsizeof_chunks)
+        self.entries: OrderedDict = OrderedDict()
         self.enabled = True
+        self.disk_cache = disk_cache
+        memory_budget.register(self)
 
     def add_chunks(self, request: ChunkRequest) -> None:
         """Add the chunks in this request to the cache.
@@ -100,7 +97,52 @@ class ChunkCache:
             LOGGER.info("ChunkCache.add_chunk: disabled")
             return
         LOGGER.info("ChunkCache.add_chunk: %s", request.key)
-        self.chunks[request.key.key] = request.chunks
+
+        if request.tiles:
+            # Cache each tile under its own key, so a different request
+            # which overlaps this one can reuse the tiles they share.
+            for name, tile in request.tiles.items():
+                chunks = {'image': request.chunks[name]}
+                self.add_chunks(ChunkRequest(tile.key, chunks))
+            return
+
+        self._add_to_memory(request, request.chunks)
+
+        # We are usually in a worker thread, so writing is not in the way.
+        if self._use_disk(request) and all(
+            isinstance(array, np.ndarray) for array in request.chunks.values()
+        ):
+            self.disk_cache.add_chunks(request.key.stable_key, request.chunks)
+
+    def _use_disk(self, request: ChunkRequest) -> bool:
+        """Return True if this request can use the disk cache."""
+        return (
+            self.disk_cache is not None and request.key.stable_key is not None
+        )
+
+    def _add_to_memory(
+        self, request: ChunkRequest, chunks: ChunkArrays
+    ) -> None:
+        """Add these chunks to the memory cache.
+
+        Parameters
+        ----------
+        request : ChunkRequest
+            The request the chunks are for.
+        chunks : ChunkArrays
+            The chunks to add.
+        """
+        with memory_budget.lock:
+            key = request.key.key
+            self.chunks[key] = chunks
+            self.entries[key] = CacheEntry(
+                time.monotonic(),
+                request.key.layer_id,
+                _getsizeof_chunks(chunks),
+            )
+            self.entries.move_to_end(key)
+
+        memory_budget.shrink()
 
     def get_chunks(self, request: ChunkRequest) -> Optional[ChunkArrays]:
         """Return the cached data for this request or None.
@@ -119,4 +161,54 @@ class ChunkCache:
             LOGGER.info("ChunkCache.get_chunk: disabled")
             return None
         LOGGER.info("ChunkCache.get_chunk: %s", request.key)
-        return self.chunks.get(request.key.key)
+
+        with memory_budget.lock:
+            key = request.key.key
+            chunks = self.chunks.get(key)
+            if chunks is not None:
+                self.entries[key] = self.entries[key]._replace(
+                    access_time=time.monotonic()
+                )
+                self.entries.move_to_end(key)
+                return chunks
+
+        if not self._use_disk(request):
+            return None
+
+        # Promote disk hits so the next lookup is a memory hit.
+        chunks = self.disk_cache.get_chunks(request.key.stable_key)
+        if chunks is not None:
+            LOGGER.info("ChunkCache.get_chunk: disk hit %s", request.key)
+            self._add_to_memory(request, chunks)
+        return chunks
+
+    @property
+    def nbytes(self) -> int:
+        """Return how many bytes the cache is using."""
+        return self.chunks.currsize
+
+    def oldest_access(self) -> Optional[float]:
+        """Return the access time of the least recently used entry."""
+        with memory_budget.lock:
+            if not self.entries:
+                return None
+            return next(iter(self.entries.values())).access_time
+
+    def evict_one(self) -> int:
+        """Evict the least recently used entry, return bytes freed."""
+        with memory_budget.lock:
+            if not self.entries:
+                return 0
+            key, entry = self.entries.popitem(last=False)
+            del self.chunks[key]
+            return entry.num_bytes
+
+    def layer_bytes(self, layer) -> int:
+        """Return how many bytes are cached for this layer."""
+        layer_id = id(layer)
+        with memory_budget.lock:
+            return sum(
+                entry.num_bytes
+                for entry in self.entries.values()
+                if entry.layer_id == layer_id
+            )
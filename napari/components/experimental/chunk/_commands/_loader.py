@@ -7,6 +7,7 @@ import dask.array as da
 from ....._vendor.experimental.humanize.src.humanize import naturalsize
 from .....layers.base import Layer
 from .....layers.image import Image
+from .....utils.memory_budget import memory_budget
 from .._config import async_config
 from .._info import LayerInfo, LoadType
 from .._loader import chunk_loader
@@ -68,6 +69,8 @@ class InfoDisplayer:
         self.avg_ms = f"{stats.window_ms.average:.1f}"
         self.mbits = f"{stats.mbits:.1f}"
         self.load_str = stats.recent_load_str
+        self.prefetch_hits = f"{stats.prefetch.hit_rate * 100:.0f}%"
+        self.prefetch_wasted = format_bytes(stats.prefetch.wasted_bytes)
 
 
 class NoInfoDisplayer:
@@ -151,6 +154,9 @@ class ChunkLoaderLayers:
                 "TOTAL",
                 "AVG (ms)",
                 "MBIT/s",
+                "PREFETCH HITS",
+                "WASTED",
+                "CACHED",
                 "SHAPE",
             ]
         )
@@ -206,6 +212,8 @@ class ChunkLoaderLayers:
         layer_type = type(layer).__name__
         num_levels = self._get_num_levels(layer.data)
         shape_str = self._get_shape_str(layer)
+        cached_bytes = sum(memory_budget.layer_bytes(layer).values())
+        cached_str = format_bytes(cached_bytes)
 
         # Use InfoDisplayer to display LayerInfo
         info = chunk_loader.get_info(id(layer))
@@ -225,6 +233,9 @@ class ChunkLoaderLayers:
                 disp.total,
                 disp.avg_ms,
                 disp.mbits,
+                disp.prefetch_hits,
+                disp.prefetch_wasted,
+                cached_str,
                 shape_str,
             ]
         )
@@ -294,19 +305,32 @@ class LoaderCommands:
             ('use_processes', src.use_processes),
             ('auto_sync_ms', src.auto_sync_ms),
             ('delay_queue_ms', src.delay_queue_ms),
+            ('prefetch_slices', src.prefetch_slices),
+            ('prefetch_lookahead_ms', src.prefetch_lookahead_ms),
+            ('cache_bytes', src.cache_bytes),
+            ('disk_cache_bytes', src.disk_cache_bytes),
+            ('disk_cache_path', src.disk_cache_path),
+            ('multiscale_tiles', src.multiscale_tiles),
+            ('range_samples', src.range_samples),
+            ('contrast_percentiles', src.contrast_percentiles),
         ]
         print_property_table(config)
 
     @property
     def cache(self):
         chunk_cache = chunk_loader.cache
-        cur_str = format_bytes(chunk_cache.chunks.currsize)
-        max_str = format_bytes(chunk_cache.chunks.maxsize)
         table = [
             ('enabled', chunk_cache.enabled),
-            ('currsize', cur_str),
-            ('maxsize', max_str),
+            ('budget', format_bytes(memory_budget.max_bytes)),
+            ('used', format_bytes(memory_budget.used_bytes)),
         ]
+        for name, num_bytes in memory_budget.cache_bytes().items():
+            table.append((f'{name} cache', format_bytes(num_bytes)))
+        disk_cache = chunk_cache.disk_cache
+        if disk_cache is not None:
+            table.append(('disk path', disk_cache.path))
+            table.append(('disk budget', format_bytes(disk_cache.max_bytes)))
+            table.append(('disk used', format_bytes(disk_cache.nbytes)))
         print_property_table(table)
 
     @property
@@ -15,7 +15,15 @@ LOGGER = logging.getLogger("napari.async")
 # in experimental this module will not even be imported if NAPARI_ASYNC=0.
 DEFAULT_SYNC_CONFIG = {"synchronous": True}
 
-# NAPARI_ASYNC=1 will use these default settings:
+# NAPARI_ASYNC=1 will use these default settings. A cache_bytes of None
+# means the memory budget shared by all caches comes from the
+# NAPARI_CACHE_BYTES env var or a fraction of RAM, see utils.memory_budget.
+# A disk_cache_bytes of 0 disables the disk cache, a disk_cache_path of
+# None puts it in the user cache directory. With multiscale_tiles multiscale
+# images load the view as tiles aligned to the data's chunks. Large lazy
+# images estimate their contrast range from up to range_samples chunks
+# loaded in the background, and if contrast_percentiles is [low, high] the
+# contrast limits are set to those percentiles of the values seen.
 DEFAULT_ASYNC_CONFIG = {
     "log_path": None,
     "synchronous": False,
@@ -23,6 +31,14 @@ DEFAULT_ASYNC_CONFIG = {
     "use_processes": False,
     "auto_sync_ms": 30,
     "delay_queue_ms": 100,
+    "prefetch_slices": 4,
+    "prefetch_lookahead_ms": 500,
+    "cache_bytes": None,
+    "disk_cache_bytes": 0,
+    "disk_cache_path": None,
+    "multiscale_tiles": False,
+    "range_samples": 32,
+    "contrast_percentiles": None,
 }
 
 # The async config settings.
@@ -35,6 +51,14 @@ AsyncConfig = namedtuple(
         "use_processes",
         "auto_sync_ms",
         "delay_queue_ms",
+        "prefetch_slices",
+        "prefetch_lookahead_ms",
+        "cache_bytes",
+        "disk_cache_bytes",
+        "disk_cache_path",
+        "multiscale_tiles",
+        "range_samples",
+        "contrast_percentiles",
     ],
 )
 
@@ -117,6 +141,14 @@ def _create_async_config(data: dict) -> AsyncConfig:
         use_processes=data.get("use_processes", False),
         auto_sync_ms=data.get("auto_sync_ms", 30),
         delay_queue_ms=data.get("delay_queue_ms", 100),
+        prefetch_slices=data.get("prefetch_slices", 4),
+        prefetch_lookahead_ms=data.get("prefetch_lookahead_ms", 500),
+        cache_bytes=data.get("cache_bytes"),
+        disk_cache_bytes=data.get("disk_cache_bytes", 0),
+        disk_cache_path=data.get("disk_cache_path"),
+        multiscale_tiles=data.get("multiscale_tiles", False),
+        range_samples=data.get("range_samples", 32),
+        contrast_percentiles=data.get("contrast_percentiles"),
     )
 
     _log_to_file(config.log_path)
@@ -0,0 +1,213 @@
+"""DiskCache class.
+
+Keeps loaded chunks on disk so they survive between sessions.
+"""
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+
+from ....types import ArrayLike
+from ....utils._appdirs import user_cache_dir
+
+LOGGER = logging.getLogger("napari.async")
+
+# Chunks are stored as .npy files which we can memory map on read.
+CHUNK_SUFFIX = ".npy"
+
+ChunkArrays = Dict[str, ArrayLike]
+
+
+def get_default_disk_cache_path() -> Path:
+    """Return the default location of the disk cache.
+
+    Returns
+    -------
+    Path
+        The chunks directory inside napari's user cache directory.
+    """
+    return Path(user_cache_dir()) / "chunks"
+
+
+def _dir_bytes(path: Path) -> int:
+    """Return the total size of the files in this directory.
+
+    Parameters
+    ----------
+    path : Path
+        The directory to measure.
+    """
+    return sum(entry.stat().st_size for entry in path.iterdir())
+
+
+class DiskCache:
+    """Least recently used cache of decoded chunks on disk.
+
+    Each entry is a directory named after the request's stable key, with
+    one .npy file per array in the request. We write each entry to a
+    temporary directory and rename it into place, so a crash or a second
+    napari instance never sees a half-written entry.
+
+    Reads memory map the .npy files, so a hit costs no decoding and only
+    the pages we actually touch are read from disk.
+
+    Parameters
+    ----------
+    path : Path
+        The directory to store entries in, created if needed.
+    max_bytes : int
+        Evict the least recently used entries to stay under this size.
+
+    Attributes
+    ----------
+    index : OrderedDict
+        The size in bytes of each entry, least recently used first.
+    nbytes : int
+        The total size of all entries.
+    lock : threading.Lock
+        Entries are written from worker threads.
+    """
+
+    def __init__(self, path: Path, max_bytes: int):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.index: OrderedDict = OrderedDict()
+        self.nbytes = 0
+        self.lock = threading.Lock()
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._scan()
+
+    def _scan(self) -> None:
+        """Index the entries left over from previous sessions."""
+        entries = []
+        for entry_path in self.path.iterdir():
+            if not entry_path.is_dir() or entry_path.name.startswith("."):
+                continue  # Skip temporary directories.
+            try:
+                stat = entry_path.stat()
+                entries.append((stat.st_mtime, entry_path.name, entry_path))
+            except OSError:
+                continue  # Removed by another instance.
+
+        # The directory's mtime is when we last touched it.
+        for _, name, entry_path in sorted(entries):
+            num_bytes = _dir_bytes(entry_path)
+            self.index[name] = num_bytes
+            self.nbytes += num_bytes
+
+        LOGGER.info(
+            "DiskCache: %d entries %d bytes in %s",
+            len(self.index),
+            self.nbytes,
+            self.path,
+        )
+        self._evict()
+
+    def get_chunks(self, stable_key: str) -> Optional[ChunkArrays]:
+        """Return the memory mapped arrays for this key or None.
+
+        Parameters
+        ----------
+        stable_key : str
+            The key to look up.
+
+        Returns
+        -------
+        Optional[ChunkArrays]
+            The arrays or None if the key is not in the cache.
+        """
+        with self.lock:
+            if stable_key not in self.index:
+                return None
+            self.index.move_to_end(stable_key)
+
+        entry_path = self.path / stable_key
+        try:
+            chunks = {
+                chunk_path.stem: np.load(chunk_path, mmap_mode='r')
+                for chunk_path in entry_path.glob("*" + CHUNK_SUFFIX)
+            }
+            os.utime(entry_path)  # So the next session sees the access.
+        except (OSError, ValueError) as exc:
+            LOGGER.warning("DiskCache: cannot read %s: %s", entry_path, exc)
+            self._remove(stable_key)
+            return None
+
+        return chunks
+
+    def add_chunks(self, stable_key: str, chunks: ChunkArrays) -> None:
+        """Write these arrays to the cache.
+
+        Parameters
+        ----------
+        stable_key : str
+            The key to store the arrays under.
+        chunks : ChunkArrays
+            The arrays to store, all must be ndarrays.
+        """
+        with self.lock:
+            if stable_key in self.index:
+                self.index.move_to_end(stable_key)
+                return
+
+        num_bytes = 0
+        temp_path = None
+        try:
+            temp_path = Path(tempfile.mkdtemp(prefix=".", dir=self.path))
+            for name, array in chunks.items():
+                chunk_path = temp_path / (name + CHUNK_SUFFIX)
+                np.save(chunk_path, array, allow_pickle=False)
+                num_bytes += chunk_path.stat().st_size
+            os.rename(temp_path, self.path / stable_key)
+        except OSError as exc:
+            # Disk full, or another instance wrote this key first.
+            LOGGER.info("DiskCache: cannot write %s: %s", stable_key, exc)
+            if temp_path is not None:
+                shutil.rmtree(temp_path, ignore_errors=True)
+            return
+
+        with self.lock:
+            self.index[stable_key] = num_bytes
+            self.nbytes += num_bytes
+        self._evict()
+
+    def _remove(self, stable_key: str) -> None:
+        """Remove this entry from the index and the disk.
+
+        Parameters
+        ----------
+        stable_key : str
+            The entry to remove.
+        """
+        with self.lock:
+            num_bytes = self.index.pop(stable_key, None)
+            if num_bytes is None:
+                return
+            self.nbytes -= num_bytes
+
+        # Might fail on Windows if the entry is still memory mapped.
+        shutil.rmtree(self.path / stable_key, ignore_errors=True)
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until we fit in max_bytes."""
+        while True:
+            with self.lock:
+                if self.nbytes <= self.max_bytes or not self.index:
+                    return
+                stable_key = next(iter(self.index))
+            LOGGER.debug("DiskCache._evict: %s", stable_key)
+            self._remove(stable_key)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self.lock:
+            keys = list(self.index)
+        for stable_key in keys:
+            self._remove(stable_key)
@@ -21,6 +21,46 @@ class LoadCounts:
         self.bytes: int = 0
 
 
+class PrefetchCounts:
+    """Counts of how useful prefetching has been for one layer.
+
+    Attributes
+    ----------
+    requests : int
+        How many prefetch requests were submitted.
+    loads : int
+        How many prefetch requests finished loading.
+    cancelled : int
+        How many prefetch requests were cancelled before they loaded.
+    hits : int
+        How many prefetched requests the layer later asked for.
+    bytes : int
+        How many bytes were loaded by prefetching.
+    used_bytes : int
+        How many of those bytes the layer later asked for.
+    """
+
+    def __init__(self):
+        self.requests: int = 0
+        self.loads: int = 0
+        self.cancelled: int = 0
+        self.hits: int = 0
+        self.bytes: int = 0
+        self.used_bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the fraction of prefetch requests that were used."""
+        if self.requests == 0:
+            return 0
+        return self.hits / self.requests
+
+    @property
+    def wasted_bytes(self) -> int:
+        """Return how many prefetched bytes have not been used."""
+        return self.bytes - self.used_bytes
+
+
 def _get_type_str(data) -> str:
     """Get human readable name for the data's type.
 
@@ -106,6 +146,7 @@ class LoadStats:
         self.window_bytes: StatWindow = StatWindow(self.WINDOW_SIZE)
         self.recent_loads: list = []
         self.counts: LoadCounts = LoadCounts()
+        self.prefetch: PrefetchCounts = PrefetchCounts()
 
     def on_load_finished(self, request: ChunkRequest, sync: bool) -> None:
         """Record stats on this request that was just loaded.
@@ -146,6 +187,31 @@ class LoadStats:
         keep = self.NUM_RECENT_LOADS - 1
         self.recent_loads = self.recent_loads[-keep:] + [load_info]
 
+    def on_prefetch_finished(self, request: ChunkRequest) -> None:
+        """Record stats on this prefetch request that was just loaded.
+
+        We do not count prefetches as regular loads, they only count once
+        the layer actually asks for them, see on_prefetch_hit().
+
+        Parameters
+        ----------
+        request : ChunkRequest
+            The prefetch request that was just loaded.
+        """
+        self.prefetch.loads += 1
+        self.prefetch.bytes += request.num_bytes
+
+    def on_prefetch_hit(self, num_bytes: int) -> None:
+        """Record that the layer asked for a prefetched request.
+
+        Parameters
+        ----------
+        num_bytes : int
+            How many of the prefetched bytes the layer is using.
+        """
+        self.prefetch.hits += 1
+        self.prefetch.used_bytes += num_bytes
+
     @property
     def mbits(self) -> float:
         """Return Mbit/second."""
@@ -13,11 +13,15 @@ from typing import Dict, List, Optional, Union
 
 from ....types import ArrayLike
 from ....utils.events import EmitterGroup
+from ....utils.memory_budget import memory_budget
 from ._cache import ChunkCache
 from ._config import async_config
 from ._delay_queue import DelayQueue
+from ._disk_cache import DiskCache, get_default_disk_cache_path
 from ._info import LayerInfo, LoadType
-from ._request import ChunkKey, ChunkRequest
+from ._prefetch import PrefetchPolicy, get_prefetch_chunks
+from ._request import ChunkKey, ChunkRequest, ChunkTile, LoadPriority
+from ._scheduler import ChunkFuture, LoadScheduler
 
 LOGGER = logging.getLogger("napari.async")
 
@@ -63,6 +67,21 @@ def _create_executor(use_processes: bool, num_workers: int) -> PoolExecutor:
     return ThreadPoolExecutor(max_workers=num_workers)
 
 
+def _create_disk_cache() -> Optional[DiskCache]:
+    """Return the DiskCache, or None if it's disabled in the config."""
+    if not async_config.disk_cache_bytes:
+        return None
+
+    path = async_config.disk_cache_path
+    if path is None:
+        path = get_default_disk_cache_path()
+    try:
+        return DiskCache(path, async_config.disk_cache_bytes)
+    except OSError as exc:
+        LOGGER.warning("ChunkLoader: disk cache disabled: %s", exc)
+        return None
+
+
 class ChunkLoader:
     """Loads chunks synchronously or asynchronously in worker thread or processes.
 
@@ -78,7 +97,9 @@ class ChunkLoader:
         The number of workers.
     executor : PoolExecutor
         The thread or process pool executor.
-    futures : Dict[int, List[Future]]
+    scheduler : LoadScheduler
+        Submits requests to the executor in priority order.
+    futures : Dict[int, List[ChunkFuture]]
         In progress futures for each layer (data_id).
     layer_map : Dict[int, LayerInfo]
         Stores a LayerInfo about each layer we are tracking.
@@ -86,6 +107,10 @@ class ChunkLoader:
         Cache of previously loaded chunks.
     delay_queue : DelayQueue
         Requests sit in here for a bit before submission.
+    prefetch_policy : PrefetchPolicy
+        Decides which slices to load before they are asked for.
+    max_prefetch : int
+        The most prefetch requests we allow in the pool at once.
     events : EmitterGroup
         We only signal one event: chunk_loaded.
     """
@@ -99,9 +124,18 @@ class ChunkLoader:
             self.use_processes, self.num_workers
         )
 
-        self.futures: Dict[int, List[Future]] = {}
+        # The scheduler feeds the pool in priority order.
+        self.scheduler = LoadScheduler(
+            self.executor, self.num_workers, _chunk_loader_worker
+        )
+
+        self.futures: Dict[int, List[ChunkFuture]] = {}
         self.layer_map: Dict[int, LayerInfo] = {}
-        self.cache: ChunkCache = ChunkCache()
+
+        # The ChunkCache shares one memory budget with the dask cache.
+        if async_config.cache_bytes is not None:
+            memory_budget.resize(async_config.cache_bytes)
+        self.cache: ChunkCache = ChunkCache(_create_disk_cache())
 
         # The DelayeQueue prevents us from spamming the worker pool when
         # the user is rapidly scrolling through slices.
@@ -109,6 +143,13 @@ class ChunkLoader:
             async_config.delay_queue_ms, self._submit_async
         )
 
+        # Prefetch while the user scrubs, but always leave one worker free
+        # so prefetches do not delay the slice the user is looking at.
+        self.prefetch_policy = PrefetchPolicy(
+            async_config.prefetch_slices, async_config.prefetch_lookahead_ms
+        )
+        self.max_prefetch: int = max(self.num_workers - 1, 1)
+
         self.events = EmitterGroup(
             source=self, auto_connect=True, chunk_loaded=None
         )
@@ -118,7 +159,11 @@ class ChunkLoader:
         return self.layer_map.get(layer_id)
 
     def create_request(
-        self, layer, key: ChunkKey, chunks: Dict[str, ArrayLike]
+        self,
+        layer,
+        key: ChunkKey,
+        chunks: Dict[str, ArrayLike],
+        tiles: Optional[Dict[str, ChunkTile]] = None,
     ) -> ChunkRequest:
         """Create a ChunkRequest for submission to load_chunk.
 
@@ -130,6 +175,8 @@ class ChunkLoader:
             The key for the request.
         chunks : Dict[str, ArrayLike]
             The arrays we want to load.
+        tiles : Optional[Dict[str, ChunkTile]]
+            If the chunks are tiles of the image, the tiles.
         """
         layer_id = key.layer_id
 
@@ -138,7 +185,7 @@ class ChunkLoader:
             self.layer_map[layer_id] = LayerInfo(layer)
 
         # Return the new request.
-        return ChunkRequest(key, chunks)
+        return ChunkRequest(key, chunks, tiles=tiles)
 
     def load_chunk(self, request: ChunkRequest) -> Optional[ChunkRequest]:
         """Load the given request sync or async.
@@ -163,22 +210,197 @@ class ChunkLoader:
         if self._load_synchronously(request):
             return request
 
+        # Did the user jump away from where they were scrubbing?
+        jumped = self.prefetch_policy.is_jump(request.key)
+        self.prefetch_policy.record(request.key)
+
         # Check the cache first.
-        chunks = self.cache.get_chunks(request)
+        satisfied = self._load_from_cache(request)
 
-        if chunks is not None:
-            LOGGER.info("ChunkLoader._load_async: cache hit %s", request.key)
-            request.chunks = chunks
+        if satisfied is None:
+            LOGGER.info("ChunkLoader.load_chunk: cache miss %s", request.key)
+
+            # It might already be loading as a prefetch.
+            promoted = self.prefetch_policy.promote(request.key)
+
+            # Clear any pending requests for this specific data_id, and
+            # the prefetches too if the user jumped somewhere else.
+            self._clear_pending(request.key.data_id, prefetch=jumped)
+
+            if promoted:
+                satisfied = self._check_promoted(request)
+            elif self._revive_stale(request):
+                pass  # Already running, _done() will deliver it.
+            else:
+                # Add to the delay queue, the delay queue will call our
+                # _submit_async() method later on if the delay expires
+                # without the request getting cancelled.
+                self.delay_queue.add(request)
+        elif jumped:
+            self._clear_prefetch(request.key.data_id)
+
+        self._prefetch(request)
+        return satisfied
+
+    def load_background(self, request: ChunkRequest) -> None:
+        """Load a request the layer is not waiting on, such as statistics.
+
+        Background requests always load asynchronously at the lowest
+        priority. They are not cancelled when the layer slices, and they
+        are not cached, since nothing will ask for them again.
+
+        Parameters
+        ----------
+        request : ChunkRequest
+            Contains the arrays to load.
+        """
+        LOGGER.debug("ChunkLoader.load_background: %s", request.key)
+        request.priority = LoadPriority.BACKGROUND
+        future = self.scheduler.submit(request)
+        future.add_done_callback(self._done)
+
+    def load_thumbnail(self, request: ChunkRequest) -> Optional[ChunkRequest]:
+        """Load a layer's thumbnail source sync or async.
+
+        Thumbnails load separately from the slice at a lower priority, so
+        they never hold up the image the user is looking at. Like slices
+        they are cached and cancelled when the layer slices again, but
+        they do not count as user motion for prefetching.
+
+        Parameters
+        ----------
+        request : ChunkRequest
+            Contains the thumbnail source to load.
+
+        Returns
+        -------
+        Optional[ChunkRequest]
+            The ChunkRequest if it was satisfied otherwise None.
+        """
+        request.priority = LoadPriority.THUMBNAIL
+
+        if self._load_synchronously(request):
             return request
 
-        LOGGER.info("ChunkLoader.load_chunk: cache miss %s", request.key)
-        # Clear any pending requests for this specific data_id.
-        self._clear_pending(request.key.data_id)
+        chunks = self.cache.get_chunks(request)
+        if chunks is not None:
+            LOGGER.info(
+                "ChunkLoader.load_thumbnail: cache hit %s", request.key
+            )
+            request.chunks.update(chunks)
+            return request
 
-        # Add to the delay queue, the delay queue will call our
-        # _submit_async() method later on if the delay expires without the
-        # request getting cancelled.
         self.delay_queue.add(request)
+        return None
+
+    def _load_from_cache(
+        self, request: ChunkRequest
+    ) -> Optional[ChunkRequest]:
+        """Return the request satisfied from the cache, or None.
+
+        Parameters
+        ----------
+        request : ChunkRequest
+            The request to look up in the cache.
+        """
+        chunks = self.cache.get_chunks(request)
+
+        if chunks is None:
+            return None
+
+        LOGGER.info("ChunkLoader._load_async: cache hit %s", request.key)
+
+        # If this was prefetched, we just prevented a load.
+        if self.prefetch_policy.remove_pending(request.key) is not None:
+            num_bytes = sum(array.nbytes for array in chunks.values())
+            info = self._get_layer_info(request)
+            info.stats.on_prefetch_hit(num_bytes)
+
+        # A prefetch might not contain every chunk the request has, for
+        # example the thumbnail_source, so only replace what we have.
+        request.chunks.update(chunks)
+
+        if not request.in_memory:
+            # Load the rest in a worker, not in the GUI thread. The chunks
+            # we got from the cache are already loaded so they cost nothing.
+            LOGGER.info("ChunkLoader._load_async: partial hit %s", request.key)
+            return None
+
+        return request
+
+    def _revive_stale(self, request: ChunkRequest) -> bool:
+        """Return True if a stale running request has the same key.
+
+        The user scrolled away from a slice and came back to it while it
+        was still loading. We want that load after all.
+
+        Parameters
+        ----------
+        request : ChunkRequest
+            The request the layer just made.
+        """
+        for future in self.futures.get(request.key.data_id, []):
+            if future.request.key == request.key and not future.done():
+                future.request.stale = False
+                return True
+        return False
+
+    def _check_promoted(self, request: ChunkRequest) -> Optional[ChunkRequest]:
+        """Return the request if its promoted prefetch already finished.
+
+        The prefetch might have finished after we checked the cache but
+        before it was promoted. In that case _done() put it in the cache
+        without delivering it, so we have to deliver it ourselves.
+
+        Parameters
+        ----------
+        request : ChunkRequest
+            The request that was promoted.
+        """
+        if self.cache.get_chunks(request) is None:
+            return None  # Still loading, _done() will deliver it.
+
+        if not self.prefetch_policy.pop_promoted(request.key):
+            return None  # _done() beat us to it and delivered it.
+
+        return self._load_from_cache(request)
+
+    def _prefetch(self, request: ChunkRequest) -> None:
+        """Submit prefetch requests for what the user will want next.
+
+        Parameters
+        ----------
+        request : ChunkRequest
+            The request the layer just made.
+        """
+        policy = self.prefetch_policy
+        if not policy.enabled or not self.cache.enabled:
+            return  # Prefetched chunks would have nowhere to go.
+
+        info = self._get_layer_info(request)
+        layer = info.get_layer()
+        if layer is None:
+            return
+
+        for key, indices in policy.predict(layer, request.key):
+            if policy.num_in_flight >= self.max_prefetch:
+                return  # Leave the rest of the pool for the user.
+
+            if policy.is_pending(key):
+                continue  # Already prefetched or being prefetched.
+
+            prefetch = ChunkRequest(
+                key, get_prefetch_chunks(layer, key, indices), prefetch=True
+            )
+
+            if self.cache.get_chunks(prefetch) is not None:
+                continue  # Already loaded, nothing to do.
+
+            LOGGER.debug("ChunkLoader._prefetch: %s", key)
+            future = self.scheduler.submit(prefetch)
+            policy.add_pending(key, future)
+            future.add_done_callback(self._done)
+            info.stats.prefetch.requests += 1
 
     def _load_synchronously(self, request: ChunkRequest) -> bool:
         """Return True if we loaded the request synchronously."""
@@ -186,6 +408,12 @@ class ChunkLoader:
 
         if self._should_load_sync(request, info):
             request.load_chunks()
+
+            # Tiles are cached even if they loaded fast, so that the next
+            # pan only has to load the newly exposed ones.
+            if request.tiles:
+                self.cache.add_chunks(request)
+
             info.stats.on_load_finished(request, sync=True)
             return True
 
@@ -241,34 +469,45 @@ class ChunkLoader:
         # https://blog.pilosus.org/posts/2020/01/24/python-f-strings-in-logging/
         LOGGER.debug("ChunkLoader._submit_async: %s", request.key)
 
-        # Submit the future, have it call ChunkLoader._done when done.
-        future = self.executor.submit(_chunk_loader_worker, request)
+        # Submit the request, have it call ChunkLoader._done when done.
+        future = self.scheduler.submit(request)
         future.add_done_callback(self._done)
 
         # Store the future in case we need to cancel it.
         self.futures.setdefault(request.key.data_id, []).append(future)
 
-    def _clear_pending(self, data_id: int) -> None:
+    def _clear_pending(self, data_id: int, prefetch: bool = False) -> None:
         """Clear any pending requests for this data_id.
 
         Parameters
         ----------
         data_id : int
             Clear all requests associated with this data_id.
+        prefetch : bool
+            If True clear pending prefetch requests as well.
         """
         LOGGER.debug("ChunkLoader._clear_pending %d", data_id)
 
+        if prefetch:
+            self._clear_prefetch(data_id)
+
         # Clear delay queue first. These requests are trivial to clear
         # because they have not even been submitted to the worker pool.
         self.delay_queue.clear(data_id)
 
-        # Get list of futures we submitted to the pool.
+        # Get list of futures we submitted to the scheduler.
         future_list = self.futures.setdefault(data_id, [])
 
         # Try to cancel all futures in the list, but cancel() will return
-        # False if the task already started running.
+        # False if the request is already running in the pool. We keep
+        # those but mark them stale, so _done() will drop their results
+        # instead of delivering them to the layer.
         num_before = len(future_list)
-        future_list[:] = [x for x in future_list if x.cancel()]
+        future_list[:] = [
+            x for x in future_list if not x.cancel() and not x.done()
+        ]
+        for future in future_list:
+            future.request.stale = True
         num_after = len(future_list)
         num_cleared = num_before - num_after
 
@@ -287,6 +526,31 @@ class ChunkLoader:
                 num_after,
             )
 
+    def _clear_prefetch(self, data_id: int) -> None:
+        """Cancel the prefetch requests for this data_id.
+
+        Parameters
+        ----------
+        data_id : int
+            Cancel prefetches associated with this data_id.
+        """
+        cleared = self.prefetch_policy.clear_pending(data_id)
+        num_cancelled = sum(
+            entry.future is not None and entry.future.cancel()
+            for entry in cleared
+        )
+
+        LOGGER.debug(
+            "ChunkLoader._clear_prefetch: %d of %d cancelled",
+            num_cancelled,
+            len(cleared),
+        )
+
+        if cleared:
+            info = self.layer_map.get(cleared[0].key.layer_id)
+            if info is not None:
+                info.stats.prefetch.cancelled += num_cancelled
+
     @staticmethod
     def _get_request(future: Future) -> Optional[ChunkRequest]:
         """Return the ChunkRequest for this future.
@@ -339,10 +603,20 @@ class ChunkLoader:
         # to do this in the worker. Later we might need to arrange for this
         # to be done in the GUI thread if cache access becomes more
         # complicated.
-        self.cache.add_chunks(request)
+        if request.priority != LoadPriority.BACKGROUND:
+            self.cache.add_chunks(request)
+
+        # Check the stale flag on the request we submitted, with processes
+        # the request we got back is a copy.
+        if future.request.stale:
+            LOGGER.debug("ChunkLoader._done: stale %s", request.key)
+            return  # User moved on, so don't send it to the layer.
 
         # Lookup this Request's LayerInfo.
-        info = self._get_layer_info(request)
+        try:
+            info = self._get_layer_info(request)
+        except KeyError:
+            return  # Layer was deleted during the load.
 
         # Resolve the weakref.
         layer = info.get_layer()
@@ -350,6 +624,21 @@ class ChunkLoader:
         if layer is None:
             return  # Ignore chunks since layer was deleted.
 
+        if request.priority == LoadPriority.BACKGROUND:
+            # Not a slice, so it does not count towards the load stats.
+            self.events.chunk_loaded(layer=layer, request=request)
+            return
+
+        if request.prefetch:
+            self.prefetch_policy.on_loaded(request.key)
+            info.stats.on_prefetch_finished(request)
+
+            if not self.prefetch_policy.pop_promoted(request.key):
+                return  # Nobody asked for it yet, it waits in the cache.
+
+            # The layer asked for this while it was loading.
+            info.stats.on_prefetch_hit(request.num_bytes)
+
         info.stats.on_load_finished(request, sync=False)
 
         # Fire event to tell QtChunkReceiver to forward this chunk to its
@@ -443,8 +732,8 @@ There is one global chunk_loader instance to handle async loading for all
 Viewer instances. There are two main reasons we do this instead of one
 ChunkLoader per Viewer:
 
-1. We size the ChunkCache as a fraction of RAM, so having more than one
-   cache would use too much RAM.
+1. The ChunkCache shares one memory budget with the dask cache, so having
+   more than one cache would just split that budget.
 
 2. We might size the thread pool for optimal performance, and having
    multiple pools would result in more workers than we want.
@@ -0,0 +1,481 @@
+"""PrefetchPolicy class.
+"""
+import logging
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Deque, Dict, List, NamedTuple, Optional, Set, Tuple
+
+import numpy as np
+
+from ....types import ArrayLike
+from ._request import ChunkKey
+
+LOGGER = logging.getLogger("napari.async")
+
+# The recent positions we remember for each layer: (time, key).
+HistoryEntry = Tuple[float, ChunkKey]
+
+
+class PendingPrefetch(NamedTuple):
+    """A prefetch that was submitted but not yet asked for.
+
+    Attributes
+    ----------
+    key : ChunkKey
+        The key being prefetched.
+    future : Optional[Future]
+        The future loading it, or None once it has loaded.
+    """
+
+    key: ChunkKey
+    future: Optional[Future]
+
+
+class ScrubMotion(NamedTuple):
+    """How the user is moving through the slices of one layer.
+
+    Attributes
+    ----------
+    axis : int
+        The non-displayed axis being scrubbed.
+    step : int
+        The signed number of slices moved per update.
+    rate : float
+        How many updates per second the user is making.
+    """
+
+    axis: int
+    step: int
+    rate: float
+
+
+def _int_positions(indices) -> Optional[Dict[int, int]]:
+    """Return {axis: index} for the non-displayed (integer) indices.
+
+    Parameters
+    ----------
+    indices : Tuple[Union[int, slice], ...]
+        The indices of a ChunkKey.
+
+    Returns
+    -------
+    Optional[Dict[int, int]]
+        The integer positions, or None if indices are not a tuple.
+    """
+    if not isinstance(indices, tuple):
+        return None
+    return {
+        axis: int(value)
+        for axis, value in enumerate(indices)
+        if not isinstance(value, slice)
+    }
+
+
+def _get_motion(older: HistoryEntry, newer: HistoryEntry) -> Optional[tuple]:
+    """Return (axis, step, seconds) between two keys, or None.
+
+    There is a motion only if the two keys are for the same level, have
+    the same displayed region, and differ along exactly one axis.
+    """
+    (older_time, older_key), (newer_time, newer_key) = older, newer
+
+    if older_key.data_level != newer_key.data_level:
+        return None
+
+    old_pos = _int_positions(older_key.indices)
+    new_pos = _int_positions(newer_key.indices)
+    if old_pos is None or new_pos is None or old_pos.keys() != new_pos.keys():
+        return None
+
+    # The displayed region must not have changed, only the slice.
+    for old, new in zip(older_key.indices, newer_key.indices):
+        if isinstance(old, slice) and old != new:
+            return None
+
+    moved = [axis for axis in new_pos if new_pos[axis] != old_pos[axis]]
+    if len(moved) != 1:
+        return None
+
+    axis = moved[0]
+    step = new_pos[axis] - old_pos[axis]
+    return axis, step, newer_time - older_time
+
+
+def _shift_indices(indices: tuple, axis: int, value: int) -> tuple:
+    """Return indices with the integer index on the given axis replaced."""
+    return indices[:axis] + (value,) + indices[axis + 1 :]
+
+
+def _scale_indices(indices: tuple, factors: np.ndarray, shape) -> tuple:
+    """Return indices scaled into a neighbouring multiscale level.
+
+    Parameters
+    ----------
+    indices : tuple
+        Indices into the current level.
+    factors : np.ndarray
+        Per-axis ratio of the current level's size to the new level's.
+    shape : tuple
+        Shape of the new level, used to clip the result.
+    """
+    scaled = []
+    for value, factor, size in zip(indices, factors, shape):
+        if isinstance(value, slice):
+            if value.start is None or value.stop is None:
+                scaled.append(value)  # The whole axis at any level.
+                continue
+            start = int(math.floor(value.start / factor))
+            stop = int(math.ceil(value.stop / factor))
+            scaled.append(slice(max(start, 0), min(stop, size), value.step))
+        else:
+            scaled.append(int(np.clip(round(value / factor), 0, size - 1)))
+    return tuple(scaled)
+
+
+class PrefetchPolicy:
+    """Decide which slices to speculatively load while the user scrubs.
+
+    Every key that a layer asks the ChunkLoader for is recorded. When the
+    recent keys show the user moving along one non-displayed axis in a
+    consistent direction, we predict the next few slices along that axis
+    and return keys for them so the ChunkLoader can load them early.
+
+    The faster the user is scrubbing the further ahead we look, up to
+    num_slices. For multiscale layers we also predict the next coarser
+    level at the current position, since zooming out needs it next.
+
+    Parameters
+    ----------
+    num_slices : int
+        The most slices we will prefetch ahead. Zero disables prefetch.
+    lookahead_ms : float
+        Prefetch as many slices as the user will reach in this time.
+
+    Attributes
+    ----------
+    history : Dict[int, Deque[HistoryEntry]]
+        The recent keys requested for each layer_id.
+    pending : Dict[int, PendingPrefetch]
+        Prefetches that have not been asked for yet, by key hash.
+    promoted : Set[int]
+        Key hashes that were asked for while still being prefetched.
+    lock : threading.Lock
+        Lock because loads complete in worker threads.
+    """
+
+    HISTORY_SIZE = 4  # Remember this many recent keys per layer.
+    MAX_PENDING = 256  # Remember this many unused prefetches.
+
+    def __init__(self, num_slices: int, lookahead_ms: float):
+        self.num_slices = num_slices
+        self.lookahead_seconds = lookahead_ms / 1000
+
+        self.history: Dict[int, Deque[HistoryEntry]] = {}
+        self.pending: Dict[int, PendingPrefetch] = {}
+        self.promoted: Set[int] = set()
+        self.lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Return True if we are prefetching at all."""
+        return self.num_slices > 0
+
+    def get_motion(self, layer_id: int) -> Optional[ScrubMotion]:
+        """Return how the user is scrubbing this layer, if they are.
+
+        Parameters
+        ----------
+        layer_id : int
+            The layer to check.
+
+        Returns
+        -------
+        Optional[ScrubMotion]
+            The motion or None if there is no consistent motion.
+        """
+        entries = list(self.history.get(layer_id, []))
+        if len(entries) < 2:
+            return None
+
+        motions = [
+            _get_motion(older, newer)
+            for older, newer in zip(entries[:-1], entries[1:])
+        ]
+
+        # Only the unbroken run of consistent motions at the end counts.
+        last = motions[-1]
+        if last is None:
+            return None
+        axis, step, _ = last
+
+        seconds = []
+        for motion in reversed(motions):
+            if motion is None or motion[0] != axis:
+                break
+            if np.sign(motion[1]) != np.sign(step):
+                break
+            seconds.append(motion[2])
+
+        average = sum(seconds) / len(seconds)
+        rate = 1 / average if average > 0 else math.inf
+        return ScrubMotion(axis, step, rate)
+
+    def is_jump(self, key: ChunkKey) -> bool:
+        """Return True if key is not where the recent motion was heading.
+
+        Parameters
+        ----------
+        key : ChunkKey
+            The key that was just requested.
+        """
+        motion = self.get_motion(key.layer_id)
+        if motion is None:
+            return False  # No prediction so nothing to jump away from.
+
+        latest = self.history[key.layer_id][-1]
+        if latest[1] == key:
+            return False  # Same key again, for example a refresh.
+
+        found = _get_motion(latest, (time.time(), key))
+        if found is None:
+            return True  # Different level, region or axis.
+
+        axis, step, _ = found
+        ahead = step * np.sign(motion.step)
+        max_ahead = (self.num_slices + 1) * abs(motion.step)
+        return axis != motion.axis or not 0 < ahead <= max_ahead
+
+    def record(self, key: ChunkKey) -> None:
+        """Record that this key was requested by its layer.
+
+        Parameters
+        ----------
+        key : ChunkKey
+            The key that was requested.
+        """
+        history = self.history.setdefault(
+            key.layer_id, deque(maxlen=self.HISTORY_SIZE)
+        )
+        if history and history[-1][1] == key:
+            return  # Same key again, for example a refresh.
+        history.append((time.time(), key))
+
+    def predict(self, layer, key: ChunkKey) -> List[Tuple[ChunkKey, tuple]]:
+        """Return the keys and indices we should prefetch next.
+
+        Parameters
+        ----------
+        layer : Layer
+            The layer that requested the key.
+        key : ChunkKey
+            The key the layer most recently requested.
+
+        Returns
+        -------
+        List[Tuple[ChunkKey, tuple]]
+            The keys to prefetch, nearest first, with their indices.
+        """
+        if not self.enabled or not isinstance(key.indices, tuple):
+            return []
+
+        predicted = []
+        motion = self.get_motion(key.layer_id)
+
+        if motion is not None:
+            size = _get_level_shape(layer, key.data_level)[motion.axis]
+            count = motion.rate * self.lookahead_seconds
+            count = int(np.clip(math.ceil(count), 1, self.num_slices))
+            position = int(key.indices[motion.axis])
+
+            for i in range(1, count + 1):
+                value = position + motion.step * i
+                if not 0 <= value < size:
+                    break
+                indices = _shift_indices(key.indices, motion.axis, value)
+                predicted.append(
+                    (ChunkKey(layer, indices, key.data_level), indices)
+                )
+
+        coarser = _get_coarser_indices(layer, key)
+        if coarser is not None:
+            level, indices = coarser
+            predicted.append((ChunkKey(layer, indices, level), indices))
+
+        return predicted
+
+    def add_pending(self, key: ChunkKey, future: Future) -> None:
+        """Note that key is being prefetched by this future.
+
+        Parameters
+        ----------
+        key : ChunkKey
+            The key we submitted for prefetch.
+        future : Future
+            The future that is loading the key.
+        """
+        with self.lock:
+            self.pending[key.key] = PendingPrefetch(key, future)
+
+            # Forget the oldest prefetches if none of them were ever used.
+            while len(self.pending) > self.MAX_PENDING:
+                del self.pending[next(iter(self.pending))]
+
+    def on_loaded(self, key: ChunkKey) -> None:
+        """The prefetch for this key finished loading.
+
+        Drop our reference to the future so we don't hold the loaded
+        chunks in memory, they are now in the cache.
+
+        Parameters
+        ----------
+        key : ChunkKey
+            The key that was loaded.
+        """
+        with self.lock:
+            if key.key in self.pending:
+                self.pending[key.key] = PendingPrefetch(key, None)
+
+    def is_pending(self, key: ChunkKey) -> bool:
+        """Return True if this key was prefetched but not yet used.
+
+        Parameters
+        ----------
+        key : ChunkKey
+            The key to check.
+        """
+        with self.lock:
+            return key.key in self.pending
+
+    def remove_pending(self, key: ChunkKey) -> Optional[PendingPrefetch]:
+        """Remove and return the pending prefetch for this key, if any.
+
+        Parameters
+        ----------
+        key : ChunkKey
+            The key that was used or discarded.
+        """
+        with self.lock:
+            return self.pending.pop(key.key, None)
+
+    def clear_pending(self, data_id: int) -> List[PendingPrefetch]:
+        """Forget all pending prefetches for this data_id.
+
+        Parameters
+        ----------
+        data_id : int
+            Clear prefetches for this data.
+
+        Returns
+        -------
+        List[PendingPrefetch]
+            The prefetches that were cleared.
+        """
+        with self.lock:
+            cleared = [
+                entry
+                for entry in self.pending.values()
+                if entry.key.data_id == data_id
+            ]
+            for entry in cleared:
+                del self.pending[entry.key.key]
+        return cleared
+
+    def promote(self, key: ChunkKey) -> bool:
+        """Promote the in-flight prefetch for key, return True if we did.
+
+        The layer asked for a key that is still being prefetched. Rather
+        than loading it a second time, we mark the prefetch as promoted so
+        it gets delivered to the layer when it finishes.
+
+        Parameters
+        ----------
+        key : ChunkKey
+            The key the layer asked for.
+        """
+        with self.lock:
+            entry = self.pending.get(key.key)
+            if entry is None or entry.future is None or entry.future.done():
+                return False
+            del self.pending[key.key]
+            self.promoted.add(key.key)
+            return True
+
+    def pop_promoted(self, key: ChunkKey) -> bool:
+        """Return True if key was promoted, clearing the promotion.
+
+        Only one caller will get True for each promotion, so the promoted
+        request is delivered exactly once.
+
+        Parameters
+        ----------
+        key : ChunkKey
+            The key to check.
+        """
+        with self.lock:
+            try:
+                self.promoted.remove(key.key)
+                return True
+            except KeyError:
+                return False
+
+    @property
+    def num_in_flight(self) -> int:
+        """Return how many prefetches have not finished loading."""
+        with self.lock:
+            return sum(
+                entry.future is not None for entry in self.pending.values()
+            )
+
+
+def _get_level_data(layer, data_level: int) -> ArrayLike:
+    """Return the array for this level of the layer's data."""
+    if getattr(layer, 'multiscale', False):
+        return layer.data[data_level]
+    return layer.data
+
+
+def _get_level_shape(layer, data_level: int) -> tuple:
+    """Return the shape of this level of the layer's data."""
+    return _get_level_data(layer, data_level).shape
+
+
+def _get_coarser_indices(layer, key: ChunkKey) -> Optional[tuple]:
+    """Return (level, indices) for the next coarser level, if any.
+
+    Parameters
+    ----------
+    layer : Layer
+        The layer the key is for.
+    key : ChunkKey
+        The key at the current level.
+    """
+    if not getattr(layer, 'multiscale', False):
+        return None
+
+    level = key.data_level + 1
+    if level >= len(layer.data):
+        return None
+
+    factors = (
+        layer.downsample_factors[level] / layer.downsample_factors[level - 1]
+    )
+    shape = _get_level_shape(layer, level)
+    return level, _scale_indices(key.indices, factors, shape)
+
+
+def get_prefetch_chunks(layer, key: ChunkKey, indices: tuple) -> dict:
+    """Return the chunks to load for a prefetch of this key.
+
+    Parameters
+    ----------
+    layer : Layer
+        The layer we are prefetching for.
+    key : ChunkKey
+        The key we are prefetching.
+    indices : tuple
+        The indices into the key's data level.
+    """
+    return {'image': _get_level_data(layer, key.data_level)[indices]}
@@ -1,15 +1,17 @@
 """ChunkKey and ChunkRequest classes.
 """
 import contextlib
+import hashlib
 import logging
-from typing import Optional, Tuple
+from enum import IntEnum
+from typing import NamedTuple, Optional, Tuple
 
 import numpy as np
 
 from ....layers.base.base import Layer
 from ....types import ArrayLike, Dict
 from ....utils.perf import PerfEvent, block_timer
-from ._utils import get_data_id
+from ._utils import get_data_id, get_stable_data_id
 
 LOGGER = logging.getLogger("napari.async")
 
@@ -31,6 +33,15 @@ def _flatten(indices) -> tuple:
     return tuple(result)
 
 
+class LoadPriority(IntEnum):
+    """How urgently a ChunkRequest should load, lower is more urgent."""
+
+    VISIBLE = 0  # Data for the slice the user is looking at.
+    THUMBNAIL = 1  # Data only used for the layer's thumbnail.
+    PREFETCH = 2  # Data we guess the user will look at next.
+    BACKGROUND = 3  # Data only used for statistics, never drawn.
+
+
 class ChunkKey:
     """The key for one single ChunkRequest.
 
@@ -40,6 +51,8 @@ class ChunkKey:
         The layer to load data for.
     indices : Indices
         The indices to load from the layer.
+    data_level : Optional[int]
+        The level to load, defaults to the layer's current level.
 
     Attributes
     ----------
@@ -51,12 +64,22 @@ class ChunkKey:
         The indices of the slice.
     key : Tuple
         The combined key, all the identifiers together.
+    stable_key : Optional[str]
+        Key that is the same every session, or None if the data has no
+        stable identity. Used by the disk cache.
     """
 
-    def __init__(self, layer: Layer, indices: Tuple[Optional[slice], ...]):
+    def __init__(
+        self,
+        layer: Layer,
+        indices: Tuple[Optional[slice], ...],
+        data_level: Optional[int] = None,
+    ):
         self.layer_id = id(layer)
         self.data_id = get_data_id(layer)
-        self.data_level = layer._data_level
+        self.data_level = (
+            layer._data_level if data_level is None else data_level
+        )
         self.indices = indices
 
         combined = (
@@ -66,6 +89,25 @@ class ChunkKey:
             _flatten(self.indices),
         )
         self.key = hash(combined)
+        self.stable_key = self._get_stable_key(layer)
+
+    def _get_stable_key(self, layer) -> Optional[str]:
+        """Return the key for the disk cache, or None if not stable.
+
+        Parameters
+        ----------
+        layer : Layer
+            The layer the key is for.
+        """
+        stable_data_id = get_stable_data_id(layer, self.data_level)
+        if stable_data_id is None:
+            return None
+
+        indices = tuple(
+            None if x is None else int(x) for x in _flatten(self.indices)
+        )
+        combined = repr((stable_data_id, self.data_level, indices))
+        return hashlib.sha1(combined.encode()).hexdigest()
 
     def __str__(self):
         return (
@@ -77,6 +119,21 @@ class ChunkKey:
         return self.key == other.key
 
 
+class ChunkTile(NamedTuple):
+    """One tile of a tiled ChunkRequest.
+
+    Attributes
+    ----------
+    key : ChunkKey
+        The tile is cached under this key, not the request's key.
+    offset : Tuple[int, ...]
+        Where the tile goes in the composited image.
+    """
+
+    key: ChunkKey
+    offset: Tuple[int, ...]
+
+
 class ChunkRequest:
     """A request asking the ChunkLoader to load one or more arrays.
 
@@ -86,6 +143,13 @@ class ChunkRequest:
         The key of the request.
     chunks : Dict[str, ArrayLike]
         The chunk arrays we need to load.
+    prefetch : bool
+        True if this is a speculative request nothing has asked for yet.
+    priority : Optional[LoadPriority]
+        How urgently to load, defaults to PREFETCH or VISIBLE.
+    tiles : Optional[Dict[str, ChunkTile]]
+        If given these chunks are tiles, which are cached one by one and
+        composited into the image chunk after loading.
 
     Attributes
     ----------
@@ -93,11 +157,27 @@ class ChunkRequest:
         The key of the request.
     chunks : Dict[str, ArrayLike]
         The chunk arrays we need to load.
+    prefetch : bool
+        True if this is a speculative request nothing has asked for yet.
+    priority : LoadPriority
+        How urgently to load.
+    stale : bool
+        True if nobody wants this request anymore, so once loaded it only
+        goes into the cache and is not delivered to the layer.
+    tiles : Optional[Dict[str, ChunkTile]]
+        The chunks which are tiles of the image, or None.
     timers : Dict[str, PerfEvent]
         Timing information about chunk load time.
     """
 
-    def __init__(self, key: ChunkKey, chunks: Dict[str, ArrayLike]):
+    def __init__(
+        self,
+        key: ChunkKey,
+        chunks: Dict[str, ArrayLike],
+        prefetch: bool = False,
+        priority: Optional[LoadPriority] = None,
+        tiles: Optional[Dict[str, ChunkTile]] = None,
+    ):
         # Make sure chunks dict is what we expect.
         for chunk_key, array in chunks.items():
             assert isinstance(chunk_key, str)
@@ -105,6 +185,14 @@ class ChunkRequest:
 
         self.key = key
         self.chunks = chunks
+        self.prefetch = prefetch
+        if priority is None:
+            priority = (
+                LoadPriority.PREFETCH if prefetch else LoadPriority.VISIBLE
+            )
+        self.priority = priority
+        self.stale = False
+        self.tiles = tiles
 
         self.timers: Dict[str, PerfEvent] = {}
 
@@ -156,6 +244,40 @@ class ChunkRequest:
                     loaded_array = np.asarray(array)
                     self.chunks[key] = loaded_array
 
+            if self.tiles:
+                with self.chunk_timer("composite_tiles"):
+                    self.chunks['image'] = self._composite_tiles()
+
+    def _composite_tiles(self) -> np.ndarray:
+        """Return our loaded tiles composited into one image.
+
+        Returns
+        -------
+        np.ndarray
+            The image, just big enough to hold all the tiles.
+        """
+        tiles = [
+            (self.chunks[name], tile.offset)
+            for name, tile in self.tiles.items()
+        ]
+        first, offset = tiles[0]
+        ndim = len(offset)
+
+        # Dimensions past the offset, like RGB, are the same in every tile.
+        shape = [
+            max(offset[i] + array.shape[i] for array, offset in tiles)
+            for i in range(ndim)
+        ]
+        image = np.empty(shape + list(first.shape[ndim:]), dtype=first.dtype)
+
+        for array, offset in tiles:
+            region = tuple(
+                slice(start, start + size)
+                for start, size in zip(offset, array.shape)
+            )
+            image[region] = array
+        return image
+
     def transpose_chunks(self, order: tuple) -> None:
         """Transpose all our chunks.
 
@@ -0,0 +1,153 @@
+"""LoadScheduler class.
+"""
+import heapq
+import itertools
+import logging
+import threading
+from concurrent.futures import CancelledError, Future
+from functools import partial
+from typing import Callable, List, Tuple
+
+from ....utils.perf import add_counter_event
+from ._request import ChunkRequest
+
+LOGGER = logging.getLogger("napari.async")
+
+# Heap entries sort by priority, then by submission order.
+HeapEntry = Tuple[int, int, ChunkRequest, "ChunkFuture"]
+
+
+class ChunkFuture(Future):
+    """A Future for a request waiting in the LoadScheduler.
+
+    Until the scheduler hands the request to the pool this future is
+    pending, so cancel() succeeds just like it would for a future queued
+    inside the pool. Once the request is running cancel() returns False.
+
+    Parameters
+    ----------
+    request : ChunkRequest
+        The request this future is for.
+    """
+
+    def __init__(self, request: ChunkRequest):
+        super().__init__()
+        self.request = request
+
+
+class LoadScheduler:
+    """Hands requests to the pool in priority order.
+
+    A ThreadPoolExecutor or ProcessPoolExecutor runs requests in the
+    order they were submitted. If we submitted everything directly, a
+    burst of prefetch or thumbnail requests would sit in front of the
+    request for the slice the user is looking at.
+
+    So instead we only give the pool as many requests as it has workers.
+    The rest wait in a heap, and every time a worker frees up we submit
+    the most urgent waiting request. Waiting requests can be cancelled
+    for free, since the pool has never seen them.
+
+    Parameters
+    ----------
+    executor : PoolExecutor
+        The pool to run requests in.
+    num_workers : int
+        How many requests the pool can run at once.
+    worker : Callable[[ChunkRequest], ChunkRequest]
+        The function the pool runs for each request.
+
+    Attributes
+    ----------
+    heap : List[HeapEntry]
+        The requests waiting for a worker, most urgent first.
+    num_running : int
+        How many requests the pool is running.
+    lock : threading.Lock
+        Requests finish in worker threads.
+    """
+
+    def __init__(self, executor, num_workers: int, worker: Callable):
+        self.executor = executor
+        self.num_workers = num_workers
+        self.worker = worker
+
+        self.heap: List[HeapEntry] = []
+        self.num_running = 0
+        self.counter = itertools.count()
+        self.lock = threading.Lock()
+
+    def submit(self, request: ChunkRequest) -> ChunkFuture:
+        """Schedule this request to load at its priority.
+
+        Parameters
+        ----------
+        request : ChunkRequest
+            The request to load.
+
+        Returns
+        -------
+        ChunkFuture
+            Finishes when the request was loaded or cancelled.
+        """
+        future = ChunkFuture(request)
+        entry = (request.priority, next(self.counter), request, future)
+
+        with self.lock:
+            heapq.heappush(self.heap, entry)
+
+        self._dispatch()
+        return future
+
+    @property
+    def num_waiting(self) -> int:
+        """Return how many requests are waiting for a worker."""
+        with self.lock:
+            return len(self.heap)
+
+    def _dispatch(self) -> None:
+        """Submit the most urgent waiting requests while we have workers."""
+        while True:
+            with self.lock:
+                if self.num_running >= self.num_workers or not self.heap:
+                    break
+                _, _, request, future = heapq.heappop(self.heap)
+
+                # False if the future was cancelled while waiting.
+                if not future.set_running_or_notify_cancel():
+                    continue
+                self.num_running += 1
+                num_waiting = len(self.heap)
+
+            LOGGER.debug("LoadScheduler._dispatch: %s", request.key)
+            add_counter_event("load_scheduler", waiting=num_waiting)
+
+            pool_future = self.executor.submit(self.worker, request)
+            pool_future.add_done_callback(partial(self._on_done, future))
+
+    def _on_done(self, future: ChunkFuture, pool_future: Future) -> None:
+        """A request finished in the pool, pass along its result.
+
+        Parameters
+        ----------
+        future : ChunkFuture
+            The future we gave out for the request.
+        pool_future : Future
+            The pool's future for the request.
+        """
+        with self.lock:
+            self.num_running -= 1
+
+        # Free up the worker before anyone looks at the result.
+        self._dispatch()
+
+        if pool_future.cancelled():
+            # We never cancel pool futures, but shutting down can.
+            future.set_exception(CancelledError())
+            return
+
+        exception = pool_future.exception()
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(pool_future.result())
@@ -0,0 +1,40 @@
+"""Tests for components.experimental.chunk._cache."""
+import numpy as np
+
+from napari.components.experimental.chunk import ChunkKey, ChunkRequest
+from napari.components.experimental.chunk._cache import ChunkCache
+from napari.layers.image import Image
+from napari.utils.memory_budget import memory_budget
+
+
+def test_chunk_cache_budget():
+    """ChunkCache evicts least recently used chunks to fit the budget."""
+    layer = Image(np.zeros((4, 8, 8)))
+    cache = ChunkCache()
+    previous = memory_budget.max_bytes
+
+    try:
+        requests = [
+            ChunkRequest(
+                ChunkKey(layer, (i, slice(None), slice(None))),
+                {'image': np.zeros((8, 8), dtype=np.uint8)},
+            )
+            for i in range(4)
+        ]
+        memory_budget.resize(64 * 3)
+
+        for request in requests[:3]:
+            cache.add_chunks(request)
+        assert cache.layer_bytes(layer) == 64 * 3
+
+        # Touch the first one so the second is least recently used.
+        assert cache.get_chunks(requests[0]) is not None
+        cache.add_chunks(requests[3])
+
+        assert cache.nbytes == 64 * 3
+        assert cache.get_chunks(requests[1]) is None
+        assert cache.get_chunks(requests[0]) is not None
+        assert cache.get_chunks(requests[3]) is not None
+    finally:
+        memory_budget.unregister(cache)
+        memory_budget.resize(previous)
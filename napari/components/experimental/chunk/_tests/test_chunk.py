@@ -2,7 +2,12 @@
 import numpy as np
 import pytest
 
-from napari.components.experimental.chunk import ChunkKey, chunk_loader
+from napari.components.experimental.chunk import (
+    ChunkKey,
+    ChunkRequest,
+    LoadPriority,
+    chunk_loader,
+)
 from napari.layers.image import Image
 from napari.utils import config
 
@@ -92,3 +97,48 @@ def test_loader():
     # Test transpose_chunks()
     request.transpose_chunks((1, 0))
     assert request.image.shape == transpose_shape
+
+
+def test_load_from_cache_partial():
+    """Test a cache hit missing a lazy chunk is loaded in a worker."""
+    da = pytest.importorskip('dask.array')
+    layer = _create_layer()
+    key = ChunkKey(layer, (0, 0))
+    image = np.random.random((4, 4))
+    cached = ChunkRequest(key, {'image': image})
+    chunk_loader.cache.add_chunks(cached)
+
+    # The cache has the image, but not the thumbnail_source.
+    thumbnail_source = da.zeros((2, 2))
+    request = ChunkRequest(
+        key, {'image': da.zeros((4, 4)), 'thumbnail_source': thumbnail_source}
+    )
+    assert chunk_loader._load_from_cache(request) is None
+    assert request.chunks['image'] is image
+    assert request.chunks['thumbnail_source'] is thumbnail_source
+
+    request = ChunkRequest(key, {'image': da.zeros((4, 4))})
+    assert chunk_loader._load_from_cache(request) is request
+    assert request.chunks['image'] is image
+
+
+def test_load_thumbnail(monkeypatch):
+    """Test thumbnails load async at thumbnail priority."""
+    da = pytest.importorskip('dask.array')
+    layer = _create_layer()
+    queued = []
+    monkeypatch.setattr(chunk_loader.delay_queue, 'add', queued.append)
+    monkeypatch.setattr(chunk_loader, '_load_synchronously', lambda r: False)
+
+    key = ChunkKey(layer, (1, 0))
+    request = chunk_loader.create_request(layer, key, {'image': da.zeros(4)})
+    assert chunk_loader.load_thumbnail(request) is None
+    assert queued == [request]
+    assert request.priority == LoadPriority.THUMBNAIL
+
+    # Once cached it loads right away.
+    chunk_loader.cache.add_chunks(ChunkRequest(key, {'image': np.ones(4)}))
+    request = chunk_loader.create_request(layer, key, {'image': da.zeros(4)})
+    assert chunk_loader.load_thumbnail(request) is request
+    np.testing.assert_array_equal(request.image, np.ones(4))
+    assert len(queued) == 1
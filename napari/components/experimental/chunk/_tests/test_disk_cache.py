@@ -0,0 +1,109 @@
+"""Tests for components.experimental.chunk._disk_cache."""
+import subprocess
+import sys
+
+import dask.array as da
+import numpy as np
+import zarr
+
+from napari.components.experimental.chunk import ChunkKey, ChunkRequest
+from napari.components.experimental.chunk._cache import ChunkCache
+from napari.components.experimental.chunk._disk_cache import DiskCache
+from napari.layers.image import Image
+from napari.utils.memory_budget import memory_budget
+
+ALL = slice(None)
+
+
+STABLE_KEY_SCRIPT = """
+import sys
+import dask.array as da
+from napari.components.experimental.chunk import ChunkKey
+from napari.layers.image import Image
+data = da.from_zarr(sys.argv[1], component='0')
+print(ChunkKey(Image(data), (1, slice(None), slice(None))).stable_key)
+"""
+
+
+def _stable_key_in_subprocess(path):
+    """Return the stable key of the zarr data as computed in a new session."""
+    result = subprocess.run(
+        [sys.executable, '-c', STABLE_KEY_SCRIPT, str(path)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return result.stdout.strip().splitlines()[-1]
+
+
+def test_stable_key(tmp_path):
+    """Zarr data opened again in a new session has the same key."""
+    path = tmp_path / 'data.zarr'
+    group = zarr.open_group(str(path), mode='w')
+    group.create_dataset('0', shape=(4, 8, 8), chunks=(1, 8, 8), dtype='f4')
+
+    data = da.from_zarr(str(path), component='0')
+    key1 = ChunkKey(Image(data), (1, ALL, ALL))
+    assert key1.stable_key is not None
+    assert key1.stable_key == _stable_key_in_subprocess(path)
+    assert key1.stable_key != ChunkKey(Image(data), (2, ALL, ALL)).stable_key
+
+    # Data derived from the store, or without a store, has no stable key.
+    assert ChunkKey(Image(data + 1), (1, ALL, ALL)).stable_key is None
+    data = da.ones((4, 8, 8), chunks=(1, 8, 8))
+    assert ChunkKey(Image(data), (1, ALL, ALL)).stable_key is None
+    assert (
+        ChunkKey(Image(np.ones((4, 8, 8))), (1, ALL, ALL)).stable_key is None
+    )
+
+
+def test_disk_cache_persists(tmp_path):
+    """Entries written in one session are read back in the next."""
+    chunks = {'image': np.arange(64).reshape(8, 8)}
+    cache = DiskCache(tmp_path, max_bytes=1e6)
+    cache.add_chunks("key1", chunks)
+    assert cache.nbytes > 0
+
+    reopened = DiskCache(tmp_path, max_bytes=1e6)
+    assert reopened.nbytes == cache.nbytes
+    result = reopened.get_chunks("key1")
+    assert isinstance(result['image'], np.memmap)
+    np.testing.assert_array_equal(result['image'], chunks['image'])
+    assert reopened.get_chunks("missing") is None
+
+
+def test_disk_cache_evicts_lru(tmp_path):
+    """The least recently used entries are evicted to fit max_bytes."""
+    chunks = {'image': np.zeros((32, 32), dtype=np.uint8)}
+    cache = DiskCache(tmp_path, max_bytes=1e6)
+    cache.add_chunks("a", chunks)
+    entry_bytes = cache.nbytes
+    cache.max_bytes = entry_bytes * 2
+
+    cache.add_chunks("b", chunks)
+    cache.get_chunks("a")  # Now "b" is least recently used.
+    cache.add_chunks("c", chunks)
+
+    assert list(cache.index) == ["a", "c"]
+    assert not (tmp_path / "b").exists()
+    assert cache.nbytes == entry_bytes * 2
+
+
+def test_chunk_cache_disk_tier(tmp_path):
+    """A memory miss is served from the disk cache."""
+    path = str(tmp_path / 'data.zarr')
+    zarr.zeros((4, 8, 8), chunks=(1, 8, 8), store=path)
+    layer = Image(da.from_zarr(path))
+    key = ChunkKey(layer, (1, ALL, ALL))
+    chunks = {'image': np.full((8, 8), 7)}
+
+    cache = ChunkCache(DiskCache(tmp_path / 'cache', max_bytes=1e6))
+    cache.add_chunks(ChunkRequest(key, chunks))
+    memory_budget.unregister(cache)
+
+    # A new memory cache finds the chunks on disk.
+    cache = ChunkCache(DiskCache(tmp_path / 'cache', max_bytes=1e6))
+    result = cache.get_chunks(ChunkRequest(key, {}))
+    np.testing.assert_array_equal(result['image'], 7)
+    assert cache.nbytes == chunks['image'].nbytes
+    memory_budget.unregister(cache)
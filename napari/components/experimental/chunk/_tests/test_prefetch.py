@@ -0,0 +1,97 @@
+"""Tests for components.experimental.chunk._prefetch."""
+import numpy as np
+
+from napari.components.experimental.chunk import ChunkKey
+from napari.components.experimental.chunk._info import LoadStats
+from napari.components.experimental.chunk._prefetch import PrefetchPolicy
+from napari.layers.image import Image
+
+ALL = slice(None)
+
+
+def _scrub(policy, layer, positions):
+    """Record keys for the given positions along axis 0."""
+    for pos in positions:
+        policy.record(ChunkKey(layer, (pos, ALL, ALL)))
+
+
+def test_predict_forward():
+    """Scrubbing forward predicts the next slices."""
+    layer = Image(np.zeros((20, 8, 8)))
+    policy = PrefetchPolicy(num_slices=3, lookahead_ms=1000)
+
+    _scrub(policy, layer, [4, 5, 6])
+    motion = policy.get_motion(id(layer))
+    assert motion.axis == 0
+    assert motion.step == 1
+
+    key = ChunkKey(layer, (6, ALL, ALL))
+    predicted = policy.predict(layer, key)
+    assert [indices[0] for _, indices in predicted] == [7, 8, 9]
+    assert predicted[0][0] == ChunkKey(layer, (7, ALL, ALL))
+
+
+def test_predict_backward_clipped():
+    """Scrubbing backward stops at the start of the data."""
+    layer = Image(np.zeros((20, 8, 8)))
+    policy = PrefetchPolicy(num_slices=4, lookahead_ms=1000)
+
+    _scrub(policy, layer, [6, 4, 2])
+    key = ChunkKey(layer, (2, ALL, ALL))
+    predicted = policy.predict(layer, key)
+    assert [indices[0] for _, indices in predicted] == [0]
+
+
+def test_no_motion():
+    """No prediction until the user has moved consistently."""
+    layer = Image(np.zeros((20, 8, 8)))
+    policy = PrefetchPolicy(num_slices=4, lookahead_ms=1000)
+
+    _scrub(policy, layer, [3])
+    assert policy.get_motion(id(layer)) is None
+    assert policy.predict(layer, ChunkKey(layer, (3, ALL, ALL))) == []
+
+    # Reversing direction is not a consistent motion yet.
+    _scrub(policy, layer, [4, 3])
+    assert policy.get_motion(id(layer)).step == -1
+
+
+def test_is_jump():
+    """Moving outside the predicted window is a jump."""
+    layer = Image(np.zeros((20, 8, 8)))
+    policy = PrefetchPolicy(num_slices=2, lookahead_ms=1000)
+
+    _scrub(policy, layer, [1, 2])
+    assert not policy.is_jump(ChunkKey(layer, (2, ALL, ALL)))
+    assert not policy.is_jump(ChunkKey(layer, (3, ALL, ALL)))
+    assert not policy.is_jump(ChunkKey(layer, (5, ALL, ALL)))
+    assert policy.is_jump(ChunkKey(layer, (6, ALL, ALL)))
+    assert policy.is_jump(ChunkKey(layer, (1, ALL, ALL)))
+
+
+def test_predict_coarser_level():
+    """Multiscale layers also prefetch the next coarser level."""
+    data = [np.zeros((10, 64, 64)), np.zeros((10, 32, 32))]
+    layer = Image(data, multiscale=True)
+    policy = PrefetchPolicy(num_slices=1, lookahead_ms=1000)
+
+    key = ChunkKey(layer, (3, slice(0, 64, 1), slice(0, 64, 1)), 0)
+    predicted = policy.predict(layer, key)
+    assert len(predicted) == 1
+
+    coarser, indices = predicted[0]
+    assert coarser.data_level == 1
+    assert indices == (3, slice(0, 32, 1), slice(0, 32, 1))
+
+
+def test_prefetch_stats():
+    """Hit rate and wasted bytes are tracked in LoadStats."""
+    stats = LoadStats()
+    assert stats.prefetch.hit_rate == 0
+
+    stats.prefetch.requests = 4
+    stats.prefetch.bytes = 400
+    stats.on_prefetch_hit(100)
+
+    assert stats.prefetch.hit_rate == 0.25
+    assert stats.prefetch.wasted_bytes == 300
@@ -0,0 +1,74 @@
+"""Tests for components.experimental.chunk._scheduler."""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from napari.components.experimental.chunk import (
+    ChunkKey,
+    ChunkRequest,
+    LoadPriority,
+)
+from napari.components.experimental.chunk._scheduler import LoadScheduler
+from napari.layers.image import Image
+
+
+def _create_request(layer, index, priority):
+    key = ChunkKey(layer, (index, slice(None), slice(None)))
+    return ChunkRequest(key, {'image': np.zeros((4, 4))}, priority=priority)
+
+
+def test_priority_order():
+    """The most urgent waiting request runs next."""
+    layer = Image(np.zeros((8, 4, 4)))
+    release = threading.Event()
+    order = []
+
+    def worker(request):
+        release.wait()
+        order.append(request.key.indices[0])
+        return request
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    scheduler = LoadScheduler(executor, 1, worker)
+
+    # The first request occupies the only worker.
+    first = scheduler.submit(_create_request(layer, 0, LoadPriority.VISIBLE))
+    futures = [
+        scheduler.submit(_create_request(layer, 1, LoadPriority.BACKGROUND)),
+        scheduler.submit(_create_request(layer, 2, LoadPriority.PREFETCH)),
+        scheduler.submit(_create_request(layer, 3, LoadPriority.VISIBLE)),
+    ]
+    assert scheduler.num_waiting == 3
+
+    release.set()
+    first.result()
+    for future in futures:
+        future.result()
+
+    assert order == [0, 3, 2, 1]
+    executor.shutdown()
+
+
+def test_cancel_waiting():
+    """Waiting requests can be cancelled, running ones cannot."""
+    layer = Image(np.zeros((8, 4, 4)))
+    release = threading.Event()
+
+    def worker(request):
+        release.wait()
+        return request
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    scheduler = LoadScheduler(executor, 1, worker)
+
+    running = scheduler.submit(_create_request(layer, 0, 0))
+    waiting = scheduler.submit(_create_request(layer, 1, 0))
+
+    assert not running.cancel()
+    assert waiting.cancel()
+
+    release.set()
+    assert running.result().key.indices[0] == 0
+    assert waiting.cancelled()
+    executor.shutdown()
@@ -1,7 +1,9 @@
 """ChunkLoader utilities.
 """
+import os
 from typing import Optional
 
+import dask.array as da
 import numpy as np
 
 
@@ -27,6 +29,111 @@ def get_data_id(layer) -> int:
     return id(data)  # Not a list, just use it.
 
 
+def _get_zarr_source(data: da.Array):
+    """Return the zarr array that data reads directly, or None.
+
+    Parameters
+    ----------
+    data : da.Array
+        The dask array, for example from ``da.from_zarr``.
+
+    Notes
+    -----
+    Only graphs that just read the source are accepted. A derived array,
+    such as ``data + 1``, reads the same source but has other values.
+    """
+    layers = data.dask.layers
+    if not set(layers) <= {data.name, 'original-' + data.name}:
+        return None
+
+    candidates = []
+    for layer in layers.values():
+        if hasattr(layer, 'indices'):  # Blockwise, inline_array=True
+            candidates.extend(arg for arg, _ in layer.indices)
+        else:
+            candidates.extend(layer.values())
+
+    sources = [
+        x for x in candidates if hasattr(x, 'store') and hasattr(x, 'path')
+    ]
+    return sources[0] if len(sources) == 1 else None
+
+
+def _get_store_url(store) -> Optional[str]:
+    """Return the path or URL of a zarr store, or None if it has none.
+
+    Parameters
+    ----------
+    store
+        The zarr store, for example a DirectoryStore or FSStore.
+    """
+    path = getattr(store, 'path', None)
+    if not isinstance(path, str):
+        return None  # For example an in-memory store.
+
+    fs = getattr(store, 'fs', None)
+    protocol = getattr(fs, 'protocol', None)
+    if isinstance(protocol, (tuple, list)):
+        protocol = protocol[0]
+    if protocol is None or protocol in ('file', 'local'):
+        return os.path.abspath(path)
+    return f"{protocol}://{path}"
+
+
+def get_stable_data_id(layer, data_level: int = 0) -> Optional[str]:
+    """Return an id for the layer's data that is the same every session.
+
+    Parameters
+    ----------
+    layer
+        The layer to get the stable id from.
+    data_level : int
+        The level of multiscale data to get the id for.
+
+    Returns
+    -------
+    Optional[str]
+        The id, or None if the data has no stable identity.
+
+    Notes
+    -----
+    Dask names can not be used, since the name ``da.from_zarr`` gives
+    depends on the zarr array object and so changes every session. Instead
+    the id is built from where the data is stored, the store path or URL
+    and the component within it, along with the shape, dtype and chunks of
+    the level. Only dask arrays that read a zarr array directly have such
+    an identity. In-memory data does not, but it also has nothing to gain
+    from a disk cache.
+    """
+    data = layer.data
+    if isinstance(data, list):
+        if not data:
+            return None
+        data = data[data_level]
+
+    if not isinstance(data, da.Array):
+        return None
+
+    source = _get_zarr_source(data)
+    if source is None:
+        return None
+
+    url = _get_store_url(source.store)
+    if url is None:
+        return None
+
+    return repr(
+        (
+            url,
+            source.path,
+            data.shape,
+            data.dtype.str,
+            data.chunks,
+            data_level,
+        )
+    )
+
+
 class StatWindow:
     """Average value over a rolling window.
 
@@ -66,6 +66,9 @@ class ImageSlice:
         self.rgb = rgb
         self.loader = _create_loader_class()
 
+        # True once a thumbnail source loaded separately from the image.
+        self._has_thumbnail_source = False
+
         # With async there can be a gap between when the ImageSlice is
         # created and the data is actually loaded. However initialize
         # as True in case we aren't even doing async loading.
@@ -85,16 +88,30 @@ class ImageSlice:
         thumbnail : ArrayLike
             Derive the thumbnail from this image.
         """
-        # Single scale images don't have a separate thumbnail so we just
-        # use the image itself.
-        if thumbnail_source is None:
-            thumbnail_source = image
-
         if self.rgb and image.dtype.kind == 'f':
             image = np.clip(image, 0, 1)
-            thumbnail_source = np.clip(thumbnail_source, 0, 1)
         self.image.raw = image
+
+        if thumbnail_source is not None:
+            self.set_thumbnail_source(thumbnail_source)
+        elif not self._has_thumbnail_source:
+            # Single scale images don't have a separate thumbnail so we
+            # just use the image itself. So do multiscale images until
+            # their thumbnail source loads.
+            self.thumbnail.raw = image
+
+    def set_thumbnail_source(self, thumbnail_source: ArrayLike) -> None:
+        """Set the image the thumbnail is derived from.
+
+        Parameters
+        ----------
+        thumbnail_source : ArrayLike
+            Derive the thumbnail from this image.
+        """
+        if self.rgb and thumbnail_source.dtype.kind == 'f':
+            thumbnail_source = np.clip(thumbnail_source, 0, 1)
         self.thumbnail.raw = thumbnail_source
+        self._has_thumbnail_source = True
 
     def load(self, data: ImageSliceData) -> bool:
         """Load this data into the slice.
@@ -24,6 +24,9 @@ class ImageSliceData:
         The image to display in the slice.
     thumbnail_source : ArrayList
         The source used to create the thumbnail for the slice.
+    thumbnail_indices : Optional[Tuple[Optional[slice], ...]]
+        The indices of the thumbnail source in the thumbnail level, if the
+        thumbnail source is not the image itself.
     """
 
     def __init__(
@@ -32,11 +35,13 @@ class ImageSliceData:
         indices: Tuple[Optional[slice], ...],
         image: ArrayLike,
         thumbnail_source: ArrayLike,
+        thumbnail_indices: Optional[Tuple[Optional[slice], ...]] = None,
     ):
         self.layer = layer
         self.indices = indices
         self.image = image
         self.thumbnail_source = thumbnail_source
+        self.thumbnail_indices = thumbnail_indices
 
     def load_sync(self) -> None:
         """Call asarray on our images to load them."""
@@ -31,3 +31,16 @@ def test_image_slice():
     assert id(image_slice.thumbnail.raw) == id(image4)
     assert np.all(image_slice.image.view == image3 * 2)
     assert np.all(image_slice.thumbnail.view == image4 * 2)
+
+
+def test_image_slice_thumbnail_source():
+    """Test a separately loaded thumbnail source is kept."""
+    image1 = np.random.random((32, 16))
+    image2 = np.random.random((8, 4))
+    image_slice = ImageSlice(np.zeros((1, 1)), _converter)
+
+    # The thumbnail source loaded before the image.
+    image_slice.set_thumbnail_source(image2)
+    image_slice._set_raw_images(image1, None)
+    assert id(image_slice.image.raw) == id(image1)
+    assert id(image_slice.thumbnail.raw) == id(image2)
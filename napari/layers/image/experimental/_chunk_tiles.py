@@ -0,0 +1,138 @@
+"""Split a multiscale slice into tiles aligned to the data's chunks.
+
+If we request one rectangle for the whole view, panning by a few pixels
+changes the rectangle, so we fetch everything again. Instead we grow the
+view to the chunk grid of the level and request each chunk as its own
+tile. Each tile is cached under its own ChunkKey, so after a pan only the
+newly exposed tiles need to be fetched.
+"""
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ....types import ArrayLike
+
+
+class SliceTile(NamedTuple):
+    """One tile of a slice.
+
+    Attributes
+    ----------
+    name : str
+        The name of the tile's chunk in the ChunkRequest.
+    indices : tuple
+        The indices of the tile in the level.
+    offset : Tuple[int, int]
+        Where the tile goes in the composited image.
+    """
+
+    name: str
+    indices: tuple
+    offset: Tuple[int, int]
+
+
+def get_chunk_bounds(array: ArrayLike, axis: int) -> Optional[np.ndarray]:
+    """Return where each chunk starts along this axis, plus the end.
+
+    Parameters
+    ----------
+    array : ArrayLike
+        A dask or zarr array.
+    axis : int
+        The axis to return the chunk bounds of.
+
+    Returns
+    -------
+    Optional[np.ndarray]
+        The bounds or None if the array is not chunked.
+    """
+    chunks = getattr(array, 'chunks', None)
+    if chunks is None:
+        return None
+
+    size = array.shape[axis]
+    if isinstance(chunks[axis], tuple):
+        # Dask lists the size of every chunk.
+        return np.cumsum((0,) + chunks[axis])
+
+    # Zarr has one chunk size for the whole axis.
+    return np.append(np.arange(0, size, chunks[axis]), size)
+
+
+def snap_corners_to_chunks(
+    array: ArrayLike, corners: np.ndarray, displayed: Sequence[int]
+) -> np.ndarray:
+    """Return the corners grown outwards to the array's chunk grid.
+
+    Parameters
+    ----------
+    array : ArrayLike
+        The level we are slicing.
+    corners : np.ndarray
+        The (2, ndim) first and last pixel we need to show.
+    displayed : Sequence[int]
+        The displayed axes, only these are snapped.
+
+    Returns
+    -------
+    np.ndarray
+        The snapped corners, unchanged if the array is not chunked.
+    """
+    corners = np.array(corners)
+    for axis in displayed:
+        bounds = get_chunk_bounds(array, axis)
+        if bounds is None:
+            continue
+        first = np.searchsorted(bounds, corners[0, axis], side='right') - 1
+        last = np.searchsorted(bounds, corners[1, axis], side='right')
+        corners[0, axis] = bounds[max(first, 0)]
+        corners[1, axis] = bounds[min(last, len(bounds) - 1)] - 1
+    return corners
+
+
+def get_slice_tiles(
+    array: ArrayLike, indices: tuple, displayed: Sequence[int]
+) -> Optional[List[SliceTile]]:
+    """Return the chunk aligned tiles which cover this slice.
+
+    Parameters
+    ----------
+    array : ArrayLike
+        The level we are slicing.
+    indices : tuple
+        The slice, with a slice object for each displayed axis.
+    displayed : Sequence[int]
+        The displayed axes.
+
+    Returns
+    -------
+    Optional[List[SliceTile]]
+        The tiles, or None if the array is not chunked.
+    """
+    # Indexing leaves the displayed axes in data order.
+    row_axis, col_axis = sorted(displayed)
+
+    spans = []
+    for axis in (row_axis, col_axis):
+        bounds = get_chunk_bounds(array, axis)
+        if bounds is None:
+            return None
+        start, stop, _ = indices[axis].indices(array.shape[axis])
+        inside = bounds[(bounds > start) & (bounds < stop)]
+        edges = [start] + inside.tolist() + [stop]
+        spans.append(list(zip(edges[:-1], edges[1:])))
+
+    tiles = []
+    for row_start, row_stop in spans[0]:
+        for col_start, col_stop in spans[1]:
+            tile_indices = list(indices)
+            tile_indices[row_axis] = slice(row_start, row_stop, 1)
+            tile_indices[col_axis] = slice(col_start, col_stop, 1)
+            tiles.append(
+                SliceTile(
+                    f"tile.{row_start}.{col_start}",
+                    tuple(tile_indices),
+                    (row_start - spans[0][0][0], col_start - spans[1][0][0]),
+                )
+            )
+    return tiles
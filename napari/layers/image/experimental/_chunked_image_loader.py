@@ -3,7 +3,7 @@
 import logging
 from typing import Optional
 
-from ....components.experimental.chunk import ChunkKey
+from ....components.experimental.chunk import ChunkKey, ChunkRequest
 from .._image_loader import ImageLoader
 from ._chunked_slice_data import ChunkedSliceData
 
@@ -17,11 +17,15 @@ class ChunkedImageLoader(ImageLoader):
     ----------
     current_key : Optional[ChunkKey]
         The ChunkKey we are currently loading or showing.
+    thumbnail_key : Optional[ChunkKey]
+        The ChunkKey of the thumbnail source we are loading, if it loads
+        asynchronously.
     """
 
     def __init__(self):
         # We're showing nothing to start.
         self.current_key: Optional[ChunkKey] = None
+        self.thumbnail_key: Optional[ChunkKey] = None
 
     def load(self, data: ChunkedSliceData) -> bool:
         """Load this ChunkedSliceData (sync or async).
@@ -47,10 +51,12 @@ class ChunkedImageLoader(ImageLoader):
         # Now "showing" this slice, even if it hasn't loaded yet.
         self.current_key = key
 
-        if data.load_chunks(key):
-            return True  # Load was sync, load is done.
+        loaded = data.load_chunks(key)
 
-        return False  # Load was async, so not loaded yet.
+        if data.thumbnail_request is not None:
+            self.thumbnail_key = data.thumbnail_request.key
+
+        return loaded
 
     def match(self, data: ChunkedSliceData) -> bool:
         """Return True if slice data matches what we are loading.
@@ -76,3 +82,18 @@ class ChunkedImageLoader(ImageLoader):
         # should get into the cache, so the load wasn't totally wasted.
         LOGGER.debug("ChunkedImageLoader.match: reject %s", key)
         return False
+
+    def match_thumbnail(self, request: ChunkRequest) -> bool:
+        """Return True if this is the thumbnail source we are loading.
+
+        Parameters
+        ----------
+        request : ChunkRequest
+            The thumbnail request that was loaded.
+
+        Return
+        ------
+        bool
+            Return True if request matches.
+        """
+        return self.thumbnail_key == request.key
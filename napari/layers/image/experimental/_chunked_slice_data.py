@@ -1,16 +1,19 @@
 """ChunkedSliceData class.
 """
 import logging
-from typing import Optional
+from typing import Dict, Optional
 
 from ....components.experimental.chunk import (
     ChunkKey,
     ChunkRequest,
+    ChunkTile,
+    async_config,
     chunk_loader,
 )
 from ....types import ArrayLike
 from ...base import Layer
 from .._image_slice_data import ImageSliceData
+from ._chunk_tiles import get_slice_tiles
 
 LOGGER = logging.getLogger("napari.async")
 
@@ -28,8 +31,16 @@ class ChunkedSliceData(ImageSliceData):
         The image to display in the slice.
     thumbnail_source : ArrayList
         The source used to create the thumbnail for the slice.
+    thumbnail_indices : Optional[tuple]
+        The indices of the thumbnail source in the thumbnail level.
     request : Optional[ChunkRequest]
         The ChunkRequest that was used to load this data.
+
+    Attributes
+    ----------
+    thumbnail_request : Optional[ChunkRequest]
+        The request for the thumbnail source if it is loading
+        asynchronously, otherwise None.
     """
 
     def __init__(
@@ -38,9 +49,12 @@ class ChunkedSliceData(ImageSliceData):
         indices,
         image: ArrayLike,
         thumbnail_source: ArrayLike,
+        thumbnail_indices: Optional[tuple] = None,
         request: Optional[ChunkRequest] = None,
     ):
-        super().__init__(layer, indices, image, thumbnail_source)
+        super().__init__(
+            layer, indices, image, thumbnail_source, thumbnail_indices
+        )
 
         # When ChunkedSliceData is first created self.request is
         # None, it will get set one of two ways:
@@ -53,6 +67,7 @@ class ChunkedSliceData(ImageSliceData):
         #    classmethod. It will set the completed self.request.
         #
         self.request = request
+        self.thumbnail_request: Optional[ChunkRequest] = None
 
     def load_chunks(self, key: ChunkKey) -> bool:
         """Load this slice data's chunks sync or async.
@@ -67,26 +82,103 @@ class ChunkedSliceData(ImageSliceData):
         bool
             True if chunks were loaded synchronously.
         """
-        # Always load the image.
-        chunks = {'image': self.image}
-
-        # Optionally load the thumbnail_source if it exists.
-        if self.thumbnail_source is not None:
-            chunks['thumbnail_source'] = self.thumbnail_source
+        # Load the image in tiles if we can, otherwise in one piece.
+        tiles = self._get_tiles()
+        if tiles is None:
+            chunks = {'image': self.image}
+        else:
+            chunks = self._get_tile_chunks(tiles)
 
         # Create the ChunkRequest and load it with the ChunkLoader.
-        self.request = chunk_loader.create_request(self.layer, key, chunks)
+        self.request = chunk_loader.create_request(
+            self.layer, key, chunks, tiles
+        )
         satisfied_request = chunk_loader.load_chunk(self.request)
 
+        # Load the thumbnail_source if it exists, in its own request so it
+        # does not hold up the image.
+        if self.thumbnail_source is not None:
+            self._load_thumbnail()
+
         if satisfied_request is None:
             return False  # Load was async.
 
         # Load was sync.
         self.request = satisfied_request
         self.image = self.request.chunks.get('image')
-        self.thumbnail_image = self.request.chunks.get('thumbnail_source')
         return True
 
+    def _load_thumbnail(self) -> None:
+        """Load the thumbnail_source sync or async.
+
+        If the load is async the image is used as the thumbnail_source
+        until the thumbnail request is delivered to the layer.
+        """
+        layer = self.layer
+        key = ChunkKey(layer, self.thumbnail_indices, layer._thumbnail_level)
+        request = chunk_loader.create_request(
+            layer, key, {'image': self.thumbnail_source}
+        )
+        satisfied_request = chunk_loader.load_thumbnail(request)
+
+        if satisfied_request is None:
+            self.thumbnail_source = None
+            self.thumbnail_request = request
+        else:
+            self.thumbnail_source = satisfied_request.image
+
+    def _get_tiles(self) -> Optional[Dict[str, ChunkTile]]:
+        """Return the tiles to load the image in, or None.
+
+        We only tile 2D views of multiscale images, where the view is a
+        region of the level and panning would otherwise load the whole
+        region again.
+        """
+        layer = self.layer
+        if not (
+            async_config.multiscale_tiles
+            and layer.multiscale
+            and layer._dims.ndisplay == 2
+        ):
+            return None
+
+        level = layer.data_level
+        slice_tiles = get_slice_tiles(
+            layer.data[level], tuple(self.indices), layer._dims.displayed
+        )
+        if slice_tiles is None:
+            return None  # Data is not chunked.
+
+        return {
+            tile.name: ChunkTile(
+                ChunkKey(layer, tile.indices, level), tile.offset
+            )
+            for tile in slice_tiles
+        }
+
+    def _get_tile_chunks(
+        self, tiles: Dict[str, ChunkTile]
+    ) -> Dict[str, ArrayLike]:
+        """Return the chunks to load for these tiles.
+
+        Tiles we already have in the cache are passed in loaded, so only
+        the new tiles are fetched.
+
+        Parameters
+        ----------
+        tiles : Dict[str, ChunkTile]
+            The tiles of the image.
+        """
+        level_data = self.layer.data[self.layer.data_level]
+        chunks = {}
+        for name, tile in tiles.items():
+            cached = chunk_loader.cache.get_chunks(ChunkRequest(tile.key, {}))
+            if cached is not None:
+                chunks[name] = cached['image']
+            else:
+                chunks[name] = level_data[tile.key.indices]
+        return chunks
+
     @classmethod
     def from_request(cls, layer: Layer, request: ChunkRequest):
         """Create an ChunkedSliceData from a ChunkRequest.
@@ -101,5 +193,4 @@ class ChunkedSliceData(ImageSliceData):
         """
         indices = request.key.indices
         image = request.chunks.get('image')
-        thumbnail_slice = request.chunks.get('thumbnail_slice')
-        return cls(layer, indices, image, thumbnail_slice, request)
+        return cls(layer, indices, image, None, request=request)
@@ -0,0 +1,217 @@
+"""ContrastRangeLoader class.
+
+Estimates an image's contrast range from chunks loaded in the background.
+"""
+import logging
+from typing import List, Optional, Set, Tuple
+
+import numpy as np
+
+from ....components.experimental.chunk import (
+    ChunkKey,
+    ChunkRequest,
+    async_config,
+    chunk_loader,
+)
+from ....types import ArrayLike
+from ...utils._data_range import DataRangeEstimator, get_sample_indices
+
+LOGGER = logging.getLogger("napari.async")
+
+# Arrays smaller than this are read in full by calc_data_range().
+MIN_BACKGROUND_SIZE = 1e6
+
+# How many sample requests we have in the pool at once.
+MAX_IN_FLIGHT = 2
+
+
+def get_initial_range(dtype: np.dtype) -> List[float]:
+    """Return the range to use before any samples have loaded.
+
+    Parameters
+    ----------
+    dtype : np.dtype
+        The dtype of the data.
+
+    Returns
+    -------
+    List[float]
+        The full range of integer types, otherwise [0, 1].
+    """
+    if np.issubdtype(dtype, np.integer):
+        info = np.iinfo(dtype)
+        return [float(info.min), float(info.max)]
+    return [0.0, 1.0]
+
+
+class ContrastRangeLoader:
+    """Refines a layer's contrast range as sample chunks load.
+
+    Creating a layer with a huge lazy array should not wait on reading
+    the data. So start() returns a placeholder range right away and asks
+    the ChunkLoader to load sample chunks spread out through the data, at
+    the lowest priority so they never delay the slice the user is looking
+    at. As each sample loads we widen the layer's contrast_limits_range.
+    If the user has not changed the contrast limits we set those too,
+    either to the range or to the configured percentiles.
+
+    Parameters
+    ----------
+    data : ArrayLike
+        The data, or the multiscale level, to estimate the range of.
+    data_level : int
+        The level of the data if multiscale.
+    num_samples : int
+        The most chunks to load.
+    percentiles : Optional[Tuple[float, float]]
+        If given the contrast limits are these percentiles of the values.
+
+    Attributes
+    ----------
+    estimator : DataRangeEstimator
+        The running estimate.
+    pending : Set[int]
+        The keys of the sample requests that are loading.
+    limits : List[float]
+        The contrast limits we last set.
+    """
+
+    def __init__(
+        self,
+        data: ArrayLike,
+        data_level: int = 0,
+        num_samples: int = 32,
+        percentiles: Optional[Tuple[float, float]] = None,
+    ):
+        self.data = data
+        self.data_level = data_level
+        self.percentiles = percentiles
+        self.estimator = DataRangeEstimator()
+        self.pending: Set[int] = set()
+        self.limits = get_initial_range(data.dtype)
+        self._samples = iter(get_sample_indices(data, num_samples))
+
+    @staticmethod
+    def should_load(data: ArrayLike) -> bool:
+        """Return True if we should estimate the range in the background.
+
+        Parameters
+        ----------
+        data : ArrayLike
+            The data we need the range of.
+        """
+        if chunk_loader.synchronous:
+            return False  # Nothing loads in the background.
+
+        if isinstance(data, np.ndarray) or data.dtype == np.uint8:
+            return False  # Quick to compute, or nothing to compute.
+
+        return np.prod(data.shape) > MIN_BACKGROUND_SIZE
+
+    @classmethod
+    def from_config(cls, data: ArrayLike, data_level: int = 0):
+        """Return a loader using the async config settings.
+
+        Parameters
+        ----------
+        data : ArrayLike
+            The data to estimate the range of.
+        data_level : int
+            The level of the data if multiscale.
+        """
+        return cls(
+            data,
+            data_level,
+            async_config.range_samples,
+            async_config.contrast_percentiles,
+        )
+
+    def start(self, layer) -> List[float]:
+        """Start loading samples and return the initial range.
+
+        Parameters
+        ----------
+        layer : Image
+            The layer to load the samples for.
+
+        Returns
+        -------
+        List[float]
+            The range to use until samples have loaded.
+        """
+        for _ in range(MAX_IN_FLIGHT):
+            self._submit_next(layer)
+        return list(self.limits)
+
+    def reset(self) -> List[float]:
+        """Return the current limits and go back to updating them.
+
+        Returns
+        -------
+        List[float]
+            The range, or percentiles, of the values seen so far.
+        """
+        if self.estimator.num_chunks > 0:
+            self.limits = self._get_limits()
+        return list(self.limits)
+
+    def _submit_next(self, layer) -> None:
+        """Submit a request for the next sample, if any are left.
+
+        Parameters
+        ----------
+        layer : Image
+            The layer to load the sample for.
+        """
+        indices = next(self._samples, None)
+        if indices is None:
+            return
+
+        key = ChunkKey(layer, indices, self.data_level)
+        request = chunk_loader.create_request(
+            layer, key, {'sample': self.data[indices]}
+        )
+        self.pending.add(key.key)
+        chunk_loader.load_background(request)
+
+    def on_loaded(self, layer, request: ChunkRequest) -> None:
+        """A sample loaded, update the layer's range and limits.
+
+        Parameters
+        ----------
+        layer : Image
+            The layer the sample was loaded for.
+        request : ChunkRequest
+            The loaded sample.
+        """
+        if request.key.key not in self.pending:
+            return  # Not one of ours, the layer's data changed.
+        self.pending.discard(request.key.key)
+
+        self.estimator.add(request.chunks['sample'])
+        LOGGER.debug(
+            "ContrastRangeLoader: %d samples range=%s",
+            self.estimator.num_chunks,
+            self.estimator.get_range(),
+        )
+
+        self._submit_next(layer)
+
+        # If every value so far was the same, wait for more samples rather
+        # than squeezing the user's limits into a made up range.
+        estimator = self.estimator
+        if estimator.min == estimator.max and self.pending:
+            return
+
+        # Only update the limits if they are still the ones we set.
+        auto_limits = layer.contrast_limits == list(self.limits)
+        layer.contrast_limits_range = estimator.get_range()
+        if auto_limits:
+            self.limits = self._get_limits()
+            layer.contrast_limits = self.limits
+
+    def _get_limits(self) -> List[float]:
+        """Return the contrast limits for the values seen so far."""
+        if self.percentiles is None:
+            return self.estimator.get_range()
+        return self.estimator.get_percentiles(*self.percentiles)
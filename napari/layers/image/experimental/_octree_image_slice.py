@@ -1,19 +1,72 @@
 """OctreeImageSlice class.
 """
 import logging
-from typing import Callable, List
+from typing import Callable, List, Optional
 
+import numpy as np
+
+from ....components.experimental.chunk import (
+    ChunkKey,
+    ChunkRequest,
+    chunk_loader,
+)
 from ....types import ArrayLike
-from ....utils.perf import block_timer
 from .._image_slice import ImageSlice
-from .octree import Octree
+from .._image_slice_data import ImageSliceData
+from .octree import Octree, TileCache, TilePos, TileSource
 from .octree_util import ChunkData, OctreeInfo, OctreeLevelInfo
 
 LOGGER = logging.getLogger("napari.async")
 
 
+class ChunkLoaderTileCache(TileCache):
+    """Keeps the computed tiles in the ChunkLoader's cache.
+
+    So the tiles share the memory budget with everything else we cache,
+    and with a disk cache enabled they even survive between sessions.
+
+    Parameters
+    ----------
+    layer : Layer
+        The layer the tiles are for.
+    indices
+        The indices of the slice the tiles are for.
+    """
+
+    def __init__(self, layer, indices):
+        self.layer = layer
+        self.indices = tuple(indices)
+
+    def _get_request(
+        self, level_index: int, pos: TilePos, tile=None
+    ) -> ChunkRequest:
+        """Return a ChunkRequest for this tile."""
+        key = ChunkKey(self.layer, self.indices + pos, level_index)
+        chunks = {} if tile is None else {'tile': tile}
+        return ChunkRequest(key, chunks)
+
+    def get(self, level_index: int, pos: TilePos) -> Optional[np.ndarray]:
+        """Return the tile or None if it's not in the cache."""
+        chunks = chunk_loader.cache.get_chunks(
+            self._get_request(level_index, pos)
+        )
+        return None if chunks is None else chunks['tile']
+
+    def add(self, level_index: int, pos: TilePos, tile: np.ndarray) -> None:
+        """Add this tile to the cache."""
+        chunk_loader.cache.add_chunks(
+            self._get_request(level_index, pos, tile)
+        )
+
+
 class OctreeImageSlice(ImageSlice):
     """Add Octree functionality to ImageSlice
+
+    Attributes
+    ----------
+    tile_sources : Optional[List[TileSource]]
+        For a multiscale image the levels of this slice, otherwise None and
+        we create the levels from the image.
     """
 
     def __init__(
@@ -30,6 +83,8 @@ class OctreeImageSlice(ImageSlice):
         self._tile_size = tile_size
         self._octree = None
         self._octree_level = octree_level
+        self._tile_cache = None
+        self.tile_sources: Optional[List[TileSource]] = None
 
     @property
     def num_octree_levels(self) -> int:
@@ -61,11 +116,17 @@ class OctreeImageSlice(ImageSlice):
         """
         super()._set_raw_images(image, thumbnail_source)
 
-        # TODO_OCTREE: Create an octree as a test... the expection is this
-        # is a *single* scale image and we create an octree on the fly just
-        # so we have something to render.
-        with block_timer("Octree.from_image", print_time=True):
-            self._octree = Octree.from_image(image, self._tile_size)
+        # A multiscale image brings its own levels. For a single scale
+        # image we create the levels on the fly. Either way this is cheap,
+        # the tiles are only read or created when we draw them.
+        if self.tile_sources is not None:
+            self._octree = Octree.from_multiscale(
+                self.tile_sources, self._tile_size, self._tile_cache
+            )
+        else:
+            self._octree = Octree.from_image(
+                image, self._tile_size, self._tile_cache
+            )
 
         # Set to max level if we had no previous level (None) or if
         # our previous level was too high for this new tree.
@@ -77,6 +138,25 @@ class OctreeImageSlice(ImageSlice):
 
         # self._octree.print_tiles()
 
+    def on_loaded(self, data: ImageSliceData) -> bool:
+        """Data was loaded, show the new data.
+
+        Parameters
+        ----------
+        data : ImageSliceData
+            The newly loaded data we want to show.
+
+        Return
+        ------
+        bool
+            True if the data was used, False if was for the wrong slice.
+        """
+        # Cache tiles with the ChunkLoader unless its cache is disabled,
+        # since then we'd recompute the coarse tiles on every draw.
+        if chunk_loader.cache.enabled:
+            self._tile_cache = ChunkLoaderTileCache(data.layer, data.indices)
+        return super().on_loaded(data)
+
     def get_view_chunks(self, corners_2d) -> List[ChunkData]:
         """Return the chunks currently in view."""
 
@@ -0,0 +1,72 @@
+import dask.array as da
+import numpy as np
+
+from napari.components.experimental.chunk import ChunkKey, synchronous_loading
+from napari.layers.image import Image
+from napari.layers.image.experimental import _chunked_slice_data
+from napari.layers.image.experimental._chunk_tiles import (
+    get_slice_tiles,
+    snap_corners_to_chunks,
+)
+from napari.layers.image.experimental._chunked_slice_data import (
+    ChunkedSliceData,
+)
+
+
+def test_snap_corners():
+    """Corners grow outwards to the chunk grid of the displayed axes."""
+    data = da.zeros((10, 100, 90), chunks=(1, 32, 32))
+    corners = np.array([[3, 40, 5], [3, 70, 64]])
+    snapped = snap_corners_to_chunks(data, corners, (1, 2))
+    np.testing.assert_array_equal(snapped, [[3, 32, 0], [3, 95, 89]])
+
+    # Numpy arrays are not chunked, so the corners don't change.
+    np.testing.assert_array_equal(
+        snap_corners_to_chunks(np.zeros((10, 100, 90)), corners, (1, 2)),
+        corners,
+    )
+
+
+def test_slice_tiles():
+    """The slice is split on chunk boundaries."""
+    data = da.zeros((10, 100, 90), chunks=(1, 32, 32))
+    indices = (3, slice(32, 96, 1), slice(0, 90, 1))
+    tiles = get_slice_tiles(data, indices, (1, 2))
+
+    assert len(tiles) == 2 * 3
+    assert tiles[0].indices == (3, slice(32, 64, 1), slice(0, 32, 1))
+    assert tiles[-1].indices == (3, slice(64, 96, 1), slice(64, 90, 1))
+    assert tiles[-1].offset == (32, 64)
+    assert get_slice_tiles(np.zeros((10, 100, 90)), indices, (1, 2)) is None
+
+
+def test_tiled_load(monkeypatch):
+    """Tiles are composited and cached, so a pan reuses them."""
+    config = _chunked_slice_data.async_config._replace(multiscale_tiles=True)
+    monkeypatch.setattr(_chunked_slice_data, 'async_config', config)
+
+    base = da.random.random((128, 128), chunks=(32, 32))
+    layer = Image([base, base[::2, ::2]], multiscale=True)
+    layer.data_level = 0
+
+    def _load(indices):
+        image = base[indices]
+        data = ChunkedSliceData(layer, indices, image, None)
+        with synchronous_loading(True):
+            assert data.load_chunks(ChunkKey(layer, indices))
+        return data
+
+    indices = (slice(0, 64, 1), slice(32, 96, 1))
+    data = _load(indices)
+    np.testing.assert_array_equal(data.image, base[indices].compute())
+    assert len(data.request.tiles) == 4
+
+    # Panning right by one chunk only fetches the two new tiles.
+    indices = (slice(0, 64, 1), slice(64, 128, 1))
+    data = ChunkedSliceData(layer, indices, base[indices], None)
+    chunks = data._get_tile_chunks(data._get_tiles())
+    fetched = [name for name, x in chunks.items() if isinstance(x, da.Array)]
+    assert fetched == ['tile.0.96', 'tile.32.96']
+
+    data = _load(indices)
+    np.testing.assert_array_equal(data.image, base[indices].compute())
@@ -0,0 +1,59 @@
+import dask.array as da
+import numpy as np
+
+from napari.components.experimental.chunk import chunk_loader
+from napari.layers.image import Image
+from napari.layers.image.experimental._contrast_range import (
+    ContrastRangeLoader,
+)
+
+
+def _load_all(loader, layer, requests):
+    """Load the submitted sample requests one at a time."""
+    while requests:
+        request = requests.pop(0)
+        request.load_chunks()
+        loader.on_loaded(layer, request)
+
+
+def test_contrast_range_loader(monkeypatch):
+    """The layer's range is refined as samples load in the background."""
+    requests = []
+    monkeypatch.setattr(chunk_loader, 'load_background', requests.append)
+
+    array = np.zeros((9, 64, 64), dtype=np.uint16)
+    array[4, 0, 0] = 1000
+    array[8, 0, 0] = 10
+    data = da.from_array(array, chunks=(1, 64, 64))
+    layer = Image(data, contrast_limits=[0, 65535])
+
+    loader = ContrastRangeLoader(data, num_samples=3)
+    assert loader.start(layer) == [0, 65535]
+    assert len(requests) == 2  # Only a few at a time.
+
+    _load_all(loader, layer, requests)
+    assert loader.estimator.num_chunks == 3
+    assert layer.contrast_limits_range == [0, 1000]
+    assert layer.contrast_limits == [0, 1000]
+
+
+def test_contrast_range_keeps_user_limits(monkeypatch):
+    """If the user changed the limits we only update the range."""
+    requests = []
+    monkeypatch.setattr(chunk_loader, 'load_background', requests.append)
+
+    array = np.zeros((3, 64, 64), dtype=np.uint16)
+    array[1, 0, 0] = 1000
+    data = da.from_array(array, chunks=(1, 64, 64))
+    layer = Image(data, contrast_limits=[0, 65535])
+
+    loader = ContrastRangeLoader(data, num_samples=3)
+    loader.start(layer)
+    layer.contrast_limits = [10, 20]
+
+    _load_all(loader, layer, requests)
+    assert layer.contrast_limits_range == [0, 1000]
+    assert layer.contrast_limits == [10, 20]
+
+    # Resetting goes back to the estimated limits.
+    assert loader.reset() == [0, 1000]
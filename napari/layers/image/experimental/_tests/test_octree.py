@@ -1,7 +1,11 @@
 import numpy as np
 import pytest
 
-from napari.layers.image.experimental.octree import _combine_tiles
+from napari.layers.image.experimental.octree import (
+    Octree,
+    _combine_tiles,
+    _downsample,
+)
 
 
 def _square(value):
@@ -60,3 +64,61 @@ def test_combine():
     assert (case4[0:2, 3:5] == tiles[1]).all()
     assert (case4[3:5, 0:2] == tiles[2]).all()
     assert (case4[3:5, 3:5] == tiles[3]).all()
+
+
+def test_downsample():
+    """Test _downsample() averages 2x2 blocks, odd edges alone."""
+    array = np.arange(15, dtype=np.float32).reshape(3, 5)
+    result = _downsample(array)
+    assert result.shape == (2, 3)
+    assert result.dtype == np.float32
+    assert result[0, 0] == np.mean([0, 1, 5, 6])
+    assert result[0, 2] == np.mean([4, 9])
+    assert result[1, 2] == 14
+
+    rgb = np.zeros((4, 4, 3), dtype=np.uint8)
+    rgb[0, 0] = 255
+    result = _downsample(rgb)
+    assert result.shape == (2, 2, 3)
+    assert result.dtype == np.uint8
+    assert (result[0, 0] == 64).all()
+
+
+def test_lazy_tiles():
+    """Tiles are only computed when asked for."""
+    image = np.random.random((100, 70, 3))
+    octree = Octree.from_image(image, 16)
+
+    # 7x5 tiles in level 0, then 4x3, 2x2 and finally 1x1.
+    assert octree.num_levels == 4
+    assert octree.levels[1].info.tile_shape == (4, 3)
+    assert octree.levels[3].info.image_shape == (13, 9)
+    assert not octree.cache.tiles
+
+    # A level 1 tile computes only itself.
+    (tile,) = octree.get_tiles(1, [(0, 0)])
+    np.testing.assert_allclose(tile, _downsample(image[:32, :32]))
+    assert list(octree.cache.tiles) == [(1, 0, 0)]
+
+    # The root tile computes the whole tree and matches going direct.
+    (root,) = octree.get_tiles(3, [(0, 0)])
+    expected = _downsample(_downsample(_downsample(image)))
+    np.testing.assert_allclose(root, expected)
+    assert len(octree.cache.tiles) == 4 * 3 + 2 * 2 + 1
+
+
+def test_level_chunks():
+    """OctreeLevel.get_chunks positions tiles in base image coordinates."""
+    octree = Octree.from_image(np.zeros((64, 64, 3)), 16)
+    corners = np.array([[0, 0], [63, 63]], dtype=float)
+
+    chunks = octree.levels[1].get_chunks(corners)
+    assert len(chunks) == 4
+    assert [chunk.pos for chunk in chunks] == [
+        [0, 0],
+        [32, 0],
+        [0, 32],
+        [32, 32],
+    ]
+    assert chunks[0].scale == [2, 2]
+    assert chunks[0].data.shape == (16, 16, 3)
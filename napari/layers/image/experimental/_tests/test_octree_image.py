@@ -0,0 +1,80 @@
+import dask.array as da
+import numpy as np
+
+from napari.components.experimental.chunk import synchronous_loading
+from napari.layers.image.experimental.octree import Octree, TileSource
+from napari.layers.image.experimental.octree_image import OctreeImage
+
+
+def _pyramid(shape, chunks, num_levels):
+    """Return a multiscale pyramid of dask arrays of random values."""
+    base = da.random.random(shape, chunks=chunks)
+    levels = [base]
+    for _ in range(num_levels - 1):
+        levels.append(levels[-1][..., ::2, ::2])
+    return levels
+
+
+def test_tile_source():
+    """TileSource reads one region of any slice in display order."""
+    data = np.arange(4 * 6 * 8).reshape(4, 6, 8)
+    source = TileSource(data, (2, slice(None), slice(None)), (2, 1))
+    assert source.shape == (8, 6)
+    assert source.get_tile_size(256) == (256, 256)
+
+    tile = source.read(slice(0, 3), slice(1, 4))
+    np.testing.assert_array_equal(tile, data[2, 1:4, 0:3].T)
+
+    chunked = TileSource(da.from_array(data, chunks=(1, 3, 5)), (0,), (1, 2))
+    assert chunked.get_tile_size(4) == (3, 5)
+    assert chunked.get_tile_size(10) == (9, 10)
+
+
+def test_from_multiscale():
+    """Each level of a pyramid becomes one level of the octree."""
+    levels = _pyramid((3, 100, 60), (1, 16, 16), 3)
+    indices = (1, slice(None), slice(None))
+    sources = [TileSource(level, indices, (1, 2)) for level in levels]
+    octree = Octree.from_multiscale(sources, 32)
+
+    assert octree.num_levels == 3
+    info = octree.levels[1].info
+    assert info.image_shape == (50, 30)
+    assert info.scale == (2, 2)
+    assert info.tile_size == (32, 32)
+    assert info.tile_shape == (2, 1)
+
+    corners = np.array([[0, 0], [99, 59]], dtype=float)
+    chunks = octree.levels[1].get_chunks(corners)
+    assert [chunk.pos for chunk in chunks] == [[0, 0], [0, 64]]
+    np.testing.assert_array_equal(
+        chunks[1].data, levels[1][1, 32:50, 0:30].compute()
+    )
+
+    # Tiles read from lazy levels are cached.
+    assert len(octree.cache.tiles) == 2
+
+
+def test_multiscale_nd_layer():
+    """OctreeImage slices every level at the dims point."""
+    with synchronous_loading(True):
+        levels = _pyramid((4, 3, 64, 64), (1, 1, 32, 32), 3)
+        layer = OctreeImage(levels, multiscale=True)
+        layer.tile_size = 32
+        layer._data_corners = np.array([[0, 0, 0, 0], [3, 2, 63, 63]], float)
+
+        layer._slice_dims(point=[2, 1, 0, 0])
+
+        assert layer.num_octree_levels == 3
+        layer.octree_level = 0
+        chunks = layer.view_chunks
+        assert len(chunks) == 4
+        np.testing.assert_array_equal(
+            chunks[0].data, levels[0][2, 1, 0:32, 0:32].compute()
+        )
+
+        # Level 2 is 16x16 so its one tile covers the whole slice.
+        layer.octree_level = 2
+        (chunk,) = layer.view_chunks
+        assert chunk.scale == [4, 4]
+        np.testing.assert_array_equal(chunk.data, levels[2][2, 1].compute())
@@ -1,59 +1,62 @@
 """Octree class.
 """
-from typing import List
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
-from scipy import ndimage as ndi
 
-from ....utils.perf import block_timer
 from .octree_level import OctreeLevel
-from .octree_util import OctreeInfo, TileArray
+from .octree_util import OctreeInfo, OctreeLevelInfo
 
-Levels = List[TileArray]
+LOGGER = logging.getLogger("napari.async")
 
+# The [row, col] of a tile within its level.
+TilePos = Tuple[int, int]
 
-def _create_tiles(array: np.ndarray, tile_size: int) -> np.ndarray:
-    """
-    Return an NxM array of (tile_size, tile_size) ndarrays except the edge
-    tiles might be smaller if the array did not divide evenly.
+# Shared by all octrees, only created when we first compute a tile.
+_executor: Optional[ThreadPoolExecutor] = None
 
-    TODO_OCTREE: slices_from_chunks from dask.array.core possibly does
-    the same thing, if we are going to use this in production.
 
-    Parameters
-    ----------
-    array : np.ndarray
-        The array to create tiles out of.
-    tiles_size : int
-        Edge length of the square tiles.
-    """
-    if array.ndim != 3:
-        raise ValueError(f"Unexpected array dimension {array.ndim}")
-    (rows, cols, _) = array.shape
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the thread pool we compute coarser tiles in."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+    return _executor
 
-    tiles = []
 
-    print(f"_create_tiles array={array.shape} tile_size={tile_size}")
+def _downsample(array: np.ndarray) -> np.ndarray:
+    """Return the array downsampled by two using the mean of 2x2 blocks.
 
-    row = 0
-    while row < rows:
-        row_tiles = []
-        col = 0
-        while col < cols:
-            tile = array[row : row + tile_size, col : col + tile_size, :]
-            row_tiles.append(tile)
-            col += tile_size
-        tiles.append(row_tiles)
-        row += tile_size
+    If a dimension is odd we repeat its last row or column, so that the
+    edge blocks are the mean of just the pixels that exist.
 
-    return tiles
+    Parameters
+    ----------
+    array : np.ndarray
+        The (rows, cols) or (rows, cols, channels) array to downsample.
 
+    Returns
+    -------
+    np.ndarray
+        The downsampled array with the same dtype.
+    """
+    rows, cols = array.shape[:2]
+    pad = [(0, rows % 2), (0, cols % 2)] + [(0, 0)] * (array.ndim - 2)
+    if rows % 2 or cols % 2:
+        array = np.pad(array, pad, mode='edge')
 
-def _get_tile(tiles: TileArray, row, col):
-    try:
-        return tiles[row][col]
-    except IndexError:
-        return None
+    blocks = array.reshape(
+        (array.shape[0] // 2, 2, array.shape[1] // 2, 2) + array.shape[2:]
+    )
+    mean = blocks.mean(axis=(1, 3))
+
+    if np.issubdtype(array.dtype, np.integer):
+        mean = np.round(mean)
+    return mean.astype(array.dtype, copy=False)
 
 
 def _none(items):
@@ -109,48 +112,109 @@ def _create_downsampled_tile(*tiles: np.ndarray) -> np.ndarray:
     combined_tile = _combine_tiles(*tiles)
 
     # Down sample by half.
-    return ndi.zoom(combined_tile, [0.5, 0.5, 1])
+    return _downsample(combined_tile)
+
+
+class TileCache:
+    """Holds the tiles we computed or read.
+
+    Tiles from in-memory arrays are just views, so they are never cached.
+    """
+
+    def __init__(self):
+        self.tiles: Dict[Tuple[int, int, int], np.ndarray] = {}
 
+    def get(self, level_index: int, pos: TilePos) -> Optional[np.ndarray]:
+        """Return the tile or None if it's not in the cache."""
+        return self.tiles.get((level_index,) + pos)
 
-def _create_coarser_level(tiles: TileArray) -> TileArray:
-    """Return a level that is one level coarser.
+    def add(self, level_index: int, pos: TilePos, tile: np.ndarray) -> None:
+        """Add this tile to the cache."""
+        self.tiles[(level_index,) + pos] = tile
 
-    Combine each 2x2 group of tiles into one downsampled tile.
+
+class TileSource:
+    """Reads the tiles of one level directly from an array.
+
+    The array is any numpy, dask or zarr array with any number of
+    dimensions. We only index the region of the tile we are reading, so
+    with dask or zarr nothing else is loaded.
 
     Parameters
     ----------
-    tiles : TileArray
-        The tiles to combine.
-
-    Returns
-    -------
-    TileArray
-        The coarser level of tiles.
+    array : ArrayLike
+        The full array of the level.
+    indices : Optional[tuple]
+        The indices of the slice, slice(None) for the displayed axes.
+    displayed : Tuple[int, int]
+        The axes of the array we draw as rows and as columns.
     """
 
-    level = []
-
-    for row in range(0, len(tiles), 2):
-        row_tiles = []
-        for col in range(0, len(tiles[row]), 2):
-            # The layout of the children is:
-            # 0 1
-            # 2 3
-            group = (
-                _get_tile(tiles, row, col),
-                _get_tile(tiles, row, col + 1),
-                _get_tile(tiles, row + 1, col),
-                _get_tile(tiles, row + 1, col + 1),
-            )
-            tile = _create_downsampled_tile(*group)
-            row_tiles.append(tile)
-        level.append(row_tiles)
+    def __init__(self, array, indices=None, displayed=(0, 1)):
+        self.array = array
+        if indices is None:
+            indices = (slice(None),) * array.ndim
+        self.indices = tuple(indices)
+        self.displayed = tuple(displayed)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """Return the (rows, cols) of the level."""
+        return tuple(self.array.shape[axis] for axis in self.displayed)
+
+    @property
+    def in_memory(self) -> bool:
+        """Return True if reading a tile is free, so never cache it."""
+        return isinstance(self.array, np.ndarray)
+
+    def get_tile_size(self, tile_size: int) -> Tuple[int, int]:
+        """Return the tile size aligned to the array's chunks.
+
+        We use the largest multiple of the chunk size which is not bigger
+        than tile_size, or one chunk if the chunks are bigger. So every
+        tile reads whole chunks and no chunk is read by two tiles.
+
+        Parameters
+        ----------
+        tile_size : int
+            The tile size we'd like to use.
+
+        Returns
+        -------
+        Tuple[int, int]
+            The (rows, cols) of the tiles.
+        """
+        # Dask has chunksize, zarr has chunks, numpy has neither.
+        chunks = getattr(self.array, 'chunksize', None)
+        if chunks is None:
+            chunks = getattr(self.array, 'chunks', None)
+        if chunks is None:
+            return (tile_size, tile_size)
+
+        return tuple(
+            max(tile_size // chunks[axis], 1) * chunks[axis]
+            for axis in self.displayed
+        )
 
-    return level
+    def read(self, rows: slice, cols: slice) -> np.ndarray:
+        """Return this region of the level.
 
+        Parameters
+        ----------
+        rows : slice
+            The rows to read.
+        cols : slice
+            The columns to read.
+        """
+        indices = list(self.indices)
+        indices[self.displayed[0]] = rows
+        indices[self.displayed[1]] = cols
+        tile = np.asarray(self.array[tuple(indices)])
 
-def _one_tile(tiles: TileArray) -> bool:
-    return len(tiles) == 1 and len(tiles[0]) == 1
+        # Indexing leaves the axes in data order, not display order.
+        if self.displayed[0] > self.displayed[1]:
+            tile = np.swapaxes(tile, 0, 1)
+        return tile
 
 
 class Octree:
@@ -166,6 +230,23 @@ class Octree:
     going from parent to child or child to parent is trivial, you just
     need to double or half the indexes.
 
+    Lazy Tiles
+    ----------
+    Levels are created up front but they are empty. A tile is only
+    created when OctreeLevel.get_chunks() first asks for it. Level 0 tiles
+    are views into the image. A tile in a coarser level is its four
+    children combined and downsampled, so computing it computes any of its
+    descendents which are not already in the cache. We compute the missing
+    tiles bottom up one level at a time, and all the tiles of one level in
+    parallel on a thread pool.
+
+    Multiscale Images
+    -----------------
+    If the image already has a pyramid we use its levels as is. Every
+    level has a TileSource, so tiles are read directly from the level in
+    parallel and never computed. The tiles are aligned to the level's
+    chunks, so panning only reads the chunks that came into view.
+
     Future Work: Geometry
     ---------------------
     Eventually we want our octree to hold geometry, not just images.
@@ -178,16 +259,29 @@ class Octree:
 
     Parameters
     ----------
-    base_shape : Tuple[int, int]
-        The shape of the full base image.
-    levels : Levels
-        All the levels of the tree.
+    info : OctreeInfo
+        The shape and tile size of the octree.
+    level_infos : List[OctreeLevelInfo]
+        The shape, scale and tile size of each level.
+    sources : List[Optional[TileSource]]
+        Reads the tiles of each level, None for levels we compute.
+    cache : Optional[TileCache]
+        Where we keep the tiles we computed or read.
     """
 
-    def __init__(self, info: OctreeInfo, levels: Levels):
+    def __init__(
+        self,
+        info: OctreeInfo,
+        level_infos: List[OctreeLevelInfo],
+        sources: List[Optional[TileSource]],
+        cache: Optional[TileCache] = None,
+    ):
         self.info = info
+        self.sources = sources
+        self.cache = TileCache() if cache is None else cache
         self.levels = [
-            OctreeLevel(info, i, level) for (i, level) in enumerate(levels)
+            OctreeLevel(level_info, self.get_tiles)
+            for level_info in level_infos
         ]
         self.num_levels = len(self.levels)
 
@@ -196,33 +290,191 @@ class Octree:
         for level in self.levels:
             level.print_info()
 
+    def get_tiles(
+        self, level_index: int, positions: List[TilePos]
+    ) -> List[np.ndarray]:
+        """Return these tiles of this level, computing them if needed.
+
+        Parameters
+        ----------
+        level_index : int
+            The level the tiles are in.
+        positions : List[TilePos]
+            The [row, col] of each tile we want.
+
+        Returns
+        -------
+        List[np.ndarray]
+            The tiles in the same order as the positions.
+        """
+        self._compute_missing(level_index, positions)
+        return [self.get_tile(level_index, pos) for pos in positions]
+
+    def get_tile(self, level_index: int, pos: TilePos) -> np.ndarray:
+        """Return this tile, reading or computing it if needed.
+
+        Parameters
+        ----------
+        level_index : int
+            The level the tile is in.
+        pos : TilePos
+            The [row, col] of the tile.
+
+        Returns
+        -------
+        np.ndarray
+            The tile.
+        """
+        source = self.sources[level_index]
+        if source is not None and source.in_memory:
+            return source.read(*self._get_region(level_index, pos))
+
+        tile = self.cache.get(level_index, pos)
+        if tile is None:
+            if source is not None:
+                tile = source.read(*self._get_region(level_index, pos))
+            else:
+                tile = self._compute_tile(level_index, pos)
+            self.cache.add(level_index, pos, tile)
+        return tile
+
+    def _get_region(
+        self, level_index: int, pos: TilePos
+    ) -> Tuple[slice, slice]:
+        """Return the rows and columns the tile covers in its level."""
+        tile_rows, tile_cols = self.levels[level_index].info.tile_size
+        row, col = pos
+        return (
+            slice(row * tile_rows, (row + 1) * tile_rows),
+            slice(col * tile_cols, (col + 1) * tile_cols),
+        )
+
+    def _compute_tile(self, level_index: int, pos: TilePos) -> np.ndarray:
+        """Return the tile computed from its children in the next level."""
+        row, col = pos
+
+        # The layout of the children is:
+        # 0 1
+        # 2 3
+        children = [
+            self._get_child(level_index - 1, (row * 2 + i, col * 2 + j))
+            for i in range(2)
+            for j in range(2)
+        ]
+        return _create_downsampled_tile(*children)
+
+    def _get_child(
+        self, level_index: int, pos: TilePos
+    ) -> Optional[np.ndarray]:
+        """Return the tile or None if the level has no tile there."""
+        return (
+            self.get_tile(level_index, pos)
+            if self._exists(level_index, pos)
+            else None
+        )
+
+    def _exists(self, level_index: int, pos: TilePos) -> bool:
+        """Return True if the level has a tile at this position."""
+        tile_shape = self.levels[level_index].info.tile_shape
+        return pos[0] < tile_shape[0] and pos[1] < tile_shape[1]
+
+    def _compute_missing(
+        self, level_index: int, positions: List[TilePos]
+    ) -> None:
+        """Read or compute the tiles that are not cached yet in parallel.
+
+        Parameters
+        ----------
+        level_index : int
+            The level the tiles are in.
+        positions : List[TilePos]
+            The tiles we are about to use.
+        """
+        # Walk down to find which tiles are missing at each level. We stop
+        # at a level we can read from, since then we need no children.
+        missing_levels = []
+        needed = set(positions)
+        for index in range(level_index, -1, -1):
+            source = self.sources[index]
+            if source is not None and source.in_memory:
+                break
+            missing = [
+                pos for pos in needed if self.cache.get(index, pos) is None
+            ]
+            if not missing:
+                break
+            missing_levels.append((index, missing))
+            if source is not None:
+                break
+            needed = {
+                (row * 2 + i, col * 2 + j)
+                for row, col in missing
+                for i in range(2)
+                for j in range(2)
+                if self._exists(index - 1, (row * 2 + i, col * 2 + j))
+            }
+
+        # Then compute them bottom up, so each tile's children are ready.
+        executor = _get_executor()
+        for index, missing in reversed(missing_levels):
+            LOGGER.debug(
+                "Octree: creating %d tiles in level %d", len(missing), index
+            )
+            list(executor.map(partial(self.get_tile, index), missing))
+
     @classmethod
-    def from_image(cls, image: np.ndarray, tile_size: int):
+    def from_image(cls, image: np.ndarray, tile_size: int, cache=None):
         """Create octree from given single image.
 
+        This is cheap, no tiles are created until they are needed.
+
         Parameters
         ----------
         image : ndarray
             Create the octree for this single image.
+        tile_size : int
+            Edge length of the square tiles.
+        cache : Optional[TileCache]
+            Where we keep the tiles we computed.
         """
         info = OctreeInfo(image.shape, tile_size)
+        level_infos = [
+            OctreeLevelInfo(info, i) for i in range(info.num_levels)
+        ]
+        sources = [TileSource(image)] + [None] * (info.num_levels - 1)
+        return Octree(info, level_infos, sources, cache)
 
-        with block_timer("create_tiles", print_time=True):
-            tiles = _create_tiles(image, info.tile_size)
-        levels = [tiles]
-
-        # Keep combining tiles until there is one root tile.
-        while not _one_tile(levels[-1]):
-            with block_timer(
-                f"Create coarser level {len(levels)}:", print_time=True
-            ):
-                next_level = _create_coarser_level(levels[-1])
-            levels.append(next_level)
-
-        # _print_levels(levels)
-
-        return Octree(info, levels)
+    @classmethod
+    def from_multiscale(
+        cls,
+        sources: List[TileSource],
+        tile_size: int,
+        cache: Optional[TileCache] = None,
+    ):
+        """Create octree from the levels of an existing multiscale image.
 
+        Each level of the image becomes one level of the octree, and its
+        tiles are aligned to the level's chunks.
 
-if __name__ == "__main__":
-    tree = Octree()
+        Parameters
+        ----------
+        sources : List[TileSource]
+            The levels of the image, full resolution first.
+        tile_size : int
+            Edge length of the tiles, if the levels are not chunked.
+        cache : Optional[TileCache]
+            Where we keep the tiles we read.
+        """
+        base_shape = sources[0].shape
+        info = OctreeInfo(base_shape, tile_size)
+
+        level_infos = []
+        for i, source in enumerate(sources):
+            shape = source.shape
+            scale = (base_shape[0] / shape[0], base_shape[1] / shape[1])
+            level_infos.append(
+                OctreeLevelInfo(
+                    info, i, shape, scale, source.get_tile_size(tile_size)
+                )
+            )
+        return Octree(info, level_infos, sources, cache)
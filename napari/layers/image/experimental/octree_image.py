@@ -1,9 +1,12 @@
 """OctreeImage class.
 """
+import numpy as np
+
 from ....utils.events import Event
-from ..image import Image
+from ..image import Image, SliceDataClass
 from ._chunked_slice_data import ChunkedSliceData
 from ._octree_image_slice import OctreeImageSlice
+from .octree import TileSource
 from .octree_intersection import OctreeIntersection
 from .octree_util import OctreeInfo, OctreeLevelInfo
 
@@ -16,6 +19,12 @@ class OctreeImage(Image):
     Experimental variant of Image that renders using an Octree.
 
     Intended to eventually replace Image.
+
+    A multiscale image in 2D does not create its own levels. Each level of
+    the image becomes a level of the octree, sliced at the current dims
+    point, and tiles are read from it as they come into view. So unlike
+    Image we never need a new slice when the view is panned or zoomed,
+    only when the dims point changes.
     """
 
     def __init__(self, *args, **kwargs):
@@ -134,7 +143,12 @@ class OctreeImage(Image):
         self._data_corners = self._transforms[1:].simplified.inverse(
             corner_pixels
         )
-        super()._update_draw(scale_factor, corner_pixels, shape_threshold)
+
+        if self._octree_multiscale:
+            # The octree holds every level, so there's nothing to re-slice.
+            self.scale_factor = scale_factor
+        else:
+            super()._update_draw(scale_factor, corner_pixels, shape_threshold)
 
         if need_refresh:
             self.refresh()
@@ -150,8 +164,77 @@ class OctreeImage(Image):
         """
         Get data corners in 2d.
         """
-        # TODO_OCTREE: This is placeholder. Need to handle dims correctly.
-        if self.ndim == 2:
-            return data_corners
-        else:
-            return data_corners[:, 1:3]
+        return data_corners[:, self._dims.displayed]
+
+    @property
+    def _octree_multiscale(self) -> bool:
+        """Return True if the octree should use our multiscale levels."""
+        return self.multiscale and self._dims.ndisplay == 2
+
+    def _get_level_indices(self, level: int) -> tuple:
+        """Return the indices of the current slice in this level.
+
+        Parameters
+        ----------
+        level : int
+            The multiscale level.
+
+        Returns
+        -------
+        tuple
+            The indices with slice(None) for the displayed dimensions.
+        """
+        not_disp = self._dims.not_displayed
+        indices = np.array(self._slice_indices)
+
+        downsampled = (
+            indices[not_disp] / self.downsample_factors[level, not_disp]
+        )
+        downsampled = np.round(downsampled.astype(float)).astype(int)
+        indices[not_disp] = np.clip(
+            downsampled, 0, self.level_shapes[level, not_disp] - 1
+        )
+        return tuple(indices)
+
+    def _set_view_slice(self):
+        """Set the view given the indices to slice with."""
+        if not self._octree_multiscale:
+            super()._set_view_slice()
+            return
+
+        self._new_empty_slice()
+        not_disp = self._dims.not_displayed
+
+        # Check if requested slice outside of data range
+        indices = np.array(self._slice_indices)
+        extent = self._extent_data
+        if np.any(
+            np.less(
+                [indices[ax] for ax in not_disp],
+                [extent[0, ax] for ax in not_disp],
+            )
+        ) or np.any(
+            np.greater(
+                [indices[ax] for ax in not_disp],
+                [extent[1, ax] for ax in not_disp],
+            )
+        ):
+            return
+        self._empty = False
+
+        # The octree positions its tiles in full resolution coordinates.
+        self._transforms['tile2data'].scale = np.ones(self.ndim)
+        self._transforms['tile2data'].translate = np.zeros(self.ndim)
+
+        displayed = tuple(self._dims.displayed)
+        self._slice.tile_sources = [
+            TileSource(level_data, self._get_level_indices(level), displayed)
+            for level, level_data in enumerate(self.data)
+        ]
+
+        # The octree reads the tiles it draws, so we only need to load the
+        # small thumbnail level ourselves.
+        level = self._thumbnail_level
+        image = self.data[level][self._get_level_indices(level)]
+        data = SliceDataClass(self, self._slice_indices, image, None)
+        self._load_slice(data)
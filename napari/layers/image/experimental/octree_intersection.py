@@ -26,20 +26,18 @@ class OctreeIntersection:
         self.normalized_rows = np.clip(self.rows / base[0], 0, 1)
         self.normalized_cols = np.clip(self.cols / base[1], 0, 1)
 
-        self.rows /= self.info.scale
-        self.cols /= self.info.scale
+        self.rows /= self.info.scale[0]
+        self.cols /= self.info.scale[1]
 
         self.row_range = self.row_range(self.rows)
         self.col_range = self.column_range(self.cols)
 
-    def tile_range(self, span, num_tiles):
+    def tile_range(self, span, num_tiles, tile_size):
         """Return tiles indices needed to draw the span."""
 
         def _clamp(val, min_val, max_val):
             return max(min(val, max_val), min_val)
 
-        tile_size = self.info.octree_info.tile_size
-
         span_tiles = [span[0] / tile_size, span[1] / tile_size]
         clamped = [
             _clamp(span_tiles[0], 0, num_tiles - 1),
@@ -52,11 +50,15 @@ class OctreeIntersection:
 
     def row_range(self, span: Tuple[float, float]) -> range:
         """Return row indices which span image coordinates [y0..y1]."""
-        return self.tile_range(span, self.info.tile_shape[0])
+        return self.tile_range(
+            span, self.info.tile_shape[0], self.info.tile_size[0]
+        )
 
     def column_range(self, span: Tuple[float, float]) -> range:
         """Return column indices which span image coordinates [x0..x1]."""
-        return self.tile_range(span, self.info.tile_shape[1])
+        return self.tile_range(
+            span, self.info.tile_shape[1], self.info.tile_size[1]
+        )
 
     def is_visible(self, row: int, col: int) -> bool:
         """Return True if the tile [row, col] is in the intersection.
@@ -1,33 +1,40 @@
 """OctreeLevel class
 """
-from typing import List
+from typing import Callable, List, Tuple
+
+import numpy as np
 
 from .octree_intersection import OctreeIntersection
-from .octree_util import ChunkData, OctreeInfo, OctreeLevelInfo, TileArray
+from .octree_util import ChunkData, OctreeLevelInfo
+
+# Returns the tiles at [row, col] for each of the given positions.
+GetTiles = Callable[[int, List[Tuple[int, int]]], List[np.ndarray]]
 
 
 class OctreeLevel:
     """One level of the octree.
 
-    A level contains a 2D array of tiles.
+    A level contains a 2D array of tiles. The tiles are not created until
+    get_chunks() first asks for them.
 
     Soon might also contain a 3D array of sub-volumes.
-    """
 
-    def __init__(
-        self, octree_info: OctreeInfo, level_index: int, tiles: TileArray
-    ):
-        self.info = OctreeLevelInfo(
-            octree_info, level_index, [len(tiles), len(tiles[0])]
-        )
+    Parameters
+    ----------
+    info : OctreeLevelInfo
+        The shape, scale and tile size of this level.
+    get_tiles : GetTiles
+        Returns tiles of this level, computing them if needed.
+    """
 
-        self.tiles = tiles
+    def __init__(self, info: OctreeLevelInfo, get_tiles: GetTiles):
+        self.info = info
+        self._get_tiles = get_tiles
 
     def print_info(self):
         """Print information about this level."""
-        nrows = len(self.tiles)
-        ncols = len(self.tiles[0])
-        print(f"level={self.level_index} dim={nrows}x{ncols}")
+        nrows, ncols = self.info.tile_shape
+        print(f"level={self.info.level_index} dim={nrows}x{ncols}")
 
     def get_intersection(self, data_corners) -> OctreeIntersection:
 
@@ -41,29 +48,27 @@ class OctreeLevel:
         data_corners
             Return chunks within this rectangular region.
         """
-        chunks = []
-
         intersection = self.get_intersection(data_corners)
 
-        scale = self.info.scale
-        scale_vec = [scale, scale]
-
-        tile_size = self.info.octree_info.tile_size
+        positions = [
+            (row, col)
+            for row in intersection.row_range
+            for col in intersection.col_range
+        ]
+        tiles = self._get_tiles(self.info.level_index, positions)
 
-        # Iterate over every tile in the rectangular region.
-        data = None
-        y = intersection.row_range.start * tile_size
-        for row in intersection.row_range:
-            x = intersection.col_range.start * tile_size
-            for col in intersection.col_range:
+        # ChunkData wants the scale in [x, y] order like pos.
+        row_scale, col_scale = self.info.scale
+        scale_vec = [col_scale, row_scale]
 
-                data = self.tiles[row][col]
-                pos = [x, y]
+        # The size of one tile in base image pixels.
+        tile_rows = self.info.tile_size[0] * row_scale
+        tile_cols = self.info.tile_size[1] * col_scale
 
-                if 0 not in data.shape:
-                    chunks.append(ChunkData(data, pos, scale_vec))
-
-                x += data.shape[1] * scale
-            y += data.shape[0] * scale
+        chunks = []
+        for (row, col), data in zip(positions, tiles):
+            if 0 not in data.shape:
+                pos = [col * tile_cols, row * tile_rows]
+                chunks.append(ChunkData(data, pos, scale_vec))
 
         return chunks
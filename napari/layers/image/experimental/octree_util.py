@@ -1,13 +1,12 @@
 """Octree utility classes.
 """
-from typing import List, Tuple
+import math
+from typing import Optional, Tuple
 
 import numpy as np
 
 from ....types import ArrayLike
 
-TileArray = List[List[np.ndarray]]
-
 # TODO_OCTREE: These types might be a horrible idea but trying it for now.
 Int2 = np.ndarray  # [x, x] dtype=numpy.int32
 
@@ -19,23 +18,85 @@ class OctreeInfo:
         self.aspect = base_shape[1] / base_shape[0]
         self.tile_size = tile_size
 
+    @property
+    def num_levels(self) -> int:
+        """Return how many levels we need until one tile covers the image."""
+        shape = self.base_shape[:2]
+        num_levels = 1
+        while max(_num_tiles(shape, self.tile_size)) > 1:
+            shape = _half_shape(shape)
+            num_levels += 1
+        return num_levels
+
+
+def _half_shape(shape: Tuple[int, int]) -> Tuple[int, int]:
+    """Return the shape after downsampling by two, rounding up."""
+    return tuple(math.ceil(x / 2) for x in shape)
+
+
+def _num_tiles(shape: Tuple[int, int], tile_size) -> Tuple[int, int]:
+    """Return how many rows and columns of tiles cover this shape.
+
+    Parameters
+    ----------
+    shape : Tuple[int, int]
+        The shape of the level.
+    tile_size : Union[int, Tuple[int, int]]
+        The size of the tiles, square if only one value.
+    """
+    if isinstance(tile_size, int):
+        tile_size = (tile_size, tile_size)
+    return tuple(math.ceil(x / size) for x, size in zip(shape, tile_size))
+
 
 class OctreeLevelInfo:
+    """Information about one level of the octree.
+
+    By default the level is the previous level downsampled by two, where
+    the last row or column is averaged alone if the size was odd. For a
+    multiscale image the level's shape, scale and tile size come from the
+    level's array instead.
+
+    Parameters
+    ----------
+    octree_info : OctreeInfo
+        Information about the whole octree.
+    level_index : int
+        The index of this level, 0 is full resolution.
+    image_shape : Optional[Tuple[int, int]]
+        The (rows, cols) of the level.
+    scale : Optional[Tuple[float, float]]
+        The size of one of the level's pixels in base image pixels.
+    tile_size : Optional[Tuple[int, int]]
+        The (rows, cols) of the level's tiles.
+    """
+
     def __init__(
-        self, octree_info: OctreeInfo, level_index: int, tile_shape: Int2
+        self,
+        octree_info: OctreeInfo,
+        level_index: int,
+        image_shape: Optional[Tuple[int, int]] = None,
+        scale: Optional[Tuple[float, float]] = None,
+        tile_size: Optional[Tuple[int, int]] = None,
     ):
         self.octree_info = octree_info
-
         self.level_index = level_index
-        self.scale = 2 ** self.level_index
 
-        base = self.octree_info.base_shape
-        self.image_shape = (
-            int(base[0] / self.scale),
-            int(base[1] / self.scale),
-        )
+        if image_shape is None:
+            image_shape = self.octree_info.base_shape[:2]
+            for _ in range(level_index):
+                image_shape = _half_shape(image_shape)
+        self.image_shape = tuple(image_shape)
+
+        if scale is None:
+            scale = (2 ** level_index, 2 ** level_index)
+        self.scale = tuple(scale)
+
+        if tile_size is None:
+            tile_size = (octree_info.tile_size, octree_info.tile_size)
+        self.tile_size = tuple(tile_size)
 
-        self.tile_shape = tile_shape
+        self.tile_shape: Int2 = _num_tiles(self.image_shape, self.tile_size)
 
 
 # TODO_OCTREE: this class is placeholder, needs work
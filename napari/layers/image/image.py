@@ -256,6 +256,7 @@ class Image(IntensityVisualizationMixin, Layer):
         self._gamma = gamma
         self._iso_threshold = iso_threshold
         self._attenuation = attenuation
+        self._contrast_range = None
         if contrast_limits is None:
             self.contrast_limits_range = self._calc_data_range()
         else:
@@ -320,8 +321,36 @@ class Image(IntensityVisualizationMixin, Layer):
             input_data = self.data[-1]
         else:
             input_data = self.data
+        if config.async_loading:
+            return self._calc_data_range_async(input_data)
         return calc_data_range(input_data)
 
+    def _calc_data_range_async(self, data):
+        """Return the data range, maybe estimating it in the background.
+
+        Large lazy data would block for seconds, so we return a placeholder
+        right away, and refine the range as sample chunks load.
+
+        Parameters
+        ----------
+        data : ArrayLike
+            The data, or the multiscale level, to get the range of.
+        """
+        from .experimental._contrast_range import ContrastRangeLoader
+
+        loader = self._contrast_range
+        if loader is not None and loader.data is data:
+            return loader.reset()  # Already estimating it.
+
+        if not ContrastRangeLoader.should_load(data):
+            return calc_data_range(data)
+
+        data_level = len(self.data) - 1 if self.multiscale else 0
+        self._contrast_range = ContrastRangeLoader.from_config(
+            data, data_level
+        )
+        return self._contrast_range.start(self)
+
     @property
     def dtype(self):
         return self.data[0].dtype if self.multiscale else self.data.dtype
@@ -334,6 +363,7 @@ class Image(IntensityVisualizationMixin, Layer):
     @data.setter
     def data(self, data):
         self._data = data
+        self._contrast_range = None
         self._update_dims()
         self.events.data()
 
@@ -600,14 +630,11 @@ class Image(IntensityVisualizationMixin, Layer):
             self._transforms['tile2data'].scale = scale
 
             if self._dims.ndisplay == 2:
+                corners = self._get_slice_corners(level)
                 for d in self._dims.displayed:
-                    indices[d] = slice(
-                        self.corner_pixels[0, d],
-                        self.corner_pixels[1, d] + 1,
-                        1,
-                    )
+                    indices[d] = slice(corners[0, d], corners[1, d] + 1, 1)
                 self._transforms['tile2data'].translate = (
-                    self.corner_pixels[0] * self._transforms['tile2data'].scale
+                    corners[0] * self._transforms['tile2data'].scale
                 )
             image = self.data[level][tuple(indices)]
             image_indices = indices
@@ -628,7 +655,10 @@ class Image(IntensityVisualizationMixin, Layer):
             )
             indices[not_disp] = downsampled_indices
 
-            thumbnail_source = self.data[self._thumbnail_level][tuple(indices)]
+            thumbnail_indices = tuple(indices)
+            thumbnail_source = self.data[self._thumbnail_level][
+                thumbnail_indices
+            ]
         else:
             self._transforms['tile2data'].scale = np.ones(self.ndim)
             image_indices = self._slice_indices
@@ -639,11 +669,43 @@ class Image(IntensityVisualizationMixin, Layer):
             # call request.thumbnail_source() and it knows to just use the
             # image itself is there is no explicit thumbnail_source.
             thumbnail_source = None
+            thumbnail_indices = None
 
         # Load our images, might be sync or async.
-        data = SliceDataClass(self, image_indices, image, thumbnail_source)
+        data = SliceDataClass(
+            self, image_indices, image, thumbnail_source, thumbnail_indices
+        )
         self._load_slice(data)
 
+    def _get_slice_corners(self, level: int) -> np.ndarray:
+        """Return the corners of the region of this level to slice.
+
+        When loading multiscale images in tiles we grow the region to the
+        level's chunk grid, so a small pan asks for the same tiles again.
+
+        Parameters
+        ----------
+        level : int
+            The multiscale level we are slicing.
+
+        Returns
+        -------
+        np.ndarray
+            The (2, ndim) first and last pixel of the region.
+        """
+        if not config.async_loading:
+            return self.corner_pixels
+
+        from ...components.experimental.chunk import async_config
+        from .experimental._chunk_tiles import snap_corners_to_chunks
+
+        if not async_config.multiscale_tiles:
+            return self.corner_pixels
+
+        return snap_corners_to_chunks(
+            self.data[level], self.corner_pixels, self._dims.displayed
+        )
+
     def _load_slice(self, data: SliceDataClass):
         """Load the image and maybe thumbnail source.
 
@@ -659,6 +721,12 @@ class Image(IntensityVisualizationMixin, Layer):
             # property is now false, since the load is in progress.
             self.events.loaded()
 
+            # The thumbnail_source can load on its own, before the image.
+            if data.thumbnail_source is not None:
+                self._slice.set_thumbnail_source(
+                    data.thumbnail_source.transpose(self._get_order())
+                )
+
     def _on_data_loaded(self, data: SliceDataClass, sync: bool) -> None:
         """The given data a was loaded, use it now.
 
@@ -810,6 +878,24 @@ class Image(IntensityVisualizationMixin, Layer):
             request : ChunkRequest
                 This request was loaded.
             """
+            from ...components.experimental.chunk import LoadPriority
+
+            if request.priority == LoadPriority.BACKGROUND:
+                # A sample for our contrast range, not a slice.
+                if self._contrast_range is not None:
+                    self._contrast_range.on_loaded(self, request)
+                return
+
+            if request.priority == LoadPriority.THUMBNAIL:
+                # Loaded separately after the slice itself.
+                if self._slice.loader.match_thumbnail(request):
+                    thumbnail_source = request.image.transpose(
+                        self._get_order()
+                    )
+                    self._slice.set_thumbnail_source(thumbnail_source)
+                    self._update_thumbnail()
+                return
+
             # Convert the ChunkRequest to SliceData and use it.
             data = SliceDataClass.from_request(self, request)
             self._on_data_loaded(data, sync=False)
@@ -64,3 +64,136 @@ def sphere_indices(radius, sphere_dims):
     mask_indices = indices[distances_sq <= radius ** 2].astype(int)
 
     return mask_indices
+
+
+class LabelLookupTable:
+    """Cached mapping from integer label ids to displayed values.
+
+    Values are computed once per label id and stored in a dense table, so
+    mapping a slice of labels is a single vectorized gather. Negative ids and
+    ids too large for the dense table are mapped by calling ``func`` directly.
+
+    Parameters
+    ----------
+    func : callable
+        Vectorized function mapping an array of label ids to displayed
+        values.
+    max_label : int, optional
+        Largest label id with its own value. All larger ids share the value
+        of ``max_label + 1``. If None, every id can have its own value and
+        the table grows to cover the largest id seen so far.
+    max_dense_size : int
+        Largest number of entries in the dense table.
+    """
+
+    def __init__(self, func, max_label=None, max_dense_size=2 ** 22):
+        self._func = func
+        self._max_label = max_label
+        self._max_dense_size = max_dense_size
+        if max_label is None:
+            self._table = func(np.arange(0))
+        elif max_label + 2 <= max_dense_size:
+            self._table = func(np.arange(max_label + 2))
+        else:
+            self._table = None
+
+    def __call__(self, raw):
+        """Map an array of label ids to displayed values.
+
+        Parameters
+        ----------
+        raw : array
+            Array of label ids.
+
+        Returns
+        -------
+        values : array
+            Displayed value for each label id, same shape as ``raw``.
+        """
+        raw = np.asarray(raw)
+        if self._table is None or raw.dtype.kind not in 'iu' or raw.size == 0:
+            return self._func(raw)
+
+        # Negative ids have no entry in the table
+        if raw.dtype.kind == 'i' and raw.min() < 0:
+            return self._func(raw)
+
+        if self._max_label is not None:
+            return self._table[np.minimum(raw, self._max_label + 1)]
+
+        top = int(raw.max())
+        if top >= self._max_dense_size:
+            return self._func(raw)
+        if top >= len(self._table):
+            size = min(1 << top.bit_length(), self._max_dense_size)
+            self._table = self._func(np.arange(size))
+        return self._table[raw]
+
+
+def sparse_label_mapping(index, default):
+    """Make a vectorized function from a dict of label values.
+
+    Parameters
+    ----------
+    index : dict of int to float
+        Displayed value for each label.
+    default : float
+        Displayed value for labels not in ``index``.
+
+    Returns
+    -------
+    func : callable
+        Function mapping an array of label ids to displayed values using a
+        binary search of the sorted labels.
+    """
+    keys = np.array(sorted(index))
+    values = np.array([index[k] for k in keys], dtype=float)
+    if len(keys) == 0:
+        return lambda ids: np.full(np.shape(ids), default, dtype=float)
+
+    def func(ids):
+        pos = np.minimum(np.searchsorted(keys, ids), len(keys) - 1)
+        return np.where(keys[pos] == ids, values[pos], default)
+
+    return func
+
+
+def mask_bounding_box(mask):
+    """Find the smallest box containing all True values of a mask.
+
+    Parameters
+    ----------
+    mask : np.ndarray of bool
+        Boolean mask with at least one True value.
+
+    Returns
+    -------
+    box : tuple of slice
+        Slice along each dimension of the mask covering all True values.
+    """
+    box = []
+    for axis in range(mask.ndim):
+        other_axes = tuple(a for a in range(mask.ndim) if a != axis)
+        nonzero = np.flatnonzero(np.any(mask, axis=other_axes))
+        box.append(slice(nonzero[0], nonzero[-1] + 1))
+    return tuple(box)
+
+
+def history_entry_nbytes(entry):
+    """Number of bytes used by the saved regions of a history entry.
+
+    Parameters
+    ----------
+    entry : list of tuple
+        Pairs of index into data and the values saved at that index.
+
+    Returns
+    -------
+    nbytes : int
+        Bytes used by the saved values and any index arrays.
+    """
+    nbytes = 0
+    for key, values in entry:
+        nbytes += values.nbytes
+        nbytes += sum(k.nbytes for k in key if isinstance(k, np.ndarray))
+    return nbytes
@@ -4,7 +4,9 @@ import pytest
 from napari._tests.utils import check_layer_world_data_extent
 from napari.layers import Labels
 from napari.layers.labels._labels_constants import LabelColorMode
+from napari.layers.labels._labels_utils import history_entry_nbytes
 from napari.utils import Colormap
+from napari.utils.colormaps import low_discrepancy_image
 
 
 def test_random_labels():
@@ -190,6 +192,42 @@ def test_seed():
     assert layer.seed == 0.7
 
 
+def test_raw_to_displayed_lookup_table():
+    """Test displayed values are rebuilt when the colors change."""
+    np.random.seed(0)
+    data = np.random.randint(20, size=(10, 15))
+    layer = Labels(data)
+    expected = np.where(data > 0, low_discrepancy_image(data, 0.5), 0)
+    np.testing.assert_allclose(layer._raw_to_displayed(data), expected)
+
+    layer.seed = 0.9
+    expected = np.where(data > 0, low_discrepancy_image(data, 0.9), 0)
+    np.testing.assert_allclose(layer._raw_to_displayed(data), expected)
+
+    layer.color = {1: 'white', 2: 'red'}
+    index = layer._label_color_index
+    displayed = layer._raw_to_displayed(data)
+    for label in np.unique(data):
+        value = index.get(label, index[None])
+        assert np.all(displayed[data == label] == value)
+
+
+@pytest.mark.parametrize('dtype', [np.int8, np.int16, np.int64])
+def test_raw_to_displayed_negative_labels(dtype):
+    """Test negative labels are displayed the same for any dtype."""
+    data = np.array([[-1, 0], [1, 2]], dtype=dtype)
+    layer = Labels(data)
+    expected = np.where(data > 0, low_discrepancy_image(data, 0.5), 0)
+    np.testing.assert_allclose(layer._raw_to_displayed(data), expected)
+
+    layer.color = {-1: 'blue', 1: 'red'}
+    assert layer.color_mode == 'direct'
+    index = layer._label_color_index
+    expected = [[index.get(x, index[None]) for x in row] for row in data]
+    assert expected[0][0] != index[None]
+    np.testing.assert_array_equal(layer._raw_to_displayed(data), expected)
+
+
 def test_num_colors():
     """Test setting number of colors in colormap."""
     np.random.seed(0)
@@ -521,6 +559,54 @@ def test_fill():
     assert np.unique(layer.data[5:10, 5:10]) == 2
 
 
+def test_undo_redo_3d():
+    """Test undoing and redoing edits that change data outside the slice."""
+    data = np.zeros((10, 20, 20), dtype=np.uint8)
+    data[:6, 5:15, 5:15] = 1
+    layer = Labels(data)
+    original = layer.data.copy()
+
+    # Fill in the first slice, then paint and fill across all dimensions
+    layer.fill((0, 10, 10), 2)
+    assert np.sum(layer.data == 2) == 100
+    layer.n_dimensional = True
+    layer.paint((0, 0, 0), 3)
+    layer.fill((3, 10, 10), 4)
+    assert np.sum(layer.data == 4) == 500
+    edited = layer.data.copy()
+
+    # Only the edited regions are saved
+    sizes = [history_entry_nbytes(entry) for entry in layer._undo_history]
+    assert sizes[0] == 100
+    assert sizes[2] == 5 * 10 * 10
+
+    layer.undo()
+    layer.undo()
+    layer.undo()
+    np.testing.assert_array_equal(layer.data, original)
+
+    layer.redo()
+    layer.redo()
+    layer.redo()
+    np.testing.assert_array_equal(layer.data, edited)
+
+
+def test_history_max_bytes():
+    """Test the oldest edits are dropped once over the byte budget."""
+    data = np.zeros((20, 20), dtype=np.uint8)
+    layer = Labels(data)
+    layer._history_max_bytes = 1000
+    for label in range(1, 6):
+        layer.fill((0, 0), label)
+    assert len(layer._undo_history) == 2
+    assert layer._history_nbytes == 800
+
+    layer.undo()
+    layer.undo()
+    layer.undo()
+    assert np.unique(layer.data) == 3
+
+
 def test_value():
     """Test getting the value of the data at the current coordinates."""
     np.random.seed(0)
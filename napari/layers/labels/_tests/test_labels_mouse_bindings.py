@@ -274,3 +274,37 @@ def test_fill_nD_all(Event):
     assert np.unique(layer.data[:5, -5:, -5:]) == 5
     assert np.unique(layer.data[-5:, :5, -5:]) == 5
     assert np.unique(layer.data[0, 8:10, 8:10]) == 2
+
+
+def test_paint_stroke_undo(Event):
+    """Test a whole drag stroke is undone at once."""
+    data = np.ones((20, 20), dtype=np.uint8)
+    layer = Labels(data)
+    layer.brush_size = 4
+    layer.mode = 'paint'
+    layer.selected_label = 3
+    layer.position = (0, 0)
+
+    # Simulate click
+    event = ReadOnlyWrapper(Event(type='mouse_press', is_dragging=False))
+    mouse_press_callbacks(layer, event)
+
+    layer.position = (19, 19)
+
+    # Simulate drag
+    event = ReadOnlyWrapper(Event(type='mouse_move', is_dragging=True))
+    mouse_move_callbacks(layer, event)
+
+    # Simulate release
+    event = ReadOnlyWrapper(Event(type='mouse_release', is_dragging=False))
+    mouse_release_callbacks(layer, event)
+
+    assert np.sum(layer.data == 3) > 0
+    painted = layer.data.copy()
+    assert len(layer._undo_history) == 1
+
+    layer.undo()
+    np.testing.assert_array_equal(layer.data, data)
+
+    layer.redo()
+    np.testing.assert_array_equal(layer.data, painted)
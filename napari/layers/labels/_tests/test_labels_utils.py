@@ -1,6 +1,11 @@
 import numpy as np
 
-from napari.layers.labels._labels_utils import interpolate_coordinates
+from napari.layers.labels._labels_utils import (
+    LabelLookupTable,
+    interpolate_coordinates,
+    mask_bounding_box,
+    sparse_label_mapping,
+)
 
 
 def test_interpolate_coordinates():
@@ -25,3 +30,44 @@ def test_interpolate_coordinates():
         ]
     )
     assert np.all(coords == expected_coords)
+
+
+def test_label_lookup_table_grows():
+    """Test the dense table grows to cover the largest label seen."""
+    table = LabelLookupTable(lambda ids: ids * 2.0)
+    raw = np.array([[0, 3], [5, 1]], dtype=np.uint16)
+    np.testing.assert_array_equal(table(raw), raw * 2.0)
+    assert len(table._table) == 8
+
+    raw = np.array([100], dtype=np.int32)
+    np.testing.assert_array_equal(table(raw), [200.0])
+    assert len(table._table) == 128
+
+
+def test_label_lookup_table_sparse_ids():
+    """Test ids too large for the dense table are mapped directly."""
+    table = LabelLookupTable(lambda ids: ids * 2.0, max_dense_size=16)
+    raw = np.array([1, 2 ** 40], dtype=np.int64)
+    np.testing.assert_array_equal(table(raw), raw * 2.0)
+    assert len(table._table) == 0
+
+    raw = np.array([-4, 3], dtype=np.int64)
+    np.testing.assert_array_equal(table(raw), [-8.0, 6.0])
+
+
+def test_label_lookup_table_max_label():
+    """Test ids above max_label share a single value."""
+    func = sparse_label_mapping({0: 0.0, 2: 0.5}, 1.0)
+    table = LabelLookupTable(func, max_label=2)
+    raw = np.array([0, 1, 2, 3, 2 ** 20, -1], dtype=np.int32)
+    np.testing.assert_array_equal(table(raw), [0, 1, 0.5, 1, 1, 1])
+    np.testing.assert_array_equal(func(raw), table(raw))
+
+
+def test_mask_bounding_box():
+    mask = np.zeros((5, 6, 7), dtype=bool)
+    mask[1, 2, 3] = True
+    mask[3, 4, 3] = True
+    box = mask_bounding_box(mask)
+    assert box == (slice(1, 4), slice(2, 5), slice(3, 4))
+    assert np.sum(mask[box]) == 2
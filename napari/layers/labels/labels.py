@@ -16,7 +16,13 @@ from ..utils.color_transformations import transform_color
 from ..utils.layer_utils import dataframe_to_properties
 from ._labels_constants import LabelBrushShape, LabelColorMode, Mode
 from ._labels_mouse_bindings import draw, pick
-from ._labels_utils import sphere_indices
+from ._labels_utils import (
+    LabelLookupTable,
+    history_entry_nbytes,
+    mask_bounding_box,
+    sparse_label_mapping,
+    sphere_indices,
+)
 
 
 class Labels(Image):
@@ -144,7 +150,7 @@ class Labels(Image):
         background label `0` is selected.
     """
 
-    _history_limit = 100
+    _history_max_bytes = 256 * 1024 ** 2
 
     def __init__(
         self,
@@ -172,6 +178,8 @@ class Labels(Image):
         self._num_colors = num_colors
         self._random_colormap = label_colormap(self.num_colors)
         self._color_mode = LabelColorMode.AUTO
+        self._label_color_index = {}
+        self._lookup_table = None
         self._brush_shape = LabelBrushShape.CIRCLE
 
         if properties is None:
@@ -285,6 +293,7 @@ class Labels(Image):
     @seed.setter
     def seed(self, seed):
         self._seed = seed
+        self._lookup_table = None
         self._selected_color = self.get_color(self.selected_label)
         self.refresh()
         self.events.selected_label()
@@ -400,6 +409,8 @@ class Labels(Image):
             return
 
         self._selected_label = selected_label
+        if self._color_mode == LabelColorMode.SELECTED:
+            self._lookup_table = None
         self._selected_color = self.get_color(selected_label)
         self.events.selected_label()
 
@@ -438,6 +449,7 @@ class Labels(Image):
             raise ValueError("Unsupported Color Mode")
 
         self._color_mode = color_mode
+        self._lookup_table = None
         self._selected_color = self.get_color(self.selected_label)
         self.events.color_mode()
         self.events.colormap()
@@ -578,45 +590,62 @@ class Labels(Image):
         image : array
             Image mapped between 0 and 1 to be displayed.
         """
+        if self._lookup_table is None:
+            self._lookup_table = self._make_lookup_table()
+        return self._lookup_table(raw)
+
+    def _make_lookup_table(self):
+        """Build the label to displayed value table for the color mode.
+
+        Returns
+        -------
+        lookup_table : LabelLookupTable
+            Cached mapping from label ids to displayed values.
+        """
+        index = self._label_color_index
+        labels = [label for label in index if label is not None]
         if self._color_mode == LabelColorMode.DIRECT:
-            u, inv = np.unique(raw, return_inverse=True)
-            image = np.array(
-                [
-                    self._label_color_index[x]
-                    if x in self._label_color_index
-                    else self._label_color_index[None]
-                    for x in u
-                ]
-            )[inv].reshape(raw.shape)
-        elif self._color_mode == LabelColorMode.AUTO:
-            image = np.where(
-                raw > 0, low_discrepancy_image(raw, self._seed), 0
+            func = sparse_label_mapping(
+                {label: index[label] for label in labels}, index[None]
             )
+            max_label = max(labels, default=0)
+            if min(labels, default=0) < 0:
+                max_label = None
+            return LabelLookupTable(func, max_label=max_label)
+        elif self._color_mode == LabelColorMode.AUTO:
+            seed = self._seed
+
+            def func(ids):
+                return np.where(ids > 0, low_discrepancy_image(ids, seed), 0)
+
+            return LabelLookupTable(func)
         elif self._color_mode == LabelColorMode.SELECTED:
             selected = self._selected_label
+            background = self._background_label
             # we were in direct mode previously
-            if self._label_color_index:
-                if selected not in self._label_color_index:
+            if index:
+                if selected not in index:
                     selected = None
-                index = self._label_color_index
-                image = np.where(
-                    raw == selected,
-                    index[selected],
-                    np.where(
-                        raw != self._background_label,
-                        index[None],
-                        index[self._background_label],
-                    ),
-                )
+                selected_value = index[selected]
+                other_value = index[None]
+                background_value = index[background]
             else:
-                image = np.where(
-                    raw == selected,
-                    low_discrepancy_image(selected, self._seed),
-                    0,
+                selected_value = low_discrepancy_image(selected, self._seed)
+                other_value = 0
+                background_value = 0
+
+            def func(ids):
+                return np.where(
+                    ids == selected,
+                    selected_value,
+                    np.where(ids != background, other_value, background_value),
                 )
+
+            if selected is None:
+                return LabelLookupTable(func, max_label=background)
+            return LabelLookupTable(func, max_label=max(selected, background))
         else:
             raise ValueError("Unsupported Color Mode")
-        return image
 
     def new_colormap(self):
         self.seed = np.random.rand()
@@ -633,27 +662,65 @@ class Labels(Image):
     def _reset_history(self, event=None):
         self._undo_history = deque()
         self._redo_history = deque()
+        self._history_nbytes = 0
 
     def _trim_history(self):
+        """Drop the oldest edits until the history fits in its byte budget.
+
+        The most recent edit is always kept so that it can be undone.
+        """
         while (
-            len(self._undo_history) + len(self._redo_history)
-            > self._history_limit
+            self._history_nbytes > self._history_max_bytes
+            and len(self._undo_history) > 1
         ):
-            self._undo_history.popleft()
+            entry = self._undo_history.popleft()
+            self._history_nbytes -= history_entry_nbytes(entry)
 
     def _save_history(self):
+        """Start a new history entry for the next edits.
+
+        While ``_block_saving`` is set, for example during a drag stroke,
+        edits keep being added to the current entry so they are undone
+        together.
+        """
+        if not self._block_saving and (
+            len(self._undo_history) == 0 or self._undo_history[-1]
+        ):
+            self._undo_history.append([])
+
+    def _record_history(self, key):
+        """Save the values of a region of data before it is edited.
+
+        Parameters
+        ----------
+        key : tuple of int, slice or array
+            Index into data of the region about to be edited.
+        """
+        for entry in self._redo_history:
+            self._history_nbytes -= history_entry_nbytes(entry)
         self._redo_history = deque()
-        if not self._block_saving:
-            self._undo_history.append(self.data[self._slice_indices].copy())
-            self._trim_history()
+        if len(self._undo_history) == 0:
+            self._undo_history.append([])
+
+        item = (key, np.array(self.data[key], copy=True))
+        self._undo_history[-1].append(item)
+        self._history_nbytes += history_entry_nbytes([item])
+        self._trim_history()
 
     def _load_history(self, before, after):
+        while len(before) > 0 and not before[-1]:
+            before.pop()
         if len(before) == 0:
             return
 
-        prev = before.pop()
-        after.append(self.data[self._slice_indices].copy())
-        self.data[self._slice_indices] = prev
+        entry = before.pop()
+        # Restore the regions in reverse order, saving their current values
+        # so the edit can be re-applied by loading the new entry.
+        swapped = []
+        for key, values in reversed(entry):
+            swapped.append((key, np.array(self.data[key], copy=True)))
+            self.data[key] = values
+        after.append(swapped)
 
         self.refresh()
 
@@ -716,6 +783,17 @@ class Labels(Image):
                     matches, labeled_matches == match_label
                 )
 
+        box = mask_bounding_box(matches)
+        if self.n_dimensional or self.ndim == 2:
+            key = box
+        else:
+            displayed = iter(box)
+            key = tuple(
+                next(displayed) if isinstance(index, slice) else index
+                for index in self._slice_indices
+            )
+        self._record_history(key)
+
         # Replace target pixels with new_label
         labels[matches] = new_label
 
@@ -816,6 +894,7 @@ class Labels(Image):
         # slice_coord from circle brush is tuple of coord. arrays per dimension
 
         # update the labels image
+        self._record_history(slice_coord)
 
         if not self.preserve_labels:
             self.data[slice_coord] = new_label
@@ -1,7 +1,5 @@
 import numpy as np
 
-from ._points_utils import points_in_box
-
 
 def select(layer, event):
     """Select points.
@@ -66,9 +64,7 @@ def select(layer, event):
     if layer._is_selecting:
         layer._is_selecting = False
         if len(layer._view_data) > 0:
-            selection = points_in_box(
-                layer._drag_box, layer._view_data, layer._view_size
-            )
+            selection = layer._points_in_box(layer._drag_box)
             # If shift combine drag selection with existing selected ones
             if modify_selection:
                 new_selected = layer._indices_view[selection]
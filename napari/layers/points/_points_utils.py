@@ -76,3 +76,97 @@ def points_in_box(corners, points, sizes):
     # Determine indices of points which have at least one corner inside box
     inside = np.unique(point_corners_in_box % len(points))
     return list(inside)
+
+
+class PointsIndex:
+    """Index of points by the plane they lie in.
+
+    Points are bucketed by their integer coordinates along the
+    non-displayed dimensions, so the points in a slice can be found without
+    scanning all the data.
+
+    Parameters
+    ----------
+    data : (N, D) array
+        Coordinates of the points.
+    not_displayed : sequence of int
+        Dimensions that are sliced through.
+
+    Attributes
+    ----------
+    not_displayed : tuple of int
+        Dimensions that are sliced through.
+    """
+
+    def __init__(self, data, not_displayed):
+        self.not_displayed = tuple(not_displayed)
+        self._planes = {}
+        self._add_to_planes(data, 0)
+
+    def plane(self, indices):
+        """Get the points in a plane.
+
+        Parameters
+        ----------
+        indices : sequence of int
+            Integer coordinates of the plane along the non-displayed
+            dimensions.
+
+        Returns
+        -------
+        plane_indices : (M,) array
+            Sorted indices of the points in the plane.
+        """
+        key = tuple(int(i) for i in indices)
+        return self._planes.get(key, np.empty(0, dtype=int))
+
+    def add(self, data, start):
+        """Add new points to the index.
+
+        Parameters
+        ----------
+        data : (N, D) array
+            Coordinates of the new points.
+        start : int
+            Index of the first new point, which must be larger than the
+            index of every point already in the index.
+        """
+        self._add_to_planes(data, start)
+
+    def remove(self, index):
+        """Remove points from the index and renumber the remaining ones.
+
+        Parameters
+        ----------
+        index : sequence of int
+            Indices of the points to remove.
+        """
+        removed = np.unique(np.asarray(index, dtype=int))
+        for key, plane_indices in list(self._planes.items()):
+            keep = plane_indices[~np.isin(plane_indices, removed)]
+            if len(keep) == 0:
+                del self._planes[key]
+            else:
+                self._planes[key] = keep - np.searchsorted(removed, keep)
+
+    def _add_to_planes(self, data, start):
+        """Add points to the plane buckets in sorted order."""
+        if len(data) == 0:
+            return
+        keys = np.asarray(data)[:, list(self.not_displayed)].astype(int)
+        if keys.shape[1] == 0:
+            order = np.arange(len(keys))
+            starts = np.array([0])
+        else:
+            # lexsort is stable, so indices in each bucket stay sorted
+            order = np.lexsort(keys.T[::-1])
+            keys = keys[order]
+            changes = np.any(np.diff(keys, axis=0) != 0, axis=1)
+            starts = np.concatenate([[0], np.flatnonzero(changes) + 1])
+        stops = np.append(starts[1:], len(order))
+        for first, last in zip(starts, stops):
+            key = tuple(keys[first].tolist())
+            new_indices = order[first:last] + start
+            if key in self._planes:
+                new_indices = np.concatenate((self._planes[key], new_indices))
+            self._planes[key] = new_indices
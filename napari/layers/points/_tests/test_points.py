@@ -8,7 +8,10 @@ from vispy.color import get_colormap
 
 from napari._tests.utils import check_layer_world_data_extent
 from napari.layers import Points
-from napari.layers.points._points_utils import points_to_squares
+from napari.layers.points._points_utils import (
+    points_in_box,
+    points_to_squares,
+)
 from napari.utils.colormaps.standardize_color import transform_color
 
 
@@ -305,6 +308,150 @@ def test_removing_selected_points():
     assert len(layer.data) == shape[0] - 3
 
 
+def test_removing_points_keeps_earlier_arrays():
+    """Test removing points doesn't modify arrays returned before."""
+    layer = Points([[0, 0], [1, 1]], properties={'label': np.array([0, 1])})
+    for coord in [[2, 2], [3, 3], [4, 4]]:
+        layer.add(coord)
+    data = layer.data
+    size = layer.size
+    face_color = layer.face_color
+    label = layer.properties['label']
+    expected = [np.copy(a) for a in (data, size, face_color, label)]
+
+    layer.selected_data = {0}
+    layer.remove_selected()
+    assert len(layer.data) == 4
+    for array, values in zip((data, size, face_color, label), expected):
+        np.testing.assert_array_equal(array, values)
+
+
+def test_adding_to_older_data_keeps_newer_arrays():
+    """Test adding to data set back from an older array doesn't modify newer
+    arrays."""
+    layer = Points([[0, 0], [1, 1]])
+    layer.add([2, 2])
+    older = layer.data
+    layer.add([3, 3])
+    newer = layer.data
+
+    layer.data = older
+    layer.add([9, 9])
+    np.testing.assert_array_equal(newer[-1], [3, 3])
+    np.testing.assert_array_equal(layer.data[-1], [9, 9])
+
+
+def test_slicing_after_adding_and_removing():
+    """Test the points index stays in sync with the data."""
+    data = np.array([[0, 5, 5], [1, 6, 6], [0, 7, 7], [2, 8, 8], [1, 9, 9]])
+    layer = Points(data)
+    np.testing.assert_array_equal(layer._indices_view, [0, 2])
+
+    layer.add([0, 3, 3])
+    np.testing.assert_array_equal(layer._indices_view, [0, 2, 5])
+
+    layer.selected_data = {0, 1}
+    layer.remove_selected()
+    np.testing.assert_array_equal(layer._indices_view, [0, 3])
+    np.testing.assert_array_equal(layer._view_data, [[7, 7], [3, 3]])
+
+    layer._slice_dims([1, 0, 0], ndisplay=2)
+    np.testing.assert_array_equal(layer._indices_view, [2])
+
+    # Slice through a different dimension
+    layer._slice_dims([0, 0, 8], ndisplay=2, order=[2, 0, 1])
+    np.testing.assert_array_equal(layer._indices_view, [1])
+
+
+def test_slicing_after_editing_data_in_place():
+    """Test refreshing after editing the data in place re-slices it."""
+    layer = Points(np.array([[0, 5, 5], [0, 6, 6], [1, 7, 7]]))
+    np.testing.assert_array_equal(layer._indices_view, [0, 1])
+    points_index = layer._points_index
+
+    # Slicing and adding points keep the index
+    layer._slice_dims([1, 0, 0], ndisplay=2)
+    layer.add([1, 8, 8])
+    np.testing.assert_array_equal(layer._indices_view, [2, 3])
+    assert layer._points_index is points_index
+
+    layer.data[0, 0] = 1
+    layer.refresh()
+    np.testing.assert_array_equal(layer._indices_view, [0, 2, 3])
+    layer._slice_dims([0, 0, 0], ndisplay=2)
+    np.testing.assert_array_equal(layer._indices_view, [1])
+
+
+def test_value_and_box_with_many_points():
+    """Test hit-testing matches a full scan of the points in view."""
+    np.random.seed(0)
+    data = 1000 * np.random.random((2000, 2))
+    layer = Points(data, size=np.random.randint(1, 20, 2000))
+
+    layer.position = tuple(data[7])
+    sizes = layer._view_size[:, np.newaxis] / 2
+    hits = np.all(abs(data - data[7]) <= sizes, axis=1)
+    assert layer.get_value() == np.flatnonzero(hits)[-1]
+
+    box = np.array([[100, 200], [400, 300]])
+    expected = points_in_box(box, layer._view_data, layer._view_size)
+    np.testing.assert_array_equal(layer._points_in_box(box), expected)
+
+
+def test_batched_update():
+    """Test changes inside a batched update emit a single data event."""
+    shape = (10, 2)
+    np.random.seed(0)
+    data = 20 * np.random.random(shape)
+    layer = Points(data)
+    events = []
+    layer.events.data.connect(events.append)
+    layer.events.set_data.connect(events.append)
+
+    with layer.batched_update():
+        for i in range(5):
+            layer.add([i, i])
+        layer.selected_data = {0, 12}
+        layer.remove_selected()
+        assert len(events) == 0
+
+    assert len(events) == 2
+    assert len(layer.data) == 13
+    np.testing.assert_array_equal(layer.data[-2:], [[3, 3], [4, 4]])
+    assert len(layer.size) == len(layer.face_color) == 13
+    assert len(layer._indices_view) == 13
+
+
+def test_level_of_detail():
+    """Test only one point per screen-space bin is drawn when zoomed out."""
+    np.random.seed(0)
+    data = 100 * np.random.random((1000, 2))
+    layer = Points(data)
+    assert layer._view_lod_index is None
+
+    layer._lod_threshold = 100
+    events = []
+    layer.events.set_data.connect(events.append)
+    corners = np.array([[0, 0], [100, 100]])
+    layer._update_draw(8, corners, (100, 100))
+    assert len(events) == 1
+
+    # Bins are 16 world units wide, so there are at most 7 x 7 of them
+    lod_index = layer._view_lod_index
+    assert 0 < len(lod_index) <= 49
+    bins = np.floor(data[lod_index] / 16)
+    assert len(np.unique(bins, axis=0)) == len(lod_index)
+    # The last point is drawn on top, so it is always kept
+    assert lod_index[-1] == len(data) - 1
+
+    # Redraws only happen when the level of detail changes
+    layer._update_draw(7, corners, (100, 100))
+    assert len(events) == 1
+    layer._update_draw(0.01, corners, (100, 100))
+    assert len(events) == 2
+    assert len(layer._view_lod_index) == len(data)
+
+
 def test_move():
     """Test moving points."""
     shape = (10, 2)
@@ -627,6 +774,31 @@ def test_set_text_with_kwarg_dict(properties):
         np.testing.assert_equal(layer_value, value)
 
 
+def test_text_declutter():
+    """Test that only non-overlapping text near the canvas is drawn"""
+    np.random.seed(0)
+    data = 1000 * np.random.random((1000, 2))
+    properties = {'id': np.arange(1000)}
+    layer = Points(
+        data, properties=properties, text={'text': '{id}', 'declutter': True}
+    )
+    # every text element is drawn before the canvas is known
+    assert len(layer._view_text) == 1000
+
+    layer._update_draw(1, np.array([[0, 0], [100, 100]]), (1024, 1024))
+    text_coords, _, _ = layer._view_text_coords
+    text = layer._view_text
+    assert 0 < len(text) < 1000
+    assert len(text_coords) == len(text)
+    assert np.all(text_coords <= 150)
+    # the text is drawn at the points it belongs to
+    index = [int(t) for t in text]
+    np.testing.assert_allclose(text_coords, data[index])
+
+    layer.text.declutter = False
+    assert len(layer._view_text) == 1000
+
+
 @pytest.mark.parametrize("properties", [properties_array, properties_list])
 def test_text_error(properties):
     """creating a layer with text as the wrong type should raise an error"""
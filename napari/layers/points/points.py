@@ -1,9 +1,11 @@
 import warnings
+from contextlib import contextmanager
 from copy import copy, deepcopy
 from itertools import cycle
 from typing import Dict, List, Tuple, Union
 
 import numpy as np
+from scipy.spatial import cKDTree
 
 from ...utils.colormaps import Colormap, ValidColormapArg, ensure_colormap
 from ...utils.colormaps.standardize_color import (
@@ -15,6 +17,7 @@ from ...utils.colormaps.standardize_color import (
 from ...utils.events import Event
 from ...utils.status_messages import format_float
 from ..base import Layer
+from ..utils._column_buffers import ColumnBuffers
 from ..utils.color_transformations import (
     ColorType,
     normalize_and_broadcast_colors,
@@ -29,7 +32,12 @@ from ..utils.layer_utils import (
 from ..utils.text import TextManager
 from ._points_constants import SYMBOL_ALIAS, ColorMode, Mode, Symbol
 from ._points_mouse_bindings import add, highlight, select
-from ._points_utils import create_box, points_to_squares
+from ._points_utils import (
+    PointsIndex,
+    create_box,
+    points_in_box,
+    points_to_squares,
+)
 
 DEFAULT_COLOR_CYCLE = np.array([[1, 0, 1, 1], [0, 1, 0, 1]])
 
@@ -233,6 +241,11 @@ class Points(Layer):
     # If more points are present then they are randomly subsampled
     _max_points_thumbnail = 1024
 
+    # When more points than this are in view in 2D, only one point is drawn
+    # for each bin of _lod_bin_size canvas pixels
+    _lod_threshold = 100_000
+    _lod_bin_size = 2
+
     def __init__(
         self,
         data=None,
@@ -308,8 +321,23 @@ class Points(Layer):
 
         self._colors = get_color_namelist()
 
+        # Spare capacity for appending to the per-point arrays
+        self._buffers = ColumnBuffers()
+        # Nesting depth of batched_update blocks, and whether anything
+        # changed inside them that still needs a refresh
+        self._batch_depth = 0
+        self._batch_changed = False
+
         # Save the point coordinates
         self._data = np.asarray(data)
+        # Index of points by plane, built when first sliced
+        self._points_index = None
+        self._keep_points_index = False
+        # KD-tree and half sizes of the points in view, built when needed
+        self._view_tree = None
+        # Points drawn at each level of detail, computed when needed
+        self._lod_level = None
+        self._lod_cache = {}
 
         # Save the properties
         if properties is None:
@@ -480,8 +508,22 @@ class Points(Layer):
 
     @data.setter
     def data(self, data: np.ndarray):
+        self._set_data(data)
+
+    def _set_data(self, data: np.ndarray, points_index=None):
+        """Set the point coordinates.
+
+        Parameters
+        ----------
+        data : (N, D) array
+            Coordinates for N points in D dimensions.
+        points_index : PointsIndex, optional
+            Index already updated for the new data. If None, the index is
+            rebuilt the next time the points are sliced.
+        """
         cur_npoints = len(self._data)
         self._data = data
+        self._points_index = points_index
 
         # Adjust the size array when the number of points has changed
         if len(data) < cur_npoints:
@@ -515,8 +557,8 @@ class Points(Layer):
                     new_property = np.repeat(
                         self.current_properties[k], adding, axis=0
                     )
-                    self.properties[k] = np.concatenate(
-                        (self.properties[k], new_property), axis=0
+                    self.properties[k] = self._buffers.append(
+                        ('properties', k), self.properties[k], new_property
                     )
 
                 # add new edge colors
@@ -525,13 +567,67 @@ class Points(Layer):
                 # add new face colors
                 self._add_point_color(adding, 'face')
 
-                self.size = np.concatenate((self._size, size), axis=0)
+                self._size = self._buffers.append('size', self._size, size)
                 self.selected_data = set(np.arange(cur_npoints, len(data)))
 
                 self.text.add(self.current_properties, adding)
 
-        self._update_dims()
-        self.events.data()
+        if self._batch_depth > 0:
+            self._batch_changed = True
+        else:
+            with self._keeping_points_index():
+                self._update_dims()
+            self.events.data()
+
+    @contextmanager
+    def batched_update(self):
+        """Combine the changes made inside the block into one update.
+
+        Slicing, highlighting and the data event are deferred until the end
+        of the outermost block, so the visual is updated once when adding,
+        removing or moving many points one at a time.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_changed:
+                self._batch_changed = False
+                with self._keeping_points_index():
+                    self._update_dims()
+                self.events.data()
+
+    @contextmanager
+    def _keeping_points_index(self):
+        """Keep the index of points by plane when refreshing in the block.
+
+        Used where the index is known to match the data, such as when only
+        the slice changed or points were moved within their plane.
+        """
+        keep = self._keep_points_index
+        self._keep_points_index = True
+        try:
+            yield
+        finally:
+            self._keep_points_index = keep
+
+    def refresh(self, event=None):
+        """Refresh all layer data based on current view slice.
+
+        The index of points by plane is rebuilt on the next slice, so edits
+        made to ``data`` in place are shown.
+        """
+        if not self._keep_points_index:
+            self._points_index = None
+        if self._batch_depth > 0:
+            self._batch_changed = True
+            return
+        super().refresh(event)
+
+    def _slice_dims(self, point=None, ndisplay=2, order=None):
+        with self._keeping_points_index():
+            super()._slice_dims(point=point, ndisplay=ndisplay, order=order)
 
     def _add_point_color(self, adding: int, attribute: str):
         """Add the edge or face colors for new points.
@@ -584,9 +680,10 @@ class Points(Layer):
         if len(colors) == 0:
             setattr(self, f'_{attribute}_color', new_colors)
         else:
-            setattr(
-                self, f'_{attribute}_color', np.vstack((colors, new_colors))
+            colors = self._buffers.append(
+                f'{attribute}_color', colors, new_colors
             )
+            setattr(self, f'_{attribute}_color', colors)
 
     @property
     def properties(self) -> Dict[str, np.ndarray]:
@@ -614,7 +711,7 @@ class Points(Layer):
                 'property used for edge_color dropped', RuntimeWarning
             )
 
-        if self.text.values is not None:
+        if self.text._has_values:
             self.refresh_text()
 
     @property
@@ -1397,7 +1494,10 @@ class Points(Layer):
         text : (N x 1) np.ndarray
             Array of text strings for the N text elements in view
         """
-        return self.text.view_text(self._indices_view)
+        index = self._view_text_index
+        if index is None:
+            return self.text.view_text(self._indices_view)
+        return self.text.view_text(np.asarray(self._indices_view)[index])
 
     @property
     def _view_text_coords(self) -> np.ndarray:
@@ -1408,9 +1508,32 @@ class Points(Layer):
         text_coords : (N x D) np.ndarray
             Array of coordindates for the N text elements in view
         """
-        return self.text.compute_text_coords(
+        text_coords, anchor_x, anchor_y = self.text.compute_text_coords(
             self._view_data, self._dims.ndisplay
         )
+        if self.text.declutter:
+            index = self.text._declutter_index(
+                self._indices_view, text_coords, anchor_x, anchor_y
+            )
+            if index is not None:
+                text_coords = text_coords[index]
+        return text_coords, anchor_x, anchor_y
+
+    @property
+    def _view_text_index(self) -> Union[None, np.ndarray]:
+        """Indices into the points in view of the text elements to draw.
+
+        None if the text is not decluttered and every text element in view
+        is drawn.
+        """
+        if not self.text.declutter:
+            return None
+        return self.text._declutter_index(
+            self._indices_view,
+            *self.text.compute_text_coords(
+                self._view_data, self._dims.ndisplay
+            ),
+        )
 
     @property
     def _view_size(self) -> np.ndarray:
@@ -1505,13 +1628,107 @@ class Points(Layer):
                 slice_indices = np.where(matches)[0].astype(int)
                 return slice_indices, scale
             else:
-                data = self.data[:, not_disp].astype('int')
-                matches = np.all(data == indices[not_disp], axis=1)
-                slice_indices = np.where(matches)[0].astype(int)
+                points_index = self._get_points_index()
+                slice_indices = points_index.plane(indices[not_disp])
                 return slice_indices, 1
         else:
             return [], []
 
+    def _get_lod_level(self) -> Union[None, int]:
+        """Level of detail to draw the points in view at.
+
+        Returns
+        -------
+        level : int or None
+            Bins of ``2 ** level`` world units are used to subsample the
+            points, or None if all the points in view are drawn.
+        """
+        if (
+            self._dims.ndisplay != 2
+            or len(self._indices_view) <= self._lod_threshold
+        ):
+            return None
+        # Round the bin size up to a power of two so that the points only
+        # need to be binned again after zooming by a factor of two
+        bin_size = self.scale_factor * self._lod_bin_size
+        return int(np.ceil(np.log2(bin_size)))
+
+    @property
+    def _view_lod_index(self) -> Union[None, np.ndarray]:
+        """Indices into the points in view of the points to draw.
+
+        When zoomed out on many points, most of them fall on the same canvas
+        pixels, so only the most recently added point in each screen-space
+        bin is drawn. When zoomed in, or with few points in view, this is
+        None and every point is drawn.
+        """
+        level = self._get_lod_level()
+        if level is None:
+            return None
+        if level not in self._lod_cache:
+            scale = np.asarray(self.scale)[self._dims.displayed]
+            bins = np.floor(self._view_data * scale / 2 ** level)
+            bins = (bins - bins.min(axis=0)).astype(np.int64)
+            key = bins[:, 0] * (bins[:, 1].max() + 1) + bins[:, 1]
+            # Search from the end to keep the most recently added point,
+            # which is the one drawn on top
+            _, last = np.unique(key[::-1], return_index=True)
+            self._lod_cache[level] = np.sort(len(key) - 1 - last)
+        return self._lod_cache[level]
+
+    def _update_draw(self, scale_factor, corner_pixels, shape_threshold):
+        """Update canvas scale and corner values on draw.
+
+        Redraws the points if the level of detail has changed, and the text
+        if it needs to be decluttered again.
+
+        Parameters
+        ----------
+        scale_factor : float
+            Scale factor going from canvas to world coordinates.
+        corner_pixels : array
+            Coordinates of the top-left and bottom-right canvas pixels in the
+            world coordinates.
+        shape_threshold : tuple
+            Requested shape of field of view in data coordinates.
+        """
+        super()._update_draw(scale_factor, corner_pixels, shape_threshold)
+        level = self._get_lod_level()
+        if level != self._lod_level:
+            self._lod_level = level
+            self.events.set_data()
+        displayed = self._dims.displayed
+        if self.text._update_canvas(
+            scale_factor,
+            self.corner_pixels[:, displayed],
+            np.asarray(self.scale)[displayed],
+        ):
+            self.text.events.text()
+
+    def _get_points_index(self) -> PointsIndex:
+        """Get the index of points by plane, building it if needed."""
+        not_disp = tuple(self._dims.not_displayed)
+        if (
+            self._points_index is None
+            or self._points_index.not_displayed != not_disp
+        ):
+            self._points_index = PointsIndex(self.data, not_disp)
+        return self._points_index
+
+    def _get_view_tree(self) -> Tuple[cKDTree, np.ndarray]:
+        """Get a KD-tree of the points in view, building it if needed.
+
+        Returns
+        -------
+        tree : scipy.spatial.cKDTree
+            KD-tree of the displayed coordinates of the points in view.
+        half_sizes : (M,) array
+            Half of the size of each point in view.
+        """
+        if self._view_tree is None:
+            self._view_tree = (cKDTree(self._view_data), self._view_size / 2)
+        return self._view_tree
+
     def _get_value(self) -> Union[None, int]:
         """Determine if points at current coordinates.
 
@@ -1521,14 +1738,20 @@ class Points(Layer):
             Index of point that is at the current coordinate if any.
         """
         # Display points if there are any in this slice
-        if len(self._view_data) > 0:
-            # Get the point sizes
-            distances = abs(self._view_data - self.displayed_coordinates)
+        if len(self._indices_view) > 0:
+            tree, half_sizes = self._get_view_tree()
+            coord = self.displayed_coordinates
+            # Find the points near enough to be hit by the largest point,
+            # then check them against their own sizes
+            candidates = np.sort(
+                tree.query_ball_point(coord, half_sizes.max(), p=np.inf)
+            ).astype(int)
+            distances = abs(tree.data[candidates] - coord)
             in_slice_matches = np.all(
-                distances <= np.expand_dims(self._view_size, axis=1) / 2,
+                distances <= np.expand_dims(half_sizes[candidates], axis=1),
                 axis=1,
             )
-            indices = np.where(in_slice_matches)[0]
+            indices = candidates[in_slice_matches]
             if len(indices) > 0:
                 selection = self._indices_view[indices[-1]]
             else:
@@ -1538,12 +1761,46 @@ class Points(Layer):
 
         return selection
 
+    def _points_in_box(self, corners) -> np.ndarray:
+        """Find the points in view inside an axis aligned box.
+
+        Parameters
+        ----------
+        corners : (2, 2) array
+            Two opposite corners of the box in displayed coordinates.
+
+        Returns
+        -------
+        inside : (M,) array
+            Indices into the points in view of the points inside the box.
+        """
+        if len(self._indices_view) == 0:
+            return np.empty(0, dtype=int)
+        tree, half_sizes = self._get_view_tree()
+        corners = np.asarray(corners)
+        center = corners.mean(axis=0)
+        # The squares around points reach sqrt(2) / 2 of their size out,
+        # so look that far beyond the box for candidates
+        radius = abs(corners[1] - corners[0]).max() / 2
+        radius += np.sqrt(2) * half_sizes.max()
+        candidates = np.sort(
+            tree.query_ball_point(center, radius, p=np.inf)
+        ).astype(int)
+        if len(candidates) == 0:
+            return candidates
+        inside = points_in_box(
+            corners, tree.data[candidates], 2 * half_sizes[candidates]
+        )
+        return candidates[inside]
+
     def _set_view_slice(self):
         """Sets the view given the indices to slice with."""
         # get the indices of points in view
         indices, scale = self._slice_data(self._slice_indices)
         self._view_size_scale = scale
         self._indices_view = indices
+        self._view_tree = None
+        self._lod_cache = {}
         # get the selected points that are in view
         self._selected_view = list(
             np.intersect1d(
@@ -1565,6 +1822,10 @@ class Points(Layer):
         force : bool
             Bool that forces a redraw to occur when `True`
         """
+        # The view is out of date until the end of a batched update
+        if self._batch_depth > 0:
+            self._batch_changed = True
+            return
         # Check if any point ids have changed since last call
         if self.selected:
             if (
@@ -1666,25 +1927,39 @@ class Points(Layer):
         ----------
         coord : sequence of indices to add point at
         """
-        self.data = np.append(self.data, np.atleast_2d(coord), axis=0)
+        coord = np.atleast_2d(coord)
+        points_index = self._points_index
+        if points_index is not None:
+            points_index.add(coord, len(self.data))
+        data = self._buffers.append('data', self.data, coord)
+        self._set_data(data, points_index)
 
     def remove_selected(self):
         """Removes selected points if any."""
         index = list(self.selected_data)
         index.sort()
         if len(index) > 0:
-            self._size = np.delete(self._size, index, axis=0)
-            self._edge_color = np.delete(self.edge_color, index, axis=0)
-            self._face_color = np.delete(self.face_color, index, axis=0)
+            buffers = self._buffers
+            self._size = buffers.delete('size', self._size, index)
+            self._edge_color = buffers.delete(
+                'edge_color', self.edge_color, index
+            )
+            self._face_color = buffers.delete(
+                'face_color', self.face_color, index
+            )
             for k in self.properties:
-                self.properties[k] = np.delete(
-                    self.properties[k], index, axis=0
+                self.properties[k] = buffers.delete(
+                    ('properties', k), self.properties[k], index
                 )
             self.text.remove(index)
             if self._value in self.selected_data:
                 self._value = None
             self.selected_data = set()
-            self.data = np.delete(self.data, index, axis=0)
+            points_index = self._points_index
+            if points_index is not None:
+                points_index.remove(index)
+            data = buffers.delete('data', self.data, index)
+            self._set_data(data, points_index)
 
     def _move(self, index, coord):
         """Moves points relative drag start location.
@@ -1707,7 +1982,8 @@ class Points(Layer):
             self.data[np.ix_(index, disp)] = (
                 self.data[np.ix_(index, disp)] + shift
             )
-            self.refresh()
+            with self._keeping_points_index():
+                self.refresh()
 
     def _paste_data(self):
         """Paste any point from clipboard and select them."""
@@ -1722,26 +1998,28 @@ class Points(Layer):
                 for i in not_disp
             ]
             data[:, not_disp] = data[:, not_disp] + np.array(offset)
-            self._data = np.append(self.data, data, axis=0)
-            self._size = np.append(
-                self.size, deepcopy(self._clipboard['size']), axis=0
+            if self._points_index is not None:
+                self._points_index.add(data, totpoints)
+            buffers = self._buffers
+            self._data = buffers.append('data', self.data, data)
+            self._size = buffers.append(
+                'size', self.size, self._clipboard['size']
             )
-            self._edge_color = np.vstack(
-                (
-                    self.edge_color,
-                    transform_color(deepcopy(self._clipboard['edge_color'])),
-                )
+            self._edge_color = buffers.append(
+                'edge_color',
+                self.edge_color,
+                transform_color(self._clipboard['edge_color']),
             )
-            self._face_color = np.vstack(
-                (
-                    self.face_color,
-                    transform_color(deepcopy(self._clipboard['face_color'])),
-                )
+            self._face_color = buffers.append(
+                'face_color',
+                self.face_color,
+                transform_color(self._clipboard['face_color']),
             )
             for k in self.properties:
-                self.properties[k] = np.concatenate(
-                    (self.properties[k], self._clipboard['properties'][k]),
-                    axis=0,
+                self.properties[k] = buffers.append(
+                    ('properties', k),
+                    self.properties[k],
+                    self._clipboard['properties'][k],
                 )
             self._selected_view = list(
                 range(npoints, npoints + len(self._clipboard['data']))
@@ -1751,8 +2029,8 @@ class Points(Layer):
             )
 
             if self._clipboard['text'] is not None:
-                self.text._values = np.concatenate(
-                    (self.text.values, self._clipboard['text']), axis=0
+                self.text._paste(
+                    self._clipboard['text'], self._clipboard['properties']
                 )
 
             self.refresh()
@@ -1772,11 +2050,11 @@ class Points(Layer):
                 'indices': self._slice_indices,
             }
 
-            if self.text.values is None:
+            if not self.text._has_values:
                 self._clipboard['text'] = None
 
             else:
-                self._clipboard['text'] = deepcopy(self.text.values[index])
+                self._clipboard['text'] = self.text._get_values(index)
 
         else:
             self._clipboard = {}
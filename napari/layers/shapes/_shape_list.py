@@ -1,9 +1,16 @@
+import dask.array as da
 import numpy as np
+from scipy.spatial import cKDTree
 
 from ._mesh import Mesh
 from ._shapes_constants import ShapeType, shape_classes
 from ._shapes_models import Line, Path, Shape
-from ._shapes_utils import inside_triangles, triangles_intersect_box
+from ._shapes_utils import (
+    contiguous_ranges,
+    inside_triangles,
+    ranges_to_indices,
+    triangles_intersect_box,
+)
 
 
 class ShapeList:
@@ -56,6 +63,16 @@ class ShapeList:
     _mesh : Mesh
         Mesh object containing all the mesh information that will ultimately
         be rendered.
+    _slice_buckets : dict or None
+        Indices of the shapes confined to each slice, keyed by the slice key
+        tuple. Built lazily and cleared whenever shapes are added or removed.
+    _shape_ranges : tuple or None
+        Start and count of the mesh triangles and of the vertices of each
+        shape. Built lazily and cleared whenever shapes are added or removed.
+    _displayed_tree : tuple or None
+        KD-tree of the bounding box centers of the displayed triangles, used
+        by `inside` and `shapes_in_box`. Cleared whenever the displayed
+        triangles change.
     """
 
     def __init__(self, data=[], ndisplay=2):
@@ -76,8 +93,12 @@ class ShapeList:
         self._edge_color = np.empty((0, 4))
         self._face_color = np.empty((0, 4))
 
-        for d in data:
-            self.add(d)
+        self._slice_buckets = None
+        self._shape_ranges = None
+        self._displayed_tree = None
+
+        if len(data) > 0:
+            self.add(list(data))
 
     @property
     def data(self):
@@ -179,38 +200,152 @@ class ShapeList:
             self._slice_key = slice_key
             self._update_displayed()
 
+    def _get_slice_buckets(self):
+        """Return the indices of the shapes confined to each slice.
+
+        Returns
+        -------
+        buckets : dict
+            Array of shape indices for each slice key tuple. Shapes spanning
+            more than one slice are never displayed and are left out.
+        """
+        if self._slice_buckets is None:
+            buckets = {}
+            for index, shape in enumerate(self.shapes):
+                mins, maxs = shape.slice_key
+                if np.all(mins == maxs):
+                    buckets.setdefault(tuple(mins), []).append(index)
+            self._slice_buckets = {
+                key: np.array(value) for key, value in buckets.items()
+            }
+        return self._slice_buckets
+
+    def _get_shape_ranges(self):
+        """Return where the triangles and vertices of each shape are.
+
+        The triangles and vertices of each shape are stored contiguously, so
+        each shape is described by the start and length of its run.
+
+        Returns
+        -------
+        triangle_ranges : tuple of (N,) array
+            Start and count of the mesh triangles of each shape.
+        vertex_ranges : tuple of (N,) array
+            Start and count of the vertices of each shape.
+        mesh_vertex_ranges : tuple of (N,) array
+            Start and count of the mesh vertices of each shape.
+        """
+        if self._shape_ranges is None:
+            n_shapes = len(self.shapes)
+            self._shape_ranges = (
+                contiguous_ranges(self._mesh.triangles_index[:, 0], n_shapes),
+                contiguous_ranges(self._index, n_shapes),
+                contiguous_ranges(self._mesh.vertices_index[:, 0], n_shapes),
+            )
+        return self._shape_ranges
+
+    def _clear_shape_indices(self):
+        """Clear the slice buckets and ranges after adding or removing."""
+        self._slice_buckets = None
+        self._shape_ranges = None
+
     def _update_displayed(self):
         """Update the displayed data based on the slice key."""
-        # The list slice key is repeated to check against both the min and
-        # max values stored in the shapes slice key.
-        slice_key = np.array([self.slice_key, self.slice_key])
-
-        # Slice key must exactly match mins and maxs of shape as then the
-        # shape is entirely contained within the current slice.
-        if len(self.shapes) > 0:
-            self._displayed = np.all(self.slice_keys == slice_key, axis=(1, 2))
-        else:
+        # Only shapes whose slice key min and max both match the current
+        # slice key are entirely contained within the current slice.
+        buckets = self._get_slice_buckets()
+        disp_indices = buckets.get(
+            tuple(self.slice_key), np.empty(0, dtype=int)
+        )
+        self._displayed = np.zeros(len(self.shapes), dtype=bool)
+        self._displayed[disp_indices] = True
+        if len(self.shapes) == 0:
             self._displayed = []
-        disp_indices = np.where(self._displayed)[0]
 
-        z_order = self._mesh.triangles_z_order
-        disp_tri = np.isin(
-            self._mesh.triangles_index[z_order, 0], disp_indices
-        )
-        self._mesh.displayed_triangles = self._mesh.triangles[z_order][
+        (
+            (tri_starts, tri_counts),
+            (vert_starts, vert_counts),
+            _,
+        ) = self._get_shape_ranges()
+
+        # Gather the triangles of the displayed shapes in z order
+        z_rank = np.full(len(self.shapes), len(self._z_order))
+        z_rank[self._z_order] = np.arange(len(self._z_order))
+        disp_z = disp_indices[np.argsort(z_rank[disp_indices], kind='stable')]
+        disp_tri = ranges_to_indices(tri_starts[disp_z], tri_counts[disp_z])
+        self._mesh.displayed_triangles = self._mesh.triangles[disp_tri]
+        self._mesh.displayed_triangles_index = self._mesh.triangles_index[
             disp_tri
         ]
-        self._mesh.displayed_triangles_index = self._mesh.triangles_index[
-            z_order
-        ][disp_tri]
         self._mesh.displayed_triangles_colors = self._mesh.triangles_colors[
-            z_order
-        ][disp_tri]
+            disp_tri
+        ]
+        self._displayed_tree = None
 
-        disp_vert = np.isin(self._index, disp_indices)
+        # Gather the vertices of the displayed shapes in storage order
+        disp_vert = disp_indices[np.argsort(vert_starts[disp_indices])]
+        disp_vert = ranges_to_indices(
+            vert_starts[disp_vert], vert_counts[disp_vert]
+        )
         self.displayed_vertices = self._vertices[disp_vert]
         self.displayed_index = self._index[disp_vert]
 
+    def _get_displayed_tree(self):
+        """Return a spatial index of the displayed triangles.
+
+        Returns
+        -------
+        triangles : (M, 3, 2) array
+            Vertices of the displayed triangles in the first two displayed
+            dimensions, which are the ones `inside` and `shapes_in_box`
+            test against.
+        tree : scipy.spatial.cKDTree
+            KD-tree of the bounding box centers of the triangles.
+        half_sizes : (M, 2) array
+            Half the size of the bounding box of each triangle.
+        """
+        if self._displayed_tree is None:
+            triangles = self._mesh.vertices[self._mesh.displayed_triangles]
+            triangles = triangles[..., :2]
+            mins = triangles.min(axis=1, initial=np.inf)
+            maxs = triangles.max(axis=1, initial=-np.inf)
+            tree = cKDTree((mins + maxs) / 2)
+            self._displayed_tree = (triangles, tree, (maxs - mins) / 2)
+        return self._displayed_tree
+
+    def _triangles_near(self, center, half_size):
+        """Find displayed triangles whose bounding box overlaps a box.
+
+        Parameters
+        ----------
+        center : (2,) array
+            Center of the box.
+        half_size : (2,) array
+            Half the size of the box.
+
+        Returns
+        -------
+        indices : array of int
+            Sorted indices of the triangles in the displayed triangles.
+        triangles : (K, 3, 2) array
+            Vertices of those triangles.
+        """
+        triangles, tree, half_sizes = self._get_displayed_tree()
+        if len(triangles) == 0:
+            return np.empty(0, dtype=int), triangles
+        radius = np.max(half_size) + np.max(half_sizes)
+        indices = np.array(
+            tree.query_ball_point(center, radius, p=np.inf), dtype=int
+        )
+        indices.sort()
+        overlaps = np.all(
+            abs(tree.data[indices] - center)
+            <= half_size + half_sizes[indices],
+            axis=1,
+        )
+        indices = indices[overlaps]
+        return indices, triangles[indices]
+
     def add(
         self,
         shape,
@@ -219,13 +354,21 @@ class ShapeList:
         shape_index=None,
         z_refresh=True,
     ):
-        """Adds a single Shape object
+        """Adds a single Shape object, or a list of Shape objects
 
         Parameters
         ----------
-        shape : subclass Shape
+        shape : subclass Shape | list of subclass Shape
             Must be a subclass of Shape, one of "{'Line', 'Rectangle',
-            'Ellipse', 'Path', 'Polygon'}"
+            'Ellipse', 'Path', 'Polygon'}". If a list is passed all the shapes
+            are appended to the end of the list at once, see
+            `_add_multiple_shapes`.
+        face_color : None | array
+            RGBA face color of the shape. If a list of shapes is passed this
+            must be an (N, 4) array with one color for each shape.
+        edge_color : None | array
+            RGBA edge color of the shape. If a list of shapes is passed this
+            must be an (N, 4) array with one color for each shape.
         shape_index : None | int
             If int then edits the shape date at current index. To be used in
             conjunction with `remove` when renumber is `False`. If None, then
@@ -237,9 +380,23 @@ class ShapeList:
             When adding a batch of shapes, set to false  and then call
             ShapesList._update_z_order() once at the end.
         """
+        if isinstance(shape, (list, tuple)):
+            if shape_index is not None:
+                raise ValueError(
+                    'shape_index can only be used with a single shape'
+                )
+            self._add_multiple_shapes(
+                shape,
+                face_colors=face_color,
+                edge_colors=edge_color,
+                z_refresh=z_refresh,
+            )
+            return
+
         if not issubclass(type(shape), Shape):
             raise ValueError('shape must be subclass of Shape')
 
+        self._clear_shape_indices()
         if shape_index is None:
             shape_index = len(self.shapes)
             self.shapes.append(shape)
@@ -337,6 +494,120 @@ class ShapeList:
             # Set z_order
             self._update_z_order()
 
+    def _add_multiple_shapes(
+        self, shapes, face_colors=None, edge_colors=None, z_refresh=True
+    ):
+        """Appends a list of Shape objects, updating the arrays only once.
+
+        Gives the same result as calling `add` for each shape in turn, but
+        each of the vertex, index, triangle and color arrays is concatenated
+        a single time instead of once per shape.
+
+        Parameters
+        ----------
+        shapes : list of subclass Shape
+            Shapes to be added to the end of the list.
+        face_colors : None | (N, 4) array
+            RGBA face color of each shape. Defaults to white.
+        edge_colors : None | (N, 4) array
+            RGBA edge color of each shape. Defaults to black.
+        z_refresh : bool
+            If set to true, the mesh elements are reindexed with the new z
+            order once all the shapes have been added.
+        """
+        for shape in shapes:
+            if not issubclass(type(shape), Shape):
+                raise ValueError('shape must be subclass of Shape')
+        n_shapes = len(shapes)
+        if n_shapes == 0:
+            return
+        self._clear_shape_indices()
+
+        if face_colors is None:
+            face_colors = np.array([1, 1, 1, 1])
+        face_colors = np.broadcast_to(face_colors, (n_shapes, 4))
+        if edge_colors is None:
+            edge_colors = np.array([0, 0, 0, 1])
+        edge_colors = np.broadcast_to(edge_colors, (n_shapes, 4))
+
+        n_existing = len(self.shapes)
+        shape_indices = np.arange(n_existing, n_existing + n_shapes)
+        self.shapes.extend(shapes)
+        self._z_index = np.concatenate(
+            [self._z_index, [s.z_index for s in shapes]]
+        ).astype(int)
+        self._face_color = np.concatenate([self._face_color, face_colors])
+        self._edge_color = np.concatenate([self._edge_color, edge_colors])
+
+        self._vertices = np.concatenate(
+            [self._vertices] + [s.data_displayed for s in shapes], axis=0
+        )
+        counts = [len(s.data) for s in shapes]
+        self._index = np.concatenate(
+            [self._index, np.repeat(shape_indices, counts)]
+        )
+
+        # Each shape contributes a face block followed by an edge block so
+        # that the mesh is laid out exactly as if the shapes were added one
+        # at a time.
+        vertices = [self._mesh.vertices]
+        centers = [self._mesh.vertices_centers]
+        offsets = [self._mesh.vertices_offsets]
+        triangles = [np.empty((0, 3), dtype=np.int64)]
+        for s in shapes:
+            vertices.append(s._face_vertices)
+            vertices.append(s._edge_vertices + s.edge_width * s._edge_offsets)
+            centers.append(s._face_vertices)
+            centers.append(s._edge_vertices)
+            offsets.append(np.zeros(s._face_vertices.shape))
+            offsets.append(s._edge_offsets)
+            triangles.append(s._face_triangles)
+            triangles.append(s._edge_triangles)
+        n_vertices = np.array([len(v) for v in centers[1:]], dtype=int)
+        n_triangles = np.array([len(t) for t in triangles[1:]], dtype=int)
+
+        # Shift the triangles of each block by the first vertex of the block
+        block_starts = len(self._mesh.vertices) + np.concatenate(
+            [[0], np.cumsum(n_vertices)[:-1]]
+        )
+        triangles = np.concatenate(triangles, axis=0).astype(np.int64)
+        triangles += np.repeat(block_starts, n_triangles)[:, None]
+
+        block_index = np.column_stack(
+            [np.repeat(shape_indices, 2), np.tile([0, 1], n_shapes)]
+        )
+        block_colors = np.stack([face_colors, edge_colors], axis=1).reshape(
+            -1, 4
+        )
+
+        self._mesh.vertices = np.concatenate(vertices, axis=0)
+        self._mesh.vertices_centers = np.concatenate(centers, axis=0)
+        self._mesh.vertices_offsets = np.concatenate(offsets, axis=0)
+        self._mesh.vertices_index = np.concatenate(
+            [
+                self._mesh.vertices_index,
+                np.repeat(block_index, n_vertices, axis=0),
+            ]
+        )
+        self._mesh.triangles = np.concatenate(
+            [self._mesh.triangles, triangles]
+        )
+        self._mesh.triangles_index = np.concatenate(
+            [
+                self._mesh.triangles_index,
+                np.repeat(block_index, n_triangles, axis=0),
+            ]
+        )
+        self._mesh.triangles_colors = np.concatenate(
+            [
+                self._mesh.triangles_colors,
+                np.repeat(block_colors, n_triangles, axis=0),
+            ]
+        )
+
+        if z_refresh:
+            self._update_z_order()
+
     def remove_all(self):
         """Removes all shapes
         """
@@ -346,6 +617,7 @@ class ShapeList:
         self._z_index = np.empty((0), dtype=int)
         self._z_order = np.empty((0), dtype=int)
         self._mesh.clear()
+        self._clear_shape_indices()
         self._update_displayed()
 
     def remove(self, index, renumber=True):
@@ -360,6 +632,7 @@ class ShapeList:
             expectation is that this shape is being immediately added back to the
             list using `add_shape`.
         """
+        self._clear_shape_indices()
         indices = self._index != index
         self._vertices = self._vertices[indices]
         self._index = self._index[indices]
@@ -493,9 +766,101 @@ class ShapeList:
         if edge_color is not None:
             self._edge_color[index] = edge_color
 
-        self.remove(index, renumber=False)
-        self.add(shape, shape_index=index)
-        self._update_z_order()
+        self._replace(index, shape)
+
+    def _replace(self, index, shape):
+        """Replace the shape at index, updating its mesh in place if possible.
+
+        Parameters
+        ----------
+        index : int
+            Location in list of the shape to be replaced.
+        shape : Shape
+            New shape, or the shape at index after its data has changed.
+        """
+        if self._replace_in_place(index, shape):
+            self._update_displayed()
+        else:
+            self.remove(index, renumber=False)
+            self.add(shape, shape_index=index)
+            self._update_z_order()
+
+    def _replace_in_place(self, index, shape):
+        """Write a shape into the mesh slots of the shape at index.
+
+        This is only possible when the new shape has as many vertices, face
+        and edge mesh vertices and face and edge triangles as the old one,
+        which is the usual case when moving a vertex or transforming a
+        shape. The other shapes then keep their position in every array.
+
+        Parameters
+        ----------
+        index : int
+            Location in list of the shape to be replaced.
+        shape : Shape
+            New shape, or the shape at index after its data has changed.
+
+        Returns
+        -------
+        replaced : bool
+            Whether the shape could be replaced in place.
+        """
+        (
+            (tri_starts, tri_counts),
+            (vert_starts, vert_counts),
+            (mesh_starts, mesh_counts),
+        ) = self._get_shape_ranges()
+        n_face = len(shape._face_vertices)
+        n_face_tri = len(shape._face_triangles)
+        mesh_slice = slice(
+            mesh_starts[index], mesh_starts[index] + mesh_counts[index]
+        )
+        tri_slice = slice(
+            tri_starts[index], tri_starts[index] + tri_counts[index]
+        )
+        if (
+            len(shape.data) != vert_counts[index]
+            or shape.z_index != self._z_index[index]
+            or n_face + len(shape._edge_vertices) != mesh_counts[index]
+            or n_face_tri + len(shape._edge_triangles) != tri_counts[index]
+            or np.count_nonzero(self._mesh.vertices_index[mesh_slice, 1] == 0)
+            != n_face
+            or np.count_nonzero(self._mesh.triangles_index[tri_slice, 1] == 0)
+            != n_face_tri
+        ):
+            return False
+
+        self.shapes[index] = shape
+        self._z_index[index] = shape.z_index
+        start = vert_starts[index]
+        self._vertices[start : start + len(shape.data)] = shape.data_displayed
+
+        # Faces come first in the mesh slots of each shape, then edges
+        mesh = self._mesh
+        face = slice(mesh_slice.start, mesh_slice.start + n_face)
+        edge = slice(face.stop, mesh_slice.stop)
+        mesh.vertices[face] = shape._face_vertices
+        mesh.vertices_centers[face] = shape._face_vertices
+        mesh.vertices_offsets[face] = 0
+        mesh.vertices[edge] = (
+            shape._edge_vertices + shape.edge_width * shape._edge_offsets
+        )
+        mesh.vertices_centers[edge] = shape._edge_vertices
+        mesh.vertices_offsets[edge] = shape._edge_offsets
+
+        face_tri = slice(tri_slice.start, tri_slice.start + n_face_tri)
+        edge_tri = slice(face_tri.stop, tri_slice.stop)
+        mesh.triangles[face_tri] = shape._face_triangles + face.start
+        mesh.triangles[edge_tri] = shape._edge_triangles + edge.start
+        mesh.triangles_colors[face_tri] = self._face_color[index]
+        mesh.triangles_colors[edge_tri] = self._edge_color[index]
+
+        # The shape may have moved to another slice
+        mins, maxs = shape.slice_key
+        bucket = self._get_slice_buckets().get(tuple(mins), [])
+        if not (np.all(mins == maxs) and index in bucket):
+            self._slice_buckets = None
+        return True
 
     def update_edge_width(self, index, edge_width):
         """Updates the edge width of a single shape located at index.
@@ -609,10 +974,7 @@ class ShapeList:
             length 2 list specifying coordinate of center of scaling.
         """
         self.shapes[index].scale(scale, center=center)
-        shape = self.shapes[index]
-        self.remove(index, renumber=False)
-        self.add(shape, shape_index=index)
-        self._update_z_order()
+        self._replace(index, self.shapes[index])
 
     def rotate(self, index, angle, center=None):
         """Performs a rotation on a single shape located at index
@@ -656,10 +1018,7 @@ class ShapeList:
             2x2 array specifying linear transform.
         """
         self.shapes[index].transform(transform)
-        shape = self.shapes[index]
-        self.remove(index, renumber=False)
-        self.add(shape, shape_index=index)
-        self._update_z_order()
+        self._replace(index, self.shapes[index])
 
     def outline(self, indices):
         """Finds outlines of shapes listed in indices
@@ -735,10 +1094,12 @@ class ShapeList:
         shapes : list
             List of shapes that are inside the box.
         """
-
-        triangles = self._mesh.vertices[self._mesh.displayed_triangles]
+        corners = np.asarray(corners)
+        center = corners.mean(axis=0)
+        half_size = abs(corners[1] - corners[0]) / 2
+        indices, triangles = self._triangles_near(center, half_size)
         intersects = triangles_intersect_box(triangles, corners)
-        shapes = self._mesh.displayed_triangles_index[intersects, 0]
+        shapes = self._mesh.displayed_triangles_index[indices[intersects], 0]
         shapes = np.unique(shapes).tolist()
 
         return shapes
@@ -758,15 +1119,14 @@ class ShapeList:
             Index of shape if any that is at the coordinates. Returns `None`
             if no shape is found.
         """
-        triangles = self._mesh.vertices[self._mesh.displayed_triangles]
-        indices = inside_triangles(triangles - coord)
-        shapes = self._mesh.displayed_triangles_index[indices, 0]
-
-        if len(shapes) > 0:
-            z_list = self._z_order.tolist()
-            order_indices = np.array([z_list.index(m) for m in shapes])
-            ordered_shapes = shapes[np.argsort(order_indices)]
-            return ordered_shapes[0]
+        coord = np.asarray(coord)[:2]
+        indices, triangles = self._triangles_near(coord, np.zeros(2))
+        indices = indices[inside_triangles(triangles - coord)]
+
+        if len(indices) > 0:
+            # Displayed triangles are in z order, so the first one found
+            # belongs to the shape that comes first in the z order
+            return self._mesh.displayed_triangles_index[indices[0], 0]
         else:
             return None
 
@@ -795,21 +1155,27 @@ class ShapeList:
         if mask_shape is None:
             mask_shape = self.displayed_vertices.max(axis=0).astype('int')
 
-        masks = np.array(
-            [
-                s.to_mask(mask_shape, zoom_factor=zoom_factor, offset=offset)
-                for s in self.shapes
-            ]
-        )
+        masks = np.zeros((len(self.shapes),) + tuple(mask_shape), dtype=bool)
+        for mask, shape in zip(masks, self.shapes):
+            slices, bbox_mask = shape._to_bbox_mask(
+                mask_shape, zoom_factor=zoom_factor, offset=offset
+            )
+            mask[slices] = bbox_mask
 
         return masks
 
-    def to_labels(self, labels_shape=None, zoom_factor=1, offset=[0, 0]):
+    def to_labels(
+        self, labels_shape=None, zoom_factor=1, offset=[0, 0], chunks=None
+    ):
         """Returns a integer labels image, where each shape is embedded in an
         array of shape labels_shape with the value of the index + 1
         corresponding to it, and 0 for background. For overlapping shapes
         z-ordering will be respected.
 
+        Each shape is rasterized over its bounding box only and written
+        straight into the labels image, so no full size mask is created for
+        any shape.
+
         Parameters
         ----------
         labels_shape : np.ndarray | tuple | None
@@ -821,25 +1187,73 @@ class ShapeList:
         offset : 2-tuple
             Offset subtracted from coordinates before multiplying by the
             zoom_factor. Used for putting negative coordinates into the mask.
+        chunks : None | int | tuple
+            If provided, a dask array with these chunks is returned instead,
+            and each chunk is only rasterized when it is computed, in
+            parallel by the dask scheduler. This allows writing labels
+            images too large for memory straight to disk, for example with
+            `to_zarr`. Chunks are computed from the shapes in the list at the
+            time this method is called.
 
         Returns
         -------
-        labels : np.ndarray
+        labels : np.ndarray | dask.array.Array
             MxP integer array where each value is either 0 for background or an
             integer up to N for points inside the corresponding shape.
         """
         if labels_shape is None:
             labels_shape = self.displayed_vertices.max(axis=0).astype(np.int)
+        labels_shape = tuple(int(s) for s in labels_shape)
 
-        labels = np.zeros(labels_shape, dtype=int)
-
-        for ind in self._z_order[::-1]:
-            mask = self.shapes[ind].to_mask(
-                labels_shape, zoom_factor=zoom_factor, offset=offset
+        shapes = list(self.shapes)
+        z_order = self._z_order[::-1].copy()
+        bounds = np.array(
+            [
+                s._mask_bounds(
+                    labels_shape, zoom_factor=zoom_factor, offset=offset
+                )
+                for s in shapes
+            ],
+            dtype=int,
+        ).reshape(-1, 2, len(labels_shape))[z_order]
+
+        def rasterize(origin, block_shape):
+            labels = np.zeros(block_shape, dtype=int)
+            origin = np.array(origin, dtype=int)
+            stop = origin + labels.shape
+            # Only rasterize the shapes whose bounds overlap the block
+            overlaps = np.all(
+                (bounds[:, 0] < stop) & (bounds[:, 1] > origin), axis=1
             )
-            labels[mask] = ind + 1
+            for ind in z_order[overlaps]:
+                # Only the part of the shape inside the block is rasterized
+                slices, mask = shapes[ind]._to_bbox_mask(
+                    labels_shape,
+                    zoom_factor=zoom_factor,
+                    offset=offset,
+                    region=(origin, stop),
+                )
+                block = labels[
+                    tuple(
+                        slice(sl.start - o, sl.stop - o)
+                        for sl, o in zip(slices, origin)
+                    )
+                ]
+                if block.size == 0 or mask.size == 0:
+                    continue
+                block[np.broadcast_to(mask, block.shape)] = ind + 1
+            return labels
 
-        return labels
+        if chunks is None:
+            return rasterize([0] * len(labels_shape), labels_shape)
+
+        def rasterize_block(block, block_info=None):
+            location = block_info[None]['array-location']
+            return rasterize([start for start, _ in location], block.shape)
+
+        return da.zeros(labels_shape, chunks=chunks, dtype=int).map_blocks(
+            rasterize_block, dtype=int
+        )
 
     def to_colors(
         self, colors_shape=None, zoom_factor=1, offset=[0, 0], max_shapes=None
@@ -890,13 +1304,13 @@ class ShapeList:
             z_order_in_view = z_order_in_view[0:max_shapes]
 
         for ind in z_order_in_view:
-            mask = self.shapes[ind].to_mask(
+            slices, mask = self.shapes[ind]._to_bbox_mask(
                 colors_shape, zoom_factor=zoom_factor, offset=offset
             )
             if type(self.shapes[ind]) in [Path, Line]:
                 col = self._edge_color[ind]
             else:
                 col = self._face_color[ind]
-            colors[mask, :] = col
+            colors[slices][mask, :] = col
 
         return colors
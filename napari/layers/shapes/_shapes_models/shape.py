@@ -1,12 +1,11 @@
 from abc import ABC, abstractmethod
-from copy import copy
 
 import numpy as np
 
 from .._shapes_utils import (
     is_collinear,
-    path_to_mask,
-    poly_to_mask,
+    path_to_bbox_mask,
+    poly_to_bbox_mask,
     triangulate_edge,
     triangulate_face,
 )
@@ -383,11 +382,36 @@ class Shape(ABC):
                 'int'
             )
 
+        slices, mask_p = self._to_bbox_mask(
+            mask_shape, zoom_factor=zoom_factor, offset=offset
+        )
+        mask = np.zeros(mask_shape, dtype=bool)
+        mask[slices] = mask_p
+        return mask
+
+    def _mask_plane(self, mask_shape, zoom_factor=1, offset=[0, 0]):
+        """Return the mask plane shape and the vertices to rasterize in it.
+
+        Parameters
+        ----------
+        mask_shape : (D,) array
+            Shape of the full mask.
+        zoom_factor : float
+            Premultiplier applied to coordinates before generating mask.
+        offset : 2-tuple
+            Offset subtracted from coordinates before multiplying by the
+            zoom_factor.
+
+        Returns
+        -------
+        shape_plane : list of int
+            Shape of the mask along the displayed dimensions.
+        data : (N, 2) array
+            Zoomed and offset vertices of the shape in the mask plane.
+        """
         if len(mask_shape) == 2:
-            embedded = False
-            shape_plane = mask_shape
+            shape_plane = list(mask_shape)
         elif len(mask_shape) == self.data.shape[1]:
-            embedded = True
             shape_plane = [mask_shape[d] for d in self.dims_displayed]
         else:
             raise ValueError(
@@ -402,32 +426,113 @@ class Shape(ABC):
             data = self.data_displayed
 
         data = data[:, -len(shape_plane) :]
+        return shape_plane, (data - offset) * zoom_factor
+
+    def _mask_bounds(self, mask_shape, zoom_factor=1, offset=[0, 0]):
+        """Return bounds containing the bounding box of `_to_bbox_mask`.
+
+        These are cheap to compute as nothing is rasterized, and are used to
+        skip shapes that fall outside a region of the mask.
+
+        Parameters
+        ----------
+        mask_shape : (D,) array
+            Shape of the full mask.
+        zoom_factor : float
+            Premultiplier applied to coordinates before generating mask.
+        offset : 2-tuple
+            Offset subtracted from coordinates before multiplying by the
+            zoom_factor.
+
+        Returns
+        -------
+        bounds : (2, D) array of int
+            Start and stop of the bounds along each dimension of the mask.
+        """
+        shape_plane, data = self._mask_plane(mask_shape, zoom_factor, offset)
+        # Vertices outside the mask are clipped to its border, so the
+        # bounds always include at least one row and column of it.
+        plane_max = np.subtract(shape_plane, 1)
+        start = np.clip(np.floor(data.min(axis=0)), 0, plane_max)
+        stop = np.clip(np.ceil(data.max(axis=0)), 0, plane_max) + 1
+        if len(mask_shape) == 2:
+            return np.array([start, stop], dtype=int)
+
+        bounds = np.zeros((2, len(mask_shape)), dtype=int)
+        bounds[:, self.dims_displayed] = [start, stop]
+        bounds[:, self.dims_not_displayed] = self.slice_key + [[0], [1]]
+        return bounds
+
+    def _to_bbox_mask(
+        self, mask_shape, zoom_factor=1, offset=[0, 0], region=None
+    ):
+        """Convert the shape vertices to a boolean mask of its bounding box.
+
+        Gives the same result as `to_mask` cropped to the bounding box of
+        the shape, so that many shapes can be rasterized into one array
+        without allocating a full mask for each of them.
+
+        Parameters
+        ----------
+        mask_shape : (D,) array
+            Shape of the full mask.
+        zoom_factor : float
+            Premultiplier applied to coordinates before generating mask. Used
+            for generating as downsampled mask.
+        offset : 2-tuple
+            Offset subtracted from coordinates before multiplying by the
+            zoom_factor. Used for putting negative coordinates into the mask.
+        region : (2, D) array, optional
+            Start and stop of a region of the full mask. If given, the
+            bounding box is cropped to this region and only the part of the
+            shape inside it is rasterized.
+
+        Returns
+        -------
+        slices : tuple of slice
+            Location of the bounding box in the full mask.
+        mask : np.ndarray
+            Boolean array of the bounding box with `True` for points inside
+            the shape. Along dimensions that are not displayed it has length
+            one and applies to every slice of the bounding box.
+        """
+        shape_plane, data = self._mask_plane(mask_shape, zoom_factor, offset)
+        embedded = len(mask_shape) != 2
+
+        window = None
+        if region is not None:
+            region = np.asarray(region, dtype=int)
+            window = region[:, self.dims_displayed] if embedded else region
 
         if self._filled:
-            mask_p = poly_to_mask(shape_plane, (data - offset) * zoom_factor)
+            bottom, mask_p = poly_to_bbox_mask(shape_plane, data, window)
         else:
-            mask_p = path_to_mask(shape_plane, (data - offset) * zoom_factor)
-
-        # If the mask is to be embedded in a larger array, compute array
-        # and embed as a slice.
+            bottom, mask_p = path_to_bbox_mask(shape_plane, data, window)
+        slices_p = [
+            slice(b, b + size) for b, size in zip(bottom, mask_p.shape)
+        ]
+
+        # If the mask is to be embedded in a larger array, place the plane
+        # slices along the displayed dimensions and select the slice range
+        # of the shape along the others.
         if embedded:
-            mask = np.zeros(mask_shape, dtype=bool)
-            slice_key = [0] * len(mask_shape)
-            j = 0
+            displayed_order = np.argsort(self.dims_displayed)
+            mask_p = mask_p.transpose(displayed_order)
+            slices = []
             for i in range(len(mask_shape)):
                 if i in self.dims_displayed:
-                    slice_key[i] = slice(None)
+                    slices.append(slices_p[self.dims_displayed.index(i)])
                 else:
-                    slice_key[i] = slice(
-                        self.slice_key[0, j], self.slice_key[1, j] + 1
-                    )
-                j += 1
-            displayed_order = np.array(copy(self.dims_displayed))
-            displayed_order[np.argsort(displayed_order)] = list(
-                range(len(displayed_order))
-            )
-            mask[tuple(slice_key)] = mask_p.transpose(displayed_order)
+                    j = self.dims_not_displayed.index(i)
+                    start = self.slice_key[0, j]
+                    stop = self.slice_key[1, j] + 1
+                    if region is not None:
+                        start = max(start, region[0, i])
+                        stop = max(min(stop, region[1, i]), start)
+                    slices.append(slice(start, stop))
+                    mask_p = np.expand_dims(mask_p, axis=i)
+            slices = tuple(slices)
         else:
-            mask = mask_p
+            slices = tuple(slices_p)
 
-        return mask
+        return slices, mask_p
@@ -866,18 +866,66 @@ def path_to_mask(mask_shape, vertices):
         Boolean array with `True` for points along the path
     """
     mask = np.zeros(mask_shape, dtype=bool)
+    bottom, bb_mask = path_to_bbox_mask(mask_shape, vertices)
+    top = bottom + bb_mask.shape
+    mask[bottom[0] : top[0], bottom[1] : top[1]] = bb_mask
+    return mask
+
+
+def path_to_bbox_mask(mask_shape, vertices, window=None):
+    """Converts a path to a boolean mask of its bounding box, with `True`
+    for points lying along each edge.
+
+    Gives the same result as `path_to_mask` cropped to the bounding box of
+    the path, without allocating a mask of the full `mask_shape`.
+
+    Parameters
+    ----------
+    mask_shape : array (2,)
+        Shape of the full mask, used to clip the vertices.
+    vertices : array (N, 2)
+        Vertices of the path.
+    window : (2, 2) array, optional
+        Start and stop of a region of the full mask. If given, the bounding
+        box is cropped to this region and nothing outside it is rasterized.
+
+    Returns
+    -------
+    bottom : (2,) array of int
+        Position of the bounding box in the full mask.
+    mask : np.ndarray
+        Boolean array of the bounding box with `True` for points along the
+        path
+    """
     vertices = np.round(
         np.clip(vertices, 0, np.subtract(mask_shape, 1))
     ).astype(int)
+    bottom = vertices.min(axis=0)
+    top = vertices.max(axis=0) + 1
+    if window is not None:
+        bottom = np.maximum(bottom, window[0])
+        top = np.minimum(top, window[1])
+    if np.any(top <= bottom):
+        return bottom, np.zeros((0, 0), dtype=bool)
+
+    mask = np.zeros(top - bottom, dtype=bool)
     for i in range(len(vertices) - 1):
         start = vertices[i]
         stop = vertices[i + 1]
         step = np.ceil(np.max(abs(stop - start))).astype(int)
-        x_vals = np.linspace(start[0], stop[0], step)
-        y_vals = np.linspace(start[1], stop[1], step)
-        for x, y in zip(x_vals, y_vals):
-            mask[int(x), int(y)] = 1
-    return mask
+        x_vals = np.linspace(start[0], stop[0], step).astype(int)
+        y_vals = np.linspace(start[1], stop[1], step).astype(int)
+        if window is not None:
+            inside = (
+                (x_vals >= bottom[0])
+                & (x_vals < top[0])
+                & (y_vals >= bottom[1])
+                & (y_vals < top[1])
+            )
+            x_vals = x_vals[inside]
+            y_vals = y_vals[inside]
+        mask[x_vals - bottom[0], y_vals - bottom[1]] = True
+    return bottom, mask
 
 
 def poly_to_mask(mask_shape, vertices):
@@ -898,20 +946,58 @@ def poly_to_mask(mask_shape, vertices):
         Boolean array with `True` for points inside the polygon
     """
     mask = np.zeros(mask_shape, dtype=bool)
+    bottom, bb_mask = poly_to_bbox_mask(mask_shape, vertices)
+    top = bottom + bb_mask.shape
+    mask[bottom[0] : top[0], bottom[1] : top[1]] = bb_mask
+    return mask
+
+
+def poly_to_bbox_mask(mask_shape, vertices, window=None):
+    """Converts a polygon to a boolean mask of its bounding box, with `True`
+    for points lying inside the shape.
+
+    Gives the same result as `poly_to_mask` cropped to the bounding box of
+    the polygon, without allocating a mask of the full `mask_shape`.
+
+    Parameters
+    ----------
+    mask_shape : np.ndarray | tuple
+        1x2 array of shape of the full mask, used to clip the bounding box.
+    vertices : np.ndarray
+        Nx2 array of the vertices of the polygon.
+    window : (2, 2) array, optional
+        Start and stop of a region of the full mask. If given, the bounding
+        box is cropped to this region and nothing outside it is rasterized.
+
+    Returns
+    -------
+    bottom : (2,) array of int
+        Position of the bounding box in the full mask.
+    mask : np.ndarray
+        Boolean array of the bounding box with `True` for points inside the
+        polygon
+    """
     bottom = vertices.min(axis=0).astype('int')
     bottom = np.clip(bottom, 0, np.subtract(mask_shape, 1))
     top = np.ceil(vertices.max(axis=0)).astype('int')
-    # top = np.append([top], [mask_shape], axis=0).min(axis=0)
     top = np.clip(top, 0, np.subtract(mask_shape, 1))
+    if window is not None:
+        bottom = np.maximum(bottom, window[0])
+        top = np.minimum(top, window[1])
     if np.all(top > bottom):
-        bb_mask = grid_points_in_poly(top - bottom, vertices - bottom)
-        mask[bottom[0] : top[0], bottom[1] : top[1]] = bb_mask
-    return mask
+        mask = grid_points_in_poly(top - bottom, vertices - bottom)
+    else:
+        mask = np.zeros((0, 0), dtype=bool)
+    return bottom, mask
 
 
 def grid_points_in_poly(shape, vertices):
     """Converts a polygon to a boolean mask with `True` for points
-    lying inside the shape. Loops through all indices in the grid
+    lying inside the shape.
+
+    Scan converts the polygon one column at a time. This gives the same
+    result as testing every grid point with `points_in_poly`, but only
+    computes the crossings of each edge with the columns it spans.
 
     Parameters
     ----------
@@ -925,11 +1011,31 @@ def grid_points_in_poly(shape, vertices):
     mask : np.ndarray
         Boolean array with `True` for points inside the polygon
     """
-    points = np.array(
-        [(x, y) for x in range(shape[0]) for y in range(shape[1])], dtype=int
+    n_rows, n_cols = (int(s) for s in shape)
+    vertices = np.asarray(vertices, dtype=float)
+    # Edges join each vertex i to the previous vertex j
+    v_i = vertices
+    v_j = np.roll(vertices, 1, axis=0)
+    d = v_j - v_i
+    # An edge crosses the integer columns y with min <= y < max of its ends,
+    # horizontal edges cross none
+    lo = np.clip(np.ceil(np.minimum(v_i[:, 1], v_j[:, 1])), 0, n_cols)
+    hi = np.clip(np.ceil(np.maximum(v_i[:, 1], v_j[:, 1])), 0, n_cols)
+    counts = np.maximum(hi - lo, 0).astype(int)
+    counts[d[:, 1] == 0] = 0
+    edges = np.repeat(np.arange(len(vertices)), counts)
+    cols = ranges_to_indices(lo.astype(int), counts)
+    crossings = (
+        d[edges, 0] * (cols - v_i[edges, 1]) / d[edges, 1] + v_i[edges, 0]
     )
-    inside = points_in_poly(points, vertices)
-    mask = inside.reshape(shape)
+
+    # A point is inside if an odd number of crossings in its column lie
+    # beyond it, so each crossing toggles all the rows before it.
+    rows = np.clip(np.ceil(crossings), 0, n_rows).astype(int)
+    toggles = np.zeros((n_rows + 1, n_cols), dtype=int)
+    np.add.at(toggles, (np.zeros_like(rows), cols), 1)
+    np.add.at(toggles, (rows, cols), -1)
+    mask = np.cumsum(toggles, axis=0)[:n_rows] % 2 == 1
     return mask
 
 
@@ -1030,3 +1136,54 @@ def number_of_shapes(data):
         n_shapes = len(data)
 
     return n_shapes
+
+
+def contiguous_ranges(ids, n):
+    """Find the start and length of each id's run in an array of ids.
+
+    Each id must appear in a single contiguous run, as the shape index of
+    the vertices and triangles of a `ShapeList` does.
+
+    Parameters
+    ----------
+    ids : (M,) array of int
+        Array of ids between 0 and n - 1.
+    n : int
+        Number of ids.
+
+    Returns
+    -------
+    starts : (n,) array of int
+        Position of the first element of each id. Zero for absent ids.
+    counts : (n,) array of int
+        Number of elements with each id.
+    """
+    ids = np.asarray(ids, dtype=int)
+    starts = np.zeros(n, dtype=int)
+    counts = np.bincount(ids, minlength=n)[:n]
+    if len(ids) > 0:
+        first = np.flatnonzero(np.append(True, ids[1:] != ids[:-1]))
+        starts[ids[first]] = first
+    return starts, counts
+
+
+def ranges_to_indices(starts, counts):
+    """Concatenate the indices of a set of ranges.
+
+    Parameters
+    ----------
+    starts : (N,) array of int
+        First index of each range.
+    counts : (N,) array of int
+        Length of each range.
+
+    Returns
+    -------
+    indices : (M,) array of int
+        Indices of all the ranges, in order, where M is the sum of counts.
+    """
+    starts = np.asarray(starts, dtype=int)
+    counts = np.asarray(counts, dtype=int)
+    ends = np.cumsum(counts)
+    offsets = np.repeat(starts - ends + counts, counts)
+    return np.arange(ends[-1] if len(ends) > 0 else 0) + offsets
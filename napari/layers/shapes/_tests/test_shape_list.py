@@ -3,6 +3,10 @@ import pytest
 
 from napari.layers.shapes._shape_list import ShapeList
 from napari.layers.shapes._shapes_models import Path, Polygon, Rectangle
+from napari.layers.shapes._shapes_utils import (
+    inside_triangles,
+    triangles_intersect_box,
+)
 
 
 def test_empty_shape_list():
@@ -63,3 +67,129 @@ def test_bad_color_array(attribute):
     bad_color_array = np.array([[0, 0, 0, 1], [1, 1, 1, 1]])
     with pytest.raises(ValueError):
         setattr(shape_list, f'{attribute}_color', bad_color_array)
+
+
+def test_adding_multiple_shapes():
+    """Test adding a list of shapes matches adding them one at a time."""
+    np.random.seed(0)
+    shapes = [
+        Rectangle(20 * np.random.random((4, 2)), z_index=2),
+        Path(20 * np.random.random((5, 2)), edge_width=3),
+        Polygon(20 * np.random.random((6, 2)), z_index=1),
+    ]
+    face_color = np.random.random((3, 4))
+    edge_color = np.random.random((3, 4))
+
+    expected = ShapeList()
+    for s, fc, ec in zip(shapes, face_color, edge_color):
+        expected.add(s, face_color=fc, edge_color=ec)
+
+    shape_list = ShapeList()
+    shape_list.add(shapes[:1], face_color=face_color[:1])
+    shape_list.add(
+        shapes[1:], face_color=face_color[1:], edge_color=edge_color[1:]
+    )
+    shape_list.update_edge_color(0, edge_color[0])
+
+    assert shape_list.shapes == shapes
+    np.testing.assert_equal(shape_list._z_index, expected._z_index)
+    np.testing.assert_equal(shape_list._z_order, expected._z_order)
+    np.testing.assert_equal(shape_list._face_color, expected._face_color)
+    np.testing.assert_equal(shape_list._edge_color, expected._edge_color)
+    np.testing.assert_equal(shape_list._vertices, expected._vertices)
+    np.testing.assert_equal(shape_list._index, expected._index)
+    for name in [
+        'vertices',
+        'vertices_centers',
+        'vertices_offsets',
+        'vertices_index',
+        'triangles',
+        'triangles_index',
+        'triangles_colors',
+        'triangles_z_order',
+        'displayed_triangles',
+    ]:
+        np.testing.assert_equal(
+            getattr(shape_list._mesh, name), getattr(expected._mesh, name)
+        )
+    assert shape_list._mesh.triangles.dtype == expected._mesh.triangles.dtype
+
+
+def test_slicing_and_picking_many_shapes():
+    """Test displayed shapes, inside and shapes_in_box across slices."""
+    np.random.seed(0)
+    shapes = []
+    for i in range(300):
+        data = np.random.random((4, 3)) * [1, 10, 10] + [0, i % 30, i // 30]
+        data[:, 0] = i % 3
+        shapes.append(Rectangle(data, z_index=np.random.randint(3)))
+    shape_list = ShapeList(shapes)
+    shape_list.edit(4, shapes[4].data + [1, 0, 0])
+
+    for plane in range(3):
+        shape_list.slice_key = [plane]
+        slice_keys = shape_list.slice_keys
+        expected = np.all(slice_keys == plane, axis=(1, 2))
+        np.testing.assert_array_equal(shape_list._displayed, expected)
+        assert set(shape_list.displayed_index) == set(np.flatnonzero(expected))
+        disp = shape_list._mesh.displayed_triangles_index[:, 0]
+        assert set(disp) == set(np.flatnonzero(expected))
+        # Displayed triangles are sorted by z order
+        z_order = shape_list._z_order.tolist()
+        ranks = [z_order.index(i) for i in disp]
+        assert ranks == sorted(ranks)
+
+        triangles = shape_list._mesh.vertices[
+            shape_list._mesh.displayed_triangles
+        ]
+        for coord in np.random.random((20, 2)) * [31, 11]:
+            hits = disp[inside_triangles(triangles - coord)]
+            value = shape_list.inside(coord)
+            if len(hits) == 0:
+                assert value is None
+            else:
+                assert value == hits[0]
+
+        corners = np.array([[5, 2], [12, 6]])
+        hits = disp[triangles_intersect_box(triangles, corners)]
+        assert shape_list.shapes_in_box(corners) == np.unique(hits).tolist()
+
+
+def test_edit_in_place():
+    """Test editing a shape with the same mesh size updates it in place."""
+    np.random.seed(0)
+    shapes = [Polygon(20 * np.random.random((5, 3))) for _ in range(4)]
+    for i, shape in enumerate(shapes):
+        shape.data = np.c_[np.full(5, i % 2), shape.data[:, 1:]]
+    shape_list = ShapeList(shapes)
+    shape_list.slice_key = [1]
+    triangles_index = shape_list._mesh.triangles_index.copy()
+
+    data = shapes[1].data.copy()
+    data[2, 1:] += 1
+    shape_list.edit(1, data)
+    shape_list.edit(2, shapes[2].data + [1, 2, 2])
+    # The mesh keeps its layout as every shape stays in its own slots
+    np.testing.assert_array_equal(
+        shape_list._mesh.triangles_index, triangles_index
+    )
+
+    expected = ShapeList([Polygon(s.data) for s in shape_list.shapes])
+    expected.slice_key = [1]
+    assert list(np.flatnonzero(shape_list._displayed)) == [1, 2, 3]
+    np.testing.assert_array_equal(shape_list._displayed, expected._displayed)
+
+    def shape_triangles(shape_list, index):
+        mesh = shape_list._mesh
+        in_shape = mesh.triangles_index[:, 0] == index
+        return mesh.vertices[mesh.triangles[in_shape]]
+
+    for index in range(4):
+        np.testing.assert_allclose(
+            shape_triangles(shape_list, index),
+            shape_triangles(expected, index),
+        )
+        np.testing.assert_array_equal(
+            shape_list._vertices[shape_list._index == index],
+            expected._vertices[expected._index == index],
+        )
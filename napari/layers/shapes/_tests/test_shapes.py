@@ -1,6 +1,7 @@
 from copy import copy
 from itertools import cycle, islice
 
+import dask.array as da
 import numpy as np
 import pandas as pd
 import pytest
@@ -1418,6 +1419,62 @@ def test_to_labels_3D():
     assert np.all(np.unique(labels) == [0, 1, 2, 3])
 
 
+def test_to_labels_chunks():
+    """Test lazily generating labels in chunks matches the in memory path."""
+    np.random.seed(0)
+    data = 40 * np.random.random((20, 4, 3))
+    data[:, :, 0] = np.repeat(np.arange(4), 5)[:, np.newaxis]
+    layer = Shapes(data, shape_type='polygon')
+    layer.add(
+        np.array([[1, 5, 5], [1, 30, 35], [1, 10, 38]]), shape_type='path'
+    )
+    labels_shape = (4, 45, 45)
+    labels = layer.to_labels(labels_shape=labels_shape)
+    assert len(np.unique(labels)) > 10
+
+    chunked = layer.to_labels(labels_shape=labels_shape, chunks=(1, 16, 16))
+    assert isinstance(chunked, da.Array)
+    assert chunked.chunksize == (1, 16, 16)
+    np.testing.assert_array_equal(chunked.compute(), labels)
+
+
+def test_to_labels_chunks_rasterize_blocks(monkeypatch):
+    """Test each chunk only rasterizes the part of a shape inside it."""
+    from napari.layers.shapes import _shapes_utils
+
+    grid_shapes = []
+    grid_points_in_poly = _shapes_utils.grid_points_in_poly
+
+    def spy(shape, vertices):
+        grid_shapes.append(tuple(shape))
+        return grid_points_in_poly(shape, vertices)
+
+    layer = Shapes(
+        np.array([[2, 2], [2, 60], [60, 60], [60, 2]]), shape_type='polygon'
+    )
+    labels = layer.to_labels(labels_shape=(64, 64))
+    monkeypatch.setattr(_shapes_utils, 'grid_points_in_poly', spy)
+    chunked = layer.to_labels(labels_shape=(64, 64), chunks=(16, 16))
+    np.testing.assert_array_equal(chunked.compute(), labels)
+    assert len(grid_shapes) == 16
+    assert max(max(shape) for shape in grid_shapes) <= 16
+
+
+def test_to_masks_match_to_labels():
+    """Test masks and labels agree for non-overlapping shapes."""
+    data = [
+        [[0, 10, 10], [0, 10, 20], [0, 20, 20], [0, 20, 10]],
+        [[2, 5, 5], [2, 25, 8], [2, 12, 25]],
+    ]
+    layer = Shapes(data, shape_type=['ellipse', 'polygon'])
+    labels = layer.to_labels(labels_shape=(3, 30, 30))
+    masks = layer.to_masks(mask_shape=(3, 30, 30))
+    assert masks.shape == (2, 3, 30, 30)
+    np.testing.assert_array_equal(masks[0], labels == 1)
+    np.testing.assert_array_equal(masks[1], labels == 2)
+    assert np.any(masks[0][0]) and not np.any(masks[0][1:])
+
+
 def test_add_single_shape_consistent_properties():
     """Test adding a single shape ensures correct number of added properties"""
     data = [
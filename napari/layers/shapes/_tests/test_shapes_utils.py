@@ -1,6 +1,12 @@
 import numpy as np
 
-from napari.layers.shapes._shapes_utils import number_of_shapes
+from napari.layers.shapes._shapes_utils import (
+    contiguous_ranges,
+    grid_points_in_poly,
+    number_of_shapes,
+    points_in_poly,
+    ranges_to_indices,
+)
 
 
 def test_no_shapes():
@@ -17,3 +23,32 @@ def test_one_shape():
 def test_many_shapes():
     """Test many shapes."""
     assert number_of_shapes(np.random.random((8, 4, 2))) == 8
+
+
+def test_contiguous_ranges():
+    """Test finding the run of each id."""
+    starts, counts = contiguous_ranges([2, 2, 0, 0, 0, 3], 5)
+    np.testing.assert_equal(starts, [2, 0, 0, 5, 0])
+    np.testing.assert_equal(counts, [3, 0, 2, 1, 0])
+
+
+def test_ranges_to_indices():
+    """Test concatenating ranges of indices."""
+    np.testing.assert_equal(
+        ranges_to_indices([5, 0, 2], [2, 0, 3]), [5, 6, 2, 3, 4]
+    )
+    assert len(ranges_to_indices([], [])) == 0
+
+
+def test_grid_points_in_poly():
+    """Test scan converting polygons matches testing every point."""
+    np.random.seed(0)
+    for _ in range(20):
+        shape = np.random.randint(1, 30, 2)
+        vertices = np.random.random((np.random.randint(3, 8), 2))
+        vertices = vertices * (shape + 10) - 5
+        points = np.indices(shape).reshape(2, -1).T
+        expected = points_in_poly(points, vertices).reshape(shape)
+        np.testing.assert_array_equal(
+            grid_points_in_poly(shape, vertices), expected
+        )
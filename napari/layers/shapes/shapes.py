@@ -574,7 +574,7 @@ class Shapes(Layer):
                 'property used for edge_color dropped', RuntimeWarning
             )
 
-        if self.text.values is not None:
+        if self.text._has_values:
             self.refresh_text()
 
     def _get_ndim(self):
@@ -1269,7 +1269,11 @@ class Shapes(Layer):
         text : (N x 1) np.ndarray
             Array of text strings for the N text elements in view
         """
-        return self.text.view_text(self._indices_view)
+        indices_view = self._indices_view
+        index = self._view_text_index
+        if index is not None:
+            indices_view = indices_view[index]
+        return self.text.view_text(indices_view)
 
     @property
     def _view_text_coords(self) -> np.ndarray:
@@ -1280,9 +1284,40 @@ class Shapes(Layer):
         text_coords : (N x D) np.ndarray
             Array of coordindates for the N text elements in view
         """
-        return self.text.compute_text_coords(
-            self._data_view.data, self._dims.ndisplay
+        indices_view = self._indices_view
+        text_coords, anchor_x, anchor_y = self._compute_text_coords(
+            indices_view
         )
+        if self.text.declutter:
+            index = self.text._declutter_index(
+                indices_view, text_coords, anchor_x, anchor_y
+            )
+            if index is not None:
+                text_coords = text_coords[index]
+        return text_coords, anchor_x, anchor_y
+
+    @property
+    def _view_text_index(self) -> Union[None, np.ndarray]:
+        """Indices into the shapes in view of the text elements to draw.
+
+        None if the text is not decluttered and every text element in view
+        is drawn.
+        """
+        if not self.text.declutter:
+            return None
+        indices_view = self._indices_view
+        return self.text._declutter_index(
+            indices_view, *self._compute_text_coords(indices_view)
+        )
+
+    def _compute_text_coords(self, indices_view):
+        """Compute the coordinates of the text of the shapes in view."""
+        if len(indices_view) == 0:
+            return np.zeros((0, self._dims.ndisplay)), 'center', 'center'
+        view_data = [
+            self._data_view.shapes[i].data_displayed for i in indices_view
+        ]
+        return self.text.compute_text_coords(view_data, self._dims.ndisplay)
 
     @property
     def mode(self):
@@ -1681,28 +1716,27 @@ class Shapes(Layer):
                 data,
                 ensure_iterable(shape_type),
                 ensure_iterable(edge_width),
-                transformed_edge_color,
-                transformed_face_color,
                 ensure_iterable(z_index),
             )
 
-            for d, st, ew, ec, fc, z in shape_inputs:
-
-                # A False slice_key means the shape is invalid as it is not
-                # confined to a single plane
-                shape_cls = shape_classes[ShapeType(st)]
-                shape = shape_cls(
+            shapes = [
+                shape_classes[ShapeType(st)](
                     d,
                     edge_width=ew,
                     z_index=z,
                     dims_order=self._dims.order,
                     ndisplay=self._dims.ndisplay,
                 )
+                for d, st, ew, z in shape_inputs
+            ]
 
-                # Add shape
-                self._data_view.add(
-                    shape, edge_color=ec, face_color=fc, z_refresh=z_refresh
-                )
+            # Add all the shapes to the mesh at once
+            self._data_view.add(
+                shapes,
+                edge_color=transformed_edge_color,
+                face_color=transformed_face_color,
+                z_refresh=z_refresh,
+            )
 
         self._display_order_stored = copy(self._dims.order)
         self._ndisplay_stored = copy(self._dims.ndisplay)
@@ -1743,6 +1777,30 @@ class Shapes(Layer):
         """
         self.text.refresh_text(self.properties)
 
+    def _update_draw(self, scale_factor, corner_pixels, shape_threshold):
+        """Update canvas scale and corner values on draw.
+
+        Redraws the text if it needs to be decluttered again.
+
+        Parameters
+        ----------
+        scale_factor : float
+            Scale factor going from canvas to world coordinates.
+        corner_pixels : array
+            Coordinates of the top-left and bottom-right canvas pixels in the
+            world coordinates.
+        shape_threshold : tuple
+            Requested shape of field of view in data coordinates.
+        """
+        super()._update_draw(scale_factor, corner_pixels, shape_threshold)
+        displayed = self._dims.displayed
+        if self.text._update_canvas(
+            scale_factor,
+            self.corner_pixels[:, displayed],
+            np.asarray(self.scale)[displayed],
+        ):
+            self.text.events.text()
+
     def _set_view_slice(self):
         """Set the view given the slicing indices."""
         if not self._dims.ndisplay == self._ndisplay_stored:
@@ -2240,10 +2298,10 @@ class Shapes(Layer):
                 },
                 'indices': self._slice_indices,
             }
-            if self.text.values is None:
+            if not self.text._has_values:
                 self._clipboard['text'] = None
             else:
-                self._clipboard['text'] = deepcopy(self.text.values[index])
+                self._clipboard['text'] = self.text._get_values(index)
         else:
             self._clipboard = {}
 
@@ -2278,8 +2336,8 @@ class Shapes(Layer):
                 )
 
             if self._clipboard['text'] is not None:
-                self.text._values = np.concatenate(
-                    (self.text.values, self._clipboard['text']), axis=0
+                self.text._paste(
+                    self._clipboard['text'], self._clipboard['properties']
                 )
 
             self.selected_data = set(
@@ -2491,7 +2549,7 @@ class Shapes(Layer):
 
         return masks
 
-    def to_labels(self, labels_shape=None):
+    def to_labels(self, labels_shape=None, chunks=None):
         """Return an integer labels image.
 
         Parameters
@@ -2499,10 +2557,15 @@ class Shapes(Layer):
         labels_shape : np.ndarray | tuple | None
             Tuple defining shape of labels image to be generated. If non
             specified, takes the max of all the vertiecs
+        chunks : None | int | tuple
+            If provided, return a dask array with these chunks instead. Each
+            chunk is rasterized only when it is computed, so labels images
+            larger than memory can be written straight to disk, for example
+            with `labels.to_zarr(path)`.
 
         Returns
         -------
-        labels : np.ndarray
+        labels : np.ndarray | dask.array.Array
             Integer array where each value is either 0 for background or an
             integer up to N for points inside the shape at the index value - 1.
             For overlapping shapes z-ordering will be respected.
@@ -2511,6 +2574,8 @@ class Shapes(Layer):
             labels_shape = self._extent_data[1] - self._extent_data[0]
 
         labels_shape = np.ceil(labels_shape).astype('int')
-        labels = self._data_view.to_labels(labels_shape=labels_shape)
+        labels = self._data_view.to_labels(
+            labels_shape=labels_shape, chunks=chunks
+        )
 
         return labels
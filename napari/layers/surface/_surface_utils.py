@@ -0,0 +1,104 @@
+import numpy as np
+
+
+def median_edge_length(vertices, faces):
+    """Median length of the first edge of each face of a mesh.
+
+    Parameters
+    ----------
+    vertices : (N, D) array
+        Vertices of the mesh.
+    faces : (M, 3) array of int
+        Indices of the vertices that form each triangle of the mesh.
+
+    Returns
+    -------
+    length : float
+        The median edge length, or 1 if the mesh has no edges of non-zero
+        length.
+    """
+    if len(faces) == 0:
+        return 1.0
+    edges = vertices[faces[:, 1]] - vertices[faces[:, 0]]
+    length = np.median(np.linalg.norm(edges, axis=1))
+    return float(length) if length > 0 else 1.0
+
+
+def decimate_mesh(vertices, faces, cell_size):
+    """Decimate a mesh by clustering its vertices on a grid.
+
+    The vertices in each grid cell are merged into the first of them, and
+    the faces that collapse or become duplicates are dropped.
+
+    Parameters
+    ----------
+    vertices : (N, D) array
+        Vertices of the mesh.
+    faces : (M, 3) array of int
+        Indices of the vertices that form each triangle of the mesh.
+    cell_size : float
+        Size of the grid cells.
+
+    Returns
+    -------
+    kept : (K,) array of int
+        Indices of the vertices of the mesh that are kept.
+    decimated_faces : (P, 3) array of int
+        Indices into the kept vertices that form each triangle of the
+        decimated mesh.
+    """
+    if len(vertices) == 0:
+        return np.empty(0, dtype=int), np.empty((0, 3), dtype=int)
+    cells = np.floor(vertices / cell_size).astype(np.int64)
+    cells -= cells.min(axis=0)
+    key = np.ravel_multi_index(tuple(cells.T), cells.max(axis=0) + 1)
+    _, kept, inverse = np.unique(key, return_index=True, return_inverse=True)
+
+    decimated_faces = inverse.ravel()[faces]
+    collapsed = (
+        (decimated_faces[:, 0] == decimated_faces[:, 1])
+        | (decimated_faces[:, 1] == decimated_faces[:, 2])
+        | (decimated_faces[:, 0] == decimated_faces[:, 2])
+    )
+    decimated_faces = decimated_faces[~collapsed]
+    # keep the first of the duplicate faces, with its original orientation
+    _, first = np.unique(
+        np.sort(decimated_faces, axis=1), axis=0, return_index=True
+    )
+    decimated_faces = decimated_faces[np.sort(first)]
+    return kept, decimated_faces
+
+
+def decimate_mesh_levels(vertices, faces, n_levels, spacing):
+    """Build coarser levels of detail of a mesh.
+
+    Each level is decimated from the one before it, clustering vertices in
+    grid cells twice as large, starting from cells of twice the spacing.
+
+    Parameters
+    ----------
+    vertices : (N, D) array
+        Vertices of the mesh.
+    faces : (M, 3) array of int
+        Indices of the vertices that form each triangle of the mesh.
+    n_levels : int
+        Number of levels of detail to build.
+    spacing : float
+        Typical distance between neighbouring vertices of the mesh.
+
+    Returns
+    -------
+    levels : list of tuple
+        For each level, the indices of its vertices into the vertices of
+        the mesh and the faces of the level, indexing into its vertices.
+    """
+    levels = []
+    vertex_index = np.arange(len(vertices))
+    level_faces = np.asarray(faces)
+    for level in range(1, n_levels + 1):
+        kept, level_faces = decimate_mesh(
+            vertices[vertex_index], level_faces, spacing * 2 ** level
+        )
+        vertex_index = vertex_index[kept]
+        levels.append((vertex_index, level_faces))
+    return levels
@@ -101,6 +101,79 @@ def test_random_3D_multitimeseries_surface():
     assert layer._view_vertex_values.ndim == 1
 
 
+def test_timeseries_surface_keeps_geometry():
+    """Test that only the values in view change when stepping in time."""
+    np.random.seed(0)
+    vertices = np.random.random((10, 3))
+    faces = np.random.randint(10, size=(6, 3))
+    values = np.random.random((5, 10))
+    layer = Surface((vertices, faces, values))
+    layer._slice_dims([0, 0, 0, 0], ndisplay=3)
+    data_view = layer._data_view
+    view_faces = layer._view_faces
+
+    layer._slice_dims([3, 0, 0, 0], ndisplay=3)
+    assert layer._data_view is data_view
+    assert layer._view_faces is view_faces
+    np.testing.assert_equal(layer._view_vertex_values, values[3])
+
+    # new geometry is put in view
+    layer.vertices = vertices + 1
+    assert layer._data_view is not data_view
+    np.testing.assert_equal(layer._data_view, vertices + 1)
+    layer.faces = faces[:3]
+    np.testing.assert_equal(layer._view_faces, faces[:3])
+
+
+def _grid_mesh(n):
+    """Vertices and faces of a flat n x n grid of triangles."""
+    vertices = np.stack(np.mgrid[:n, :n], axis=-1).reshape(-1, 2)
+    index = np.arange(n * n).reshape(n, n)
+    a, b = index[:-1, :-1].ravel(), index[:-1, 1:].ravel()
+    c, d = index[1:, :-1].ravel(), index[1:, 1:].ravel()
+    faces = np.concatenate(
+        [np.stack([a, b, c], axis=1), np.stack([b, d, c], axis=1)]
+    )
+    return vertices.astype(float), faces
+
+
+def test_surface_decimation():
+    """Test drawing decimated levels of detail of a mesh when zoomed out."""
+    vertices, faces = _grid_mesh(64)
+    values = np.random.random((3, len(vertices)))
+    layer = Surface((vertices, faces, values))
+    assert layer.decimation_levels == 0
+    layer._update_draw(100, np.zeros((2, 3)), (512, 512))
+    assert len(layer._view_faces) == len(faces)
+
+    layer = Surface((vertices, faces, values), decimation_levels=2)
+    assert len(layer._decimated) == 2
+    n_faces = [len(faces)] + [len(f) for _, f in layer._decimated]
+    assert n_faces[0] > n_faces[1] > n_faces[2] > 0
+    for vertex_index, level_faces in layer._decimated:
+        assert np.all(level_faces < len(vertex_index))
+
+    # zoomed in the full mesh is drawn
+    layer._update_draw(0.1, np.zeros((2, 3)), (512, 512))
+    assert layer._decimation_level == 0
+    assert len(layer._view_faces) == len(faces)
+
+    # zoomed out the coarsest level is drawn, with the values of its vertices
+    layer._update_draw(100, np.zeros((2, 3)), (512, 512))
+    assert layer._decimation_level == 2
+    vertex_index, level_faces = layer._decimated[1]
+    assert layer._view_faces is level_faces
+    np.testing.assert_equal(layer._data_view, vertices[vertex_index])
+    np.testing.assert_equal(layer._view_vertex_values, values[0][vertex_index])
+
+    layer._slice_dims([2, 0, 0])
+    np.testing.assert_equal(layer._view_vertex_values, values[2][vertex_index])
+
+    layer.decimation_levels = 0
+    assert layer._decimation_level == 0
+    assert len(layer._view_faces) == len(faces)
+
+
 def test_visiblity():
     """Test setting layer visibility."""
     np.random.seed(0)
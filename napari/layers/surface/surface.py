@@ -7,6 +7,7 @@ from ...utils.events import Event
 from ..base import Layer
 from ..intensity_mixin import IntensityVisualizationMixin
 from ..utils.layer_utils import calc_data_range
+from ._surface_utils import decimate_mesh_levels, median_edge_length
 
 
 # Mixin must come before Layer
@@ -35,6 +36,11 @@ class Surface(IntensityVisualizationMixin, Layer):
         the image.
     gamma : float
         Gamma correction for determining colormap linearity. Defaults to 1.
+    decimation_levels : int
+        Number of coarser levels of detail of the mesh to precompute by
+        decimating it. The coarsest level that is detailed enough at the
+        current zoom is drawn. Defaults to 0, which always draws the full
+        mesh.
     name : str
         Name of the layer.
     metadata : dict
@@ -94,6 +100,8 @@ class Surface(IntensityVisualizationMixin, Layer):
         the image.
     gamma : float
         Gamma correction for determining colormap linearity.
+    decimation_levels : int
+        Number of coarser levels of detail of the mesh.
 
     Extended Summary
     ----------
@@ -102,11 +110,24 @@ class Surface(IntensityVisualizationMixin, Layer):
     _view_faces : (P, 3) array
         The integer indices of the vertices that form the triangles
         in the currently viewed slice.
+    _view_vertex_values : (M,) array
+        The values of the vertices in the currently viewed slice.
     _colorbar : array
         Colorbar for current colormap.
+    _decimated : list of tuple
+        For each coarser level of detail, the indices of its vertices into
+        the vertices of the mesh and the faces of the level.
+    _decimation_level : int
+        Level of detail drawn at the current zoom, where 0 is the full mesh.
+    _view_geometry_key : tuple or None
+        Level, displayed dimensions and slice of the vertices and faces in
+        view, which are kept while only the vertex values change.
     """
 
     _colormaps = AVAILABLE_COLORMAPS
+    # The max size in screen pixels of the vertex clusters of a decimated
+    # mesh when it is drawn
+    _decimation_pixels = 2
 
     def __init__(
         self,
@@ -115,6 +136,7 @@ class Surface(IntensityVisualizationMixin, Layer):
         colormap='gray',
         contrast_limits=None,
         gamma=1,
+        decimation_levels=0,
         name=None,
         metadata=None,
         scale=None,
@@ -144,7 +166,9 @@ class Surface(IntensityVisualizationMixin, Layer):
             visible=visible,
         )
 
-        self.events.add(interpolation=Event, rendering=Event)
+        self.events.add(
+            interpolation=Event, rendering=Event, decimation_levels=Event
+        )
 
         # Set contrast_limits and colormaps
         self._gamma = gamma
@@ -160,12 +184,18 @@ class Surface(IntensityVisualizationMixin, Layer):
         self._data_view = np.zeros((0, self._dims.ndisplay))
         self._view_faces = np.zeros((0, 3))
         self._view_vertex_values = []
+        self._view_geometry_key = None
 
         # assign mesh data and establish default behavior
         self._vertices = data[0]
         self._faces = data[1]
         self._vertex_values = data[2]
 
+        # Precompute the decimated levels of detail of the mesh
+        self._decimation_levels = decimation_levels
+        self._decimation_level = 0
+        self._decimate()
+
         # Trigger generation of view slice and thumbnail
         self._update_dims()
 
@@ -189,6 +219,7 @@ class Surface(IntensityVisualizationMixin, Layer):
         """Array of vertices of mesh triangles."""
 
         self._vertices = vertices
+        self._decimate()
 
         self._update_dims()
         self.refresh()
@@ -215,11 +246,42 @@ class Surface(IntensityVisualizationMixin, Layer):
     def faces(self, faces: np.ndarray):
         """Array of indices of mesh triangles.."""
 
-        self.faces = faces
+        self._faces = faces
+        self._decimate()
 
         self.refresh()
         self.events.data()
 
+    @property
+    def decimation_levels(self) -> int:
+        """int: Number of coarser levels of detail of the mesh."""
+        return self._decimation_levels
+
+    @decimation_levels.setter
+    def decimation_levels(self, decimation_levels: int):
+        self._decimation_levels = decimation_levels
+        self._decimate()
+        self.events.decimation_levels()
+        self.refresh()
+
+    def _decimate(self):
+        """Build the decimated levels of detail of the mesh."""
+        self._view_geometry_key = None
+        if self._decimation_levels > 0 and len(self.faces) > 0:
+            self._edge_length = median_edge_length(self.vertices, self.faces)
+            self._decimated = decimate_mesh_levels(
+                self.vertices,
+                self.faces,
+                self._decimation_levels,
+                self._edge_length,
+            )
+        else:
+            self._edge_length = 1.0
+            self._decimated = []
+        self._decimation_level = min(
+            self._decimation_level, len(self._decimated)
+        )
+
     def _get_ndim(self):
         """Determine number of dimensions of the layer."""
         return self.vertices.shape[1] + (self.vertex_values.ndim - 1)
@@ -261,6 +323,7 @@ class Surface(IntensityVisualizationMixin, Layer):
                 'colormap': self.colormap.name,
                 'contrast_limits': self.contrast_limits,
                 'gamma': self.gamma,
+                'decimation_levels': self.decimation_levels,
                 'data': self.data,
             }
         )
@@ -287,6 +350,7 @@ class Surface(IntensityVisualizationMixin, Layer):
                 self._data_view = np.zeros((0, self._dims.ndisplay))
                 self._view_faces = np.zeros((0, 3))
                 self._view_vertex_values = []
+                self._view_geometry_key = None
                 return
 
             self._view_vertex_values = values
@@ -310,10 +374,29 @@ class Surface(IntensityVisualizationMixin, Layer):
             not_disp = list(self._dims.not_displayed)
             disp = list(self._dims.displayed)
 
-        self._data_view = self.vertices[:, disp]
-        if len(self.vertices) == 0:
+        # Decimated meshes are only drawn when the mesh isn't sliced
+        sliced = vertex_ndim > self._dims.ndisplay
+        level = 0 if sliced else self._decimation_level
+        if level > 0:
+            vertex_index, faces = self._decimated[level - 1]
+            self._view_vertex_values = self._view_vertex_values[vertex_index]
+
+        # The vertices and faces in view are kept while only the values
+        # change, so the geometry isn't sent to the visual again
+        plane = tuple(indices[not_disp]) if sliced else ()
+        geometry_key = (level, tuple(disp), plane)
+        if geometry_key == self._view_geometry_key:
+            return
+        self._view_geometry_key = geometry_key
+
+        if level > 0:
+            self._data_view = self.vertices[np.ix_(vertex_index, disp)]
+            self._view_faces = faces
+        elif len(self.vertices) == 0:
+            self._data_view = self.vertices[:, disp]
             self._view_faces = np.zeros((0, 3))
-        elif vertex_ndim > self._dims.ndisplay:
+        elif sliced:
+            self._data_view = self.vertices[:, disp]
             vertices = self.vertices[:, not_disp].astype('int')
             triangles = vertices[self.faces]
             matches = np.all(triangles == indices[not_disp], axis=(1, 2))
@@ -323,8 +406,37 @@ class Surface(IntensityVisualizationMixin, Layer):
             else:
                 self._view_faces = self.faces[matches]
         else:
+            self._data_view = self.vertices[:, disp]
             self._view_faces = self.faces
 
+    def _update_draw(self, scale_factor, corner_pixels, shape_threshold):
+        """Update canvas scale and corner values on draw.
+
+        Redraws the mesh if a different level of detail is needed.
+
+        Parameters
+        ----------
+        scale_factor : float
+            Scale factor going from canvas to world coordinates.
+        corner_pixels : array
+            Coordinates of the top-left and bottom-right canvas pixels in the
+            world coordinates.
+        shape_threshold : tuple
+            Requested shape of field of view in data coordinates.
+        """
+        super()._update_draw(scale_factor, corner_pixels, shape_threshold)
+        if len(self._decimated) == 0:
+            return
+        # Level l clusters vertices in cells of 2 ** l edge lengths, so use
+        # the coarsest level whose cells are at most a few pixels wide
+        scale = np.max(np.abs(self.scale))
+        cell_pixels = self._edge_length * scale / scale_factor
+        level = int(np.floor(np.log2(self._decimation_pixels / cell_pixels)))
+        level = int(np.clip(level, 0, len(self._decimated)))
+        if level != self._decimation_level:
+            self._decimation_level = level
+            self.refresh()
+
     def _update_thumbnail(self):
         """Update thumbnail with current surface."""
         pass
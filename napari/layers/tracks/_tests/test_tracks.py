@@ -147,3 +147,114 @@ def test_malformed_graph():
     graph = {1: [0], 2: [33]}
     with pytest.raises(ValueError):
         Tracks(data, graph=graph)
+
+
+def _random_tracks(n_tracks, n_frames, first_frame=0):
+    """Make sorted 2D+t track data with one vertex per track per frame."""
+    ids, times = np.meshgrid(
+        np.arange(n_tracks), np.arange(first_frame, n_frames), indexing='ij'
+    )
+    data = np.random.random((ids.size, 4)) * 100
+    data[:, 0] = ids.ravel()
+    data[:, 1] = times.ravel()
+    return data
+
+
+@pytest.mark.parametrize('first_frame', [10, 5])
+def test_track_layer_add(first_frame):
+    """Test adding vertices matches building from all the data.
+
+    New frames after the existing ones are added in place, while frames
+    that overlap the existing ones are merged back in time order.
+    """
+    np.random.seed(0)
+    data = _random_tracks(5, 10)
+    new_data = _random_tracks(7, 15, first_frame=first_frame)
+    merged = np.concatenate([data, new_data], axis=0)
+    merged = merged[np.lexsort((merged[:, 1], merged[:, 0]))]
+
+    layer = Tracks(data, properties={'time': data[:, 1]})
+    layer.add(new_data, properties={'time': new_data[:, 1]})
+    expected = Tracks(merged, properties={'time': merged[:, 1]})
+
+    np.testing.assert_array_equal(layer.data, expected.data)
+    np.testing.assert_array_equal(layer.track_connex, expected.track_connex)
+    np.testing.assert_array_equal(layer.track_colors, expected.track_colors)
+    for k, v in expected.properties.items():
+        np.testing.assert_array_equal(layer.properties[k], v)
+    assert layer._manager.max_time == 14
+    for t in range(15):
+        labels, pos = layer._manager.track_labels(t)
+        exp_labels, exp_pos = expected._manager.track_labels(t)
+        assert sorted(labels) == sorted(exp_labels)
+        assert len(pos) == len(exp_pos)
+    np.testing.assert_array_equal(
+        layer._manager._points[:, 0], expected._manager._points[:, 0]
+    )
+    np.testing.assert_array_equal(
+        layer._manager.data[layer._manager._ordered_points_idx, 1:],
+        layer._manager._points,
+    )
+    layer._manager.get_value(merged[3, 1:])
+    assert layer._manager._kdtree is not None
+
+
+def test_track_layer_add_mismatched_properties():
+    """Test adding vertices without the existing properties raises."""
+    data = _random_tracks(2, 5)
+    layer = Tracks(data, properties={'time': data[:, 1]})
+    with pytest.raises(ValueError):
+        layer.add(_random_tracks(2, 8, first_frame=5))
+
+
+def test_track_layer_graph_vertices():
+    """Test graph edges join the first vertex of a node to its parents."""
+    data = _random_tracks(4, 5)
+    graph = {2: [0, 1], 3: 2}
+    layer = Tracks(data, graph=graph)
+    expected = data[[10, 4, 10, 9, 15, 14], 1:]
+    np.testing.assert_array_equal(layer._manager.graph_vertices, expected)
+    np.testing.assert_array_equal(
+        layer.graph_connex, [True, False, True, False, True, False]
+    )
+    np.testing.assert_array_equal(
+        layer.track_connex, np.tile([True] * 4 + [False], 4)
+    )
+
+
+def test_track_layer_cull_tracks():
+    """Test culled tracks keep every segment with a vertex in the tail."""
+    np.random.seed(0)
+    data = _random_tracks(10, 50)
+    # stagger the tracks, so some have finished or not yet started
+    data[:, 1] += 3 * data[:, 0]
+    graph = {5: [2], 8: [3, 4]}
+    layer = Tracks(data, graph=graph, tail_length=5)
+    culled = Tracks(data, graph=graph, tail_length=5, cull_tracks=True)
+
+    def segments(vertices, connex):
+        starts = np.flatnonzero(connex)
+        return {(tuple(vertices[i]), tuple(vertices[i + 1])) for i in starts}
+
+    for t in [0, 20, 40, 70, 200]:
+        layer._slice_dims([t, 0, 0], ndisplay=2)
+        culled._slice_dims([t, 0, 0], ndisplay=2)
+        times = layer.track_times
+        tail = (times >= t - 5) & (times <= t)
+        visible = np.flatnonzero(
+            layer.track_connex & (tail | np.roll(tail, -1))
+        )
+        expected = segments(
+            layer._view_data, np.isin(np.arange(len(times)), visible)
+        )
+        result = segments(culled._view_data, culled.track_connex)
+        assert expected <= result
+        assert len(culled._view_data) < len(layer._view_data)
+        assert len(culled.track_colors) == len(culled._view_data)
+        assert len(culled.track_times) == len(culled._view_data)
+        assert culled.graph_times is not None
+        assert len(culled._view_graph) == len(culled.graph_connex)
+
+    # displaying the whole history shows everything
+    culled.cull_tracks = False
+    np.testing.assert_array_equal(culled._view_data, layer._view_data)
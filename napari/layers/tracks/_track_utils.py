@@ -19,6 +19,25 @@ def connex(vertices: np.ndarray) -> list:
     return [True] * (vertices.shape[0] - 1) + [False]
 
 
+def track_connex(track_ids: np.ndarray) -> np.ndarray:
+    """Connection array for the vertices of tracks sorted by track ID.
+
+    Consecutive vertices are connected unless they belong to different
+    tracks, so the last vertex of each track is not connected to the next.
+
+    Parameters
+    ----------
+    track_ids : array (N,)
+        Track ID for each vertex, with the vertices of each track contiguous.
+
+    Returns
+    -------
+    connex : array (N,)
+        Boolean connection array for vispy LineVisual.
+    """
+    return np.append(track_ids[:-1] == track_ids[1:], False)
+
+
 class TrackManager:
     """Manage track data and simplify interactions with the Tracks layer.
 
@@ -110,28 +129,17 @@ class TrackManager:
         self._ordered_points_idx = np.argsort(self.data[:, 1])
         self._points = self.data[self._ordered_points_idx, 1:]
 
-        # build a tree of the track data to allow fast lookup of nearest track
-        self._kdtree = cKDTree(self._points)
+        # the tree of the track data used for fast lookup of the nearest
+        # track is built the first time it is needed
+        self._kdtree = None
 
         # make the lookup table
-        # NOTE(arl): it's important to convert the time index to an integer
-        # here to make sure that we align with the napari dims index which
-        # will be an integer - however, the time index does not necessarily
-        # need to be an int, and the shader will render correctly.
-        frames = list(set(self._points[:, 0].astype(np.uint).tolist()))
-        self._points_lookup = [None] * (max(frames) + 1)
-        for f in frames:
-            idx = np.where(self._points[:, 0] == f)[0]
-            self._points_lookup[f] = slice(min(idx), max(idx) + 1, 1)
-
-        # make a second lookup table using a sparse matrix to convert track id
-        # to the vertex indices
-        self._id2idxs = coo_matrix(
-            (
-                np.broadcast_to(1, self.track_ids.size),  # just dummy ones
-                (self.track_ids, np.arange(self.track_ids.size)),
-            )
-        ).tocsr()
+        self._points_lookup = []
+        self._update_points_lookup()
+
+        # the lookup table from track id to vertex indices is built the first
+        # time it is needed
+        self._id2idxs = None
 
         # sort the data by ID then time
         # indices = np.lexsort((self.data[:, 1], self.data[:, 0]))
@@ -177,10 +185,132 @@ class TrackManager:
         """ return the number of tracks """
         return len(self.unique_track_ids) if self.data is not None else 0
 
+    def _update_points_lookup(self, first_frame: int = 0):
+        """ update the slices of the time ordered points for each frame
+
+        Only frames from first_frame onwards are updated.
+        """
+        # NOTE(arl): it's important to convert the time index to an integer
+        # here to make sure that we align with the napari dims index which
+        # will be an integer - however, the time index does not necessarily
+        # need to be an int, and the shader will render correctly.
+        times = self._points[:, 0]
+        frames = np.unique(times[times >= first_frame].astype(np.uint))
+        n_frames = int(frames[-1]) + 1 if frames.size else first_frame
+        lookup = self._points_lookup[:first_frame]
+        lookup += [None] * (n_frames - len(lookup))
+        starts = np.searchsorted(times, frames, side='left')
+        stops = np.searchsorted(times, frames, side='right')
+        for f, start, stop in zip(frames.tolist(), starts, stops):
+            if stop > start:
+                lookup[f] = slice(start, stop, 1)
+        self._points_lookup = lookup
+
     def _vertex_indices_from_id(self, track_id: int):
         """ return the vertices corresponding to a track id """
+        if self._id2idxs is None:
+            # make a lookup table using a sparse matrix to convert track id
+            # to the vertex indices
+            self._id2idxs = coo_matrix(
+                (
+                    np.broadcast_to(1, self.track_ids.size),  # dummy ones
+                    (self.track_ids, np.arange(self.track_ids.size)),
+                )
+            ).tocsr()
         return self._id2idxs[track_id].nonzero()[1]
 
+    def add(
+        self,
+        data: Union[list, np.ndarray],
+        properties: Dict[str, np.ndarray] = None,
+    ):
+        """Add new points to the tracks, e.g. the latest frames of a tracker.
+
+        Points that come after the existing points of their track, or belong
+        to new tracks, are inserted into the vertex, connex and time lookup
+        arrays without rebuilding them. Otherwise the tracks are rebuilt from
+        the merged data. The kd-tree and the track id lookup table are
+        rebuilt lazily, the next time they are needed.
+
+        Parameters
+        ----------
+        data : array (M, D+1)
+            Coordinates of the new points, with the same columns as `data`
+            and also sorted by ID then time.
+        properties : dict {str: array (M,)}, optional
+            Properties of the new points. Must have the same keys as the
+            existing properties, apart from `track_id` which is set from the
+            data.
+        """
+        data = self._validate_track_data(np.asarray(data))
+        if len(data) == 0:
+            return
+        if data.shape[1] != self.data.shape[1]:
+            raise ValueError(
+                'new track vertices must have the same dimensions as the data'
+            )
+        properties = dict(properties or {})
+        properties['track_id'] = data[:, 0].astype(np.uint16)
+        if set(properties) != set(self.properties):
+            raise ValueError(
+                'properties must be provided for the new vertices with the '
+                'same keys as the existing properties'
+            )
+        for k, v in properties.items():
+            if len(v) != len(data):
+                raise ValueError(
+                    'the number of properties must equal the number of vertices'
+                )
+
+        # new points are inserted after the last point of their track
+        ids = self.data[:, 0]
+        pos = np.searchsorted(ids, data[:, 0], side='right')
+        exists = (pos > 0) & (ids[pos - 1] == data[:, 0])
+        in_order = np.all(self.data[pos[exists] - 1, 1] <= data[exists, 1])
+
+        if not in_order:
+            # some points go back in time, so sort everything again
+            merged = np.concatenate([self.data, data], axis=0)
+            order = np.lexsort((merged[:, 1], merged[:, 0]))
+            merged_properties = {
+                k: np.concatenate([v, properties[k]])[order]
+                for k, v in self.properties.items()
+            }
+            self.data = merged[order]
+            self.build_tracks()
+            self.properties = merged_properties
+            return
+
+        self._data = np.insert(self.data, pos, data, axis=0)
+        self._properties = {
+            k: np.insert(v, pos, properties[k], axis=0)
+            for k, v in self.properties.items()
+        }
+        self._track_vertices = self._data[:, 1:]
+        track_ids = self.track_ids
+        self._track_connex = track_connex(track_ids)
+
+        # insert the points into the time ordered points, and shift the data
+        # indices of the existing points past the inserted ones
+        new_idx = pos + np.arange(len(data))
+        old_idx = np.delete(np.arange(len(self._data)), new_idx)
+        new_idx = new_idx[np.argsort(data[:, 1], kind='stable')]
+        new_points = self._data[new_idx, 1:]
+        time_pos = np.searchsorted(
+            self._points[:, 0], new_points[:, 0], side='right'
+        )
+        self._ordered_points_idx = np.insert(
+            old_idx[self._ordered_points_idx], time_pos, new_idx
+        )
+        self._points = np.insert(self._points, time_pos, new_points, axis=0)
+        self._points_id = np.insert(
+            self._points_id, time_pos, track_ids[new_idx]
+        )
+
+        self._update_points_lookup(int(data[:, 1].min()))
+        self._kdtree = None
+        self._id2idxs = None
+
     def _validate_track_data(self, data: np.ndarray) -> np.ndarray:
         """ validate the coordinate data """
 
@@ -195,12 +325,15 @@ class TrackManager:
         if not np.all(np.floor(ids) == ids):
             raise ValueError('track id must be an integer')
 
-        if not all([t >= 0 for t in data[:, 1]]):
+        times = data[:, 1]
+        if not np.all(times >= 0):
             raise ValueError('track timestamps must be greater than zero')
 
-        # check that data are sorted by ID then time
-        indices = np.lexsort((data[:, 1], data[:, 0]))
-        if not np.array_equal(indices, np.arange(data[:, 0].size)):
+        # check that data are sorted by ID then time, which is the same as a
+        # stable lexsort leaving the order unchanged
+        id_steps = np.diff(ids)
+        time_steps = np.diff(times)
+        if np.any(id_steps < 0) or np.any((id_steps == 0) & (time_steps < 0)):
             raise ValueError('tracks should be ordered by ID and time')
 
         return data
@@ -233,67 +366,48 @@ class TrackManager:
                 graph[node_idx] = [parents_idx]
 
         # check that graph nodes exist in the track id lookup
+        unique_track_ids = set(self.unique_track_ids.tolist())
         for node_idx, parents_idx in graph.items():
             nodes = [node_idx] + parents_idx
             for node in nodes:
-                if node not in self.unique_track_ids:
+                if node not in unique_track_ids:
                     raise ValueError(f'graph node {node_idx} not found')
 
         return graph
 
     def build_tracks(self):
         """ build the tracks """
-
-        points_id = []
-        track_vertices = []
-        track_connex = []
-
-        # NOTE(arl): this takes some time when the number of tracks is large
-        for idx in self.unique_track_ids:
-            indices = self._vertex_indices_from_id(idx)
-
-            # grab the correct vertices and sort by time
-            vertices = self.data[indices, 1:]
-            vertices = vertices[vertices[:, 0].argsort()]
-
-            # coordinates of the text identifiers, vertices and connections
-            points_id += [idx] * vertices.shape[0]
-            track_vertices.append(vertices)
-            track_connex.append(connex(vertices))
-
-        self._points_id = np.array(points_id)[self._ordered_points_idx]
-        self._track_vertices = np.concatenate(track_vertices, axis=0)
-        self._track_connex = np.concatenate(track_connex, axis=0)
+        # NOTE(arl): the data are sorted by ID then time, so each track is a
+        # contiguous run of vertices
+        track_ids = self.track_ids
+        self._points_id = track_ids[self._ordered_points_idx]
+        self._track_vertices = self.data[:, 1:]
+        self._track_connex = track_connex(track_ids)
 
     def build_graph(self):
         """ build the track graph """
 
-        graph_vertices = []
-        graph_connex = []
-
+        nodes = []
+        parents = []
         for node_idx, parents_idx in self.graph.items():
-            # we join from the first observation of the node, to the last
-            # observation of the parent
-            node_start = self._vertex_indices_from_id(node_idx)[0]
-            node = self.data[node_start, 1:]
-
-            for parent_idx in parents_idx:
-                parent_stop = self._vertex_indices_from_id(parent_idx)[-1]
-                parent = self.data[parent_stop, 1:]
-
-                verts = np.stack([node, parent], axis=0)
-
-                graph_vertices.append(verts)
-                graph_connex.append([True, False])
+            nodes += [node_idx] * len(parents_idx)
+            parents += parents_idx
 
         # if there is a graph, store the vertices and connection arrays,
         # otherwise, clear the vertex arrays
-        if graph_vertices:
-            self._graph_vertices = np.concatenate(graph_vertices, axis=0)
-            self._graph_connex = np.concatenate(graph_connex, axis=0)
-        else:
+        if not nodes:
             self._graph_vertices = None
             self._graph_connex = None
+            return
+
+        # we join from the first observation of the node, to the last
+        # observation of the parent
+        ids = self.data[:, 0]
+        node_start = np.searchsorted(ids, nodes, side='left')
+        parent_stop = np.searchsorted(ids, parents, side='right') - 1
+        verts = np.stack([node_start, parent_stop], axis=1).ravel()
+        self._graph_vertices = self.data[verts, 1:]
+        self._graph_connex = np.tile([True, False], len(nodes))
 
     def vertex_properties(self, color_by: str) -> np.ndarray:
         """ return the properties of tracks by vertex """
@@ -305,9 +419,14 @@ class TrackManager:
 
     def get_value(self, coords):
         """ use a kd-tree to lookup the ID of the nearest tree """
-        if self._kdtree is None:
+        if self._points is None or len(self._points) == 0:
             return
 
+        if self._kdtree is None:
+            # build a tree of the track data to allow fast lookup of nearest
+            # track
+            self._kdtree = cKDTree(self._points)
+
         # query can return indices to points that do not exist, trim that here
         # then prune to only those in the current frame/time
         # NOTE(arl): I don't like this!!!
@@ -367,6 +486,66 @@ class TrackManager:
             return self.graph_vertices[:, 0]
         return None
 
+    def track_window(
+        self, current_time: Union[int, float], tail_length: Union[int, float]
+    ) -> np.ndarray:
+        """Indices of the track vertices visible in the tail of each track.
+
+        These are the vertices with times in the window
+        [current_time - tail_length, current_time], found from the time
+        ordered points, plus the vertices connected to them on either side,
+        so that the segments entering and leaving the window are drawn.
+
+        Parameters
+        ----------
+        current_time : int, float
+            Current time.
+        tail_length : int, float
+            Length of the track tails in units of time.
+
+        Returns
+        -------
+        indices : array (K,)
+            Sorted indices into the track vertices.
+        """
+        times = self._points[:, 0]
+        start = np.searchsorted(times, current_time - tail_length, 'left')
+        stop = np.searchsorted(times, current_time, 'right')
+        indices = self._ordered_points_idx[start:stop]
+        connex = self.track_connex
+        before = indices[indices > 0] - 1
+        after = indices[connex[indices]] + 1
+        return np.unique(
+            np.concatenate([before[connex[before]], indices, after])
+        )
+
+    def graph_window(
+        self, current_time: Union[int, float], tail_length: Union[int, float]
+    ) -> np.ndarray:
+        """Indices of the graph vertices of the edges in the time window.
+
+        Parameters
+        ----------
+        current_time : int, float
+            Current time.
+        tail_length : int, float
+            Length of the track tails in units of time.
+
+        Returns
+        -------
+        indices : array (K,)
+            Sorted indices into the graph vertices, in pairs for each edge
+            with a vertex in [current_time - tail_length, current_time].
+        """
+        if self.graph_vertices is None:
+            return None
+        times = self.graph_times.reshape(-1, 2)
+        in_window = (times >= current_time - tail_length) & (
+            times <= current_time
+        )
+        edges = np.flatnonzero(np.any(in_window, axis=1))
+        return np.stack([2 * edges, 2 * edges + 1], axis=1).ravel()
+
     def track_labels(self, current_time: int) -> tuple:
         """ return track labels at the current time """
         # this is the slice into the time ordered points array
@@ -39,6 +39,10 @@ class Tracks(Layer):
         Width of the track tails in pixels.
     tail_length : float
         Length of the track tails in units of time.
+    cull_tracks : bool
+        If True, only the track vertices and graph edges within the tail
+        length of the current time are sent to the visual, rather than the
+        whole history of the tracks.
     colormap : str
         Default colormap to use to set vertex colors. Specialized colormaps,
         relating to specified properties can be passed to the layer via
@@ -94,6 +98,7 @@ class Tracks(Layer):
         graph=None,
         tail_width=2,
         tail_length=30,
+        cull_tracks=False,
         name=None,
         metadata=None,
         scale=None,
@@ -141,6 +146,7 @@ class Tracks(Layer):
         self.events.add(
             tail_width=Event,
             tail_length=Event,
+            cull_tracks=Event,
             display_id=Event,
             display_tail=Event,
             display_graph=Event,
@@ -161,6 +167,12 @@ class Tracks(Layer):
         # use this to update shaders when the displayed dims change
         self._current_displayed_dims = None
 
+        # when culling the tracks, cache the indices of the track and graph
+        # vertices in the time window, keyed by (current_time, tail_length)
+        self._cull_tracks = cull_tracks
+        self._window = None
+        self._current_window_key = None
+
         # track display properties
         self.tail_width = tail_width
         self.tail_length = tail_length
@@ -220,6 +232,7 @@ class Tracks(Layer):
                 'colormaps_dict': self.colormaps_dict,
                 'tail_width': self.tail_width,
                 'tail_length': self.tail_length,
+                'cull_tracks': self.cull_tracks,
             }
         )
         return state
@@ -227,10 +240,16 @@ class Tracks(Layer):
     def _set_view_slice(self):
         """Sets the view given the indices to slice with."""
 
-        # if the displayed dims have changed, update the shader data
-        if self._dims.displayed != self._current_displayed_dims:
-            # store the new dims
+        # if the displayed dims or the culling window have changed, update
+        # the shader data
+        window_key = self._window_key()
+        if (
+            self._dims.displayed != self._current_displayed_dims
+            or window_key != self._current_window_key
+        ):
+            # store the new dims and window
             self._current_displayed_dims = self._dims.displayed
+            self._current_window_key = window_key
             # fire the events to update the shaders
             self.events.rebuild_tracks()
             self.events.rebuild_graph()
@@ -284,15 +303,57 @@ class Tracks(Layer):
         colormapped[..., 3] *= self.opacity
         self.thumbnail = colormapped
 
+    def _window_key(self):
+        """ return the key of the current culling window, or None """
+        if (
+            not self._cull_tracks
+            or not self.use_fade
+            or self._manager.data is None
+        ):
+            return None
+        return (self.current_time, self.tail_length)
+
+    def _get_window(self):
+        """Return the indices of the track and graph vertices to display.
+
+        Returns
+        -------
+        window : tuple
+            Key of the window, and the indices of the track and graph vertices
+            in the window. The indices are None when all vertices are shown.
+        """
+        key = self._window_key()
+        if key is None:
+            return None, None, None
+        if self._window is None or self._window[0] != key:
+            current_time, tail_length = key
+            self._window = (
+                key,
+                self._manager.track_window(current_time, tail_length),
+                self._manager.graph_window(current_time, tail_length),
+            )
+        return self._window
+
+    def _windowed(self, values, graph=False):
+        """ return the values of the vertices in the culling window """
+        indices = self._get_window()[2 if graph else 1]
+        if values is None or indices is None:
+            return values
+        return values[indices]
+
     @property
     def _view_data(self):
         """ return a view of the data """
-        return self._pad_display_data(self._manager.track_vertices)
+        return self._pad_display_data(
+            self._windowed(self._manager.track_vertices)
+        )
 
     @property
     def _view_graph(self):
         """ return a view of the graph """
-        return self._pad_display_data(self._manager.graph_vertices)
+        return self._pad_display_data(
+            self._windowed(self._manager.graph_vertices, graph=True)
+        )
 
     def _pad_display_data(self, vertices):
         """ pad display data when moving between 2d and 3d """
@@ -338,6 +399,7 @@ class Tracks(Layer):
         # set the data and build the tracks
         self._manager.data = data
         self._manager.build_tracks()
+        self._window = None
 
         # reset the properties and recolor the tracks
         self.properties = {}
@@ -353,6 +415,35 @@ class Tracks(Layer):
         self.events.data()
         self._update_dims()
 
+    def add(self, data: np.ndarray, properties: Dict[str, np.ndarray] = None):
+        """Add new track vertices, e.g. the latest frames of a live tracker.
+
+        Vertices that extend their tracks forward in time, or start new
+        tracks, are added without rebuilding the existing tracks.
+
+        Parameters
+        ----------
+        data : array (M, D+1)
+            Coordinates of the new vertices, ID,T,(Z),Y,X, sorted by ID then
+            time.
+        properties : dict {str: array (M,)}, optional
+            Properties of the new vertices, with the same keys as the existing
+            properties.
+        """
+        self._manager.add(data, properties=properties)
+        self._window = None
+        self._recolor_tracks()
+
+        # the graph joins the ends of tracks, so rebuild it if there is one
+        if self._manager.graph:
+            self._manager.build_graph()
+            self.events.rebuild_graph()
+
+        # fire events to update shaders
+        self.events.rebuild_tracks()
+        self.events.data()
+        self._update_dims()
+
     @property
     def properties(self) -> Dict[str, np.ndarray]:
         """dict {str: np.ndarray (N,)}, DataFrame: Properties for each track."""
@@ -389,6 +480,7 @@ class Tracks(Layer):
         """ Set the track graph. """
         self._manager.graph = graph
         self._manager.build_graph()
+        self._window = None
         self.events.rebuild_graph()
 
     @property
@@ -410,9 +502,24 @@ class Tracks(Layer):
     @tail_length.setter
     def tail_length(self, tail_length: Union[int, float]):
         self._tail_length = tail_length
+        if self._window_key() is not None:
+            self.events.rebuild_tracks()
+            self.events.rebuild_graph()
         self.events.tail_length()
         self.status = format_float(self.tail_length)
 
+    @property
+    def cull_tracks(self) -> bool:
+        """bool: only display the vertices within the tail of each track."""
+        return self._cull_tracks
+
+    @cull_tracks.setter
+    def cull_tracks(self, value: bool):
+        self._cull_tracks = value
+        self.events.rebuild_tracks()
+        self.events.rebuild_graph()
+        self.events.cull_tracks()
+
     @property
     def display_id(self) -> bool:
         """ display the track id """
@@ -507,28 +614,34 @@ class Tracks(Layer):
     @property
     def track_connex(self) -> np.ndarray:
         """ vertex connections for drawing track lines """
-        return self._manager.track_connex
+        connex = self._windowed(self._manager.track_connex)
+        indices = self._get_window()[1]
+        if indices is not None:
+            # the window holds a contiguous run of vertices of each track,
+            # so only break the connections where the run ends
+            connex = connex & np.append(np.diff(indices) == 1, False)
+        return connex
 
     @property
     def track_colors(self) -> np.ndarray:
         """return the vertex colors according to the currently selected
         property"""
-        return self._track_colors
+        return self._windowed(self._track_colors)
 
     @property
     def graph_connex(self) -> np.ndarray:
         """ vertex connections for drawing the graph """
-        return self._manager.graph_connex
+        return self._windowed(self._manager.graph_connex, graph=True)
 
     @property
     def track_times(self) -> np.ndarray:
         """ time points associated with each track vertex """
-        return self._manager.track_times
+        return self._windowed(self._manager.track_times)
 
     @property
     def graph_times(self) -> np.ndarray:
         """ time points assocaite with each graph vertex """
-        return self._manager.graph_times
+        return self._windowed(self._manager.graph_times, graph=True)
 
     @property
     def track_labels(self) -> tuple:
@@ -0,0 +1,130 @@
+"""Per-item arrays with spare capacity for cheap appends.
+
+Layers like Points keep one array per attribute (coordinates, sizes,
+colors, each property) with one row per item. Growing these with
+``np.append`` copies every row on every click. Instead each array is kept
+as a view of the first rows of a larger buffer, so appending usually only
+writes the new rows and the buffer doubles in size when it fills up.
+"""
+from typing import Hashable, Sequence
+
+import numpy as np
+
+# Smallest number of rows allocated for a new buffer.
+MIN_CAPACITY = 16
+
+
+class ColumnBuffers:
+    """Buffers backing a set of named per-item arrays.
+
+    The arrays themselves are owned by the caller, which passes the current
+    array in and keeps the array that is returned. Only the array most
+    recently returned for a column is grown in place, and only into rows
+    past its end; any other array is copied into a new buffer first. Arrays
+    passed in by users, and arrays handed out earlier, are never modified.
+    """
+
+    def __init__(self):
+        self._buffers = {}
+        # Number of rows in the array last handed out for each column.
+        self._lengths = {}
+
+    def _owned_buffer(self, name: Hashable, array: np.ndarray):
+        """Return the buffer that array is the latest prefix of, or None.
+
+        An older, shorter array from the same buffer is not owned, because
+        rows past its end belong to arrays handed out after it.
+        """
+        buffer = self._buffers.get(name)
+        if (
+            buffer is None
+            or len(array) != self._lengths.get(name)
+            or array.base is not buffer
+            or array.dtype != buffer.dtype
+            or array.shape[1:] != buffer.shape[1:]
+            or not array.flags.c_contiguous
+            or array.ctypes.data != buffer.ctypes.data
+        ):
+            return None
+        return buffer
+
+    def append(
+        self, name: Hashable, array: np.ndarray, rows: np.ndarray
+    ) -> np.ndarray:
+        """Append rows to an array, reusing spare capacity when possible.
+
+        Parameters
+        ----------
+        name : hashable
+            Name of the column the array belongs to.
+        array : np.ndarray
+            Current values of the column.
+        rows : np.ndarray
+            Rows to append, with the same trailing shape as ``array``.
+
+        Returns
+        -------
+        array : np.ndarray
+            The column with the rows appended, with the same dtype that
+            ``np.concatenate`` would give.
+        """
+        array = np.asarray(array)
+        rows = np.asarray(rows)
+        if array.shape[1:] != rows.shape[1:]:
+            # Let numpy raise its usual error for incompatible shapes
+            return np.concatenate((array, rows), axis=0)
+
+        n_rows = len(array)
+        n_total = n_rows + len(rows)
+        buffer = self._owned_buffer(name, array)
+        dtype = np.result_type(array, rows)
+        if buffer is None or buffer.dtype != dtype or len(buffer) < n_total:
+            capacity = max(2 * n_total, MIN_CAPACITY)
+            buffer = np.empty((capacity,) + array.shape[1:], dtype=dtype)
+            buffer[:n_rows] = array
+            self._buffers[name] = buffer
+        buffer[n_rows:n_total] = rows
+        self._lengths[name] = n_total
+        return buffer[:n_total]
+
+    def delete(
+        self, name: Hashable, array: np.ndarray, index: Sequence[int]
+    ) -> np.ndarray:
+        """Delete rows from an array, keeping spare capacity for appends.
+
+        The remaining rows are copied into a new buffer, so arrays returned
+        earlier, which callers may still hold, are left unchanged.
+
+        Parameters
+        ----------
+        name : hashable
+            Name of the column the array belongs to.
+        array : np.ndarray
+            Current values of the column.
+        index : sequence of int
+            Indices of the rows to delete.
+
+        Returns
+        -------
+        array : np.ndarray
+            The column without the deleted rows.
+        """
+        array = np.asarray(array)
+        index = np.asarray(index, dtype=int)
+        buffer = self._owned_buffer(name, array)
+        if buffer is None:
+            return np.delete(array, index, axis=0)
+
+        keep = np.ones(len(array), dtype=bool)
+        keep[index] = False
+        n_kept = int(np.count_nonzero(keep))
+        new_buffer = np.empty_like(buffer)
+        np.compress(keep, array, axis=0, out=new_buffer[:n_kept])
+        self._buffers[name] = new_buffer
+        self._lengths[name] = n_kept
+        return new_buffer[:n_kept]
+
+    def clear(self):
+        """Release all the buffers."""
+        self._buffers = {}
+        self._lengths = {}
@@ -0,0 +1,253 @@
+"""Estimate the range of an array's values from a sample of its chunks.
+
+Reading every value of a large lazy array just to pick contrast limits can
+take longer than the user is willing to wait, and a few planes might miss
+sparse signal completely. Instead we read whole chunks, spread out through
+the array, and refine a running estimate as more of them come in.
+"""
+import itertools
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from ...types import ArrayLike
+
+# We never read more than this many elements from one chunk of a lazy
+# array, in case the array has huge chunks or is not chunked at all.
+MAX_SAMPLE_SIZE = 4_000_000
+
+
+def _radical_inverse(index: int) -> float:
+    """Return the base 2 radical inverse of index, in [0, 1).
+
+    This is the van der Corput sequence 0, 1/2, 1/4, 3/4, 1/8... where
+    every prefix of the sequence is spread out evenly.
+    """
+    result = 0.0
+    fraction = 0.5
+    while index:
+        result += fraction * (index & 1)
+        index >>= 1
+        fraction /= 2
+    return result
+
+
+def _get_chunk_shape(data: ArrayLike) -> Tuple[int, ...]:
+    """Return the shape of one chunk, or of one plane if not chunked.
+
+    Parameters
+    ----------
+    data : ArrayLike
+        A numpy, dask or zarr array.
+    """
+    # Dask has chunksize, zarr has chunks, numpy has neither.
+    chunks = getattr(data, 'chunksize', None)
+    if chunks is None:
+        chunks = getattr(data, 'chunks', None)
+    if chunks is None or len(chunks) != data.ndim:
+        return (1,) * (data.ndim - 2) + tuple(data.shape[-2:])
+    return tuple(int(size) for size in chunks)
+
+
+def _get_sample_shape(data: ArrayLike) -> Tuple[int, ...]:
+    """Return the shape of the region we read from each sampled chunk.
+
+    In memory arrays are cheap to read so we use the whole chunk. For lazy
+    arrays we halve the largest axis until the sample is small enough.
+    """
+    shape = list(_get_chunk_shape(data))
+    if isinstance(data, np.ndarray):
+        return tuple(shape)
+
+    while np.prod(shape) > MAX_SAMPLE_SIZE:
+        axis = int(np.argmax(shape))
+        shape[axis] = (shape[axis] + 1) // 2
+    return tuple(shape)
+
+
+def get_sample_indices(data: ArrayLike, num_samples: int) -> List[tuple]:
+    """Return indices of chunks to sample, most informative first.
+
+    The first chunk, the last chunk and the middle chunk come first, then
+    chunks in between at finer and finer spacing. So the first few samples
+    give a rough estimate, and any number of samples covers the data
+    evenly.
+
+    Parameters
+    ----------
+    data : ArrayLike
+        The array to sample.
+    num_samples : int
+        The most chunks to sample.
+
+    Returns
+    -------
+    List[tuple]
+        One tuple of slices for each sampled chunk.
+    """
+    chunk_shape = _get_chunk_shape(data)
+    sample_shape = _get_sample_shape(data)
+    grid_shape = tuple(
+        -(-size // chunk) for size, chunk in zip(data.shape, chunk_shape)
+    )
+    num_chunks = int(np.prod(grid_shape))
+    if num_chunks == 0:
+        return []
+
+    # The ends, then 1/2, 1/4, 3/4, 1/8... this covers every chunk
+    # before it runs out.
+    fractions = itertools.chain(
+        (0.0, 1.0), (_radical_inverse(i) for i in range(1, 2 * num_chunks))
+    )
+
+    chunk_ids = []
+    for fraction in fractions:
+        if len(chunk_ids) == min(num_samples, num_chunks):
+            break
+        chunk_id = int(round(fraction * (num_chunks - 1)))
+        if chunk_id not in chunk_ids:
+            chunk_ids.append(chunk_id)
+
+    indices = []
+    for chunk_id in chunk_ids:
+        grid_pos = np.unravel_index(chunk_id, grid_shape)
+        indices.append(
+            tuple(
+                slice(pos * chunk, min(pos * chunk + sample, size))
+                for pos, chunk, sample, size in zip(
+                    grid_pos, chunk_shape, sample_shape, data.shape
+                )
+            )
+        )
+    return indices
+
+
+class DataRangeEstimator:
+    """Streaming estimate of the range and distribution of values.
+
+    We see the data one chunk at a time. We keep the running min and max,
+    and a histogram with a fixed number of bins spanning them. When a
+    chunk widens the range we move the existing counts into the wider
+    bins, so the histogram is approximate, but it uses the same memory no
+    matter how much data we've seen.
+
+    Parameters
+    ----------
+    num_bins : int
+        The number of bins in the histogram.
+
+    Attributes
+    ----------
+    min : Optional[float]
+        The smallest value seen so far.
+    max : Optional[float]
+        The largest value seen so far.
+    counts : np.ndarray
+        The number of values in each bin.
+    num_chunks : int
+        The number of chunks we've added.
+    """
+
+    def __init__(self, num_bins: int = 1024):
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.counts = np.zeros(num_bins, dtype=np.int64)
+        self.num_chunks = 0
+
+    @property
+    def num_values(self) -> int:
+        """Return how many values we've seen."""
+        return int(self.counts.sum())
+
+    def _get_edges(self) -> np.ndarray:
+        """Return the edges of the histogram bins."""
+        high = self.max if self.max > self.min else self.min + 1
+        return np.linspace(self.min, high, len(self.counts) + 1)
+
+    def add(self, values: ArrayLike) -> None:
+        """Add the values of one chunk to the estimate.
+
+        Parameters
+        ----------
+        values : ArrayLike
+            The values, NaN and infinite values are ignored.
+        """
+        values = np.asarray(values).ravel()
+        if np.issubdtype(values.dtype, np.inexact):
+            values = values[np.isfinite(values)]
+        self.num_chunks += 1
+        if values.size == 0:
+            return
+
+        low = float(values.min())
+        high = float(values.max())
+        if self.min is None:
+            self.min, self.max = low, high
+        elif low < self.min or high > self.max:
+            self._rebin(min(low, self.min), max(high, self.max))
+
+        edges = self._get_edges()
+        counts, _ = np.histogram(values, bins=edges)
+        self.counts += counts
+
+    def _rebin(self, low: float, high: float) -> None:
+        """Widen the histogram to span low to high.
+
+        Parameters
+        ----------
+        low : float
+            The new minimum.
+        high : float
+            The new maximum.
+        """
+        edges = self._get_edges()
+        centers = (edges[:-1] + edges[1:]) / 2
+
+        self.min, self.max = low, high
+        new_edges = self._get_edges()
+        centers = np.clip(centers, new_edges[0], new_edges[-1])
+        self.counts, _ = np.histogram(
+            centers, bins=new_edges, weights=self.counts
+        )
+        self.counts = self.counts.astype(np.int64)
+
+    def get_range(self) -> List[float]:
+        """Return the range of the values, or [0, 1] if all are equal.
+
+        Returns
+        -------
+        List[float]
+            The min and max seen so far.
+        """
+        if self.min is None or self.min == self.max:
+            return [0.0, 1.0]
+        return [self.min, self.max]
+
+    def get_percentiles(self, low: float, high: float) -> List[float]:
+        """Return the values at these percentiles of the histogram.
+
+        Parameters
+        ----------
+        low : float
+            The lower percentile, from 0 to 100.
+        high : float
+            The upper percentile, from 0 to 100.
+
+        Returns
+        -------
+        List[float]
+            The values, or the range if they are equal.
+        """
+        if self.num_values == 0:
+            return self.get_range()
+
+        cumulative = np.concatenate(([0], np.cumsum(self.counts)))
+        cumulative = cumulative / cumulative[-1]
+        edges = self._get_edges()
+        limits = [
+            float(np.interp(percentile / 100, cumulative, edges))
+            for percentile in (low, high)
+        ]
+        if limits[0] >= limits[1]:
+            return self.get_range()
+        return limits
@@ -0,0 +1,61 @@
+import numpy as np
+
+from napari.layers.utils._column_buffers import ColumnBuffers
+
+
+def test_append_reuses_buffer():
+    """Test appending writes into spare capacity after the first copy."""
+    buffers = ColumnBuffers()
+    original = np.zeros((3, 2), dtype=int)
+    array = buffers.append('data', original, [[1, 1]])
+    np.testing.assert_array_equal(array, [[0, 0]] * 3 + [[1, 1]])
+    assert not np.shares_memory(array, original)
+
+    bigger = buffers.append('data', array, [[2, 2], [3, 3]])
+    assert np.shares_memory(array, bigger)
+    np.testing.assert_array_equal(bigger[-3:], [[1, 1], [2, 2], [3, 3]])
+
+
+def test_append_casts_like_concatenate():
+    """Test appending rows of a wider dtype upcasts the column."""
+    buffers = ColumnBuffers()
+    array = buffers.append('data', np.zeros((2, 2), dtype=int), [[1, 1]])
+    array = buffers.append('data', array, [[0.5, 0.5]])
+    assert array.dtype == float
+    np.testing.assert_array_equal(array[-1], [0.5, 0.5])
+
+    labels = buffers.append('labels', np.array(['a', 'b']), ['long'])
+    np.testing.assert_array_equal(labels, ['a', 'b', 'long'])
+
+
+def test_delete():
+    """Test deleting rows never modifies arrays passed in."""
+    buffers = ColumnBuffers()
+    original = np.arange(10)
+    array = buffers.delete('data', original, [2, 5])
+    np.testing.assert_array_equal(original, np.arange(10))
+    np.testing.assert_array_equal(array, [0, 1, 3, 4, 6, 7, 8, 9])
+
+    array = buffers.append('data', array, [10, 11])
+    smaller = buffers.delete('data', array, [7, 0, 3])
+    assert not np.shares_memory(array, smaller)
+    np.testing.assert_array_equal(array, [0, 1, 3, 4, 6, 7, 8, 9, 10, 11])
+    np.testing.assert_array_equal(smaller, [1, 3, 6, 7, 8, 10, 11])
+
+    # the remaining rows keep spare capacity for appends
+    bigger = buffers.append('data', smaller, [12])
+    assert np.shares_memory(smaller, bigger)
+    np.testing.assert_array_equal(bigger, [1, 3, 6, 7, 8, 10, 11, 12])
+
+
+def test_append_to_older_array_copies():
+    """Test appending to an older, shorter array leaves newer ones intact."""
+    buffers = ColumnBuffers()
+    older = buffers.append('data', np.zeros((2, 2)), [[2, 2]])
+    newer = buffers.append('data', older, [[3, 3]])
+    assert np.shares_memory(older, newer)
+
+    array = buffers.append('data', older, [[9, 9]])
+    assert not np.shares_memory(array, newer)
+    np.testing.assert_array_equal(newer[-1], [3, 3])
+    np.testing.assert_array_equal(array[-1], [9, 9])
@@ -0,0 +1,56 @@
+import dask.array as da
+import numpy as np
+
+from napari.layers.utils._data_range import (
+    DataRangeEstimator,
+    get_sample_indices,
+)
+
+
+def test_sample_indices_order():
+    """The first, last and middle chunks come first, then in between."""
+    data = da.zeros((9, 64, 64), chunks=(1, 64, 64))
+    indices = get_sample_indices(data, 5)
+    planes = [idx[0].start for idx in indices]
+    assert planes == [0, 8, 4, 2, 6]
+    assert all(idx[1] == slice(0, 64) for idx in indices)
+
+    # Asking for more samples than chunks returns every chunk once.
+    indices = get_sample_indices(data, 100)
+    assert sorted(idx[0].start for idx in indices) == list(range(9))
+
+
+def test_sample_indices_huge_chunks():
+    """We only read part of a chunk that is too big."""
+    data = da.zeros((2, 8192, 8192), chunks=(1, 8192, 8192))
+    for idx in get_sample_indices(data, 2):
+        assert np.prod([s.stop - s.start for s in idx]) <= 4_000_000
+
+
+def test_estimator_range():
+    """The range grows to cover every chunk we add."""
+    estimator = DataRangeEstimator()
+    assert estimator.get_range() == [0, 1]
+
+    estimator.add(np.full((4, 4), 5.0))
+    assert estimator.get_range() == [0, 1]  # All values are equal.
+
+    estimator.add(np.array([1.0, np.nan, 3.0]))
+    estimator.add(np.array([9.0, np.inf]))
+    assert estimator.get_range() == [1, 9]
+    assert estimator.num_chunks == 3
+    assert estimator.num_values == 19
+
+
+def test_estimator_percentiles():
+    """Percentiles of the histogram ignore sparse outliers."""
+    estimator = DataRangeEstimator()
+    values = np.arange(10_000, dtype=np.float32)
+    for chunk in np.split(values, 10):
+        estimator.add(chunk)
+    estimator.add(np.array([1e6]))  # One bright outlier.
+
+    assert estimator.get_range() == [0, 1e6]
+    low, high = estimator.get_percentiles(1, 99)
+    assert 0 <= low < 1100
+    assert 9000 < high < 11000
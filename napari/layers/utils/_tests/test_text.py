@@ -118,3 +118,102 @@ def test_blending_modes():
     with pytest.warns(RuntimeWarning):
         text_manager.blending = 'opaque'
         assert text_manager.blending == 'translucent'
+
+
+def test_text_manager_lazy_format():
+    """Test text is only formatted for the elements that are viewed."""
+    n_text = 5
+    text = '{name}: {weight:.1f} kg'
+    properties = {
+        'name': np.array(['a', 'b', 'c', 'd', 'e']),
+        'weight': np.arange(n_text) * 1.5,
+    }
+    text_manager = TextManager(text=text, n_text=n_text, properties=properties)
+    assert np.all(np.equal(text_manager._formatted, None))
+
+    text_view = text_manager.view_text([1, 3])
+    np.testing.assert_equal(text_view, ['b: 1.5 kg', 'd: 4.5 kg'])
+    formatted = ~np.equal(text_manager._formatted, None)
+    np.testing.assert_equal(formatted, [False, True, False, True, False])
+
+    # the text manager keeps its own copy of the properties
+    properties['weight'][1] = 10
+    np.testing.assert_equal(text_manager.view_text([1]), ['b: 1.5 kg'])
+
+    # removing and adding elements keeps the formatted strings aligned
+    text_manager.remove([0])
+    text_manager.add({'name': ['f'], 'weight': [2]}, 2)
+    np.testing.assert_equal(
+        text_manager.values,
+        [
+            'b: 1.5 kg',
+            'c: 3.0 kg',
+            'd: 4.5 kg',
+            'e: 6.0 kg',
+            'f: 2.0 kg',
+            'f: 2.0 kg',
+        ],
+    )
+
+    # refreshing formats from the new properties
+    text_manager.refresh_text(properties)
+    np.testing.assert_equal(text_manager.view_text([1]), ['b: 10.0 kg'])
+
+
+def test_text_manager_declutter():
+    n_text = 100
+    properties = {'id': np.arange(n_text)}
+    text_manager = TextManager(
+        text='label {id}', n_text=n_text, properties=properties
+    )
+    assert text_manager.declutter is False
+    canvas = np.array([[0, 0], [100, 100]])
+    assert not text_manager._update_canvas(1, canvas, np.ones(2))
+
+    text_manager.declutter = True
+    assert text_manager._update_canvas(1, canvas, np.ones(2))
+    # panning within the decluttered region doesn't change the text
+    assert not text_manager._update_canvas(1, canvas + 10, np.ones(2))
+    # zooming in does
+    assert text_manager._update_canvas(0.5, canvas // 2, np.ones(2))
+    # the canvas is ignored in 3D
+    assert text_manager._update_canvas(1, np.zeros((2, 3)), np.ones(3))
+    assert not text_manager._update_canvas(1, np.zeros((2, 3)), np.ones(3))
+
+    # a column of labels spaced by one pixel, and some far from the canvas
+    text_manager._update_canvas(1, canvas, np.ones(2))
+    coords = np.zeros((n_text, 2))
+    coords[:, 0] = np.arange(n_text)
+    coords[-10:] = 1000
+    indices_view = np.arange(n_text)
+    index = text_manager._declutter_index(
+        indices_view, coords, 'center', 'center'
+    )
+    # labels are kept when they are at least a line of text apart
+    height = text_manager.size * text_manager._pixels_per_point
+    assert len(index) > 1
+    assert np.all(np.diff(coords[index, 0]) >= height)
+    assert np.all(index < n_text - 10)
+    np.testing.assert_equal(
+        text_manager.view_text(indices_view[index]),
+        ['label ' + str(i) for i in index],
+    )
+    # labels aren't formatted beyond the decluttered ones
+    assert np.sum(np.equal(text_manager._formatted, None)) > n_text // 2
+
+    # the result is cached until the text or its coordinates change
+    assert (
+        text_manager._declutter_index(indices_view, coords, 'center', 'center')
+        is index
+    )
+    coords[:, 0] *= 2
+    new_index = text_manager._declutter_index(
+        indices_view, coords, 'center', 'center'
+    )
+    assert len(new_index) > len(index)
+
+    text_manager.declutter = False
+    assert (
+        text_manager._declutter_index(indices_view, coords, 'center', 'center')
+        is None
+    )
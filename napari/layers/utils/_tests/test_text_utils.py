@@ -12,7 +12,11 @@ from napari.layers.utils._text_utils import (
     _calculate_bbox_extents,
     _format_text_f_string,
     _get_format_keys,
+    _split_format_string,
+    declutter_text_boxes,
+    first_in_cells,
     format_text_direct,
+    format_text_indices,
     format_text_properties,
     get_text_anchors,
 )
@@ -131,6 +135,18 @@ def test_format_text_properties_f_string():
     assert isinstance(formatted_text, np.ndarray)
 
 
+def test_format_text_properties_object_sequences():
+    values = np.empty(2, dtype=object)
+    values[:] = [(1, 2), [3]]
+    properties = {'obj': values}
+
+    formatted_text, _ = format_text_properties('obj', 2, properties)
+    np.testing.assert_equal(formatted_text, ['(1, 2)', '[3]'])
+
+    formatted_text, _ = format_text_properties('got {obj}', 2, properties)
+    np.testing.assert_equal(formatted_text, ['got (1, 2)', 'got [3]'])
+
+
 coords = np.array([[0, 0], [10, 0], [0, 10], [10, 10]])
 view_data_list = [coords]
 view_data_ndarray = coords
@@ -225,3 +241,65 @@ def test_bbox_extents_exception():
     """_calculate_bbox_extents should raise a TypeError for non ndarray or list inputs"""
     with pytest.raises(TypeError):
         _ = _calculate_bbox_extents({'bad_data_type': True})
+
+
+@pytest.mark.parametrize(
+    'text',
+    [
+        '{f}',
+        '{f32} {i} {b}',
+        '{f:.2f} and {i:d}',
+        '{f:.3e}%',
+        '{i:05d} {f:>8.1f}',
+        '{missing} {s}{s}',
+        '{o}',
+    ],
+)
+def test_format_text_indices(text):
+    """Test formatting a subset of the text matches str.format."""
+    properties = {
+        'f': np.array([1.5, -2.25, 1e20, 3]),
+        'f32': np.array([0.1, 0.2, 0.3, 0.4], dtype=np.float32),
+        'i': np.array([1, 22, 333, -4]),
+        'b': np.array([True, False, True, False]),
+        's': np.array(['a', 'bb', 'ccc', '']),
+        'o': np.array([None, 1, 'x', 2.5], dtype=object),
+    }
+    format_keys = _get_format_keys(text, properties)
+    parts = _split_format_string(text, format_keys)
+    indices = np.array([3, 1, 1])
+    formatted_text = format_text_indices(parts, properties, indices)
+
+    expected_text = []
+    for i in indices:
+        values = {k: v[i] for k, v in properties.items()}
+        values['missing'] = '{missing}'
+        expected_text.append(text.format(**values))
+    np.testing.assert_equal(formatted_text, expected_text)
+
+
+def test_first_in_cells():
+    coords = np.array([[0.5, 0.5], [3, 3], [0.9, 0.1], [1.5, 0.5], [3.5, 3]])
+    indices = first_in_cells(coords, np.array([1, 2]))
+    np.testing.assert_equal(indices, [0, 1, 3])
+
+    assert len(first_in_cells(np.zeros((0, 2)), np.array([1, 1]))) == 0
+
+
+@pytest.mark.parametrize(
+    "anchor_x,anchor_y,expected",
+    [
+        ('center', 'center', [0, 2, 3]),
+        ('left', 'top', [0, 2, 3]),
+        ('right', 'bottom', [0, 1, 2, 3]),
+    ],
+)
+def test_declutter_text_boxes(anchor_x, anchor_y, expected):
+    anchors = np.array([[0, 0], [0, 12], [0, 25], [20, 0]])
+    widths = np.array([20, 10, 10, 100])
+    keep = declutter_text_boxes(anchors, widths, 10, anchor_x, anchor_y, 10)
+    np.testing.assert_equal(keep, expected)
+
+    # the number of kept boxes is capped
+    keep = declutter_text_boxes(anchors, widths, 10, anchor_x, anchor_y, 2)
+    np.testing.assert_equal(keep, expected[:2])
@@ -150,7 +150,7 @@ def format_text_properties(text: str, n_text: int, properties: dict = {}):
 
     # If the text value is a property key, the text is the property values
     if text in properties:
-        formatted_text = np.array([str(v) for v in properties[text]])
+        formatted_text = _str_property(properties[text])
         text_mode = TextMode.PROPERTY
     elif ('{' in text) and ('}' in text):
         format_keys = _get_format_keys(text, properties)
@@ -200,26 +200,201 @@ def _get_format_keys(text: str, properties: dict):
     return format_keys_in_properties
 
 
+def _split_format_string(text: str, format_keys: list) -> list:
+    """Split a format string into its literal text and its format keys.
+
+    Parameters
+    ----------
+    text : str
+        The format string, e.g. 'confidence: {confidence:.2f}'.
+    format_keys : list of tuple
+        The (property, format spec) pairs to fill in, as returned by
+        _get_format_keys. Any other fields are kept as literal text.
+
+    Returns
+    -------
+    parts : list
+        The literal strings and the (property, format spec) tuples, in order.
+    """
+    parts = []
+    for i, part in enumerate(re.split('({.*?})', text)):
+        key = tuple(part[1:-1].split(':', 1)) if i % 2 else ()
+        if len(key) == 1:
+            key = (key[0], '')
+        if key in format_keys:
+            parts.append(key)
+        elif part:
+            parts.append(part)
+    return parts
+
+
+def _str_property(values) -> np.ndarray:
+    """Convert an array of property values to strings."""
+    if isinstance(values, np.ndarray) and values.dtype.kind in 'biufcU':
+        return values.astype(str)
+    return np.array([str(v) for v in values], dtype=str)
+
+
+def _format_property(values: np.ndarray, format_spec: str) -> list:
+    """Format an array of property values with a format spec.
+
+    Plain conversions are done for the whole array at once and fixed
+    precision number formats use printf style formatting, which is faster
+    than calling format on each value.
+    """
+    kind = values.dtype.kind
+    if format_spec == '':
+        if kind == 'f' and values.dtype.itemsize < 8:
+            # numpy floats are formatted as python floats
+            values = values.astype(np.float64)
+        if kind in 'biuU' or (kind == 'f' and values.dtype.itemsize == 8):
+            return values.astype(str).tolist()
+    elif (kind in 'iuf' and re.fullmatch(r'\.\d+[eEf]', format_spec)) or (
+        kind in 'iu' and format_spec == 'd'
+    ):
+        printf_format = '%' + format_spec
+        return [printf_format % v for v in values.tolist()]
+    return [format(v, format_spec) for v in values.tolist()]
+
+
+def format_text_indices(
+    parts: list, properties: dict, indices: np.ndarray
+) -> np.ndarray:
+    """Format the text of a subset of elements.
+
+    Parameters
+    ----------
+    parts : list
+        The literal strings and (property, format spec) tuples of the format
+        string, as returned by _split_format_string.
+    properties : dict
+        The properties of all of the elements.
+    indices : np.ndarray
+        Indices of the elements to format.
+
+    Returns
+    -------
+    formatted_text : np.ndarray
+        The formatted string of each element.
+    """
+    indices = np.asarray(indices, dtype=int)
+    printf_format = ''
+    columns = []
+    for part in parts:
+        if isinstance(part, tuple):
+            values = properties[part[0]]
+            if not isinstance(values, np.ndarray):
+                values = np.array(values, dtype=object)
+            columns.append(_format_property(values[indices], part[1]))
+            printf_format += '%s'
+        else:
+            printf_format += part.replace('%', '%%')
+    if not columns:
+        return np.repeat(printf_format % (), len(indices))
+    return np.array([printf_format % row for row in zip(*columns)])
+
+
 def _format_text_f_string(
     text: str, n_text: int, format_keys: list, properties: dict
 ):
-
-    all_formatted_text = []
-    for i in range(n_text):
-        formatted_text = text
-        for format_key in format_keys:
-            prop_value = properties[format_key[0]][i]
-            string_template = '{' + ':' + format_key[1] + '}'
-            formatted_prop_value = string_template.format(prop_value)
-            if len(format_key[1]) == 0:
-                original_value = '{' + format_key[0] + '}'
-            else:
-                original_value = (
-                    '{' + format_key[0] + ':' + format_key[1] + '}'
-                )
-            formatted_text = formatted_text.replace(
-                original_value, formatted_prop_value
-            )
-        all_formatted_text.append(formatted_text)
-
-    return all_formatted_text
+    parts = _split_format_string(text, format_keys)
+    return format_text_indices(parts, properties, np.arange(n_text))
+
+
+def first_in_cells(coords: np.ndarray, cell_size: np.ndarray) -> np.ndarray:
+    """Indices of the first of the coordinates in each cell of a grid.
+
+    Parameters
+    ----------
+    coords : (N, 2) np.ndarray
+        The coordinates.
+    cell_size : (2,) np.ndarray
+        The size of the grid cells along each axis.
+
+    Returns
+    -------
+    indices : np.ndarray
+        Sorted indices of the first coordinates in each occupied cell.
+    """
+    if len(coords) == 0:
+        return np.zeros(0, dtype=int)
+    cells = np.floor(coords / cell_size).astype(np.int64)
+    cells -= cells.min(axis=0)
+    key = cells[:, 0] * (cells[:, 1].max() + 1) + cells[:, 1]
+    _, first = np.unique(key, return_index=True)
+    return np.sort(first)
+
+
+def declutter_text_boxes(
+    anchors: np.ndarray,
+    widths: np.ndarray,
+    height: float,
+    anchor_x: str,
+    anchor_y: str,
+    max_labels: int,
+) -> np.ndarray:
+    """Greedily pick text boxes that do not overlap each other.
+
+    Boxes are considered in order and each is kept if it does not overlap
+    any box kept before it, until max_labels boxes are kept.
+
+    Parameters
+    ----------
+    anchors : (N, 2) np.ndarray
+        The (row, column) anchor of each text element in screen pixels.
+    widths : (N,) np.ndarray
+        The width of each text element in screen pixels.
+    height : float
+        The height of the text elements in screen pixels.
+    anchor_x : str
+        The vispy text anchor for the x axis.
+    anchor_y : str
+        The vispy text anchor for the y axis.
+    max_labels : int
+        The maximum number of text elements to keep.
+
+    Returns
+    -------
+    keep : np.ndarray
+        Indices of the kept text elements, in order.
+    """
+    if len(anchors) == 0:
+        return np.zeros(0, dtype=int)
+    col_offset = {'left': 0, 'right': -1}.get(anchor_x, -0.5) * widths
+    row_offset = {'top': 0, 'bottom': -1, 'baseline': -1}.get(anchor_y, -0.5)
+    mins = np.column_stack(
+        [anchors[:, 0] + row_offset * height, anchors[:, 1] + col_offset]
+    )
+    maxs = mins + np.column_stack([np.full(len(widths), height), widths])
+
+    # boxes are no bigger than the grid cells, so a box can only overlap
+    # the boxes with their corner in the same or a neighbouring cell
+    cell_size = np.array([height, max(np.max(widths), height)])
+    cells = np.floor(mins / cell_size).astype(int).tolist()
+    mins = mins.tolist()
+    maxs = maxs.tolist()
+    kept_in_cell = {}
+    keep = []
+    for i, (row, col) in enumerate(cells):
+        (min_row, min_col), (max_row, max_col) = mins[i], maxs[i]
+        overlaps = False
+        for cell in [
+            (row + dr, col + dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1)
+        ]:
+            for j in kept_in_cell.get(cell, ()):
+                if (
+                    min_row < maxs[j][0]
+                    and mins[j][0] < max_row
+                    and min_col < maxs[j][1]
+                    and mins[j][1] < max_col
+                ):
+                    overlaps = True
+                    break
+            if overlaps:
+                break
+        if not overlaps:
+            keep.append(i)
+            kept_in_cell.setdefault((row, col), []).append(i)
+            if len(keep) >= max_labels:
+                break
+    return np.array(keep, dtype=int)
@@ -4,6 +4,10 @@ import dask
 import numpy as np
 
 from ...utils.colormaps import Colormap
+from ._data_range import get_sample_indices
+
+# The number of chunks calc_data_range() reads from large arrays.
+NUM_SEED_SAMPLES = 3
 
 
 def calc_data_range(data):
@@ -27,15 +31,14 @@ def calc_data_range(data):
     if data.dtype == np.uint8:
         return [0, 255]
     if np.prod(data.shape) > 1e6:
-        # If data is very large take the average of the top, bottom, and
-        # middle slices
-        bottom_plane_idx = (0,) * (data.ndim - 2)
-        middle_plane_idx = tuple(s // 2 for s in data.shape[:-2])
-        top_plane_idx = tuple(s - 1 for s in data.shape[:-2])
-        idxs = [bottom_plane_idx, middle_plane_idx, top_plane_idx]
+        # If data is very large take the range of the first, last, and
+        # middle chunks, which are planes if the data is not chunked
+        samples = [
+            data[idx] for idx in get_sample_indices(data, NUM_SEED_SAMPLES)
+        ]
         reduced_data = [
-            [np.max(data[idx]) for idx in idxs],
-            [np.min(data[idx]) for idx in idxs],
+            [np.max(sample) for sample in samples],
+            [np.min(sample) for sample in samples],
         ]
         # compute everything in one go
         reduced_data = dask.compute(*reduced_data)
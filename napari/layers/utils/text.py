@@ -1,13 +1,23 @@
 import warnings
-from typing import Tuple, Union
+from typing import Optional, Tuple, Union
 
 import numpy as np
 
 from ...utils.colormaps.standardize_color import transform_color
 from ...utils.events import EmitterGroup, Event
 from ..base._base_constants import Blending
+from ._column_buffers import ColumnBuffers
 from ._text_constants import Anchor, TextMode
-from ._text_utils import format_text_properties, get_text_anchors
+from ._text_utils import (
+    _get_format_keys,
+    _split_format_string,
+    _str_property,
+    declutter_text_boxes,
+    first_in_cells,
+    format_text_direct,
+    format_text_indices,
+    get_text_anchors,
+)
 
 
 class TextManager:
@@ -36,6 +46,9 @@ class TextManager:
         The default value is 'translucent'
     visible : bool
         Set to true of the text should be displayed.
+    declutter : bool
+        If True, only text elements that are near the canvas and do not
+        overlap each other on screen are displayed in 2D. Default is False.
 
     Attributes
     ----------
@@ -58,8 +71,18 @@ class TextManager:
         is not recommended, as colors the bounding box surrounding the text.
     visible : bool
         Set to true of the text should be displayed.
+    declutter : bool
+        If True, only text elements that are near the canvas and do not
+        overlap each other on screen are displayed in 2D.
     """
 
+    # Maximum number of decluttered text elements displayed at once
+    _max_decluttered = 1000
+    # Screen pixels per font point, and average glyph width in font sizes,
+    # used to estimate the size of the text on screen
+    _pixels_per_point = 96 / 72
+    _char_width = 0.6
+
     def __init__(
         self,
         text,
@@ -72,6 +95,7 @@ class TextManager:
         size=12,
         blending='translucent',
         visible=True,
+        declutter=False,
     ):
 
         self.events = EmitterGroup(
@@ -85,6 +109,7 @@ class TextManager:
             size=Event,
             blending=Event,
             visible=Event,
+            declutter=Event,
         )
 
         self.events.block_all()
@@ -95,6 +120,20 @@ class TextManager:
         self._size = size
         self._blending = self._check_blending_mode(blending)
         self._visible = visible
+        self._declutter = declutter
+
+        # the canvas the text is decluttered for, as the zoom level and the
+        # data region around the canvas, and the last decluttered text
+        self._canvas = None
+        self._declutter_cache = None
+
+        # in the property and formatted modes the text is formatted lazily
+        # from a copy of the properties it uses, and each formatted string is
+        # kept until the properties are refreshed
+        self._buffers = ColumnBuffers()
+        self._properties = {}
+        self._format_parts = []
+        self._formatted = np.empty(0, dtype=object)
 
         self._set_text(text, n_text, properties)
         self.events.unblock_all()
@@ -102,24 +141,86 @@ class TextManager:
     @property
     def values(self):
         """np.ndarray: the text values to be displayed"""
+        if self._is_lazy:
+            return self._format(np.arange(len(self._formatted)))
         return self._values
 
+    @property
+    def _is_lazy(self) -> bool:
+        """bool: True if the text is formatted from the properties."""
+        return self._mode in (TextMode.PROPERTY, TextMode.FORMATTED)
+
+    @property
+    def _has_values(self) -> bool:
+        """bool: True if there are text values, without formatting them."""
+        return self._is_lazy or self._values is not None
+
     def _set_text(
         self, text: Union[None, str], n_text: int, properties: dict = {}
     ):
+        self._buffers.clear()
+        self._properties = {}
+        self._format_parts = []
+        self._formatted = np.empty(0, dtype=object)
+        self._declutter_cache = None
+        self._values = None
         if len(properties) == 0 or n_text == 0 or text is None:
             self._mode = TextMode.NONE
             self._text_format_string = ''
-            self._values = None
         else:
-            formatted_text, text_mode = format_text_properties(
-                text, n_text, properties
-            )
             self._text_format_string = text
-            self._values = formatted_text
-            self._mode = text_mode
+            if text in properties:
+                self._mode = TextMode.PROPERTY
+                format_keys = [(text, '')]
+            elif ('{' in text) and ('}' in text):
+                self._mode = TextMode.FORMATTED
+                format_keys = _get_format_keys(text, properties)
+                self._format_parts = _split_format_string(text, format_keys)
+            else:
+                self._values, self._mode = format_text_direct(text, n_text)
+                format_keys = []
+
+            for key, _ in format_keys:
+                self._properties[key] = self._copy_property(properties[key])
+            if self._is_lazy:
+                self._formatted = np.empty(n_text, dtype=object)
         self.events.text()
 
+    @staticmethod
+    def _copy_property(values) -> np.ndarray:
+        """Copy property values, keeping python objects in lists as is."""
+        if isinstance(values, np.ndarray):
+            return values.copy()
+        return np.array(values, dtype=object)
+
+    def _format(self, indices: np.ndarray) -> np.ndarray:
+        """Format the text of the elements at indices.
+
+        Strings that were already formatted are reused, the others are
+        formatted together and stored.
+        """
+        indices = np.asarray(indices, dtype=int)
+        formatted = self._formatted[indices]
+        missing = np.flatnonzero(np.equal(formatted, None))
+        if len(missing) > 0:
+            missing_indices = indices[missing]
+            if self._mode == TextMode.PROPERTY:
+                values = self._properties[self._text_format_string]
+                new_text = _str_property(values[missing_indices])
+            else:
+                new_text = format_text_indices(
+                    self._format_parts, self._properties, missing_indices
+                )
+            formatted[missing] = new_text
+            self._formatted[missing_indices] = new_text
+        return formatted.astype(str)
+
+    def _get_values(self, indices: np.ndarray) -> np.ndarray:
+        """Return the text values of the elements at indices."""
+        if self._is_lazy:
+            return self._format(indices)
+        return self._values[indices]
+
     @property
     def anchor(self) -> str:
         """str: The location of the text origin relative to the bounding box.
@@ -218,6 +319,18 @@ class TextManager:
         self._visible = visible
         self.events.visible()
 
+    @property
+    def declutter(self) -> bool:
+        """bool: If True, only display text that does not overlap in 2D."""
+        return self._declutter
+
+    @declutter.setter
+    def declutter(self, declutter):
+        self._declutter = declutter
+        self._canvas = None
+        self._declutter_cache = None
+        self.events.declutter()
+
     @property
     def mode(self) -> str:
         """str: The current text setting mode."""
@@ -231,10 +344,14 @@ class TextManager:
         properties : dict
             The new properties from the layer
         """
+        if self._is_lazy:
+            n_text = len(self._formatted)
+        elif self._values is not None:
+            n_text = len(self._values)
+        else:
+            n_text = 0
         self._set_text(
-            self._text_format_string,
-            n_text=len(self.values),
-            properties=properties,
+            self._text_format_string, n_text=n_text, properties=properties,
         )
 
     def add(self, properties: dict, n_text: int):
@@ -247,12 +364,32 @@ class TextManager:
         n_text : int
             The number of text elements to add
         """
-        if self._mode in (TextMode.PROPERTY, TextMode.FORMATTED):
-            new_text, _ = format_text_properties(
-                self._text_format_string, n_text=n_text, properties=properties
+        if self._is_lazy:
+            for k, values in self._properties.items():
+                new_values = properties[k]
+                if len(new_values) != n_text:
+                    new_values = np.repeat(new_values, n_text, axis=0)
+                self._properties[k] = self._buffers.append(
+                    k, values, np.asarray(new_values)
+                )
+            self._formatted = self._buffers.append(
+                None, self._formatted, np.empty(n_text, dtype=object)
             )
 
-            self._values = np.concatenate((self.values, new_text))
+    def _paste(self, text: np.ndarray, properties: dict):
+        """Add pasted text elements
+
+        Parameters
+        ----------
+        text : np.ndarray
+            The copied text values.
+        properties : dict
+            The copied properties the text is formatted from.
+        """
+        if self._is_lazy:
+            self.add(properties, len(text))
+        elif self._values is not None:
+            self._values = np.concatenate((self._values, text), axis=0)
 
     def remove(self, indices_to_remove: Union[set, list, np.ndarray]):
         """Remove the indicated text elements
@@ -262,10 +399,19 @@ class TextManager:
         indices_to_remove : set, list, np.ndarray
             The indices of the text elements to remove.
         """
-        if self._mode != TextMode.NONE:
-            selected_indices = list(indices_to_remove)
-            if len(selected_indices) > 0:
-                self._values = np.delete(self.values, selected_indices, axis=0)
+        selected_indices = list(indices_to_remove)
+        if len(selected_indices) == 0:
+            return
+        if self._is_lazy:
+            for k, values in self._properties.items():
+                self._properties[k] = self._buffers.delete(
+                    k, values, selected_indices
+                )
+            self._formatted = self._buffers.delete(
+                None, self._formatted, selected_indices
+            )
+        elif self._mode != TextMode.NONE:
+            self._values = np.delete(self.values, selected_indices, axis=0)
 
     def compute_text_coords(
         self, view_data: np.ndarray, ndisplay: int
@@ -299,6 +445,133 @@ class TextManager:
             anchor_y = 'center'
         return text_coords, anchor_x, anchor_y
 
+    def _update_canvas(
+        self, scale_factor: float, corners: np.ndarray, scale: np.ndarray
+    ) -> bool:
+        """Update the canvas the text is decluttered for.
+
+        The text is decluttered at zoom levels that are powers of two, for a
+        region that extends half a canvas beyond each side of the canvas, so
+        it only needs to be decluttered again after zooming by a factor of
+        two or panning out of the region.
+
+        Parameters
+        ----------
+        scale_factor : float
+            Scale factor going from canvas to world coordinates.
+        corners : (2, D) np.ndarray
+            Coordinates of the top-left and bottom-right canvas pixels in the
+            displayed dimensions of the layer data.
+        scale : (D,) np.ndarray
+            Scale of the displayed dimensions of the layer data.
+
+        Returns
+        -------
+        changed : bool
+            True if the decluttered text needs to be redrawn.
+        """
+        if not self._declutter or corners.shape[1] != 2:
+            canvas = None
+        else:
+            level = int(np.ceil(np.log2(scale_factor)))
+            if (
+                self._canvas is not None
+                and self._canvas[0] == level
+                and np.all(self._canvas[1] <= corners[0])
+                and np.all(corners[1] <= self._canvas[2])
+            ):
+                return False
+            margin = (corners[1] - corners[0]) / 2
+            canvas = (
+                level,
+                corners[0] - margin,
+                corners[1] + margin,
+                np.asarray(scale) / 2 ** level,
+            )
+        changed = canvas is not None or self._canvas is not None
+        self._canvas = canvas
+        return changed
+
+    def _declutter_index(
+        self,
+        indices_view: np.ndarray,
+        text_coords: np.ndarray,
+        anchor_x: str,
+        anchor_y: str,
+    ) -> Optional[np.ndarray]:
+        """Indices into the text elements in view of the ones to display.
+
+        Text elements outside of the region around the canvas are culled,
+        then text elements are kept in order as long as they don't overlap
+        the ones kept before them on screen, up to a maximum number.
+
+        Parameters
+        ----------
+        indices_view : (N,) np.ndarray
+            Indices of the text elements in view.
+        text_coords : (N, 2) np.ndarray
+            The coordinates of the text elements in view.
+        anchor_x : str
+            The vispy text anchor for the x axis.
+        anchor_y : str
+            The vispy text anchor for the y axis.
+
+        Returns
+        -------
+        index : np.ndarray or None
+            Sorted indices into the text elements in view, or None if the
+            text is not decluttered and every text element is displayed.
+        """
+        if self._canvas is None or not self._is_lazy:
+            return None
+        key = (self._canvas[0], anchor_x, anchor_y, self.size)
+        cache = self._declutter_cache
+        if (
+            cache is not None
+            and cache[0] == key
+            and np.array_equal(cache[1], indices_view)
+            and np.array_equal(cache[2], text_coords)
+        ):
+            return cache[3]
+
+        _, region_min, region_max, pixels_per_unit = self._canvas
+        pixels = text_coords * pixels_per_unit
+        height = self.size * self._pixels_per_point
+        # at most one text element starts in each text sized screen cell
+        in_region = np.all(
+            (text_coords >= region_min) & (text_coords <= region_max), axis=1
+        )
+        index = np.flatnonzero(in_region)
+        index = index[first_in_cells(pixels[index], [height, 2 * height])]
+        # keep the text elements on the canvas before the ones around it
+        margin = (region_max - region_min) / 4
+        on_canvas = np.all(
+            (text_coords[index] >= region_min + margin)
+            & (text_coords[index] <= region_max - margin),
+            axis=1,
+        )
+        index = index[np.argsort(~on_canvas, kind='stable')]
+
+        text = self._format(np.asarray(indices_view)[index])
+        widths = np.char.str_len(text) * (height * self._char_width)
+        keep = declutter_text_boxes(
+            pixels[index],
+            widths,
+            height,
+            anchor_x,
+            anchor_y,
+            self._max_decluttered,
+        )
+        index = np.sort(index[keep])
+
+        self._declutter_cache = (
+            key,
+            np.array(indices_view, copy=True),
+            np.array(text_coords, copy=True),
+            index,
+        )
+        return index
+
     def view_text(self, indices_view: np.ndarray) -> np.ndarray:
         """Get the values of the text elements in view
 
@@ -313,8 +586,8 @@ class TextManager:
             Array of text strings for the N text elements in view
         """
         if len(indices_view) > 0:
-            if self._mode in [TextMode.FORMATTED, TextMode.PROPERTY]:
-                text = self.values[indices_view]
+            if self._is_lazy:
+                text = self._format(indices_view)
             else:
                 text = np.array([''])
         else:
@@ -332,6 +605,7 @@ class TextManager:
             'translation': self.translation,
             'size': self.size,
             'visible': self.visible,
+            'declutter': self.declutter,
         }
 
         return state
@@ -351,6 +625,7 @@ class TextManager:
         self.events.color.connect(text_update_function)
         self.events.size.connect(text_update_function)
         self.events.visible.connect(text_update_function)
+        self.events.declutter.connect(text_update_function)
 
         # connect the function for updating the text node blending
         self.events.blending.connect(blending_update_function)
@@ -360,7 +635,11 @@ class TextManager:
 
         called by: text_manager_1 == text_manager_2
         """
-        if isinstance(other, TextManager):
+        if other is self:
+            # the event emitters compare their source with each event's
+            # source, so don't format all of the text to do so
+            equal = True
+        elif isinstance(other, TextManager):
             my_state = self._get_state()
             other_state = other._get_state()
             equal = np.all(
@@ -1,3 +1,4 @@
+import dask.array as da
 import numpy as np
 import pandas as pd
 import pytest
@@ -35,6 +36,59 @@ def test_random_vectors_image():
     assert layer._view_data.shape[2] == 2
 
 
+def test_vectors_image_positions():
+    """Test that image-like vectors start at the pixel they are in."""
+    data = np.zeros((2, 3, 2))
+    data[1, 0] = [7, 8]
+    layer = Vectors(data)
+    nonzero = np.any(layer.data[:, 1] != 0, axis=1)
+    np.testing.assert_equal(layer.data[nonzero], [[[1, 0], [7, 8]]])
+
+
+@pytest.mark.parametrize("ndisplay", [2, 3])
+def test_lazy_vectors_image(ndisplay):
+    """Test that image-like dask data is sliced without converting it."""
+    shape = (3, 5, 6, 3)
+    np.random.seed(0)
+    data = np.random.random(shape)
+    layer = Vectors(da.from_array(data, chunks=(1, 5, 6, 3)))
+    assert isinstance(layer.data, da.Array)
+    assert layer.ndim == 3
+    np.testing.assert_equal(layer._extent_data, [[0, 0, 0], [2, 4, 5]])
+
+    eager_layer = Vectors(data)
+    for point in [[1, 0, 0], [2, 0, 0], [5, 0, 0]]:
+        layer._slice_dims(point, ndisplay=ndisplay)
+        eager_layer._slice_dims(point, ndisplay=ndisplay)
+        np.testing.assert_equal(layer._view_indices, eager_layer._view_indices)
+        np.testing.assert_allclose(layer._view_data, eager_layer._view_data)
+        assert len(layer._view_face_color) == len(layer._view_faces)
+
+    with pytest.raises(ValueError):
+        layer.properties = {'magnitude': np.arange(np.prod(shape[:-1]))}
+
+
+def test_lazy_vectors_image_stride():
+    """Test subsampling image-like dask data by zoom and max vectors."""
+    np.random.seed(0)
+    data = da.from_array(np.random.random((40, 40, 2)))
+    layer = Vectors(data)
+    assert len(layer._view_indices) == 1600
+
+    # zoomed out the vectors are drawn a few pixels apart
+    layer._update_draw(1, np.array([[0, 0], [40, 40]]), (512, 512))
+    stride = layer._zoom_stride
+    assert stride == layer._min_lazy_vector_spacing
+    np.testing.assert_equal(layer._view_data[:2, 0], [[0, 0], [0, stride]])
+
+    layer._update_draw(0.1, np.array([[0, 0], [40, 40]]), (512, 512))
+    assert layer._zoom_stride == 1
+    assert len(layer._view_indices) == 1600
+
+    layer.max_vectors_in_view = 100
+    assert len(layer._view_indices) <= 100
+
+
 def test_empty_vectors():
     """Test instantiating Vectors layer with empty coordinate-like 2D data."""
     shape = (0, 2, 2)
@@ -491,6 +545,78 @@ def test_length():
     assert layer.length == 3
 
 
+def test_length_extent():
+    """Test that the extent follows the length of the vectors."""
+    data = np.array([[[0, 0], [1, 2]], [[5, 5], [-1, 1]]])
+    layer = Vectors(data)
+    np.testing.assert_equal(layer._extent_data, [[0, 0], [5, 6]])
+
+    layer.length = 3
+    np.testing.assert_equal(layer._extent_data, [[0, 0], [5, 8]])
+
+
+@pytest.mark.parametrize("ndisplay", [2, 3])
+def test_slice_4D(ndisplay):
+    """Test that the vectors in view are those starting in the slice."""
+    np.random.seed(0)
+    data = np.random.random((100, 2, 4))
+    data[:, 0, :2] = np.random.randint(0, 4, (100, 2))
+    layer = Vectors(data)
+
+    for point in [[1, 2, 0, 0], [3, 0, 0, 0], [10, 10, 0, 0]]:
+        layer._slice_dims(point, ndisplay=ndisplay)
+        n_sliced = 4 - ndisplay
+        matches = np.all(
+            data[:, 0, :n_sliced].astype(int) == point[:n_sliced], axis=1
+        )
+        expected = np.flatnonzero(matches)
+        np.testing.assert_equal(layer._view_indices, expected)
+        np.testing.assert_equal(
+            layer._view_data, data[expected][:, :, n_sliced:]
+        )
+        if len(expected) > 0:
+            n_faces = 2 * len(expected) * (ndisplay - 1)
+            assert layer._view_faces.shape == (n_faces, 3)
+            assert len(layer._view_face_color) == n_faces
+        else:
+            assert len(layer._view_faces) == 0
+
+    # meshes of slices that were viewed before are reused
+    layer._slice_dims([1, 2, 0, 0], ndisplay=ndisplay)
+    faces = layer._view_faces
+    layer._slice_dims([3, 0, 0, 0], ndisplay=ndisplay)
+    layer._slice_dims([1, 2, 0, 0], ndisplay=ndisplay)
+    assert layer._view_faces is faces
+
+    # changing the width rebuilds them
+    layer.edge_width = 2
+    assert layer._view_faces is not faces
+
+
+def test_max_vectors_in_view():
+    """Test drawing a strided subset of the vectors in a slice."""
+    np.random.seed(0)
+    data = np.random.random((100, 2, 3))
+    data[:, 0, 0] = np.repeat([0, 1], 50)
+    layer = Vectors(data)
+    assert layer.max_vectors_in_view is None
+    assert len(layer._view_indices) == 50
+
+    layer.max_vectors_in_view = 20
+    np.testing.assert_equal(layer._view_indices, np.arange(0, 50, 3))
+    assert len(layer._view_faces) == 2 * 17
+
+    layer._slice_dims([1, 0, 0], ndisplay=2)
+    np.testing.assert_equal(layer._view_indices, np.arange(50, 100, 3))
+
+    layer.max_vectors_in_view = None
+    np.testing.assert_equal(layer._view_indices, np.arange(50, 100))
+
+    layer = Vectors(data, max_vectors_in_view=10)
+    assert layer.max_vectors_in_view == 10
+    assert len(layer._view_indices) == 10
+
+
 def test_thumbnail():
     """Test the image thumbnail for square data."""
     np.random.seed(0)
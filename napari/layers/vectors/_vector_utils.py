@@ -37,6 +37,88 @@ def vectors_to_coordinates(vectors):
     return coords
 
 
+def is_lazy_image_vectors(vectors):
+    """Check if vector data is an image-like array that is kept lazy.
+
+    Image-like data that is not a numpy array, such as a dask or zarr array,
+    is not converted to coordinates as a whole, as it may not fit in memory.
+
+    Parameters
+    ----------
+    vectors : array
+        Vector data of the Vectors layer.
+
+    Returns
+    -------
+    lazy : bool
+        True if the data is an image-like array other than a numpy array.
+    """
+    if isinstance(vectors, np.ndarray):
+        return False
+    shape = vectors.shape
+    coordinate_like = shape[-2] == 2 and len(shape) == 3
+    return not coordinate_like and shape[-1] == len(shape) - 1
+
+
+def slice_image_vectors(vectors, indices, displayed, stride=1):
+    """Convert the vectors in a plane of image-like data to coordinates.
+
+    Only the plane, subsampled at the stride, is read from the data, so it
+    can be a lazy array such as a dask or zarr array.
+
+    Parameters
+    ----------
+    vectors : (N1, N2, ..., ND, D) array
+        "image-like" data where there is a length D vector of the
+        projections at each pixel.
+    indices : sequence of int
+        Indices of the plane along each dimension. Only the indices along
+        the dimensions that are not displayed are used.
+    displayed : sequence of int
+        Displayed dimensions, in the order they are displayed in.
+    stride : int
+        Step between the vectors read along each displayed dimension.
+
+    Returns
+    -------
+    flat_indices : (M,) array
+        Indices of the M vectors in the plane into the vectors of the
+        coordinate representation of the data.
+    coords : (M, 2, len(displayed)) array
+        Start point and projections of the M vectors in the plane in the
+        displayed dimensions.
+    """
+    displayed = list(displayed)
+    shape = vectors.shape[:-1]
+    key = []
+    grid_ranges = []
+    for d in range(len(shape)):
+        if d in displayed:
+            key.append(slice(None, None, stride))
+            grid_ranges.append(np.arange(0, shape[d], stride))
+        else:
+            index = int(indices[d])
+            if not 0 <= index < shape[d]:
+                return (
+                    np.empty(0, dtype=int),
+                    np.empty((0, 2, len(displayed))),
+                )
+            key.append(index)
+            grid_ranges.append(np.array([index]))
+
+    # the plane has the displayed dimensions in increasing order
+    plane = np.asarray(vectors[tuple(key)])
+    plane = plane.reshape(-1, plane.shape[-1])
+    grid = np.meshgrid(*grid_ranges, indexing='ij')
+    flat_indices = np.ravel_multi_index([g.ravel() for g in grid], shape)
+
+    coords = np.empty((len(plane), 2, len(displayed)), dtype=plane.dtype)
+    for i, d in enumerate(displayed):
+        coords[:, 0, i] = grid[d].ravel()
+        coords[:, 1, i] = plane[:, d]
+    return flat_indices, coords
+
+
 def convert_image_to_coordinates(vectors):
     """To convert an image-like array with elements (y-proj, x-proj) into a
     position list of coordinates
@@ -56,7 +138,7 @@ def convert_image_to_coordinates(vectors):
     """
     # create coordinate spacing for image
     spacing = [list(range(r)) for r in vectors.shape[:-1]]
-    grid = np.meshgrid(*spacing)
+    grid = np.meshgrid(*spacing, indexing='ij')
 
     # create empty vector of necessary shape
     nvect = np.prod(vectors.shape[:-1])
@@ -140,13 +222,73 @@ def generate_vector_meshes_2D(vectors, width, length, p=(0, 0, 1)):
     offsets = offsets * signs
 
     vertices = centers + width * offsets / 2
-    triangles = np.array(
-        [
-            [2 * i, 2 * i + 1, 2 * i + 2]
-            if i % 2 == 0
-            else [2 * i - 1, 2 * i, 2 * i + 1]
-            for i in range(len(vectors))
-        ]
-    ).astype(np.uint32)
+    # the four vertices of each vector form the triangles (0, 1, 2) and
+    # (1, 2, 3)
+    triangles = (
+        4 * np.arange(len(vectors) // 2, dtype=np.uint32)[:, None, None]
+        + np.array([[0, 1, 2], [1, 2, 3]], dtype=np.uint32)
+    ).reshape(-1, 3)
 
     return vertices, triangles
+
+
+class VectorsIndex:
+    """Index of vectors by the plane their start point lies in.
+
+    Vectors are sorted once by the integer coordinates of their start point
+    along the non-displayed dimensions, so the vectors in a slice are a
+    contiguous range of the sorted order.
+
+    Parameters
+    ----------
+    data : (N, 2, D) array
+        The start point and projections of N vectors in D dimensions.
+    not_displayed : sequence of int
+        Dimensions that are sliced through.
+
+    Attributes
+    ----------
+    not_displayed : tuple of int
+        Dimensions that are sliced through.
+    """
+
+    def __init__(self, data, not_displayed):
+        self.not_displayed = tuple(not_displayed)
+        keys = np.asarray(data[:, 0, list(self.not_displayed)]).astype(int)
+        if len(keys) == 0:
+            self._order = np.empty(0, dtype=int)
+            self._ranges = {}
+        elif keys.shape[1] == 0:
+            self._order = np.arange(len(keys))
+            self._ranges = {(): (0, len(keys))}
+        else:
+            # lexsort is stable, so indices in each plane stay sorted
+            self._order = np.lexsort(keys.T[::-1])
+            keys = keys[self._order]
+            changes = np.any(np.diff(keys, axis=0) != 0, axis=1)
+            starts = np.concatenate([[0], np.flatnonzero(changes) + 1])
+            stops = np.append(starts[1:], len(keys))
+            self._ranges = {
+                tuple(key): (start, stop)
+                for key, start, stop in zip(
+                    keys[starts].tolist(), starts.tolist(), stops.tolist()
+                )
+            }
+
+    def plane(self, indices):
+        """Get the vectors in a plane.
+
+        Parameters
+        ----------
+        indices : sequence of int
+            Integer coordinates of the plane along the non-displayed
+            dimensions.
+
+        Returns
+        -------
+        plane_indices : (M,) array
+            Sorted indices of the vectors in the plane.
+        """
+        key = tuple(int(i) for i in indices)
+        start, stop = self._ranges.get(key, (0, 0))
+        return self._order[start:stop]
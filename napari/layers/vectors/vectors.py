@@ -18,7 +18,13 @@ from ..utils.layer_utils import (
     guess_continuous,
     map_property,
 )
-from ._vector_utils import generate_vector_meshes, vectors_to_coordinates
+from ._vector_utils import (
+    VectorsIndex,
+    generate_vector_meshes,
+    is_lazy_image_vectors,
+    slice_image_vectors,
+    vectors_to_coordinates,
+)
 from ._vectors_constants import DEFAULT_COLOR_CYCLE, ColorMode
 
 
@@ -33,7 +39,11 @@ class Vectors(Layer):
         list of N vectors with start point and projections of the vector in
         D dimensions. An (N1, N2, ..., ND, D) array is interpreted as
         "image-like" data where there is a length D vector of the
-        projections at each pixel.
+        projections at each pixel. Image-like data that is not a numpy
+        array, such as a dask or zarr array, is kept lazy and only the
+        vectors in the viewed slice are read from it, subsampled when zoomed
+        out. Lazy data is drawn in a single edge color and can't have
+        properties.
     properties : dict {str: array (N,)}, DataFrame
         Properties for each vector. Each property should be an array of length N,
         where N is the number of vectors.
@@ -53,6 +63,10 @@ class Vectors(Layer):
         of the specified property that are mapped to 0 and 1, respectively.
         The default value is None. If set the none, the clims will be set to
         (property.min(), property.max())
+    max_vectors_in_view : None, int
+        Maximum number of vectors drawn in a slice. If a slice has more
+        vectors, an evenly strided subset of them is drawn. The default
+        value is None, which draws every vector in the slice.
     name : str
         Name of the layer.
     metadata : dict
@@ -87,8 +101,9 @@ class Vectors(Layer):
 
     Attributes
     ----------
-    data : (N, 2, D) array
-        The start point and projections of N vectors in D dimensions.
+    data : (N, 2, D) or (N1, N2, ..., ND, D) array
+        The start point and projections of N vectors in D dimensions, or the
+        lazy image-like data.
     properties : dict {str: array (N,)}, DataFrame
         Properties for each vector. Each property should be an array of length N,
         where N is the number of vectors.
@@ -108,6 +123,9 @@ class Vectors(Layer):
         of the specified property that are mapped to 0 and 1, respectively.
         The default value is None. If set the none, the clims will be set to
         (property.min(), property.max())
+    max_vectors_in_view : None, int
+        Maximum number of vectors drawn in a slice, or None to draw every
+        vector in the slice.
 
     Extended Summary
     ----------
@@ -118,6 +136,10 @@ class Vectors(Layer):
         colors for the M in view vectors
     _view_indices : (1, M) array
         indices for the M in view vectors
+    _lazy : bool
+        True if the data is image-like data that is kept lazy.
+    _zoom_stride : int
+        Step between the vectors of lazy data drawn at the current zoom.
     _view_vertices : (4M, 2) or (8M, 2) np.ndarray
         the corner points for the M in view faces. Shape is (4M, 2) for 2D and (8M, 2) for 3D.
     _view_faces : (2M, 3) or (4M, 3) np.ndarray
@@ -126,12 +148,11 @@ class Vectors(Layer):
     _property_choices : dict {str: array (N,)}
         Possible values for the properties in Vectors.properties.
         If properties is not provided, it will be {} (empty dictionary).
-    _mesh_vertices : (4N, 2) array
-        The four corner points for the mesh representation of each vector as as
-        rectangle in the slice that it starts in.
-    _mesh_triangles : (2N, 3) array
-        The integer indices of the `_mesh_vertices` that form the two triangles
-        for the mesh representation of the vectors.
+    _vectors_index : VectorsIndex
+        Index of the vectors by the plane they start in, built when needed.
+    _plane_meshes : dict
+        Vertices and faces of the meshes of recently viewed slices, keyed by
+        the plane and the stride of the vectors drawn in it.
     _max_vectors_thumbnail : int
         The maximum number of vectors that will ever be used to render the
         thumbnail. If more vectors are present then they are randomly
@@ -141,6 +162,10 @@ class Vectors(Layer):
     # The max number of vectors that will ever be used to render the thumbnail
     # If more vectors are present then they are randomly subsampled
     _max_vectors_thumbnail = 1024
+    # The max total number of vertices in the cached meshes of viewed slices
+    _max_mesh_cache_vertices = 2 ** 24
+    # The min spacing in screen pixels between the drawn vectors of lazy data
+    _min_lazy_vector_spacing = 4
 
     def __init__(
         self,
@@ -153,6 +178,7 @@ class Vectors(Layer):
         edge_colormap='viridis',
         edge_contrast_limits=None,
         length=1,
+        max_vectors_in_view=None,
         name=None,
         metadata=None,
         scale=None,
@@ -186,6 +212,7 @@ class Vectors(Layer):
             edge_width=Event,
             edge_color=Event,
             edge_color_mode=Event,
+            max_vectors_in_view=Event,
         )
 
         self.visible = False
@@ -196,6 +223,14 @@ class Vectors(Layer):
         # length attribute
         self._length = length
 
+        self._max_vectors_in_view = max_vectors_in_view
+
+        # Meshes of the viewed slices, and the dimensions they are built in
+        self._plane_meshes = {}
+        self._displayed_stored = []
+        self._extent_data_stored = None
+        self._zoom_stride = 1
+
         self.data = data
 
         # Save the properties
@@ -233,7 +268,6 @@ class Vectors(Layer):
 
         # Data containing vectors in the currently viewed slice
         self._view_data = np.empty((0, 2, 2))
-        self._displayed_stored = []
         self._view_vertices = []
         self._view_faces = []
         self._view_indices = []
@@ -243,21 +277,22 @@ class Vectors(Layer):
 
     @property
     def data(self) -> np.ndarray:
-        """(N, 2, D) array: start point and projections of vectors."""
+        """(N, 2, D) array: start point and projections of vectors.
+
+        Lazy image-like data is returned as is.
+        """
         return self._data
 
     @data.setter
     def data(self, vectors: np.ndarray):
-        self._data = vectors_to_coordinates(vectors)
-
-        vertices, triangles = generate_vector_meshes(
-            self._data[:, :, list(self._dims.displayed)],
-            self.edge_width,
-            self.length,
-        )
-        self._mesh_vertices = vertices
-        self._mesh_triangles = triangles
-        self._displayed_stored = copy(self._dims.displayed)
+        self._lazy = is_lazy_image_vectors(vectors)
+        if self._lazy:
+            self._data = vectors
+        else:
+            self._data = vectors_to_coordinates(vectors)
+        self._vectors_index = None
+        self._plane_meshes = {}
+        self._extent_data_stored = None
 
         self._update_dims()
         self.events.data()
@@ -282,6 +317,10 @@ class Vectors(Layer):
         self, properties: Dict[str, np.ndarray]
     ) -> Dict[str, np.ndarray]:
         """Validates the type and size of the properties"""
+        if self._lazy and len(properties) > 0:
+            raise ValueError(
+                'properties are not supported for lazy image-like vector data'
+            )
         for v in properties.values():
             if len(v) != len(self.data):
                 raise ValueError(
@@ -307,6 +346,7 @@ class Vectors(Layer):
                 'edge_color_cycle': self.edge_color_cycle,
                 'edge_colormap': self.edge_colormap.name,
                 'edge_contrast_limits': self.edge_contrast_limits,
+                'max_vectors_in_view': self.max_vectors_in_view,
                 'data': self.data,
                 'properties': self.properties,
             }
@@ -315,6 +355,8 @@ class Vectors(Layer):
 
     def _get_ndim(self) -> int:
         """Determine number of dimensions of the layer."""
+        if self._lazy:
+            return self.data.ndim - 1
         return self.data.shape[2]
 
     @property
@@ -325,15 +367,26 @@ class Vectors(Layer):
         -------
         extent_data : array, shape (2, D)
         """
-        if len(self.data) == 0:
+        # the extent is kept until the data or the length change, so that
+        # slicing doesn't need to go through all of the vectors
+        if self._extent_data_stored is not None:
+            return self._extent_data_stored
+        if self._lazy:
+            # only the grid of start points is used, as the projections
+            # would all need to be read
+            extrema = np.vstack(
+                [np.zeros(self.ndim), np.subtract(self.data.shape[:-1], 1)]
+            )
+        elif len(self.data) == 0:
             extrema = np.full((2, self.ndim), np.nan)
         else:
             # Convert from projections to endpoints using the current length
-            data = copy(self.data)
-            data[:, 1, :] = data[:, 0, :] + self.length * data[:, 1, :]
-            maxs = np.max(data, axis=(0, 1))
-            mins = np.min(data, axis=(0, 1))
+            starts = self.data[:, 0, :]
+            ends = starts + self.length * self.data[:, 1, :]
+            maxs = np.maximum(np.max(starts, axis=0), np.max(ends, axis=0))
+            mins = np.minimum(np.min(starts, axis=0), np.min(ends, axis=0))
             extrema = np.vstack([mins, maxs])
+        self._extent_data_stored = extrema
         return extrema
 
     @property
@@ -344,15 +397,7 @@ class Vectors(Layer):
     @edge_width.setter
     def edge_width(self, edge_width: Union[int, float]):
         self._edge_width = edge_width
-
-        vertices, triangles = generate_vector_meshes(
-            self.data[:, :, list(self._dims.displayed)],
-            self._edge_width,
-            self.length,
-        )
-        self._mesh_vertices = vertices
-        self._mesh_triangles = triangles
-        self._displayed_stored = copy(self._dims.displayed)
+        self._plane_meshes = {}
 
         self.events.edge_width()
         self.refresh()
@@ -366,20 +411,24 @@ class Vectors(Layer):
     @length.setter
     def length(self, length: Union[int, float]):
         self._length = length
-
-        vertices, triangles = generate_vector_meshes(
-            self.data[:, :, list(self._dims.displayed)],
-            self.edge_width,
-            self._length,
-        )
-        self._mesh_vertices = vertices
-        self._mesh_triangles = triangles
-        self._displayed_stored = copy(self._dims.displayed)
+        self._plane_meshes = {}
+        self._extent_data_stored = None
 
         self.events.length()
         self.refresh()
         self.status = format_float(self.length)
 
+    @property
+    def max_vectors_in_view(self) -> Union[None, int]:
+        """None, int: Maximum number of vectors drawn in a slice."""
+        return self._max_vectors_in_view
+
+    @max_vectors_in_view.setter
+    def max_vectors_in_view(self, max_vectors_in_view: Union[None, int]):
+        self._max_vectors_in_view = max_vectors_in_view
+        self.events.max_vectors_in_view()
+        self.refresh()
+
     @property
     def edge_color(self) -> np.ndarray:
         """(1 x 4) np.ndarray: Array of RGBA edge colors (applied to all vectors)"""
@@ -403,14 +452,16 @@ class Vectors(Layer):
             self.refresh_colors()
 
         else:
+            # lazy data has one color for all of the vectors
+            n_colors = 1 if self._lazy else len(self.data)
             transformed_color = transform_color_with_defaults(
-                num_entries=len(self.data),
+                num_entries=n_colors,
                 colors=edge_color,
                 elem_name="edge_color",
                 default="white",
             )
             self._edge_color = normalize_and_broadcast_colors(
-                len(self.data), transformed_color
+                n_colors, transformed_color
             )
             new_mode = ColorMode.DIRECT
             self._edge_color_mode = new_mode
@@ -607,10 +658,17 @@ class Vectors(Layer):
     ):
         self._edge_contrast_limits = contrast_limits
 
+    @property
+    def _view_edge_color(self) -> np.ndarray:
+        """(Mx4) np.ndarray : edge colors of the M in view vectors"""
+        if self._lazy:
+            return np.repeat(self.edge_color, len(self._view_indices), axis=0)
+        return self.edge_color[self._view_indices]
+
     @property
     def _view_face_color(self) -> np.ndarray:
         """" (Mx4) np.ndarray : colors for the M in view vectors"""
-        face_color = np.repeat(self.edge_color[self._view_indices], 2, axis=0)
+        face_color = np.repeat(self._view_edge_color, 2, axis=0)
         if self._dims.ndisplay == 3 and self.ndim > 2:
             face_color = np.vstack([face_color, face_color])
 
@@ -618,57 +676,128 @@ class Vectors(Layer):
 
     def _set_view_slice(self):
         """Sets the view given the indices to slice with."""
+        displayed = copy(self._dims.displayed)
+        if not displayed == self._displayed_stored:
+            self._plane_meshes = {}
+            self._displayed_stored = displayed
 
-        if not self._dims.displayed == self._displayed_stored:
-            vertices, triangles = generate_vector_meshes(
-                self.data[:, :, list(self._dims.displayed)],
-                self.edge_width,
-                self.length,
-            )
-            self._mesh_vertices = vertices
-            self._mesh_triangles = triangles
-            self._displayed_stored = copy(self._dims.displayed)
-
-        vertices = self._mesh_vertices
         not_disp = list(self._dims.not_displayed)
-        disp = list(self._dims.displayed)
-        indices = np.array(self._slice_indices)
-
-        if len(self.data) == 0:
-            faces = []
-            self._view_data = np.empty((0, 2, 2))
-            self._view_indices = []
-        elif self.ndim > 2:
-            data = self.data[:, 0, not_disp].astype('int')
-            matches = np.all(data == indices[not_disp], axis=1)
-            matches = np.where(matches)[0]
-            self._view_indices = matches
-            self._view_data = self.data[np.ix_(matches, [0, 1], disp)]
-            if len(matches) == 0:
-                faces = []
-            else:
-                keep_inds = np.repeat(2 * matches, 2)
-                keep_inds[1::2] = keep_inds[1::2] + 1
-                if self._dims.ndisplay == 3:
-                    keep_inds = np.concatenate(
-                        [
-                            keep_inds,
-                            len(self._mesh_triangles) // 2 + keep_inds,
-                        ],
-                        axis=0,
-                    )
-                faces = self._mesh_triangles[keep_inds]
+        disp = list(displayed)
+        plane = tuple(int(i) for i in np.array(self._slice_indices)[not_disp])
+        if self._lazy:
+            stride = self._get_lazy_stride(disp)
+            matches, view_data = slice_image_vectors(
+                self.data, self._slice_indices, disp, stride
+            )
         else:
-            faces = self._mesh_triangles
-            self._view_data = self.data[:, :, disp]
-            self._view_indices = np.arange(self.data.shape[0])
-
-        if len(faces) == 0:
+            matches = self._get_vectors_index().plane(plane)
+            # draw an evenly strided subset of the vectors if there are too
+            # many
+            stride = 1
+            if self.max_vectors_in_view is not None and len(matches) > 0:
+                stride = int(np.ceil(len(matches) / self.max_vectors_in_view))
+                matches = matches[::stride]
+            view_data = self.data[np.ix_(matches, [0, 1], disp)]
+
+        self._view_indices = matches
+        self._view_data = view_data
+        if len(matches) == 0:
             self._view_vertices = []
             self._view_faces = []
         else:
-            self._view_vertices = vertices
-            self._view_faces = faces
+            self._view_vertices, self._view_faces = self._get_plane_mesh(
+                (plane, stride), self._view_data
+            )
+
+    def _get_lazy_stride(self, displayed: list) -> int:
+        """Step between the vectors of lazy data drawn along each axis.
+
+        The vectors are subsampled so they are drawn at least
+        ``_min_lazy_vector_spacing`` screen pixels apart, and so that at
+        most ``max_vectors_in_view`` of them are drawn.
+        """
+        stride = self._zoom_stride
+        if self.max_vectors_in_view is not None:
+            plane_shape = np.array([self.data.shape[d] for d in displayed])
+            n_vectors = np.prod(plane_shape)
+            stride = max(
+                stride,
+                int(
+                    np.ceil(
+                        (n_vectors / self.max_vectors_in_view)
+                        ** (1 / len(displayed))
+                    )
+                ),
+            )
+            while np.prod(np.ceil(plane_shape / stride)) > max(
+                self.max_vectors_in_view, 1
+            ):
+                stride += 1
+        return stride
+
+    def _update_draw(self, scale_factor, corner_pixels, shape_threshold):
+        """Update canvas scale and corner values on draw.
+
+        For lazy data, reads the vectors in view again if the zoom level
+        changes how they are subsampled.
+
+        Parameters
+        ----------
+        scale_factor : float
+            Scale factor going from canvas to world coordinates.
+        corner_pixels : array
+            Coordinates of the top-left and bottom-right canvas pixels in the
+            world coordinates.
+        shape_threshold : tuple
+            Requested shape of field of view in data coordinates.
+        """
+        super()._update_draw(scale_factor, corner_pixels, shape_threshold)
+        if not self._lazy:
+            return
+        stride = 1
+        if self._dims.ndisplay == 2:
+            # Round the stride up to a power of two so the vectors only need
+            # to be read again after zooming by a factor of two
+            scale = np.asarray(self.scale)[self._dims.displayed]
+            spacing = self._min_lazy_vector_spacing * scale_factor / scale
+            if np.max(spacing) > 1:
+                stride = 2 ** int(np.ceil(np.log2(np.max(spacing))))
+        if stride != self._zoom_stride:
+            self._zoom_stride = stride
+            self.refresh()
+
+    def _get_vectors_index(self) -> VectorsIndex:
+        """Get the index of vectors by plane, building it if needed."""
+        not_disp = tuple(self._dims.not_displayed)
+        if (
+            self._vectors_index is None
+            or self._vectors_index.not_displayed != not_disp
+        ):
+            self._vectors_index = VectorsIndex(self.data, not_disp)
+        return self._vectors_index
+
+    def _get_plane_mesh(
+        self, key: tuple, view_data: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the mesh of the vectors in view, building it if needed.
+
+        Meshes of recently viewed slices are kept, so stepping back and forth
+        through slices doesn't rebuild them, as long as they hold fewer than
+        ``_max_mesh_cache_vertices`` vertices in total.
+        """
+        if key in self._plane_meshes:
+            return self._plane_meshes[key]
+        mesh = generate_vector_meshes(view_data, self.edge_width, self.length)
+        # drop the least recently built meshes that don't fit in the cache
+        n_cached = len(mesh[0])
+        for cached_key, (vertices, _) in reversed(
+            list(self._plane_meshes.items())
+        ):
+            n_cached += len(vertices)
+            if n_cached > self._max_mesh_cache_vertices:
+                del self._plane_meshes[cached_key]
+        self._plane_meshes[key] = mesh
+        return mesh
 
     def _update_thumbnail(self):
         """Update thumbnail with current vectors and colors."""
@@ -693,10 +822,10 @@ class Vectors(Layer):
                 0, self._view_data.shape[0], self._max_vectors_thumbnail
             )
             vectors = copy(self._view_data[thumbnail_indices, :, -2:])
-            thumbnail_color_indices = self._view_indices[thumbnail_indices]
+            edge_colors = self._view_edge_color[thumbnail_indices]
         else:
             vectors = copy(self._view_data[:, :, -2:])
-            thumbnail_color_indices = self._view_indices
+            edge_colors = self._view_edge_color
         vectors[:, 1, :] = vectors[:, 0, :] + vectors[:, 1, :] * self.length
         downsampled = (vectors - offset) * zoom_factor
         downsampled = np.clip(
@@ -704,7 +833,6 @@ class Vectors(Layer):
         )
         colormapped = np.zeros(self._thumbnail_shape)
         colormapped[..., 3] = 1
-        edge_colors = self.edge_color[thumbnail_color_indices]
         for v, ec in zip(downsampled, edge_colors):
             start = v[0]
             stop = v[1]
@@ -0,0 +1,144 @@
+import threading
+import time
+from collections import OrderedDict
+
+import dask.array as da
+import numpy as np
+
+from napari import utils
+from napari.utils.dask_utils import create_dask_cache
+from napari.utils.memory_budget import (
+    BudgetedCache,
+    MemoryBudget,
+    memory_budget,
+)
+
+
+class FakeCache(BudgetedCache):
+    """Cache of entries with fixed sizes and access times."""
+
+    def __init__(self, name):
+        self.name = name
+        self.entries = OrderedDict()
+
+    def add(self, key, num_bytes, access_time):
+        self.entries[key] = (num_bytes, access_time)
+
+    @property
+    def nbytes(self):
+        return sum(num_bytes for num_bytes, _ in self.entries.values())
+
+    def oldest_access(self):
+        if not self.entries:
+            return None
+        return next(iter(self.entries.values()))[1]
+
+    def evict_one(self):
+        _, (num_bytes, _) = self.entries.popitem(last=False)
+        return num_bytes
+
+    def layer_bytes(self, layer):
+        return self.nbytes
+
+
+def test_budget_evicts_oldest_across_caches():
+    """The budget is shared and the oldest entry is evicted first."""
+    budget = MemoryBudget(max_bytes=300)
+    cache1 = FakeCache("one")
+    cache2 = FakeCache("two")
+    budget.register(cache1)
+    budget.register(cache2)
+
+    cache1.add("a", 100, access_time=1)
+    cache2.add("b", 100, access_time=2)
+    cache1.add("c", 100, access_time=3)
+    cache2.add("d", 100, access_time=4)
+    assert budget.used_bytes == 400
+
+    budget.shrink()
+    assert budget.used_bytes == 300
+    assert list(cache1.entries) == ["c"]
+    assert list(cache2.entries) == ["b", "d"]
+
+    budget.resize(100)
+    assert budget.used_bytes == 100
+    assert list(cache2.entries) == ["d"]
+    assert budget.cache_bytes() == {"one": 0, "two": 100}
+
+
+def test_budget_caches_with_same_name():
+    """Caches with the same name are registered side by side."""
+    budget = MemoryBudget(max_bytes=300)
+    cache1 = FakeCache("chunk")
+    cache2 = FakeCache("chunk")
+    budget.register(cache1)
+    budget.register(cache2)
+
+    cache1.add("a", 100, access_time=1)
+    cache2.add("b", 100, access_time=2)
+    assert budget.cache_bytes() == {"chunk": 200}
+
+    budget.resize(100)
+    assert list(cache1.entries) == []
+    assert list(cache2.entries) == ["b"]
+
+    budget.unregister(cache1)
+    assert budget.cache_bytes() == {"chunk": 100}
+
+
+def test_budget_env_var(monkeypatch):
+    """NAPARI_CACHE_BYTES sets the default budget."""
+    monkeypatch.setenv("NAPARI_CACHE_BYTES", "12345")
+    assert MemoryBudget().max_bytes == 12345
+
+
+def test_dask_cache_layer_bytes():
+    """The dask cache registers with the budget and reports per layer."""
+    utils.dask_cache = None
+    cache = create_dask_cache()
+    assert cache.nbytes == 0
+
+    data = da.ones((10, 10), chunks=(5, 5))
+    other = da.zeros((10, 10), chunks=(5, 5))
+    data.compute()
+
+    class FakeLayer:
+        pass
+
+    layer = FakeLayer()
+    layer.data = data
+    assert cache.layer_bytes(layer) >= data.nbytes
+
+    layer.data = other
+    assert cache.layer_bytes(layer) == 0
+
+    # Entries put in cachey directly count as new, not as the oldest.
+    del cache.access_times[cache.cache.heap.peekitem()[0]]
+    before = time.monotonic()
+    assert cache.oldest_access() >= before
+
+    # Evicting one at a time empties the cache.
+    while cache.oldest_access() is not None:
+        assert cache.evict_one() > 0
+    assert cache.nbytes == 0
+
+    np.testing.assert_array_equal(data.compute(), 1)
+
+    # layer_bytes reads cachey's entries under the budget's lock, since
+    # dask worker threads change them.
+    result = []
+    layer.data = data
+    with memory_budget.lock:
+        thread = threading.Thread(
+            target=lambda: result.append(cache.layer_bytes(layer))
+        )
+        thread.start()
+        thread.join(0.1)
+        assert thread.is_alive()
+    thread.join()
+    assert result == [cache.nbytes]
+
+    # clean up cache
+    cache.unregister()
+    memory_budget.unregister(cache)
+    utils.dask_cache = None
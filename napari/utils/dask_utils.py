@@ -1,33 +1,143 @@
 """Dask cache utilities.
 """
+import time
 import warnings
 from contextlib import contextmanager
 from distutils.version import LooseVersion
-from typing import Callable, ContextManager, Optional
+from typing import Callable, ContextManager, Dict, Optional
 
 import dask
 import dask.array as da
 from dask.cache import Cache
 
 from .. import utils
+from .memory_budget import BudgetedCache, memory_budget
+
+
+def _get_dask_names(data) -> set:
+    """Return the names of all dask graph layers behind the layer's data.
+
+    Parameters
+    ----------
+    data : Any
+        data, as passed to a ``Layer.__init__`` method.
+    """
+    arrays = data if isinstance(data, (list, tuple)) else [data]
+    names = set()
+    for array in arrays:
+        if isinstance(array, da.Array):
+            names.update(getattr(array.dask, 'layers', {array.name: None}))
+    return names
+
+
+class _BudgetedDaskCache(Cache, BudgetedCache):
+    """Dask opportunistic cache that shares napari's MemoryBudget.
+
+    The cachey cache still decides which of its entries is least valuable
+    using its cost based score. We additionally record when each entry was
+    last used so the MemoryBudget can compare it against other caches.
+
+    Parameters
+    ----------
+    nbytes : int
+        The most bytes this cache may use on its own.
+
+    Attributes
+    ----------
+    access_times : Dict
+        The time.monotonic() each key was last put or used.
+    """
+
+    name = "dask"
+
+    def __init__(self, nbytes: int):
+        super().__init__(nbytes)
+        self.access_times: Dict = {}
+
+    def _start(self, dsk):
+        # Dask calls us from its worker threads, while the MemoryBudget can
+        # evict from us in any thread, so cachey is only used under its lock.
+        with memory_budget.lock:
+            super()._start(dsk)
+            now = time.monotonic()
+            for key in set(dsk) & set(self.cache.data):
+                self.access_times[key] = now  # Cache hit.
+
+    def _posttask(self, key, value, dsk, state, id):
+        with memory_budget.lock:
+            super()._posttask(key, value, dsk, state, id)
+            if key in self.cache.data:
+                self.access_times[key] = time.monotonic()
+
+            # Forget keys that cachey evicted on its own.
+            if len(self.access_times) > 2 * len(self.cache.data) + 100:
+                self.access_times = {
+                    key: self.access_times[key]
+                    for key in self.cache.data
+                    if key in self.access_times
+                }
+
+        memory_budget.shrink()
+
+    @property
+    def nbytes(self) -> int:
+        """Return how many bytes the cache is using."""
+        return self.cache.total_bytes
+
+    def oldest_access(self) -> Optional[float]:
+        """Return the last access time of cachey's lowest scored entry.
+
+        Entries put in cachey some other way than by a dask computation
+        count as accessed when we first see them.
+        """
+        with memory_budget.lock:
+            if not self.cache.heap:
+                return None
+            key, _ = self.cache.heap.peekitem()
+            return self.access_times.setdefault(key, time.monotonic())
+
+    def evict_one(self) -> int:
+        """Evict cachey's lowest scored entry, return bytes freed."""
+        with memory_budget.lock:
+            if not self.cache.heap:
+                return 0
+            key, _ = self.cache.heap.popitem()
+            num_bytes = self.cache.nbytes[key]
+            self.cache.retire(key)
+            self.access_times.pop(key, None)
+            return num_bytes
+
+    def layer_bytes(self, layer) -> int:
+        """Return bytes cached for chunks of this layer's dask arrays."""
+        names = _get_dask_names(layer.data)
+        with memory_budget.lock:
+            items = list(self.cache.nbytes.items())
+        return sum(
+            num_bytes
+            for key, num_bytes in items
+            if (key[0] if isinstance(key, tuple) else key) in names
+        )
 
 
 def create_dask_cache(
-    nbytes: Optional[int] = None, mem_fraction: float = 0.1
+    nbytes: Optional[int] = None, mem_fraction: Optional[float] = None
 ) -> Cache:
     """Create a dask cache at utils.dask_cache if one doesn't already exist.
 
+    The dask cache shares napari's single memory budget with the other
+    caches, see :mod:`napari.utils.memory_budget`.
+
     Parameters
     ----------
     nbytes : int, optional
         The desired size of the cache, in bytes.  If ``None``, the cache size
         will autodetermined as fraction of the total memory in the system,
         using ``mem_fraction``.  If ``nbytes`` is 0, cache object will be
-        created, but not caching will occur. by default, cache size is
-        autodetermined using ``mem_fraction``.
+        created, but not caching will occur. by default, the cache may use
+        the whole shared memory budget.
     mem_fraction : float, optional
         The fraction (from 0 to 1) of total memory to use for the dask cache.
-        by default, 10% of total memory is used.
+        by default, the shared memory budget is used.
 
     Returns
     -------
@@ -37,12 +147,16 @@ def create_dask_cache(
     import psutil
 
     if nbytes is None:
-        nbytes = psutil.virtual_memory().total * mem_fraction
+        if mem_fraction is None:
+            nbytes = memory_budget.max_bytes
+        else:
+            nbytes = psutil.virtual_memory().total * mem_fraction
     if not (
         hasattr(utils, 'dask_cache') and isinstance(utils.dask_cache, Cache)
     ):
-        utils.dask_cache = Cache(nbytes)
+        utils.dask_cache = _BudgetedDaskCache(nbytes)
         utils.dask_cache.register()
+        memory_budget.register(utils.dask_cache)
     return utils.dask_cache
 
 
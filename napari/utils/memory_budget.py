@@ -0,0 +1,216 @@
+"""MemoryBudget class.
+
+One byte limit shared by all of napari's in-memory caches.
+"""
+import logging
+import os
+import threading
+import weakref
+from collections import defaultdict
+from typing import Dict, Optional
+
+LOGGER = logging.getLogger("napari.async")
+
+# Set NAPARI_CACHE_BYTES to the total number of bytes all caches together
+# may use. Otherwise they share DEFAULT_MEM_FRACTION of total RAM.
+CACHE_BYTES_ENV_VAR = "NAPARI_CACHE_BYTES"
+DEFAULT_MEM_FRACTION = 0.1
+
+
+def _get_default_max_bytes() -> int:
+    """Return the budget from NAPARI_CACHE_BYTES or a fraction of RAM.
+
+    Returns
+    -------
+    int
+        The max number of bytes all caches together should use.
+    """
+    value = os.getenv(CACHE_BYTES_ENV_VAR)
+    if value is not None:
+        return int(float(value))
+
+    import psutil
+
+    return int(psutil.virtual_memory().total * DEFAULT_MEM_FRACTION)
+
+
+class BudgetedCache:
+    """Interface a cache implements to share the MemoryBudget.
+
+    Attributes
+    ----------
+    name : str
+        The name we report the cache's usage under.
+    """
+
+    name = "cache"
+
+    @property
+    def nbytes(self) -> int:
+        """Return how many bytes the cache is using."""
+        raise NotImplementedError()
+
+    def oldest_access(self) -> Optional[float]:
+        """Return the last access time of the next entry we'd evict.
+
+        Returns
+        -------
+        Optional[float]
+            The time.monotonic() of the access, None if the cache is empty.
+        """
+        raise NotImplementedError()
+
+    def evict_one(self) -> int:
+        """Evict the cache's least valuable entry.
+
+        Called with the MemoryBudget's lock held.
+
+        Returns
+        -------
+        int
+            How many bytes were freed.
+        """
+        raise NotImplementedError()
+
+    def layer_bytes(self, layer) -> int:
+        """Return how many bytes in the cache belong to this layer.
+
+        Parameters
+        ----------
+        layer : Layer
+            The layer to report on.
+        """
+        raise NotImplementedError()
+
+
+class MemoryBudget:
+    """One byte limit shared by all registered caches.
+
+    Each cache decides for itself which of its entries is least valuable,
+    the ChunkCache uses LRU and the dask cache uses its cost based score.
+    When the caches together are over budget we evict from the cache whose
+    candidate entry was accessed longest ago. So the caches compete for the
+    budget, instead of each getting a fixed share of RAM.
+
+    Parameters
+    ----------
+    max_bytes : Optional[int]
+        The budget in bytes, defaults to NAPARI_CACHE_BYTES or 10% of RAM.
+
+    Attributes
+    ----------
+    caches : weakref.WeakValueDictionary
+        The registered caches by id, a cache that is no longer used
+        anywhere else drops out of the budget.
+    lock : threading.RLock
+        Caches are added to from worker threads. Caches hold this lock
+        whenever they change their entries, so eviction never races them.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        self._max_bytes = max_bytes
+        self.caches: Dict[int, BudgetedCache] = weakref.WeakValueDictionary()
+        self.lock = threading.RLock()
+
+    @property
+    def max_bytes(self) -> int:
+        """Return the budget in bytes for all caches combined."""
+        if self._max_bytes is None:
+            self._max_bytes = _get_default_max_bytes()
+        return self._max_bytes
+
+    @property
+    def used_bytes(self) -> int:
+        """Return how many bytes all caches combined are using."""
+        with self.lock:
+            return sum(cache.nbytes for cache in self.caches.values())
+
+    def register(self, cache: BudgetedCache) -> None:
+        """Add a cache to the budget.
+
+        Parameters
+        ----------
+        cache : BudgetedCache
+            The cache to add.
+        """
+        with self.lock:
+            self.caches[id(cache)] = cache
+        self.shrink()
+
+    def unregister(self, cache: BudgetedCache) -> None:
+        """Remove a cache from the budget.
+
+        Parameters
+        ----------
+        cache : BudgetedCache
+            The cache to remove.
+        """
+        with self.lock:
+            if self.caches.get(id(cache)) is cache:
+                del self.caches[id(cache)]
+
+    def resize(self, max_bytes: int) -> None:
+        """Set the budget and evict until we fit in it.
+
+        Parameters
+        ----------
+        max_bytes : int
+            The new budget in bytes.
+        """
+        self._max_bytes = int(max_bytes)
+        self.shrink()
+
+    def shrink(self) -> None:
+        """Evict entries until all caches together fit in the budget."""
+        with self.lock:
+            max_bytes = self.max_bytes
+            while self.used_bytes > max_bytes:
+                cache = self._get_victim()
+                if cache is None or cache.evict_one() == 0:
+                    break  # Nothing left we can evict.
+                LOGGER.debug(
+                    "MemoryBudget.shrink: evicted from %s", cache.name
+                )
+
+    def _get_victim(self) -> Optional[BudgetedCache]:
+        """Return the cache whose next eviction candidate is oldest."""
+        victim = None
+        victim_time = None
+        for cache in self.caches.values():
+            access_time = cache.oldest_access()
+            if access_time is None:
+                continue  # Cache is empty.
+            if victim_time is None or access_time < victim_time:
+                victim, victim_time = cache, access_time
+        return victim
+
+    def cache_bytes(self) -> Dict[str, int]:
+        """Return how many bytes the caches are using, by cache name."""
+        totals = defaultdict(int)
+        with self.lock:
+            for cache in self.caches.values():
+                totals[cache.name] += cache.nbytes
+        return dict(totals)
+
+    def layer_bytes(self, layer) -> Dict[str, int]:
+        """Return how many bytes each cache holds for this layer.
+
+        Parameters
+        ----------
+        layer : Layer
+            The layer to report on.
+
+        Returns
+        -------
+        Dict[str, int]
+            The bytes for the layer in the caches, by cache name.
+        """
+        totals = defaultdict(int)
+        with self.lock:
+            for cache in self.caches.values():
+                totals[cache.name] += cache.layer_bytes(layer)
+        return dict(totals)
+
+
+#: The global budget shared by the dask cache and the ChunkCache.
+memory_budget = MemoryBudget()